@@ -7,12 +7,16 @@
 
 import argparse
 import logging
-from typing import IO
+from typing import IO, Optional
 
 
 class AssembleArgs:
     manifest: IO
     keep: bool
+    parallel: int
+    fast_install: bool
+    compression_level: Optional[int]
+    compression_threads: int
 
     def __init__(self) -> None:
         parser = argparse.ArgumentParser(description="Assemble an OpenSearch Distribution")
@@ -24,6 +28,34 @@ class AssembleArgs:
             action="store_true",
             help="Do not delete the working temporary directory.",
         )
+        parser.add_argument(
+            "--parallel",
+            dest="parallel",
+            type=int,
+            default=1,
+            help="Number of plugins to copy concurrently, plugins without a custom install.sh are then installed in batches.",
+        )
+        parser.add_argument(
+            "--fast-install",
+            dest="fast_install",
+            action="store_true",
+            help="Experimental: install OpenSearch plugins without the plugin CLI when they allow it.",
+        )
+        parser.add_argument(
+            "--compression-level",
+            dest="compression_level",
+            type=int,
+            choices=range(0, 10),
+            metavar="{0-9}",
+            help="Compression level of the distribution, default is the default of its format.",
+        )
+        parser.add_argument(
+            "--compression-threads",
+            dest="compression_threads",
+            type=int,
+            default=1,
+            help="Number of threads extracting and compressing the distribution.",
+        )
         parser.add_argument(
             "-v",
             "--verbose",
@@ -35,7 +67,16 @@ class AssembleArgs:
         )
 
         args = parser.parse_args()
+        if args.parallel < 1:
+            parser.error("--parallel must be a positive number.")
+        if args.compression_threads < 1:
+            parser.error("--compression-threads must be a positive number.")
+
         self.logging_level = args.logging_level
         self.manifest = args.manifest
         self.keep = args.keep
+        self.parallel = args.parallel
+        self.fast_install = args.fast_install
+        self.compression_level = args.compression_level
+        self.compression_threads = args.compression_threads
         self.base_url = args.base_url
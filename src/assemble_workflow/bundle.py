@@ -5,13 +5,14 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import concurrent.futures
 import errno
 import logging
 import os
 import shutil
 import subprocess
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 
 from assemble_workflow.bundle_recorder import BundleRecorder
 from assemble_workflow.dist import Dist
@@ -24,6 +25,11 @@ from system.temporary_directory import TemporaryDirectory
 This class is responsible for executing the build of the full bundle and passing results to a bundle recorder.
 It requires a min tarball distribution where plugins will be installed and the path to an artifacts directory where
 plugins can be found.
+
+With more than one worker, plugin artifacts are copied concurrently and the plugins that only need the default install.sh
+are installed together with install_plugins, in manifest order. Plugins with a custom install.sh are installed one at a
+time with install_plugin, after all the plugins before them, so that the distribution and the bundle manifest are the
+same as when installing one plugin at a time.
 """
 
 
@@ -34,21 +40,39 @@ class Bundle(ABC):
     def __exit__(self, exc_type: Any, exc_value: Any, exc_traceback: Any) -> None:
         self.tmp_dir.__exit__(exc_type, exc_value, exc_traceback)
 
-    def __init__(self, build_manifest: BuildManifest, artifacts_dir: str, bundle_recorder: BundleRecorder, keep: bool = False) -> None:
+    def __init__(
+        self,
+        build_manifest: BuildManifest,
+        artifacts_dir: str,
+        bundle_recorder: BundleRecorder,
+        keep: bool = False,
+        workers: int = 1,
+        fast_install: bool = False,
+        compression_level: Optional[int] = None,
+        compression_threads: int = 1,
+    ) -> None:
         """
         Construct a new Bundle instance.
         :param build_manifest: A BuildManifest created from the build workflow.
         :param artifacts_dir: Dir location where build artifacts can be found locally
         :param bundle_recorder: The bundle recorder that will capture and build a BundleManifest
+        :param workers: Number of plugin artifacts to copy concurrently, more than one installs plugins in batches
+        :param fast_install: Install the plugins that allow it without the plugin CLI
+        :param compression_level: Compression level of the distribution, None for the default of its format
+        :param compression_threads: Number of threads compressing the distribution
         """
         self.build = build_manifest.build
         self.components = build_manifest.components
         self.artifacts_dir = artifacts_dir
         self.bundle_recorder = bundle_recorder
         self.tmp_dir = TemporaryDirectory(keep=keep)
+        self.compression_level = compression_level
+        self.compression_threads = compression_threads
         self.min_bundle = self.__get_min_bundle(build_manifest.components)
         self.min_dist = self.__get_min_dist(build_manifest.components)
         self.installed_plugins: List[str] = []
+        self.workers = workers
+        self.fast_install = fast_install
 
     def install_min(self) -> None:
         install_script = ScriptFinder.find_install_script(self.min_dist.name)
@@ -70,15 +94,18 @@ class Bundle(ABC):
         self._execute(install_command)
 
     def install_components(self) -> None:
-        for c in self.components.values():
-            if self.min_bundle == c:
-                pass
-            elif "plugins" in c.artifacts:
-                logging.info(f"Installing {c.name}")
-                self.install_plugin(c)
-            else:
-                logging.info(f"Recording {c.name}")
-                self.bundle_recorder.record_component(c)
+        if self.workers > 1:
+            self.__install_components_batched()
+        else:
+            for c in self.components.values():
+                if self.min_bundle == c:
+                    pass
+                elif "plugins" in c.artifacts:
+                    logging.info(f"Installing {c.name}")
+                    self.install_plugin(c)
+                else:
+                    logging.info(f"Recording {c.name}")
+                    self.bundle_recorder.record_component(c)
         plugins_path = os.path.join(self.min_dist.archive_path, "plugins")
         if os.path.isdir(plugins_path):
             self.installed_plugins = os.listdir(plugins_path)
@@ -99,6 +126,14 @@ class Bundle(ABC):
         )
         self._execute(install_command)
 
+    @abstractmethod
+    def install_plugins(self, tmp_paths: List[str]) -> None:
+        """
+        Install plugins that do not have a custom install script, in the order given.
+        :param tmp_paths: Copies of the plugin artifacts.
+        """
+        pass
+
     def package(self, dest: str) -> None:
         self.min_dist.build(self.bundle_recorder.package_name, dest)
 
@@ -107,23 +142,60 @@ class Bundle(ABC):
         subprocess.check_call(command, cwd=self.min_dist.archive_path, shell=True)
 
     def _copy_component(self, component: BuildComponent, component_type: str) -> str:
-        rel_path = self.__get_rel_path(component, component_type)
+        rel_path = self._get_rel_path(component, component_type)
         tmp_path = self.__copy_component_files(rel_path, self.tmp_dir.name)
         self.bundle_recorder.record_component(component, rel_path)
         return tmp_path
 
-    def __get_rel_path(self, component: BuildComponent, component_type: str) -> str:
+    def __install_components_batched(self) -> None:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bundle") as executor:
+            # Copies of the plugins waiting to be installed, by file name
+            batch: Dict[str, concurrent.futures.Future] = {}
+            for c in self.components.values():
+                if self.min_bundle == c:
+                    pass
+                elif "plugins" in c.artifacts:
+                    rel_path = self._get_rel_path(c, "plugins")
+                    if self.__has_custom_install_script(c) or os.path.basename(rel_path) in batch:
+                        self.__install_batch(batch)
+                    if self.__has_custom_install_script(c):
+                        logging.info(f"Installing {c.name}")
+                        self.install_plugin(c)
+                    else:
+                        logging.info(f"Copying {c.name}")
+                        batch[os.path.basename(rel_path)] = executor.submit(self.__copy_component_files, rel_path, self.tmp_dir.name)
+                        self.bundle_recorder.record_component(c, rel_path)
+                else:
+                    logging.info(f"Recording {c.name}")
+                    self.bundle_recorder.record_component(c)
+            self.__install_batch(batch)
+
+    def __install_batch(self, batch: Dict[str, concurrent.futures.Future]) -> None:
+        if batch:
+            tmp_paths = [future.result() for future in batch.values()]
+            logging.info(f"Installing {', '.join(batch.keys())}")
+            self.install_plugins(tmp_paths)
+            batch.clear()
+
+    def __has_custom_install_script(self, component: BuildComponent) -> bool:
+        # The default install.sh does nothing
+        return ScriptFinder.find_install_script(component.name) != os.path.realpath(os.path.join(ScriptFinder.default_scripts_path, "install.sh"))
+
+    def _get_rel_path(self, component: BuildComponent, component_type: str) -> str:
         return next(iter(component.artifacts.get(component_type, [])), None)
 
-    def __copy_component_files(self, rel_path: str, dest: str) -> str:
+    def __get_component_file(self, rel_path: str) -> str:
         local_path = os.path.join(self.artifacts_dir, rel_path)
-        dest_path = os.path.join(dest, os.path.basename(local_path))
-        if os.path.isfile(local_path):
-            # rel path provided, in this case we copy it into dest
-            shutil.copyfile(local_path, dest_path)
-            return os.path.join(dest, os.path.basename(local_path))
-        else:
+        if not os.path.isfile(local_path):
             raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), local_path)
+        return local_path
+
+    def __copy_component_files(self, rel_path: str, dest: str) -> str:
+        local_path = self.__get_component_file(rel_path)
+        # rel path provided, in this case we copy it into dest
+        dest_path = os.path.join(dest, os.path.basename(local_path))
+        shutil.copyfile(local_path, dest_path)
+        return dest_path
 
     def __get_min_bundle(self, build_components: BuildComponents) -> BuildComponent:
         min_bundle = next(iter([c for c in build_components.values() if "dist" in c.artifacts]), None)
@@ -132,12 +204,14 @@ class Bundle(ABC):
         return min_bundle
 
     def __get_min_dist(self, build_components: BuildComponents) -> Dist:
-        min_dist_path = self._copy_component(self.min_bundle, "dist")
-        logging.info(f"Copied min bundle to {min_dist_path}.")
+        rel_path = self._get_rel_path(self.min_bundle, "dist")
+        # The min bundle is extracted from the artifacts directory, it is never modified
+        min_dist_path = self.__get_component_file(rel_path)
+        self.bundle_recorder.record_component(self.min_bundle, rel_path)
         min_path = f"{self.build.filename}-{self.build.version}".replace("-SNAPSHOT", "")
         logging.info(f"Start creating distribution {self.build.distribution} for {self.min_bundle.name}.")
-        min_dist = Dists.create_dist(self.min_bundle.name, min_dist_path, min_path, self.build)
-        logging.info(f"Extracting dist into {self.tmp_dir.name}.")
+        min_dist = Dists.create_dist(self.min_bundle.name, min_dist_path, min_path, self.build, self.compression_level, self.compression_threads)
+        logging.info(f"Extracting {min_dist_path} into {self.tmp_dir.name}.")
         min_dist.extract(self.tmp_dir.name)
         logging.info(f"Extracted dist into {self.tmp_dir.name}.")
         return min_dist
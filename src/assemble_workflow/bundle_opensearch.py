@@ -5,9 +5,12 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import logging
 import os
+from typing import List
 
 from assemble_workflow.bundle import Bundle
+from assemble_workflow.plugin_installer import PluginInstaller
 from manifests.build_manifest import BuildComponent
 from system.os import current_platform
 
@@ -18,7 +21,32 @@ class BundleOpenSearch(Bundle):
         return "opensearch-plugin.bat" if current_platform() == "windows" else "opensearch-plugin"
 
     def install_plugin(self, plugin: BuildComponent) -> None:
-        tmp_path = self._copy_component(plugin, "plugins")
-        cli_path = os.path.join(self.min_dist.archive_path, "bin", self.install_plugin_script)
-        self._execute(f"{cli_path} install --batch file:{tmp_path}")
+        rel_path = self._get_rel_path(plugin, "plugins")
+        # Installed without the CLI, the plugin is read from the artifacts directory instead of a copy
+        if self.__install_fast(os.path.join(self.artifacts_dir, rel_path)):
+            self.bundle_recorder.record_component(plugin, rel_path)
+        else:
+            tmp_path = self._copy_component(plugin, "plugins")
+            self.__install_with_cli([tmp_path])
         super().install_plugin(plugin)
+
+    def install_plugins(self, tmp_paths: List[str]) -> None:
+        # A plugin that extends a plugin waiting for the CLI is installed with the CLI, after it
+        self.__install_with_cli([tmp_path for tmp_path in tmp_paths if not self.__install_fast(tmp_path)])
+
+    def __install_fast(self, path: str) -> bool:
+        if not self.fast_install:
+            return False
+        try:
+            folder = PluginInstaller(self.min_dist.archive_path).install(path)
+            logging.info(f"Installed {os.path.basename(path)} into plugins/{folder}")
+            return True
+        except PluginInstaller.UnsupportedPluginError as e:
+            logging.info(str(e))
+            return False
+
+    def __install_with_cli(self, tmp_paths: List[str]) -> None:
+        if tmp_paths:
+            cli_path = os.path.join(self.min_dist.archive_path, "bin", self.install_plugin_script)
+            # Plugins are installed in the order given, after the plugins they extend
+            self._execute(" ".join([f"{cli_path} install --batch"] + [f"file:{tmp_path}" for tmp_path in tmp_paths]))
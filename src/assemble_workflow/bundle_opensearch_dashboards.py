@@ -6,6 +6,7 @@
 # compatible open source license.
 
 import os
+from typing import List
 
 from assemble_workflow.bundle import Bundle
 from manifests.build_manifest import BuildComponent
@@ -22,3 +23,9 @@ class BundleOpenSearchDashboards(Bundle):
         cli_path = os.path.join(self.min_dist.archive_path, "bin", self.install_plugin_script)
         self._execute(f"{cli_path} --allow-root install file:{tmp_path}")
         super().install_plugin(plugin)
+
+    def install_plugins(self, tmp_paths: List[str]) -> None:
+        cli_path = os.path.join(self.min_dist.archive_path, "bin", self.install_plugin_script)
+        # The CLI installs a single plugin, through a working directory shared by all installs
+        for tmp_path in tmp_paths:
+            self._execute(f"{cli_path} --allow-root install file:{tmp_path}")
@@ -6,6 +6,8 @@
 # compatible open source license.
 
 
+from typing import Optional
+
 from assemble_workflow.bundle import Bundle
 from assemble_workflow.bundle_opensearch import BundleOpenSearch
 from assemble_workflow.bundle_opensearch_dashboards import BundleOpenSearchDashboards
@@ -27,6 +29,16 @@ class Bundles:
         return klass  # type: ignore[return-value]
 
     @classmethod
-    def create(cls, build_manifest: BuildManifest, artifacts_dir: str, bundle_recorder: BundleRecorder, keep: bool) -> Bundle:
+    def create(
+        cls,
+        build_manifest: BuildManifest,
+        artifacts_dir: str,
+        bundle_recorder: BundleRecorder,
+        keep: bool,
+        workers: int = 1,
+        fast_install: bool = False,
+        compression_level: Optional[int] = None,
+        compression_threads: int = 1,
+    ) -> Bundle:
         klass = cls.from_name(build_manifest.build.name)
-        return klass(build_manifest, artifacts_dir, bundle_recorder, keep)  # type: ignore[no-any-return, operator]
+        return klass(build_manifest, artifacts_dir, bundle_recorder, keep, workers, fast_install, compression_level, compression_threads)  # type: ignore[no-any-return, operator]
@@ -5,28 +5,50 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import collections
+import concurrent.futures
 import errno
+import io
 import logging
 import os
 import shutil
 import tarfile
 import zipfile
 from abc import ABC, abstractmethod
+from typing import Deque, Iterator, Optional, Tuple
 
 from assemble_workflow.bundle_linux_deb import BundleLinuxDeb
 from assemble_workflow.bundle_linux_rpm import BundleLinuxRpm
 from manifests.build_manifest import BuildManifest
+from system.parallel_gzip_file import ParallelGzipFile
 from system.zip_file import ZipFile
 
+try:
+    import grp
+    import pwd
+except ImportError:
+    grp = pwd = None  # type: ignore[assignment]
+
 
 class Dist(ABC):
 
-    def __init__(self, name: str, path: str, min_path: str, build_cls: BuildManifest.Build) -> None:
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        min_path: str,
+        build_cls: BuildManifest.Build,
+        compression_level: Optional[int] = None,
+        compression_threads: int = 1,
+    ) -> None:
         self.build_cls = build_cls
         self.name = name
         self.filename = name.lower()
         self.path = path
         self.min_path = min_path
+        # None is the default level of the archive format
+        self.compression_level = compression_level
+        self.compression_threads = compression_threads
 
     @abstractmethod
     def __extract__(self, dest: str) -> None:
@@ -89,33 +111,161 @@ class Dist(ABC):
 
 
 class DistTar(Dist):
+    # Buffers of tar streams and of the files extracted from them
+    BUFFER_SIZE = 1024 * 1024
+    # Larger files are extracted on the reading thread, without holding them in memory
+    MAX_THREADED_FILE_SIZE = 16 * 1024 * 1024
+
     def __extract__(self, dest: str) -> None:
-        with tarfile.open(self.path, "r:gz") as tar:
-            tar.extractall(dest)
+        # The archive is read once, as a stream ("r|gz" rather than "r:gz"): members are extracted in the order they are
+        # read, and hard links point to files that are already extracted, so tarfile never seeks back into the archive
+        with tarfile.open(self.path, "r|gz", bufsize=self.BUFFER_SIZE) as tar:
+            tar.copybufsize = self.BUFFER_SIZE  # type: ignore[attr-defined]
+            if self.compression_threads > 1:
+                self.__extract_threaded(tar, dest)
+            else:
+                tar.extractall(dest)
+
+    def __extract_threaded(self, tar: tarfile.TarFile, dest: str) -> None:
+        directories = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.compression_threads, thread_name_prefix="tar") as executor:
+            # Files are read from the stream in order, and written on several threads
+            pending: Deque[concurrent.futures.Future] = collections.deque()
+            for member in tar:
+                path = self.__member_path(member, dest)
+                if member.isreg() and member.size <= self.MAX_THREADED_FILE_SIZE:
+                    data = tar.extractfile(member).read()
+                    pending.append(executor.submit(self.__write_member, member, path, data))
+                    while len(pending) > 2 * self.compression_threads:
+                        pending.popleft().result()
+                    continue
+                if not member.isreg():
+                    # Links may point to files that are being written
+                    while pending:
+                        pending.popleft().result()
+                if member.isdir():
+                    directories.append((member, path))
+                tar.extract(member, dest, set_attrs=not member.isdir())
+            while pending:
+                pending.popleft().result()
+
+        # Like TarFile.extractall, set the attributes of directories once their files are written
+        for member, path in sorted(directories, key=lambda directory: directory[0].name, reverse=True):
+            self.__set_attrs(member, path)
+
+    @classmethod
+    def __member_path(cls, member: tarfile.TarInfo, dest: str) -> str:
+        parts = member.name.split("/")
+        if member.name.startswith("/") or os.path.isabs(member.name) or ".." in parts:
+            raise tarfile.ExtractError(f"Refusing to extract {member.name} outside of {dest}")
+        return os.path.join(dest, *[part for part in parts if part not in ["", "."]])
+
+    @classmethod
+    def __write_member(cls, member: tarfile.TarInfo, path: str, data: bytes) -> None:
+        # Like TarFile.extract for a regular file
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        cls.__set_attrs(member, path)
+
+    @classmethod
+    def __set_attrs(cls, member: tarfile.TarInfo, path: str) -> None:
+        # Like TarFile.extract: owners are only restored by root, by name when the user or group exists
+        if hasattr(os, "geteuid") and os.geteuid() == 0:
+            uid, gid = member.uid, member.gid
+            try:
+                uid = pwd.getpwnam(member.uname).pw_uid if pwd and member.uname else uid
+            except KeyError:
+                pass
+            try:
+                gid = grp.getgrnam(member.gname).gr_gid if grp and member.gname else gid
+            except KeyError:
+                pass
+            os.chown(path, uid, gid)
+        os.chmod(path, member.mode)
+        os.utime(path, (member.mtime, member.mtime))
 
     def __build__(self, name: str, dest: str) -> None:
-        with tarfile.open(name, "w:gz") as tar:
-            tar.add(self.archive_path, arcname=os.path.basename(self.archive_path))
+        compresslevel = 9 if self.compression_level is None else self.compression_level
+        if self.compression_threads > 1:
+            # Entries are added in the same order, with the same metadata, only compressed in blocks
+            with io.BufferedWriter(ParallelGzipFile(name, compresslevel, self.compression_threads)) as gz:
+                with tarfile.open(fileobj=gz, mode="w|") as tar:
+                    tar.add(self.archive_path, arcname=os.path.basename(self.archive_path), filter=self.__reproducible)
+        else:
+            with tarfile.open(name, "w:gz", compresslevel=compresslevel) as tar:
+                tar.add(self.archive_path, arcname=os.path.basename(self.archive_path), filter=self.__reproducible)
+
+    @classmethod
+    def __reproducible(cls, tarinfo: tarfile.TarInfo) -> tarfile.TarInfo:
+        # See https://reproducible-builds.org/docs/source-date-epoch/
+        source_date_epoch = os.getenv("SOURCE_DATE_EPOCH")
+        if source_date_epoch:
+            tarinfo.mtime = min(tarinfo.mtime, int(source_date_epoch))
+        return tarinfo
 
 
 class DistZip(Dist):
+    # Files that are already compressed, deflating them again takes time and saves nothing
+    STORED_EXTENSIONS = [".jar", ".zip", ".gz", ".tgz", ".bz2", ".xz", ".war", ".png", ".jpg", ".gif", ".woff", ".woff2"]
+    # Larger files are compressed on the writing thread, without holding them in memory
+    MAX_THREADED_FILE_SIZE = 16 * 1024 * 1024
+
     def __extract__(self, dest: str) -> None:
         with ZipFile(self.path, "r") as zip:
-            zip.extractall(dest)
+            if self.compression_threads > 1:
+                members = zip.infolist()
+                # Directories are created first, files are then inflated on several threads
+                for member in members:
+                    parts = [part for part in member.filename.split("/") if part not in ["", ".", ".."]]
+                    os.makedirs(os.path.join(dest, *(parts if member.is_dir() else parts[:-1])), exist_ok=True)
+                with concurrent.futures.ThreadPoolExecutor(max_workers=self.compression_threads, thread_name_prefix="zip") as executor:
+                    for future in [executor.submit(zip.extract, member, dest) for member in members if not member.is_dir()]:
+                        future.result()
+                for member in members:
+                    if member.is_dir():
+                        zip.extract(member, dest)
+            else:
+                zip.extractall(dest)
 
     def __build__(self, name: str, dest: str) -> None:
-        with ZipFile(name, "w", zipfile.ZIP_DEFLATED) as zip:
-            # root               : /tmp/tmp********/opensearch-<version+qualifier>
-            # leadingdir         : opensearch-<version+qualifier>
-            # root no leading dir: /tmp/tmp********/
-            # This is to preserve the leading directory `opensearch-<version+qualifier>` in zip
-            rootlen = len(self.archive_path)
-            leadingdirlen = len(os.path.basename(self.archive_path))
-            noleadingdirlen = rootlen - leadingdirlen
-            for base, _, files in os.walk(self.archive_path):
-                for file in files:
-                    fn = os.path.join(base, file)
-                    zip.write(fn, fn[noleadingdirlen:])
+        with ZipFile(name, "w", zipfile.ZIP_DEFLATED, compresslevel=self.compression_level) as zip:
+            if self.compression_threads > 1:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=self.compression_threads, thread_name_prefix="zip") as executor:
+                    # Files are compressed on several threads, and written in order
+                    pending: Deque[concurrent.futures.Future] = collections.deque()
+                    for fn, arcname in self.__files():
+                        if os.path.getsize(fn) > self.MAX_THREADED_FILE_SIZE:
+                            while pending:
+                                zip.write_compressed(*pending.popleft().result())
+                            zip.write(fn, arcname, self.__compress_type(fn))
+                            continue
+                        pending.append(executor.submit(ZipFile.compress, fn, arcname, self.__compress_type(fn), self.compression_level))
+                        while len(pending) > 2 * self.compression_threads:
+                            zip.write_compressed(*pending.popleft().result())
+                    while pending:
+                        zip.write_compressed(*pending.popleft().result())
+            else:
+                for fn, arcname in self.__files():
+                    zip.write(fn, arcname, self.__compress_type(fn))
+
+    def __files(self) -> Iterator[Tuple[str, str]]:
+        # root               : /tmp/tmp********/opensearch-<version+qualifier>
+        # leadingdir         : opensearch-<version+qualifier>
+        # root no leading dir: /tmp/tmp********/
+        # This is to preserve the leading directory `opensearch-<version+qualifier>` in zip
+        rootlen = len(self.archive_path)
+        leadingdirlen = len(os.path.basename(self.archive_path))
+        noleadingdirlen = rootlen - leadingdirlen
+        for base, _, files in os.walk(self.archive_path):
+            for file in files:
+                fn = os.path.join(base, file)
+                yield fn, fn[noleadingdirlen:]
+
+    def __compress_type(self, fn: str) -> int:
+        if self.compression_level == 0 or os.path.splitext(fn)[1].lower() in self.STORED_EXTENSIONS:
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
 
 
 class DistDeb(Dist):
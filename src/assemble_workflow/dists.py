@@ -5,7 +5,7 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
-from typing import Type
+from typing import Optional, Type
 
 from assemble_workflow.dist import Dist, DistDeb, DistRpm, DistTar, DistZip
 from manifests.build_manifest import BuildManifest
@@ -28,8 +28,16 @@ class Dists:
     }
 
     @classmethod
-    def create_dist(cls, name: str, path: str, min_path: str, build_cls: BuildManifest.Build) -> Dist:
+    def create_dist(
+        cls,
+        name: str,
+        path: str,
+        min_path: str,
+        build_cls: BuildManifest.Build,
+        compression_level: Optional[int] = None,
+        compression_threads: int = 1,
+    ) -> Dist:
         distribution = build_cls.distribution or 'tar'
         dist_cls = cls.DISTRIBUTIONS_MAP[distribution].cls
 
-        return dist_cls(name, path, min_path, build_cls)
+        return dist_cls(name, path, min_path, build_cls, compression_level, compression_threads)
@@ -0,0 +1,169 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import re
+import shutil
+import tempfile
+from typing import List, Optional
+
+from system.os import current_platform
+from system.properties_file import PropertiesFile
+from system.zip_file import ZipFile
+
+"""
+This class installs a plugin zip into an extracted OpenSearch distribution the way `opensearch-plugin install --batch`
+does, without starting a JVM. The zip is extracted into `plugins/.installing-*`, `bin` and `config` are copied into
+`bin/<plugin>` and `config/<plugin>`, the plugin is moved into `plugins/<plugin>`, and the permissions are set like the
+plugin CLI sets them. Before anything is written, the plugin descriptor and zip entries are checked, and a plugin that
+the CLI could reject or would process further, e.g. a plugin with a security policy, raises UnsupportedPluginError so
+that it is installed with the CLI instead. Jar hell is not checked, OpenSearch checks it again when it starts.
+The layout and permissions follow the source of the plugin CLI. TestPluginInstallerParity compares them with those of the
+plugin CLI of a distribution given with OPENSEARCH_DISTRIBUTION, it does not run without one, which is why Bundle only
+uses this class with the experimental --fast-install.
+"""
+
+
+class PluginInstaller:
+    DESCRIPTOR = "plugin-descriptor.properties"
+    POLICY = "plugin-security.policy"
+    REQUIRED_PROPERTIES = ["description", "version", "name", "opensearch.version", "java.version", "classname"]
+    BIN_DIR_PERMS = 0o755
+    BIN_FILES_PERMS = 0o755
+    CONFIG_FILES_PERMS = 0o660
+    PLUGIN_DIR_PERMS = 0o755
+    PLUGIN_FILES_PERMS = 0o644
+
+    class UnsupportedPluginError(Exception):
+        def __init__(self, path: str, reason: str) -> None:
+            super().__init__(f"{os.path.basename(path)} requires the plugin CLI, {reason}.")
+
+    def __init__(self, home: str) -> None:
+        self.home = home
+        self.plugins_path = os.path.join(home, "plugins")
+
+    @property
+    def version(self) -> Optional[str]:
+        """
+        :return: The version of OpenSearch that plugins must be built for, that of its core jar.
+        """
+        lib_path = os.path.join(self.home, "lib")
+        for name in sorted(os.listdir(lib_path)) if os.path.isdir(lib_path) else []:
+            match = re.fullmatch(r"opensearch-(\d+\.\d+\.\d+)(-[A-Za-z0-9]+)*\.jar", name)
+            if match:
+                return match.group(1)
+        return None
+
+    def install(self, zip_path: str) -> str:
+        """
+        Install a plugin.
+
+        :return: The name of the directory the plugin was installed into.
+        :raises UnsupportedPluginError: Before changing the distribution, if the plugin must be installed with the CLI.
+        """
+        with ZipFile(zip_path) as zip:
+            names = zip.namelist()
+            self.__check_entries(zip_path, names)
+            properties = PropertiesFile(zip.read(self.DESCRIPTOR).decode("iso-8859-1"))
+            folder = self.__check_descriptor(zip_path, properties)
+
+            staging_path = tempfile.mkdtemp(prefix=".installing-", dir=self.plugins_path)
+            bin_path = os.path.join(self.home, "bin", folder)
+            try:
+                # Like the CLI, create the parents of directory entries but not the directories themselves
+                for info in zip.infolist():
+                    if info.is_dir():
+                        os.makedirs(os.path.dirname(os.path.join(staging_path, info.filename.rstrip("/"))), exist_ok=True)
+                    else:
+                        zip.extract(info, staging_path)
+                self.__install_bin(os.path.join(staging_path, "bin"), bin_path)
+                self.__install_config(os.path.join(staging_path, "config"), os.path.join(self.home, "config", folder))
+                self.__move(staging_path, os.path.join(self.plugins_path, folder))
+            except Exception:
+                shutil.rmtree(staging_path, ignore_errors=True)
+                shutil.rmtree(bin_path, ignore_errors=True)
+                raise
+        return folder
+
+    def __check_entries(self, zip_path: str, names: List[str]) -> None:
+        if self.DESCRIPTOR not in names:
+            raise PluginInstaller.UnsupportedPluginError(zip_path, f"{self.DESCRIPTOR} is missing")
+        if self.POLICY in names:
+            raise PluginInstaller.UnsupportedPluginError(zip_path, f"it has a {self.POLICY}")
+        for name in names:
+            path = os.path.normpath(name)
+            if name.startswith("opensearch/") or os.path.isabs(name) or path == ".." or path.startswith(f"..{os.sep}"):
+                raise PluginInstaller.UnsupportedPluginError(zip_path, f"of the entry {name}")
+            parts = path.split(os.sep)
+            if parts[0] in ["bin", "config"] and (len(parts) == 1 and not name.endswith("/") or len(parts) > 2):
+                raise PluginInstaller.UnsupportedPluginError(zip_path, f"{parts[0]} must be a directory of files")
+
+    def __check_descriptor(self, zip_path: str, properties: PropertiesFile) -> str:
+        for key in self.REQUIRED_PROPERTIES:
+            if not properties.get_value(key):
+                raise PluginInstaller.UnsupportedPluginError(zip_path, f"{key} is missing from {self.DESCRIPTOR}")
+        name = properties.get_value("name")
+        folder: str = properties.get_value("custom.foldername") or name
+        version = self.version
+        if properties.get_value("opensearch.version") != version:
+            raise PluginInstaller.UnsupportedPluginError(zip_path, f"it was built for OpenSearch {properties.get_value('opensearch.version')}, not {version}")
+        if properties.get_value("has.native.controller", "false") != "false":
+            raise PluginInstaller.UnsupportedPluginError(zip_path, "it has a native controller")
+        if os.path.exists(os.path.join(self.home, "modules", name)):
+            raise PluginInstaller.UnsupportedPluginError(zip_path, f"{name} is a module")
+        for path in [os.path.join(self.plugins_path, name), os.path.join(self.plugins_path, folder), os.path.join(self.home, "bin", folder)]:
+            if os.path.exists(path):
+                raise PluginInstaller.UnsupportedPluginError(zip_path, f"{path} exists")
+        if any(entry.startswith(".removing-") for entry in os.listdir(self.plugins_path)):
+            raise PluginInstaller.UnsupportedPluginError(zip_path, "a plugin failed to be removed")
+        for extended_plugin in (properties.get_value("extended.plugins") or "").split(","):
+            if extended_plugin.strip() and not os.path.isdir(os.path.join(self.plugins_path, extended_plugin.strip())):
+                raise PluginInstaller.UnsupportedPluginError(zip_path, f"it extends {extended_plugin.strip()}, which is not installed")
+        return folder
+
+    def __install_bin(self, src_path: str, dest_path: str) -> None:
+        if not os.path.isdir(src_path):
+            return
+        os.makedirs(dest_path, exist_ok=True)
+        self.__chmod(dest_path, self.BIN_DIR_PERMS)
+        for name in sorted(os.listdir(src_path)):
+            shutil.copyfile(os.path.join(src_path, name), os.path.join(dest_path, name))
+            self.__chmod(os.path.join(dest_path, name), self.BIN_FILES_PERMS)
+        shutil.rmtree(src_path)
+
+    def __install_config(self, src_path: str, dest_path: str) -> None:
+        if not os.path.isdir(src_path):
+            return
+        os.makedirs(dest_path, exist_ok=True)
+        config_stat = os.stat(os.path.dirname(dest_path))
+        self.__chown(dest_path, config_stat)
+        for name in sorted(os.listdir(src_path)):
+            # Config files are left behind when a plugin is removed, and never overwritten
+            if not os.path.exists(os.path.join(dest_path, name)):
+                shutil.copyfile(os.path.join(src_path, name), os.path.join(dest_path, name))
+                self.__chmod(os.path.join(dest_path, name), self.CONFIG_FILES_PERMS)
+                self.__chown(os.path.join(dest_path, name), config_stat)
+        shutil.rmtree(src_path)
+
+    def __move(self, src_path: str, dest_path: str) -> None:
+        os.rename(src_path, dest_path)
+        for root, dirs, files in os.walk(dest_path, topdown=False):
+            parent = os.path.basename(root)
+            executable = parent == "bin" or (parent == "MacOS" and current_platform() == "darwin")
+            for name in files:
+                self.__chmod(os.path.join(root, name), self.BIN_FILES_PERMS if executable else self.PLUGIN_FILES_PERMS)
+            self.__chmod(root, self.PLUGIN_DIR_PERMS)
+
+    @classmethod
+    def __chmod(cls, path: str, mode: int) -> None:
+        if os.name == "posix":
+            os.chmod(path, mode)
+
+    @classmethod
+    def __chown(cls, path: str, owner: os.stat_result) -> None:
+        if os.name == "posix":
+            os.chown(path, owner.st_uid, owner.st_gid)
@@ -7,9 +7,15 @@
 
 import argparse
 import logging
+import os
 import sys
 from typing import IO, List
 
+from build_workflow.build_cache import BuildCache
+from build_workflow.build_shard import BuildShard
+from git.git_ref_cache import GitRefCache
+from system.file_placement import FilePlacement
+
 
 class BuildArgs:
     SUPPORTED_PLATFORMS = ["linux", "darwin", "windows"]
@@ -24,10 +30,32 @@ class BuildArgs:
     components: List[str]
     keep: bool
     platform: str
+    platforms: List[str]
     architecture: str
+    architectures: List[str]
     distribution: str
+    distributions: List[str]
     continue_on_error: bool
     incremental: bool
+    incremental_paths: bool
+    explain: bool
+    plan: bool
+    resume: bool
+    workspace: str
+    workspace_clean: bool
+    prefetch: bool
+    shard: BuildShard
+    merge: bool
+    parallel: int
+    shared_caches: bool
+    shared_caches_dir: str
+    resource_governor: bool
+    memory_budget: int
+    build_cache: bool
+    build_cache_dir: str
+    build_cache_max_size: int
+    ref_cache_ttl: int
+    artifact_placement: str
 
     def __init__(self) -> None:
         parser = argparse.ArgumentParser(description="Build an OpenSearch Distribution")
@@ -62,14 +90,16 @@ class BuildArgs:
             "--platform",
             type=str,
             choices=self.SUPPORTED_PLATFORMS,
-            help="Platform to build."
+            nargs="+",
+            help="Platforms to build."
         )
         parser.add_argument(
             "-a",
             "--architecture",
             type=str,
             choices=self.SUPPORTED_ARCHITECTURES,
-            help="Architecture to build."
+            nargs="+",
+            help="Architectures to build."
         )
         parser.add_argument(
             "-v",
@@ -85,8 +115,9 @@ class BuildArgs:
             "--distribution",
             type=str,
             choices=self.SUPPORTED_DISTRIBUTIONS,
-            help="Distribution to build.",
-            default="tar",
+            nargs="+",
+            help="Distributions to build, each component is checked out once and built for every distribution, platform and architecture.",
+            default=["tar"],
             dest="distribution"
         )
         parser.add_argument(
@@ -96,6 +127,61 @@ class BuildArgs:
             action="store_true",
             help="Do not fail the distribution build on any plugin component failure.",
         )
+        parser.add_argument(
+            "--parallel",
+            dest="parallel",
+            type=int,
+            default=1,
+            help="Number of components to build concurrently, following the depends_on entries in the manifest.",
+        )
+        parser.add_argument(
+            "--no-resource-governor",
+            dest="resource_governor",
+            default=True,
+            action="store_false",
+            help="With --parallel, do not wait for enough free memory and cores before starting a component build.",
+        )
+        parser.add_argument(
+            "--memory-budget",
+            dest="memory_budget",
+            type=float,
+            help="With --parallel, memory in GB that concurrent component builds may use, default is 90%% of the available memory.",
+        )
+        parser.add_argument(
+            "--build-cache",
+            dest="build_cache",
+            default=False,
+            action="store_true",
+            help="Restore components built from source from a local build cache, and store the components that were built in it.",
+        )
+        parser.add_argument(
+            "--build-cache-dir",
+            dest="build_cache_dir",
+            type=str,
+            default=BuildCache.DEFAULT_PATH,
+            help=f"Location of the build cache, default is {BuildCache.DEFAULT_PATH}.",
+        )
+        parser.add_argument(
+            "--build-cache-max-size",
+            dest="build_cache_max_size",
+            type=int,
+            default=BuildCache.DEFAULT_MAX_SIZE // 1024 ** 3,
+            help="Maximum size of the build cache in GB, least recently used entries are evicted first.",
+        )
+        parser.add_argument(
+            "--ref-cache-ttl",
+            dest="ref_cache_ttl",
+            type=int,
+            default=0,
+            help=f"Reuse component refs resolved in the last N seconds, cached in {GitRefCache.DEFAULT_PATH}.",
+        )
+        parser.add_argument(
+            "--artifact-placement",
+            dest="artifact_placement",
+            choices=FilePlacement.STRATEGIES,
+            default="auto",
+            help="How to place artifacts into the output directory, default is to pick the cheapest one per filesystem.",
+        )
         group = parser.add_mutually_exclusive_group()
         group.add_argument(
             "-c",
@@ -113,20 +199,139 @@ class BuildArgs:
             action="store_true",
             help="Given previous build artifacts are present, build incrementally.",
         )
+        parser.add_argument(
+            "--workspace",
+            dest="workspace",
+            help="Keep the checkouts of components in this directory, and update them in place in later builds.",
+        )
+        parser.add_argument(
+            "--workspace-clean",
+            dest="workspace_clean",
+            default=False,
+            action="store_true",
+            help="With --workspace, remove untracked files, including build outputs, from checkouts before building.",
+        )
+        parser.add_argument(
+            "--prefetch",
+            dest="prefetch",
+            default=False,
+            action="store_true",
+            help="Fetch the sources and distributions of all components in the background before they are built.",
+        )
+        parser.add_argument(
+            "--shared-caches",
+            dest="shared_caches",
+            default=False,
+            action="store_true",
+            help="Share a Gradle user home with a local build cache, and Yarn and npm caches, between all components of the build.",
+        )
+        parser.add_argument(
+            "--shared-caches-dir",
+            dest="shared_caches_dir",
+            help="Keep the shared caches in this directory and reuse them in later builds, implies --shared-caches.",
+        )
+        parser.add_argument(
+            "--resume",
+            dest="resume",
+            default=False,
+            action="store_true",
+            help="Resume a build that failed or was interrupted, without rebuilding the components that were finished.",
+        )
+        parser.add_argument(
+            "--explain",
+            dest="explain",
+            default=False,
+            action="store_true",
+            help="With --incremental, show why each component is rebuilt.",
+        )
+        parser.add_argument(
+            "--incremental-paths",
+            dest="incremental_paths",
+            default=False,
+            action="store_true",
+            help="With --incremental, reuse the previous artifacts of components whose changes only touch ignored paths, e.g. documentation.",
+        )
+        parser.add_argument(
+            "--shard",
+            dest="shard",
+            help="Build shard i of N, e.g. 1/4, into its own output directory, then combine the shards with --merge.",
+        )
+        parser.add_argument(
+            "--merge",
+            dest="merge",
+            default=False,
+            action="store_true",
+            help="Merge the build manifests and artifacts of the shards built with --shard into the output directory, without building.",
+        )
+        parser.add_argument(
+            "--plan",
+            dest="plan",
+            default=False,
+            action="store_true",
+            help="Print what the build would do as JSON, with estimated durations from previous builds, without building.",
+        )
 
         args = parser.parse_args()
+        if args.parallel < 1:
+            parser.error("--parallel must be a positive number.")
+        if args.memory_budget is not None and args.memory_budget <= 0:
+            parser.error("--memory-budget must be a positive number.")
+        if args.incremental_paths and not args.incremental:
+            parser.error("--incremental-paths requires --incremental.")
+        if args.explain and not args.incremental:
+            parser.error("--explain requires --incremental.")
+        if args.workspace_clean and not args.workspace:
+            parser.error("--workspace-clean requires --workspace.")
+        if args.plan and args.lock:
+            parser.error("--plan cannot be used with --lock.")
+        distributions = list(dict.fromkeys(args.distribution))
+        platforms = list(dict.fromkeys(args.platform)) if args.platform else None
+        architectures = list(dict.fromkeys(args.architecture)) if args.architecture else None
+        if args.incremental and len(distributions) * len(platforms or [None]) * len(architectures or [None]) > 1:
+            parser.error("--incremental builds a single distribution, platform and architecture.")
+        if args.shard and args.incremental:
+            parser.error("--shard cannot be used with --incremental.")
+        if args.merge and (args.shard or args.incremental or args.plan or args.lock):
+            parser.error("--merge cannot be used with --shard, --incremental, --plan or --lock.")
+        try:
+            shard = BuildShard.parse(args.shard) if args.shard else None
+        except ValueError as e:
+            parser.error(str(e))
         self.logging_level = args.logging_level
         self.manifest = args.manifest
         self.ref_manifest = args.manifest.name + ".lock" if args.lock else None
         self.snapshot = args.snapshot
         self.components = args.components
         self.keep = args.keep
-        self.platform = args.platform
-        self.architecture = args.architecture
-        self.distribution = args.distribution
+        self.platforms = platforms
+        self.platform = platforms[0] if platforms else None
+        self.architectures = architectures
+        self.architecture = architectures[0] if architectures else None
+        self.distributions = distributions
+        self.distribution = distributions[0]
         self.script_path = sys.argv[0].replace("/src/run_build.py", "/build.sh")
         self.continue_on_error = args.continue_on_error
         self.incremental = args.incremental
+        self.incremental_paths = args.incremental_paths
+        self.explain = args.explain
+        self.plan = args.plan
+        self.resume = args.resume
+        # Resolved before the build changes into its temporary directory
+        self.workspace = os.path.realpath(args.workspace) if args.workspace else None
+        self.workspace_clean = args.workspace_clean
+        self.prefetch = args.prefetch
+        self.shard = shard
+        self.merge = args.merge
+        self.parallel = args.parallel
+        self.shared_caches = args.shared_caches or bool(args.shared_caches_dir)
+        self.shared_caches_dir = os.path.realpath(args.shared_caches_dir) if args.shared_caches_dir else None
+        self.resource_governor = args.resource_governor and args.parallel > 1
+        self.memory_budget = int(args.memory_budget * 1024 ** 3) if args.memory_budget else None
+        self.build_cache = args.build_cache
+        self.build_cache_dir = args.build_cache_dir
+        self.build_cache_max_size = args.build_cache_max_size * 1024 ** 3
+        self.ref_cache_ttl = args.ref_cache_ttl
+        self.artifact_placement = args.artifact_placement
 
     def component_command(self, name: str) -> str:
         return " ".join(
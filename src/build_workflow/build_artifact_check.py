@@ -7,6 +7,7 @@
 
 import os
 from abc import ABC, abstractmethod
+from typing import Any, Tuple
 
 from build_workflow.build_target import BuildTarget
 
@@ -15,8 +16,13 @@ class BuildArtifactCheck(ABC):
     class BuildArtifactInvalidError(Exception):
         def __init__(self, path: str, message: str) -> None:
             self.path = path
+            self.message = message
             super().__init__(f"Artifact {os.path.basename(path)} is invalid. {message}")
 
+        def __reduce__(self) -> Tuple[Any, Tuple[str, str]]:
+            # Checks may run in another process, see BuildArtifactValidator
+            return (type(self), (self.path, self.message))
+
     def __init__(self, target: BuildTarget) -> None:
         self.target = target
 
@@ -0,0 +1,151 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+from build_workflow.build_artifact_checks import BuildArtifactChecks
+from build_workflow.build_target import BuildTarget
+
+"""
+This class runs BuildArtifactChecks on a pool of worker processes, so that artifacts are checked while the next ones
+are exported. A single pool checks the artifacts of all targets of a build. Artifacts that passed are remembered by a
+key made of their content hash, file name, artifact type and the versions the target is compatible with, and are not
+inspected again by later builds. Clients wait for the checks of a component for a target with `wait`, which raises the
+first BuildArtifactInvalidError.
+"""
+
+# Keys of the artifacts known to be valid when the pool was started, set in each worker process
+valid_keys: FrozenSet[str] = frozenset()
+
+
+def initialize_worker(keys: FrozenSet[str]) -> None:
+    global valid_keys
+    valid_keys = keys
+
+
+def check_artifact(target: BuildTarget, artifact_type: str, path: str) -> Tuple[str, float, bool]:
+    start = time.time()
+    key = BuildArtifactValidator.key(target, artifact_type, path)
+    if key in valid_keys:
+        return key, time.time() - start, True
+    BuildArtifactChecks.check(target, artifact_type, path)
+    return key, time.time() - start, False
+
+
+class BuildArtifactValidator:
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "opensearch-build", "artifact-checks.json")
+    MAX_KEYS = 100000
+
+    def __init__(self, workers: int = os.cpu_count() or 1, path: str = DEFAULT_PATH) -> None:
+        self.workers = workers
+        self.path = path
+        self.lock = threading.Lock()
+        self.executor: concurrent.futures.ProcessPoolExecutor = None
+        # Checks by output directory of the target and component name
+        self.pending: Dict[Tuple[str, str], List[Tuple[str, concurrent.futures.Future]]] = {}
+        self.times: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self.memoized: Dict[str, int] = {}
+        self.keys: Dict[str, None] = {}
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    self.keys = dict.fromkeys(json.load(f))
+            except (OSError, ValueError) as e:
+                logging.warning(f"Ignoring artifact checks cache {self.path}: {e}")
+
+    @classmethod
+    def key(cls, target: BuildTarget, artifact_type: str, path: str) -> str:
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha.update(chunk)
+        data = {
+            "sha256": sha.hexdigest(),
+            # checks look at file names and extensions
+            "file": os.path.basename(path),
+            "type": artifact_type,
+            "name": target.name,
+            "compatible_versions": target.compatible_versions,
+            "compatible_component_versions": target.compatible_component_versions,
+            "compatible_min_versions": target.compatible_min_versions,
+        }
+        return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+    def submit(self, target: BuildTarget, component_name: str, artifact_type: str, path: str) -> None:
+        if not BuildArtifactChecks.create(target, artifact_type):
+            return
+        with self.lock:
+            if self.executor is None:
+                self.executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    # builds run in threads, do not fork them
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=initialize_worker,
+                    initargs=(frozenset(self.keys),),
+                )
+            future = self.executor.submit(check_artifact, target, artifact_type, path)
+            self.pending.setdefault((target.output_dir, component_name), []).append((artifact_type, future))
+
+    def wait(self, target: BuildTarget, component_name: str) -> None:
+        """
+        Wait for the checks of all artifacts of a component for a target.
+
+        :raises BuildArtifactCheck.BuildArtifactInvalidError: An artifact is invalid.
+        """
+        with self.lock:
+            pending = self.pending.pop((target.output_dir, component_name), [])
+        error: BaseException = None
+        for artifact_type, future in pending:
+            try:
+                key, elapsed, memoized = future.result()
+            except Exception as e:
+                error = error or e
+                continue
+            with self.lock:
+                # most recently used keys last
+                self.keys.pop(key, None)
+                self.keys[key] = None
+                self.times[artifact_type] = self.times.get(artifact_type, 0) + elapsed
+                self.counts[artifact_type] = self.counts.get(artifact_type, 0) + 1
+                self.memoized[artifact_type] = self.memoized.get(artifact_type, 0) + (1 if memoized else 0)
+        if error:
+            raise error
+
+    def close(self) -> None:
+        if self.executor:
+            self.executor.shutdown()
+            self.executor = None
+        for artifact_type in sorted(self.counts.keys()):
+            logging.info(
+                f"Checked {self.counts[artifact_type]} {artifact_type} artifact(s) in {self.times[artifact_type]:.2f}s,"
+                f" {self.memoized[artifact_type]} unchanged"
+            )
+        if not self.counts:
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.realpath(self.path)), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(list(self.keys)[-self.MAX_KEYS:], f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"Unable to save artifact checks cache {self.path}: {e}")
+
+    def __enter__(self) -> 'BuildArtifactValidator':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, exc_traceback: Any) -> None:
+        self.close()
@@ -0,0 +1,166 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import filecmp
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+from typing import Any, Dict, List, Tuple
+
+import yaml
+
+from build_workflow.build_target import BuildTarget
+
+"""
+This class is a local on-disk cache of the artifacts produced by component builds.
+Entries are keyed on the repository URL, the commit ID that was built, the build target and the contents of the
+build script, so that a component is never built twice for the same inputs. Each entry is a directory named after
+its key that contains the artifacts and an `entry.yml` describing them. When the cache grows past its maximum size,
+the least recently used entries are evicted once the build is done. Components that another build sharing the cache is
+building, e.g. the core components built by the first shard of a sharded build, are awaited instead of being rebuilt.
+"""
+
+
+class BuildCache:
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "opensearch-build", "build-cache")
+    DEFAULT_MAX_SIZE = 50 * 1024 ** 3
+    ENTRY_FILE = "entry.yml"
+    # How long to wait for an awaited component to be stored by another build
+    WAIT_TIMEOUT = 4 * 60 * 60
+    WAIT_INTERVAL = 10
+
+    class Entry:
+        def __init__(self, path: str, data: dict) -> None:
+            self.path = path
+            self.component = data["component"]
+            self.repository = data["repository"]
+            self.ref = data["ref"]
+            self.commit_id = data["commit_id"]
+            self.artifacts: Dict[str, List[str]] = data.get("artifacts", {})
+
+        def file(self, artifact_path: str) -> str:
+            return os.path.join(self.path, artifact_path)
+
+        def publish_to_maven_local(self, maven_local: str = os.path.join(os.path.expanduser("~"), ".m2", "repository")) -> None:
+            # A restored component is not built, so downstream components would not find it in maven local otherwise
+            for artifact_path in self.artifacts.get("maven", []):
+                dest = os.path.join(maven_local, os.path.relpath(artifact_path, "maven"))
+                # A SNAPSHOT left in maven local by another build of the component would shadow the cached one
+                if not os.path.isfile(dest) or not filecmp.cmp(self.file(artifact_path), dest, shallow=False):
+                    os.makedirs(os.path.dirname(dest), exist_ok=True)
+                    shutil.copyfile(self.file(artifact_path), dest)
+
+    def __init__(self, path: str = DEFAULT_PATH, max_size: int = DEFAULT_MAX_SIZE, awaited: List[str] = None) -> None:
+        self.path = path
+        self.max_size = max_size
+        self.awaited = awaited or []
+
+    @classmethod
+    def key(cls, repository: str, commit_id: str, target: BuildTarget, build_script: str) -> str:
+        with open(build_script, "rb") as f:
+            build_script_sha = hashlib.sha256(f.read()).hexdigest()
+        data = {
+            "repository": repository,
+            "commit_id": commit_id,
+            "name": target.name,
+            "version": target.version,
+            "qualifier": target.qualifier,
+            "patches": target.patches,
+            "platform": target.platform,
+            "architecture": target.architecture,
+            "snapshot": target.snapshot,
+            "distribution": target.distribution,
+            "build_script": build_script_sha,
+        }
+        return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str, component: str = None) -> 'BuildCache.Entry':
+        """
+        :param component: Component name, an awaited component is waited for until another build stores it.
+        """
+        entry_path = os.path.join(self.path, key)
+        entry_file = os.path.join(entry_path, self.ENTRY_FILE)
+        if component in self.awaited and not os.path.isfile(entry_file):
+            logging.info(f"Waiting for another build to store {component} in build cache {entry_path}")
+            deadline = time.monotonic() + self.WAIT_TIMEOUT
+            while not os.path.isfile(entry_file) and time.monotonic() < deadline:
+                time.sleep(self.WAIT_INTERVAL)
+        if not os.path.isfile(entry_file):
+            return None
+        with open(entry_file, "r") as f:
+            entry = BuildCache.Entry(entry_path, yaml.safe_load(f))
+        # Mark the entry as recently used
+        os.utime(entry_file)
+        return entry
+
+    def put(self, key: str, component: str, git_repo: Any, artifacts: List[Tuple[str, str, str]]) -> None:
+        """
+        Store the artifacts of a component build.
+
+        :param key: Cache key, see BuildCache.key.
+        :param component: Component name.
+        :param git_repo: The repository that was built, with url, ref and sha.
+        :param artifacts: List of (artifact type, relative artifact path, absolute path to file).
+        """
+        entry_path = os.path.join(self.path, key)
+        if os.path.isdir(entry_path):
+            return
+        tmp_path = os.path.join(self.path, f".{key}-{uuid.uuid4().hex}")
+        try:
+            data: Dict[str, Any] = {
+                "component": component,
+                "repository": git_repo.url,
+                "ref": git_repo.ref,
+                "commit_id": git_repo.sha,
+                "artifacts": {},
+            }
+            for artifact_type, artifact_path, artifact_file in artifacts:
+                dest = os.path.join(tmp_path, artifact_path)
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                shutil.copyfile(artifact_file, dest)
+                data["artifacts"].setdefault(artifact_type, []).append(artifact_path)
+            os.makedirs(tmp_path, exist_ok=True)
+            with open(os.path.join(tmp_path, self.ENTRY_FILE), "w") as f:
+                yaml.safe_dump(data, f, sort_keys=False)
+            os.rename(tmp_path, entry_path)
+            logging.info(f"Stored {component} in build cache {entry_path}")
+        except OSError as e:
+            logging.warning(f"Unable to store {component} in build cache: {e}")
+        finally:
+            if os.path.isdir(tmp_path):
+                shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits its maximum size, walks the whole cache.
+        """
+        if not os.path.isdir(self.path):
+            return
+        entries: List[Tuple[float, int, str]] = []
+        for item in os.scandir(self.path):
+            entry_file = os.path.join(item.path, self.ENTRY_FILE)
+            if item.is_dir() and os.path.isfile(entry_file):
+                entries.append((os.path.getmtime(entry_file), self.__size(item.path), item.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            logging.info(f"Evicting {path} from build cache")
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    @classmethod
+    def __size(cls, path: str) -> int:
+        size = 0
+        for dir, _, files in os.walk(path):
+            for file_name in files:
+                size += os.path.getsize(os.path.join(dir, file_name))
+        return size
@@ -0,0 +1,75 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import logging
+import os
+import statistics
+import threading
+from typing import Dict, List, Optional
+
+from build_workflow.build_target import BuildTarget
+
+"""
+This class keeps the durations of the latest component builds in `~/.cache/opensearch-build/build-history.json`, by
+component and target, and estimates how long the next build of a component will take as the median of its latest
+durations for the same target, or for any target when it was never built for this one.
+"""
+
+
+class BuildHistory:
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "opensearch-build", "build-history.json")
+    # Durations kept per component and target
+    MAX_DURATIONS = 10
+
+    def __init__(self, path: str = DEFAULT_PATH) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.durations: Dict[str, Dict[str, List[float]]] = {}
+        self.recorded = False
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    self.durations = json.load(f)
+            except (OSError, ValueError) as e:
+                logging.warning(f"Ignoring build history {self.path}: {e}")
+
+    @classmethod
+    def key(cls, target: BuildTarget) -> str:
+        return f"{target.platform}/{target.architecture}/{target.distribution or 'tar'}"
+
+    def record(self, name: str, target: BuildTarget, seconds: float) -> None:
+        """
+        Record how long a component took to check out, build, export and check, for a target.
+        """
+        with self.lock:
+            durations = self.durations.setdefault(name, {}).setdefault(self.key(target), [])
+            durations.append(round(seconds, 1))
+            del durations[:-self.MAX_DURATIONS]
+            self.recorded = True
+
+    def estimate(self, name: str, target: BuildTarget) -> Optional[float]:
+        """
+        :return: Estimated seconds to build a component for a target, or None if it was never built.
+        """
+        with self.lock:
+            targets = self.durations.get(name, {})
+            durations = targets.get(self.key(target)) or [duration for durations in targets.values() for duration in durations]
+        return round(statistics.median(durations), 1) if durations else None
+
+    def save(self) -> None:
+        with self.lock:
+            if not self.recorded:
+                return
+            try:
+                os.makedirs(os.path.dirname(os.path.realpath(self.path)), exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(self.durations, f, indent=2, sort_keys=True)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logging.warning(f"Unable to save build history {self.path}: {e}")
@@ -5,60 +5,146 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import concurrent.futures
+import fnmatch
 import logging
 import os
-from typing import List
+import subprocess
+from typing import Dict, List, Optional
 
-from manifests.build_manifest import BuildManifest
-from manifests.input_manifest import InputManifest
+from git.git_ref_cache import GitRefCache
+from git.git_repository import GitRepository
+from manifests.build_manifest import BuildComponent, BuildManifest
+from manifests.input_manifest import InputComponent, InputComponentFromSource, InputManifest
 
 
 class BuildIncremental:
-    def __init__(self, input_manifest: InputManifest, distribution: str):
+    # Changes to these paths alone never require a rebuild, components can add their own with `incremental_ignore`
+    IGNORE_PATTERNS = ["*.md", ".github/*", "release-notes/*", ".gitignore", "CODEOWNERS"]
+
+    def __init__(self, input_manifest: InputManifest, distribution: str, ref_cache: GitRefCache = None, paths: bool = False, workers: int = 8):
         self.distribution = distribution
         self.input_manifest = input_manifest
+        self.ref_cache = ref_cache
+        # Compare the paths changed between commits, and skip components whose changes are all ignored
+        self.paths = paths
+        self.workers = workers
+        self.skipped: Dict[str, Dict[str, str]] = {}
+        # Why each component is rebuilt, see explain
+        self.reasons: Dict[str, str] = {}
 
     # Given input manifest and return a list of what components changed and added.
     def commits_diff(self, input_manifest: InputManifest) -> List[str]:
         build_manifest_path = os.path.join(self.distribution, "builds", input_manifest.build.filename, "manifest.yml")
         if not os.path.exists(build_manifest_path):
             logging.info("Previous build manifest does not exist. Rebuilding Core.")
+            self.reasons[input_manifest.build.name.replace(" ", "-")] = "the previous build manifest does not exist"
             return [input_manifest.build.name.replace(" ", "-")]
         previous_build_manifest = BuildManifest.from_path(build_manifest_path)
-        stable_input_manifest = input_manifest.stable()
+        stable_input_manifest = input_manifest.stable(ref_cache=self.ref_cache)
         if previous_build_manifest.build.version != stable_input_manifest.build.version:
             logging.info("The version of previous build manifest doesn't match the current input manifest. Rebuilding Core.")
+            self.reasons[input_manifest.build.name.replace(" ", "-")] = f"the version changed from {previous_build_manifest.build.version}"
             return [input_manifest.build.name.replace(" ", "-")]
         components = []
+        changed = []
         for component in stable_input_manifest.components.select():
             if component.name not in previous_build_manifest.components:
                 components.append(component.name)
+                self.reasons[component.name] = "missing from the previous build manifest"
                 logging.info(f"Adding {component.name} since it is missing from previous build manifest")
                 continue
             if component.ref != previous_build_manifest.components[component.name].commit_id:  # type: ignore[attr-defined]
-                components.append(component.name)
-                logging.info(f"Adding {component.name} because it has different commit ID and needs to be rebuilt.")
+                changed.append(component)
+        if self.paths:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as executor:
+                reasons = list(executor.map(lambda component: self.__ignored_changes(component, previous_build_manifest.components[component.name]), changed))
+        else:
+            reasons = [None] * len(changed)
+        for component, reason in zip(changed, reasons):
+            previous = previous_build_manifest.components[component.name]
+            if reason:
+                self.skipped[component.name] = {
+                    "commit_id": component.ref,  # type: ignore[attr-defined]
+                    "built_commit_id": previous.incremental["commit_id"] if previous.incremental else previous.commit_id,
+                    "reason": reason,
+                }
+                logging.info(f"Skipping {component.name}, {reason}")
                 continue
+            components.append(component.name)
+            self.reasons[component.name] = f"commit changed from {previous.commit_id} to {component.ref}"  # type: ignore[attr-defined]
+            logging.info(f"Adding {component.name} because it has different commit ID and needs to be rebuilt.")
         return components
 
+    def __ignored_changes(self, component: InputComponent, previous: BuildComponent) -> Optional[str]:
+        """
+        Compare the paths changed since the previous build of a component with the ignore patterns.
+
+        :return: Why the component does not need to be rebuilt, or None if it does.
+        """
+        if not isinstance(component, InputComponentFromSource):
+            return None
+        try:
+            paths = GitRepository.changed_paths(component.repository, previous.commit_id, component.ref)
+        except subprocess.CalledProcessError as e:
+            logging.warning(f"Unable to compare {component.name} commits {previous.commit_id} and {component.ref}, rebuilding: {e}")
+            return None
+        patterns = self.IGNORE_PATTERNS + (component.incremental_ignore or [])
+        relevant = [path for path in paths if not any(fnmatch.fnmatchcase(path, pattern) for pattern in patterns)]
+        if relevant:
+            logging.info(f"{component.name} changed {len(relevant)} path(s) that are not ignored, e.g. {relevant[0]}")
+            return None
+        listed = ", ".join(paths[:10]) + (f" and {len(paths) - 10} more" if len(paths) > 10 else "")
+        return f"only ignored paths changed since {previous.commit_id}: {listed or 'none'}"
+
+    def reuse(self, build_manifest: BuildManifest) -> BuildManifest:
+        """
+        Record the components skipped by commits_diff at their new commit ID, keeping their previous artifacts.
+
+        :return: A copy of the build manifest, with why each skipped component was not rebuilt in `incremental`.
+        """
+        if not self.skipped:
+            return build_manifest
+        data = build_manifest.to_dict()
+        for component in data.get("components", []):
+            skipped = self.skipped.get(component["name"], None)
+            if skipped:
+                component["commit_id"] = skipped["commit_id"]
+                component["incremental"] = {"commit_id": skipped["built_commit_id"], "reason": skipped["reason"]}
+                logging.info(f"Reusing the artifacts of {component['name']} built from {skipped['built_commit_id']}")
+        return BuildManifest(data)
+
     # Given updated plugins and look into the depends_on of all components to finalize a list of rebuilding components.
     def rebuild_plugins(self, changed_plugins: List, input_manifest: InputManifest) -> List[str]:
         if not changed_plugins:
             return []
 
-        if any(core in changed_plugins for core in ("OpenSearch", "OpenSearch-Dashboards")):
+        order = input_manifest.topological_order
+        core = next((core for core in ("OpenSearch", "OpenSearch-Dashboards") if core in changed_plugins), None)
+        if core:
             logging.info("Core engine has new changes, rebuilding all components.")
-            return [component.name for component in input_manifest.components.select()]
+            for name in order:
+                self.reasons.setdefault(name, f"{core} changed and every component depends on it")
+            return order
 
-        queue = changed_plugins
-        rebuild_list = []
-
-        rebuild_list.append("OpenSearch-Dashboards") if input_manifest.build.filename == "opensearch-dashboards" else rebuild_list
-        while queue:
-            plugin = queue.pop(0)
-            rebuild_list.append(plugin) if plugin not in rebuild_list else rebuild_list
-            for dependent_plugin in input_manifest.plugins_depend_on(plugin):
-                queue.append(dependent_plugin) if dependent_plugin not in rebuild_list else queue
+        closure = input_manifest.dependents_closure(changed_plugins)
+        if input_manifest.build.filename == "opensearch-dashboards":
+            closure.setdefault("OpenSearch-Dashboards", None)
+            self.reasons.setdefault("OpenSearch-Dashboards", "required to build OpenSearch Dashboards plugins")
+        for name, dependency in closure.items():
+            if dependency:
+                self.reasons.setdefault(name, f"depends on {dependency}")
+        rebuild_list = [name for name in order if name in closure]
 
         logging.info(f"Rebuilding list is {rebuild_list}")
         return rebuild_list
+
+    def explain(self, components: List[str]) -> None:
+        """
+        Log why each component is rebuilt, or not.
+        """
+        logging.info(f"Rebuilding {len(components)} component(s):")
+        for name in components:
+            logging.info(f"  {name}: {self.reasons.get(name, 'selected')}")
+        for name, skipped in self.skipped.items():
+            logging.info(f"  {name}: not rebuilt, {skipped['reason']}")
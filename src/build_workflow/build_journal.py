@@ -0,0 +1,127 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import copy
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from build_workflow.build_target import BuildTarget
+
+"""
+This class keeps a write-ahead journal of a build in its output directory. The build, every recorded component and
+artifact, and every component that finished building are appended to `journal.jsonl` as JSON lines and flushed to
+disk as they happen. When a build that failed or was interrupted is run again with `--resume`, the components that
+finished are loaded from the journal and not rebuilt, unless one of their artifacts is missing from the output directory
+or their ref now points to another commit.
+"""
+
+
+class BuildJournal:
+    FILENAME = "journal.jsonl"
+
+    def __init__(self, target: BuildTarget, resume: bool = False, commit_ids: Optional[Dict[str, str]] = None) -> None:
+        """
+        :param commit_ids: The commit IDs the refs of the components currently resolve to, components that finished
+            building another commit are rebuilt.
+        """
+        self.output_dir = target.output_dir
+        self.commit_ids = commit_ids or {}
+        self.path = os.path.join(target.output_dir, self.FILENAME)
+        self.build = {
+            "name": target.name,
+            "version": target.opensearch_version,
+            "platform": target.platform,
+            "architecture": target.architecture,
+            "distribution": target.distribution,
+        }
+        self.lock = threading.Lock()
+        # Components that finished building in the previous run, as build manifest entries
+        self.finished: Dict[str, Dict[str, Any]] = self.__load() if resume else {}
+        if self.finished:
+            logging.info(f"Resuming the build from {self.path}, {len(self.finished)} component(s) finished: {', '.join(self.finished)}")
+        os.makedirs(target.output_dir, exist_ok=True)
+        self.file = open(self.path, "w")
+        self.record("build", **self.build)
+        for component in self.finished.values():
+            self.__replay(component)
+
+    def __enter__(self) -> 'BuildJournal':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, exc_traceback: Any) -> None:
+        self.close()
+
+    def record(self, event: str, **data: Any) -> None:
+        with self.lock:
+            self.file.write(json.dumps({"event": event, **data}) + "\n")
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+    def complete(self) -> None:
+        """
+        Record that all components were built, a later build with `--resume` starts over.
+        """
+        self.record("complete")
+
+    def close(self) -> None:
+        if not self.file.closed:
+            self.file.close()
+
+    def __replay(self, component: Dict[str, Any]) -> None:
+        data = {key: value for key, value in component.items() if key != "artifacts"}
+        self.record("component", **data)
+        for type, paths in component.get("artifacts", {}).items():
+            for path in paths:
+                self.record("artifact", name=component["name"], type=type, path=path)
+        self.record("finished", name=component["name"])
+
+    def __load(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.isfile(self.path):
+            logging.info(f"No build journal at {self.path}, nothing to resume")
+            return {}
+        components: Dict[str, Dict[str, Any]] = {}
+        finished: Dict[str, Dict[str, Any]] = {}
+        with open(self.path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # The last line may have been cut short when the build was interrupted
+                    logging.warning(f"Ignoring incomplete entry in {self.path}: {line.strip()}")
+                    continue
+                event = entry.pop("event")
+                if event == "build" and entry != self.build:
+                    logging.info(f"The build journal at {self.path} is for a different build, nothing to resume")
+                    return {}
+                elif event == "complete":
+                    logging.info(f"The build journal at {self.path} is for a build that completed, nothing to resume")
+                    return {}
+                elif event == "component":
+                    # A component that is recorded again is being rebuilt
+                    components[entry["name"]] = {**entry, "artifacts": {}}
+                    finished.pop(entry["name"], None)
+                elif event == "artifact" and entry["name"] in components:
+                    components[entry["name"]]["artifacts"].setdefault(entry["type"], []).append(entry["path"])
+                elif event == "finished" and entry["name"] in components:
+                    finished[entry["name"]] = copy.deepcopy(components[entry["name"]])
+        return {name: component for name, component in finished.items() if self.__reusable(component)}
+
+    def __reusable(self, component: Dict[str, Any]) -> bool:
+        commit_id = self.commit_ids.get(component["name"])
+        # a ref that is a commit ID may be abbreviated
+        if commit_id and not component.get("commit_id", "").startswith(commit_id):
+            logging.info(f"Rebuilding {component['name']}, it was built at {component.get('commit_id')} and {component.get('ref')} is now at {commit_id}")
+            return False
+        for paths in component.get("artifacts", {}).values():
+            for path in paths:
+                if not os.path.isfile(os.path.join(self.output_dir, path)):
+                    logging.info(f"Rebuilding {component['name']}, its artifact {path} is missing from {self.output_dir}")
+                    return False
+        return True
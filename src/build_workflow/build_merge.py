@@ -0,0 +1,114 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import logging
+import os
+import re
+from typing import Any, Dict, List
+
+from manifests.build_manifest import BuildManifest
+from system.file_placement import FilePlacement
+
+"""
+This class merges the build manifest fragments written by the shards of a build, see BuildShard, into one build
+manifest. Components that were built by more than one shard, e.g. OpenSearch, are kept once when their entries are
+identical, and any other difference between the fragments is a conflict. Artifacts are placed into the output
+directory with the layout of a build that was not sharded, and the merged manifest is validated before it is written.
+"""
+
+
+class BuildMerge:
+    class ConflictError(Exception):
+        def __init__(self, name: str, first: str, second: str) -> None:
+            super().__init__(f"Conflicting entries for {name} in {first} and {second}.")
+
+    class NoShardsError(Exception):
+        def __init__(self, shards_dir: str) -> None:
+            super().__init__(f"No shards found in {shards_dir}, build them with --shard first.")
+
+    class MissingFragmentsError(Exception):
+        def __init__(self, shards_dir: str, missing: List[str]) -> None:
+            super().__init__(f"Missing build manifest fragments in {shards_dir}: {', '.join(missing)}.")
+
+    def __init__(self, fragments: List[str], output_dir: str, file_placement: FilePlacement = None) -> None:
+        self.fragments = fragments
+        self.output_dir = output_dir
+        self.file_placement = file_placement or FilePlacement()
+
+    @classmethod
+    def find(cls, shards_dir: str) -> List[str]:
+        """
+        Find the fragments of all shards of a build, e.g. tar/shards/opensearch/1-of-2 and tar/shards/opensearch/2-of-2.
+
+        :raises NoShardsError: No shard was built into the directory.
+        :raises MissingFragmentsError: A shard did not write its build manifest.
+        :raises ValueError: Builds with a different number of shards wrote to the same directory.
+        """
+        shards: Dict[int, Dict[int, str]] = {}
+        for entry in sorted(os.listdir(shards_dir)) if os.path.isdir(shards_dir) else []:
+            match = re.fullmatch(r"(\d+)-of-(\d+)", entry)
+            if match:
+                shards.setdefault(int(match.group(2)), {})[int(match.group(1))] = os.path.join(shards_dir, entry)
+        if not shards:
+            raise BuildMerge.NoShardsError(shards_dir)
+        if len(shards) > 1:
+            raise ValueError(f"Found the shards of more than one build in {shards_dir}, built with {', '.join(map(str, sorted(shards)))} shards.")
+        count, fragments = shards.popitem()
+        missing = [f"{index}-of-{count}" for index in range(1, count + 1) if not os.path.isfile(os.path.join(fragments.get(index, ""), "manifest.yml"))]
+        if missing:
+            raise BuildMerge.MissingFragmentsError(shards_dir, missing)
+        return [fragments[index] for index in range(1, count + 1)]
+
+    def merge(self, order: List[str] = []) -> BuildManifest:
+        """
+        Merge the fragments and place their artifacts into the output directory.
+
+        :param List[str] order: Component names, merged components are sorted in this order and others follow.
+        :return: The merged build manifest.
+        :raises ConflictError: Fragments are for different builds, or have different entries for a component or an artifact path.
+        """
+        data: Dict[str, Any] = {}
+        components: Dict[str, Dict[str, Any]] = {}
+        sources: Dict[str, str] = {}
+        paths: Dict[str, str] = {}
+
+        for fragment in self.fragments:
+            manifest = BuildManifest.from_path(os.path.join(fragment, "manifest.yml")).to_dict()
+            if not data:
+                data = manifest
+                sources["build"] = fragment
+            elif {**manifest["build"], "id": None} != {**data["build"], "id": None}:
+                raise BuildMerge.ConflictError("build", sources["build"], fragment)
+
+            for component in manifest.get("components", []):
+                name = component["name"]
+                if name in components:
+                    if components[name] != component:
+                        raise BuildMerge.ConflictError(name, sources[name], fragment)
+                    continue
+                for artifacts in component.get("artifacts", {}).values():
+                    for path in artifacts:
+                        if paths.get(path, name) != name:
+                            raise BuildMerge.ConflictError(path, sources[paths[path]], fragment)
+                        paths[path] = name
+                        dest = os.path.join(self.output_dir, path)
+                        os.makedirs(os.path.dirname(dest), exist_ok=True)
+                        self.file_placement.place(os.path.join(fragment, path), dest)
+                components[name] = component
+                sources[name] = fragment
+            logging.info(f"Merged {len(manifest.get('components', []))} component(s) from {fragment}")
+
+        position = {name: index for index, name in enumerate(order)}
+        data["components"] = sorted(components.values(), key=lambda component: position.get(component["name"], len(position)))
+        return BuildManifest(data)
+
+    def write(self, order: List[str] = []) -> BuildManifest:
+        manifest = self.merge(order)
+        manifest_path = os.path.join(self.output_dir, "manifest.yml")
+        manifest.to_file(manifest_path)
+        logging.info(f"Created build manifest {manifest_path} from {len(self.fragments)} fragment(s)")
+        return manifest
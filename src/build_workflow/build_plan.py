@@ -0,0 +1,135 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import json
+import logging
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from build_workflow.build_history import BuildHistory
+from build_workflow.build_scheduler import BuildScheduler
+from build_workflow.build_target import BuildTarget
+from git.git_repository import GitRepository
+from manifests.input_manifest import InputComponentFromSource, InputManifest
+from paths.script_finder import ScriptFinder
+
+"""
+This class describes what a build would do without building anything, as JSON that schedulers can use to spread
+builds across agents. Components are listed in build order with the commit their ref resolves to and how long that took, their build script,
+the components they wait for, why they are rebuilt by an incremental build, and how long they are expected to take for
+all targets according to BuildHistory. Build scripts are found in the same order as Builder does, looking for one in the
+component's repository in the tree of its commit, fetched without the contents of files. The estimates of the whole build
+are the sum of all components, and the longest chain of dependent components, which bounds a parallel build.
+"""
+
+
+class BuildPlan:
+    # Repositories looked into for build scripts by this many threads
+    WORKERS = 8
+
+    def __init__(
+        self,
+        manifest: InputManifest,
+        targets: List[BuildTarget],
+        components: List[Any],
+        history: BuildHistory,
+        commit_ids: Dict[str, str] = {},
+        reasons: Dict[str, str] = None,
+        incremental: bool = False,
+        resolve_times: Dict[str, float] = {},
+    ) -> None:
+        self.manifest = manifest
+        self.targets = targets
+        self.components = components
+        self.history = history
+        self.commit_ids = commit_ids
+        self.reasons = reasons
+        self.incremental = incremental
+        self.resolve_times = resolve_times
+
+    def to_dict(self) -> Dict[str, Any]:
+        order = {name: index for index, name in enumerate(self.manifest.topological_order)}
+        components = sorted(self.components, key=lambda component: order.get(component.name, len(order)))
+        dependencies = BuildScheduler(components, 1).dependencies
+        from_source = [component for component in components if isinstance(component, InputComponentFromSource)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.WORKERS) as executor:
+            build_scripts = dict(zip([component.name for component in from_source], executor.map(self.__build_script, from_source)))
+
+        entries: List[Dict[str, Any]] = []
+        finish: Dict[str, float] = {}
+        for component in components:
+            estimates = [self.history.estimate(component.name, target) for target in self.targets if component.__matches__(platform=target.platform)]
+            estimate = round(sum(estimates), 1) if estimates and None not in estimates else None
+            entry: Dict[str, Any] = {"name": component.name}
+            if isinstance(component, InputComponentFromSource):
+                entry["repository"] = component.repository
+                entry["ref"] = component.ref
+                entry["commit_id"] = self.commit_ids.get(component.name)
+                entry["resolve_time"] = round(self.resolve_times[component.name], 2) if component.name in self.resolve_times else None
+                entry["build_script"], entry["build_script_in_repository"] = build_scripts[component.name]
+            else:
+                entry["dist"] = component.dist
+            entry["depends_on"] = sorted(dependencies[component.name], key=lambda name: order.get(name, len(order)))
+            if self.reasons is not None:
+                entry["reason"] = self.reasons.get(component.name, "selected")
+            entry["estimate"] = estimate
+            entries.append(entry)
+            finish[component.name] = (estimate or 0) + max([finish.get(name, 0) for name in dependencies[component.name]], default=0)
+
+        return {
+            "build": {
+                "name": self.manifest.build.name,
+                "version": self.manifest.build.version,
+                "qualifier": self.manifest.build.qualifier,
+                "incremental": self.incremental,
+                "targets": [
+                    {
+                        "distribution": target.distribution,
+                        "platform": target.platform,
+                        "architecture": target.architecture,
+                        "output_dir": target.output_dir,
+                    }
+                    for target in self.targets
+                ],
+            },
+            "components": entries,
+            "estimate": {
+                "serial": round(sum(entry["estimate"] or 0 for entry in entries), 1),
+                "critical_path": round(max(finish.values(), default=0), 1),
+                "unknown": [entry["name"] for entry in entries if entry["estimate"] is None],
+            },
+        }
+
+    def write(self, stream: TextIO = None) -> None:
+        json.dump(self.to_dict(), stream or sys.stdout, indent=2)
+        (stream or sys.stdout).write("\n")
+
+    def __build_script(self, component: InputComponentFromSource) -> Tuple[Optional[str], Optional[bool]]:
+        """
+        :return: The build script, a path relative to the root of the component's repository when it has one, and
+            whether it is in the repository; None for both when the repository could not be fetched.
+        """
+        component_script = os.path.realpath(os.path.join(ScriptFinder.component_scripts_path, component.name, "build.sh"))
+        if os.path.exists(component_script):
+            return component_script, False
+        # Same order as ScriptFinder.find_build_script, in the directory Builder runs the build from
+        directory = component.working_directory or ""
+        candidates = [os.path.join(directory, "build.sh"), os.path.join(directory, "scripts", "build.sh")]
+        try:
+            existing = GitRepository.existing_paths(component.repository, self.commit_ids.get(component.name) or component.ref, candidates)
+        except subprocess.CalledProcessError as e:
+            logging.warning(f"Unable to look for a build script in {component.repository}: {e}")
+            return None, None
+        if existing:
+            return existing[0], True
+        try:
+            return ScriptFinder.find_default_build_script(self.manifest.build.name, component.name), False
+        except ScriptFinder.ScriptNotFoundError:
+            return None, False
@@ -0,0 +1,140 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import hashlib
+import logging
+import os
+import subprocess
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import manifests.distribution
+from build_workflow.build_target import BuildTarget
+from git.git_mirror import GitMirror
+from manifests.build_manifest import BuildManifest
+from system.download_pool import DownloadPool
+
+"""
+This class fetches what the components of a build need from the network before they are built, so that downloads
+overlap the builds of the first components instead of running between builds. The ref of every component built from
+source is fetched into a GitMirror that GitRepository checks out from, and the build manifest and artifacts of every
+component from a distribution are downloaded into a directory that BuilderFromDist takes them from. Everything is
+fetched in build order. A fetch that fails is logged, and the builder fetches what it needs itself.
+"""
+
+
+class BuildPrefetch:
+    def __init__(self, mirror: GitMirror, download_dir: str, download_pool: DownloadPool = None, workers: int = 4) -> None:
+        self.mirror = mirror
+        self.download_dir = download_dir
+        self.download_pool = download_pool or DownloadPool.default()
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        self.lock = threading.Lock()
+        self.refs: Dict[Tuple[str, str], concurrent.futures.Future] = {}
+        self.dists: Dict[Tuple[str, str, str, str, str], concurrent.futures.Future] = {}
+        self.artifacts: Dict[str, Tuple[str, concurrent.futures.Future]] = {}
+
+    def start(self, components: List[Any], targets: List[BuildTarget]) -> None:
+        """
+        Start fetching the sources and distributions of components in the background, in the order given.
+        """
+        for component in components:
+            if hasattr(component, "dist"):
+                for target in targets:
+                    dist_key = self.__dist_key(component, target)
+                    if dist_key not in self.dists and component.__matches__(platform=target.platform):
+                        self.dists[dist_key] = self.executor.submit(self.__fetch_dist, *dist_key)
+            elif hasattr(component, "repository") and self.mirror:
+                ref_key = (component.repository, component.ref)
+                if ref_key not in self.refs:
+                    self.refs[ref_key] = self.executor.submit(self.__fetch_ref, *ref_key)
+        logging.info(f"Prefetching {len(self.refs)} repositories and {len(self.dists)} distribution(s)")
+
+    def dist(self, component: Any, target: BuildTarget) -> Optional[Tuple[str, BuildManifest]]:
+        """
+        Wait for the build manifest of a component from a distribution, and for its artifacts to be known.
+
+        :return: The URL of the distribution and its build manifest, or None if they were not prefetched.
+        """
+        future = self.dists.get(self.__dist_key(component, target))
+        if future is None:
+            return None
+        try:
+            distribution_url, build_manifest = future.result()
+            return distribution_url, build_manifest
+        except Exception as e:
+            logging.warning(f"Unable to prefetch {component.dist} for {component.name}: {e}")
+            return None
+
+    def artifact(self, url: str) -> Optional[str]:
+        """
+        Wait for an artifact of a distribution.
+
+        :return: The downloaded file, or None if it was not prefetched.
+        """
+        with self.lock:
+            entry = self.artifacts.get(url)
+        if entry is None:
+            return None
+        dest, future = entry
+        try:
+            future.result()
+            return dest
+        except Exception as e:
+            logging.warning(f"Unable to prefetch {url}: {e}")
+            return None
+
+    def close(self) -> None:
+        """
+        Cancel the fetches and downloads that did not start, e.g. when a build failed, and wait for the running ones.
+        """
+        for future in list(self.refs.values()) + list(self.dists.values()):
+            future.cancel()
+        self.executor.shutdown(wait=True)
+        with self.lock:
+            downloads = [future for _, future in self.artifacts.values()]
+        for future in downloads:
+            future.cancel()
+        concurrent.futures.wait(downloads)
+
+    def __enter__(self) -> 'BuildPrefetch':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, exc_traceback: Any) -> None:
+        self.close()
+
+    @classmethod
+    def __dist_key(cls, component: Any, target: BuildTarget) -> Tuple[str, str, str, str, str]:
+        return (component.name, component.dist, target.platform, target.architecture, target.name.lower().replace(' ', '-'))
+
+    def __fetch_ref(self, url: str, ref: str) -> Optional[str]:
+        try:
+            return self.mirror.fetch(url, ref)
+        except subprocess.CalledProcessError as e:
+            logging.warning(f"Unable to prefetch {url}@{ref}: {e}")
+            return None
+
+    def __fetch_dist(self, name: str, dist: str, platform: str, architecture: str, target_name: str) -> Tuple[str, BuildManifest]:
+        distribution_url = manifests.distribution.find_build_root(dist, platform, architecture, target_name)
+        build_manifest = BuildManifest.from_url(f"{distribution_url}/manifest.yml")
+        component = build_manifest.components[name]
+        for artifact_type, artifacts in component.artifacts.items():
+            # Maven artifacts are not re-published, see BuilderFromDist
+            if artifact_type == "maven":
+                continue
+            for artifact in artifacts:
+                url = f"{distribution_url}/{artifact}"
+                # Artifact checks look at file names
+                dest = os.path.join(self.download_dir, hashlib.sha1(url.encode()).hexdigest()[:16], os.path.basename(artifact))
+                with self.lock:
+                    if url in self.artifacts:
+                        continue
+                    os.makedirs(os.path.dirname(dest), exist_ok=True)
+                    self.artifacts[url] = (dest, self.download_pool.submit(url, dest, verify=True))
+        logging.info(f"Prefetching {name} from {distribution_url}")
+        return distribution_url, build_manifest
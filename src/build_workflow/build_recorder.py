@@ -5,52 +5,172 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import concurrent.futures
 import logging
 import os
-import shutil
-from typing import Any, Dict
+import threading
+from typing import Any, Collection, Dict, List, Tuple
 
 from build_workflow.build_artifact_checks import BuildArtifactChecks
+from build_workflow.build_artifact_validator import BuildArtifactValidator
+from build_workflow.build_journal import BuildJournal
 from build_workflow.build_target import BuildTarget
+from build_workflow.build_tracer import BuildTracer
 from git.git_repository import GitRepository
 from manifests.build_manifest import BuildManifest
+from system.file_placement import FilePlacement
 
 
 class BuildRecorder:
-    def __init__(self, target: BuildTarget, build_manifest: BuildManifest = None) -> None:
+    # Artifacts of a component recorded with record_artifacts are placed by this many threads
+    WORKERS = 8
+
+    def __init__(
+        self,
+        target: BuildTarget,
+        build_manifest: BuildManifest = None,
+        file_placement: FilePlacement = None,
+        artifact_validator: BuildArtifactValidator = None,
+        tracer: BuildTracer = None,
+        journal: BuildJournal = None,
+        skip_maven: Collection[str] = (),
+    ) -> None:
         self.build_manifest = self.BuildManifestBuilder(target, build_manifest)
         self.target = target
         self.name = target.name
+        self.file_placement = file_placement or FilePlacement()
+        self.artifact_validator = artifact_validator
+        self.tracer = tracer or BuildTracer()
+        self.journal = journal
+        # Maven artifacts are the same for every target, a build of several targets records them for the first target
+        # that builds a component only, these components were built for another target
+        self.skip_maven = skip_maven
+        if self.journal:
+            # Components that finished before the build was resumed
+            self.build_manifest.components_hash.update(self.journal.finished)
+        # Artifacts placed in the output directory, recorded in the build manifest once their checks passed
+        self.unchecked: Dict[str, List[Tuple[str, str]]] = {}
+        # Components may be built concurrently, see BuildScheduler
+        self.lock = threading.Lock()
 
     def record_component(self, component_name: str, git_repo: GitRepository) -> None:
-        self.build_manifest.append_component(
-            component_name,
-            self.target.component_version,
-            git_repo.url,
-            git_repo.ref,
-            git_repo.sha,
-        )
+        with self.lock:
+            self.build_manifest.append_component(
+                component_name,
+                self.target.component_version,
+                git_repo.url,
+                git_repo.ref,
+                git_repo.sha,
+            )
+            if self.journal:
+                component = {key: value for key, value in self.build_manifest.components_hash[component_name].items() if key != "artifacts"}
+                self.journal.record("component", **component)
 
     def record_artifact(self, component_name: str, artifact_type: str, artifact_path: str, artifact_file: str) -> None:
+        if component_name in self.skip_maven and artifact_type == "maven":
+            return
         logging.info(f"Recording {artifact_type} artifact for {component_name}: {artifact_path} (from {artifact_file})")
         # Ensure the target directory exists
         dest_file = os.path.join(self.target.output_dir, artifact_path)
         dest_dir = os.path.dirname(dest_file)
         os.makedirs(dest_dir, exist_ok=True)
-        # Check artifact
-        BuildArtifactChecks.check(self.target, artifact_type, artifact_file)
-        # Copy the file
-        shutil.copyfile(artifact_file, dest_file)
+        self.__place(component_name, artifact_type, artifact_path, artifact_file)
+        if self.artifact_validator:
+            self.artifact_validator.submit(self.target, component_name, artifact_type, dest_file)
         # Notify the recorder
+        with self.lock:
+            self.__append(component_name, artifact_type, artifact_path)
+
+    def record_artifacts(self, component_name: str, artifacts: List[Tuple[str, str, str]]) -> None:
+        """
+        Record the artifacts of a component in bulk, e.g. the thousands of maven artifacts of OpenSearch. Destination
+        directories are created once, files are checked and placed by a pool of threads, and the build manifest lists
+        the artifacts in the order given.
+
+        :param artifacts: The type, path in the output directory, and source file of every artifact.
+        """
+        if component_name in self.skip_maven:
+            artifacts = [artifact for artifact in artifacts if artifact[0] != "maven"]
+        if not artifacts:
+            return
+        logging.info(f"Recording {len(artifacts)} artifact(s) for {component_name} into {self.target.output_dir}")
+        for dest_dir in sorted({os.path.dirname(os.path.join(self.target.output_dir, artifact_path)) for _, artifact_path, _ in artifacts}):
+            os.makedirs(dest_dir, exist_ok=True)
+
+        def place(artifact: Tuple[str, str, str]) -> None:
+            artifact_type, artifact_path, artifact_file = artifact
+            logging.debug(f"Recording {artifact_type} artifact for {component_name}: {artifact_path} (from {artifact_file})")
+            self.__place(component_name, artifact_type, artifact_path, artifact_file)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.WORKERS, len(artifacts))) as executor:
+            # Raises the first error, in the order of the artifacts
+            list(executor.map(place, artifacts))
+        if self.artifact_validator:
+            for artifact_type, artifact_path, _ in artifacts:
+                self.artifact_validator.submit(self.target, component_name, artifact_type, os.path.join(self.target.output_dir, artifact_path))
+        with self.lock:
+            for artifact_type, artifact_path, _ in artifacts:
+                self.__append(component_name, artifact_type, artifact_path)
+
+    def __place(self, component_name: str, artifact_type: str, artifact_path: str, artifact_file: str) -> None:
+        dest_file = os.path.join(self.target.output_dir, artifact_path)
+        # Check artifact, in the background when possible
+        if not self.artifact_validator:
+            BuildArtifactChecks.check(self.target, artifact_type, artifact_file)
+        # Copy, link or clone the file
+        with self.tracer.span(artifact_path, "copy", component_name, self.target.output_dir, type=artifact_type) as args:
+            args["method"] = self.file_placement.place(artifact_file, dest_file)
+
+    def __append(self, component_name: str, artifact_type: str, artifact_path: str) -> None:
+        if self.artifact_validator:
+            # Checks run in the background, see check_artifacts
+            self.unchecked.setdefault(component_name, []).append((artifact_type, artifact_path))
+            return
+        self.__record(component_name, artifact_type, artifact_path)
+
+    def __record(self, component_name: str, artifact_type: str, artifact_path: str) -> None:
         self.build_manifest.append_artifact(component_name, artifact_type, artifact_path)
+        if self.journal:
+            self.journal.record("artifact", name=component_name, type=artifact_type, path=artifact_path)
+
+    def check_artifacts(self, component_name: str) -> None:
+        """
+        Wait for the checks of the artifacts of a component, and record them in the build manifest once they all passed.
+
+        :raises BuildArtifactCheck.BuildArtifactInvalidError: An artifact is invalid, the artifacts of the component are removed from the output directory.
+        """
+        if not self.artifact_validator:
+            return
+        with self.lock:
+            unchecked = self.unchecked.pop(component_name, [])
+        try:
+            self.artifact_validator.wait(self.target, component_name)
+        except Exception:
+            for _, artifact_path in unchecked:
+                dest_file = os.path.join(self.target.output_dir, artifact_path)
+                if os.path.lexists(dest_file):
+                    os.unlink(dest_file)
+            raise
+        with self.lock:
+            for artifact_type, artifact_path in unchecked:
+                self.__record(component_name, artifact_type, artifact_path)
+
+    def finish_component(self, component_name: str) -> None:
+        if self.journal:
+            self.journal.record("finished", name=component_name)
 
     def get_manifest(self) -> BuildManifest:
-        return self.build_manifest.to_manifest()
+        with self.lock:
+            return self.build_manifest.to_manifest()
 
     def write_manifest(self) -> None:
         manifest_path = os.path.join(self.target.output_dir, "manifest.yml")
         self.get_manifest().to_file(manifest_path)
         logging.info(f"Created build manifest {manifest_path}")
+        self.tracer.write(os.path.join(self.target.output_dir, "trace.json"), self.target.output_dir)
+        if self.file_placement.stats:
+            stats = ", ".join(f"{count} {used}" for used, count in self.file_placement.stats.most_common())
+            logging.info(f"Placed artifacts in {self.target.output_dir}: {stats}")
 
     class BuildManifestBuilder:
         def __init__(self, target: BuildTarget, build_manifest: BuildManifest = None) -> None:
@@ -0,0 +1,198 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, List
+
+import psutil
+
+"""
+This class governs how many component builds run at once by the memory and CPU they need, rather than by a fixed
+number of workers. Each component has a hint of its peak resident memory and average number of busy cores, learned
+from previous builds and stored in `~/.cache/opensearch-build/resource-hints.json`. A build only starts once its hint
+fits in the memory and cores that are not reserved by running builds, and returns them when it finishes, a build that
+needs more than the whole budget runs alone. While builds run, the process trees they started are sampled with psutil,
+and a build that uses much more memory than its hint, or leaves the host short of memory, is flagged in the log. Build
+scripts run Gradle without a daemon, see `env`, as a daemon is not a descendant of the build that started it. The CPU
+time of processes that exited is counted in the processes that waited for them.
+"""
+
+
+class BuildResources:
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "opensearch-build", "resource-hints.json")
+    # Hint for components that were not built before, a Gradle daemon with a default heap
+    DEFAULT_HINT = {"rss": 2 * 1024 ** 3, "cores": 1.0}
+    # Flag builds that use more than this many times their hint
+    RUNAWAY_FACTOR = 2.0
+    # Flag builds while the host has less than this fraction of its memory available
+    LOW_MEMORY = 0.05
+
+    class Reservation:
+        def __init__(self, name: str, directory: str, hint: Dict[str, float]) -> None:
+            self.name = name
+            self.directory = os.path.realpath(directory)
+            self.hint = hint
+            self.start = time.monotonic()
+            self.rss = 0
+            self.cpu_time = 0.0
+            self.flagged = False
+
+        @property
+        def cores(self) -> float:
+            elapsed = time.monotonic() - self.start
+            return self.cpu_time / elapsed if elapsed > 0 else 0.0
+
+    def __init__(self, memory: int = None, cores: float = None, path: str = DEFAULT_PATH, interval: float = 2.0) -> None:
+        self.path = path
+        self.interval = interval
+        # Keep a tenth of the memory available when the build started for everything else
+        self.memory = memory or int(psutil.virtual_memory().available * 0.9)
+        self.cores = cores or float(os.cpu_count() or 1)
+        self.free = {"rss": float(self.memory), "cores": self.cores}
+        self.condition = threading.Condition()
+        self.running: Dict[str, BuildResources.Reservation] = {}
+        self.hints: Dict[str, Dict[str, float]] = {}
+        self.learned: Dict[str, Dict[str, float]] = {}
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path, "r") as f:
+                    self.hints = json.load(f)
+            except (OSError, ValueError) as e:
+                logging.warning(f"Ignoring resource hints {self.path}: {e}")
+        self.stopped = threading.Event()
+        self.sampler = threading.Thread(target=self.__sample_loop, name="build-resources", daemon=True)
+        self.sampler.start()
+        logging.info(f"Scheduling builds within {self.memory / 1024 ** 3:.1f} GB of memory and {self.cores:g} cores")
+
+    @property
+    def env(self) -> Dict[str, str]:
+        """
+        Environment of a component build script.
+        """
+        return {"GRADLE_OPTS": " ".join(filter(None, [os.environ.get("GRADLE_OPTS"), "-Dorg.gradle.daemon=false"]))}
+
+    def hint(self, name: str) -> Dict[str, float]:
+        hint = {**self.DEFAULT_HINT, **self.hints.get(name, {})}
+        # A build that needs more than the whole budget runs alone
+        return {"rss": min(hint["rss"], self.memory), "cores": min(hint["cores"], self.cores)}
+
+    @contextmanager
+    def reserve(self, name: str, directory: str) -> Generator['BuildResources.Reservation', None, None]:
+        """
+        Wait for the memory and cores a component build needs and hold them for the duration of a block.
+
+        :param str name: The component.
+        :param str directory: The checkout of the component, processes started in it are attributed to the component.
+        """
+        hint = self.hint(name)
+        with self.condition:
+            if not self.__fits(hint):
+                logging.info(f"Waiting for {hint['rss'] / 1024 ** 3:.1f} GB of memory and {hint['cores']:g} cores to build {name}")
+            self.condition.wait_for(lambda: self.__fits(hint))
+            for key in self.free:
+                self.free[key] -= hint[key]
+            reservation = self.Reservation(name, directory, hint)
+            self.running[name] = reservation
+        try:
+            yield reservation
+        finally:
+            self.__sample(reservation)
+            with self.condition:
+                del self.running[name]
+                for key in self.free:
+                    self.free[key] += hint[key]
+                self.condition.notify_all()
+            self.__learn(reservation)
+
+    def close(self) -> None:
+        self.stopped.set()
+        self.sampler.join()
+        for name, learned in self.learned.items():
+            logging.info(f"Resources used by {name}: {learned['rss'] / 1024 ** 3:.1f} GB peak memory, {learned['cores']:.1f} cores")
+        if not self.learned:
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.realpath(self.path)), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self.hints, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"Unable to save resource hints {self.path}: {e}")
+
+    def __enter__(self) -> 'BuildResources':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, exc_traceback: Any) -> None:
+        self.close()
+
+    def __fits(self, hint: Dict[str, float]) -> bool:
+        return not self.running or all(hint[key] <= self.free[key] for key in self.free)
+
+    def __learn(self, reservation: 'BuildResources.Reservation') -> None:
+        if not reservation.rss:
+            # Restored from a cache, or no process was seen
+            return
+        observed = {"rss": float(reservation.rss), "cores": round(reservation.cores, 2)}
+        with self.condition:
+            previous = self.hints.get(reservation.name)
+            # Grow at once, shrink slowly
+            self.hints[reservation.name] = {key: max(value, (previous[key] + value) / 2) if previous else value for key, value in observed.items()}
+            self.learned[reservation.name] = observed
+
+    def __sample_loop(self) -> None:
+        while not self.stopped.wait(self.interval):
+            with self.condition:
+                reservations = list(self.running.values())
+            for reservation in reservations:
+                self.__sample(reservation)
+            memory = psutil.virtual_memory()
+            if reservations and memory.available < memory.total * self.LOW_MEMORY:
+                logging.warning(f"Low on memory while building {', '.join(sorted(reservation.name for reservation in reservations))}")
+
+    def __sample(self, reservation: 'BuildResources.Reservation') -> None:
+        rss = 0
+        cpu_time = 0.0
+        for process in self.__processes(reservation.directory):
+            try:
+                with process.oneshot():
+                    rss += process.memory_info().rss
+                    cpu_times = process.cpu_times()
+                    # Includes the processes that exited since the last sample, once their parent waited for them
+                    cpu_time += cpu_times.user + cpu_times.system + cpu_times.children_user + cpu_times.children_system
+            except psutil.Error:
+                # The process exited
+                continue
+        reservation.rss = max(reservation.rss, rss)
+        reservation.cpu_time = max(reservation.cpu_time, cpu_time)
+        if not reservation.flagged and rss > reservation.hint["rss"] * self.RUNAWAY_FACTOR and reservation.name in self.hints:
+            reservation.flagged = True
+            logging.warning(
+                f"{reservation.name} uses {rss / 1024 ** 3:.1f} GB of memory,"
+                f" more than {self.RUNAWAY_FACTOR:g} times the {reservation.hint['rss'] / 1024 ** 3:.1f} GB it used before"
+            )
+
+    @classmethod
+    def __processes(cls, directory: str) -> List[psutil.Process]:
+        """
+        Find the processes started in a directory by this process, with all their descendants.
+        """
+        processes: List[psutil.Process] = []
+        for child in psutil.Process().children():
+            try:
+                cwd = os.path.realpath(child.cwd())
+                if os.path.commonpath([cwd, directory]) == directory:
+                    processes.append(child)
+                    processes.extend(child.children(recursive=True))
+            except (psutil.Error, ValueError):
+                continue
+        return processes
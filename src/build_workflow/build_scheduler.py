@@ -0,0 +1,104 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import collections
+import concurrent.futures
+import logging
+from typing import Callable, Deque, Dict, List, Set
+
+from manifests.input_manifest import InputComponent
+
+"""
+This class is responsible for building components concurrently on a pool of workers.
+The `depends_on` entries of the selected components form a graph, and a component is only started once all of its
+dependencies were built. The core components (OpenSearch, OpenSearch-Dashboards) are an implicit dependency of every
+other component. Dependencies that are not part of the selection are assumed to be available already.
+"""
+
+
+class BuildScheduler:
+    CORE_COMPONENTS = ["OpenSearch", "OpenSearch-Dashboards"]
+
+    class CycleError(Exception):
+        def __init__(self, components: List[str]) -> None:
+            self.components = components
+            super().__init__(f"Circular dependency between components: {', '.join(components)}.")
+
+    def __init__(self, components: List[InputComponent], workers: int) -> None:
+        self.components: Dict[str, InputComponent] = {component.name: component for component in components}
+        self.workers = workers
+        self.dependencies: Dict[str, Set[str]] = {}
+        cores = [name for name in self.CORE_COMPONENTS if name in self.components]
+        for component in components:
+            dependencies = set(getattr(component, "depends_on", None) or []) & set(self.components.keys())
+            if component.name not in self.CORE_COMPONENTS:
+                dependencies.update(cores)
+            dependencies.discard(component.name)
+            self.dependencies[component.name] = dependencies
+        self.__check_cycles()
+
+    def run(self, build: Callable[[InputComponent], None], can_continue: Callable[[str], bool]) -> List[str]:
+        """
+        Build all components.
+
+        :param build: Builds a single component, raises on failure.
+        :param can_continue: Whether the build may go on after the named component failed.
+        :return: Names of the components that failed, followed by their dependents that were skipped.
+        :raises Exception: The first failure of a component that the build cannot continue without.
+        """
+        pending = {name: set(dependencies) for name, dependencies in self.dependencies.items()}
+        failed: List[str] = []
+        error: BaseException = None
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as executor:
+            running: Dict[concurrent.futures.Future, str] = {}
+            while True:
+                if error is None:
+                    for name in [name for name, dependencies in pending.items() if not dependencies]:
+                        del pending[name]
+                        running[executor.submit(build, self.components[name])] = name
+                if not running:
+                    break
+                finished, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    exception = future.exception()
+                    if exception is None:
+                        for dependencies in pending.values():
+                            dependencies.discard(name)
+                    elif can_continue(name):
+                        failed.append(name)
+                        failed.extend(self.__skip_dependents(name, pending))
+                    elif error is None:
+                        error = exception
+
+        if error is not None:
+            raise error
+        return failed
+
+    def __skip_dependents(self, name: str, pending: Dict[str, Set[str]]) -> List[str]:
+        skipped: List[str] = []
+        queue: Deque[str] = collections.deque([name])
+        while queue:
+            failed = queue.popleft()
+            for dependent in [dependent for dependent, dependencies in pending.items() if failed in dependencies]:
+                logging.error(f"Skipping {dependent} because {failed} did not build")
+                del pending[dependent]
+                skipped.append(dependent)
+                queue.append(dependent)
+        return skipped
+
+    def __check_cycles(self) -> None:
+        pending = {name: set(dependencies) for name, dependencies in self.dependencies.items()}
+        while pending:
+            ready = [name for name, dependencies in pending.items() if not dependencies]
+            if not ready:
+                raise BuildScheduler.CycleError(sorted(pending.keys()))
+            for name in ready:
+                del pending[name]
+            for dependencies in pending.values():
+                dependencies.difference_update(ready)
@@ -0,0 +1,94 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import re
+from typing import Dict, List, Set
+
+from manifests.input_manifest import InputComponent, InputManifest
+
+"""
+This class splits the components of a build into N shards that can be built by separate processes or hosts.
+Each shard is closed under `depends_on`: a component is built with the components it depends on, so that the shard
+can publish them to maven local itself, and a dependency shared by components of different shards is built by each of
+them. Components are assigned to the shard that grows the least, components with the most dependencies first. The core
+components that every other component depends on are in every shard: the first shard builds them, and the others restore
+them from a build cache shared with it, see `awaited`. The partition only depends on the input manifest and the selected
+components, so every shard computes the same one.
+"""
+
+
+class BuildShard:
+    # Components that every other component depends on
+    CORE = ["OpenSearch", "OpenSearch-Dashboards"]
+
+    def __init__(self, index: int, count: int) -> None:
+        if count < 1 or not 1 <= index <= count:
+            raise ValueError(f"Invalid shard {index}/{count}, expected a shard between 1 and the number of shards.")
+        self.index = index
+        self.count = count
+
+    @classmethod
+    def parse(cls, value: str) -> 'BuildShard':
+        match = re.fullmatch(r"(\d+)/(\d+)", value.strip())
+        if not match:
+            raise ValueError(f"Invalid shard {value}, expected i/N, e.g. 1/4.")
+        return cls(int(match.group(1)), int(match.group(2)))
+
+    def __str__(self) -> str:
+        return f"{self.index}-of-{self.count}"
+
+    @classmethod
+    def shards_dir(cls, filename: str, distribution: str, cwd: str = None) -> str:
+        return os.path.join(cwd or os.getcwd(), distribution, "shards", filename)
+
+    def output_dir(self, filename: str, distribution: str, cwd: str = None) -> str:
+        """
+        Where the shard writes its build manifest fragment and artifacts, e.g. tar/shards/opensearch/1-of-4.
+        """
+        return os.path.join(self.shards_dir(filename, distribution, cwd), str(self))
+
+    def partition(self, manifest: InputManifest, names: List[str]) -> List[List[str]]:
+        """
+        Split components into shards.
+
+        :param InputManifest manifest: The manifest that declares the components and their dependencies.
+        :param List[str] names: The selected components, in build order.
+        :return: The components of each shard, in the given order.
+        """
+        shared = [name for name in names if name in self.CORE]
+        others = [name for name in names if name not in self.CORE]
+
+        # Each component with the components it depends on, directly or indirectly
+        closures: Dict[str, Set[str]] = {}
+        for name in manifest.topological_order:
+            if name in others:
+                closures[name] = {name}
+                for dependency in manifest.components[name].depends_on or []:
+                    closures[name] |= closures.get(dependency, set())
+
+        # Largest closures first, ties in build order, each to the shard that grows the least
+        position = {name: index for index, name in enumerate(names)}
+        shards: List[Set[str]] = [set() for _ in range(self.count)]
+        for name in sorted(others, key=lambda name: (-len(closures[name]), position[name])):
+            if not any(name in shard for shard in shards):
+                min(shards, key=lambda shard: len(shard | closures[name])).update(closures[name])
+
+        return [shared + sorted(shard, key=position.__getitem__) for shard in shards]
+
+    def awaited(self, names: List[str]) -> List[str]:
+        """
+        The core components that this shard waits for the first shard to store in a shared build cache.
+        """
+        return [] if self.index == 1 else [name for name in names if name in self.CORE]
+
+    def select(self, manifest: InputManifest, components: List[InputComponent]) -> List[InputComponent]:
+        """
+        Select the components of this shard.
+        """
+        names = set(self.partition(manifest, [component.name for component in components])[self.index - 1])
+        return [component for component in components if component.name in names]
@@ -0,0 +1,242 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import collections
+import glob
+import logging
+import os
+import re
+import shutil
+import tempfile
+from typing import Any, Counter, Dict
+
+"""
+This class provisions the caches of the build tools that component build scripts run, and shares them between all
+components of a build, or between builds when kept in a persistent directory. Gradle runs with a managed
+GRADLE_USER_HOME, so dependencies and wrapper distributions are downloaded once, and with an init script that enables
+a local build cache, so task outputs are reused across components and builds. Yarn and npm use shared cache folders.
+The init script records the outcome of every Gradle task with a build service that listens to task completion, npm
+writes its debug logs, which tell whether each request was served from the cache, next to them, and Yarn, which does
+not log cache hits, is reported by the packages it added to the cache while the component was built. The outcomes
+are reported per component, and are removed when the caches are closed.
+"""
+
+
+class BuildToolCaches:
+    INIT_SCRIPT = """// Managed by opensearch-build, enables a shared local build cache and records task outcomes
+import javax.inject.Inject
+import org.gradle.api.provider.Property
+import org.gradle.api.services.BuildService
+import org.gradle.api.services.BuildServiceParameters
+import org.gradle.build.event.BuildEventsListenerRegistry
+import org.gradle.tooling.events.FinishEvent
+import org.gradle.tooling.events.OperationCompletionListener
+import org.gradle.tooling.events.task.TaskFinishEvent
+import org.gradle.tooling.events.task.TaskSkippedResult
+import org.gradle.tooling.events.task.TaskSuccessResult
+
+interface OpenSearchBuildTaskOutcomesParameters extends BuildServiceParameters {
+    Property<String> getStatsFile()
+}
+
+abstract class OpenSearchBuildTaskOutcomes implements BuildService<OpenSearchBuildTaskOutcomesParameters>, OperationCompletionListener {
+    @Override
+    void onFinish(FinishEvent event) {
+        if (!(event instanceof TaskFinishEvent)) {
+            return
+        }
+        def result = event.result
+        def outcome = result instanceof TaskSkippedResult ? 'skipped' :
+            result instanceof TaskSuccessResult && result.fromCache ? 'from-cache' :
+            result instanceof TaskSuccessResult && result.upToDate ? 'up-to-date' : 'executed'
+        synchronized (OpenSearchBuildTaskOutcomes) {
+            new File(parameters.statsFile.get()) << "${outcome}\\n"
+        }
+    }
+}
+
+abstract class OpenSearchBuildTaskOutcomesPlugin implements Plugin<Gradle> {
+    @Inject
+    abstract BuildEventsListenerRegistry getRegistry()
+
+    void apply(Gradle gradle) {
+        def statsFile = System.getenv('OPENSEARCH_BUILD_GRADLE_STATS')
+        if (statsFile) {
+            def outcomes = gradle.sharedServices.registerIfAbsent('opensearchBuildTaskOutcomes', OpenSearchBuildTaskOutcomes) { spec ->
+                spec.parameters.statsFile.set(statsFile)
+            }
+            registry.onTaskCompletion(outcomes)
+        }
+    }
+}
+
+def cacheDir = System.getenv('OPENSEARCH_BUILD_GRADLE_CACHE')
+if (cacheDir) {
+    settingsEvaluated { settings ->
+        settings.buildCache {
+            local {
+                enabled = true
+                directory = new File(cacheDir)
+            }
+        }
+    }
+}
+apply plugin: OpenSearchBuildTaskOutcomesPlugin
+"""
+
+    def __init__(self, path: str) -> None:
+        self.path = os.path.realpath(path)
+        self.gradle_user_home = os.path.join(self.path, "gradle")
+        self.gradle_build_cache = os.path.join(self.path, "gradle-build-cache")
+        self.yarn_cache = os.path.join(self.path, "yarn")
+        self.npm_cache = os.path.join(self.path, "npm")
+        for directory in [self.gradle_user_home, self.gradle_build_cache, self.yarn_cache, self.npm_cache]:
+            os.makedirs(directory, exist_ok=True)
+        # Task outcomes of this build only, concurrent builds may share the caches
+        self.stats_dir = tempfile.mkdtemp(prefix="build-tool-stats-")
+        self.totals: Counter[str] = collections.Counter()
+        self.npm_totals: Counter[str] = collections.Counter()
+        self.yarn_totals = 0
+        # Packages in the Yarn cache when each component started building
+        self.yarn_packages: Dict[str, int] = {}
+        self.sizes = {directory: self.__size(directory) for directory in [self.gradle_build_cache, self.yarn_cache, self.npm_cache]}
+        self.__write_gradle_settings()
+        logging.info(f"Sharing Gradle, Yarn and npm caches in {self.path}")
+
+    def env(self, component_name: str) -> Dict[str, str]:
+        """
+        Environment of a component build script.
+        """
+        stats = os.path.join(self.stats_dir, f"{component_name}.txt")
+        if os.path.isfile(stats):
+            os.unlink(stats)
+        npm_logs = os.path.join(self.stats_dir, f"{component_name}-npm-logs")
+        shutil.rmtree(npm_logs, ignore_errors=True)
+        self.yarn_packages[component_name] = self.__yarn_package_count()
+        return {
+            "GRADLE_USER_HOME": self.gradle_user_home,
+            "OPENSEARCH_BUILD_GRADLE_CACHE": self.gradle_build_cache,
+            "OPENSEARCH_BUILD_GRADLE_STATS": stats,
+            "YARN_CACHE_FOLDER": self.yarn_cache,
+            "npm_config_cache": self.npm_cache,
+            "npm_config_logs_dir": npm_logs,
+            # npm keeps the last 10 logs by default
+            "npm_config_logs_max": "1000",
+        }
+
+    def stats(self, component_name: str) -> Counter[str]:
+        """
+        Outcomes of the Gradle tasks of the last build of a component, e.g. `from-cache` or `executed`.
+        """
+        stats = os.path.join(self.stats_dir, f"{component_name}.txt")
+        if not os.path.isfile(stats):
+            return collections.Counter()
+        with open(stats, "r") as f:
+            return collections.Counter(line.strip() for line in f if line.strip())
+
+    def npm_stats(self, component_name: str) -> Counter[str]:
+        """
+        Outcomes of the npm requests of the last build of a component, e.g. `cache hit` or `cache miss`.
+        """
+        stats: Counter[str] = collections.Counter()
+        for log in glob.glob(os.path.join(self.stats_dir, f"{component_name}-npm-logs", "*.log")):
+            with open(log, "r", errors="replace") as f:
+                for line in f:
+                    # e.g. `http fetch GET 200 https://registry.npmjs.org/lodash 5ms (cache hit)`
+                    match = re.search(r"\bhttp fetch .*\((cache [a-z]+)\)$", line.strip())
+                    if match:
+                        stats[match.group(1)] += 1
+        return stats
+
+    def yarn_stats(self, component_name: str) -> int:
+        """
+        Packages added to the Yarn cache since the last build of a component started, including those of components built at the same time.
+        """
+        if component_name not in self.yarn_packages:
+            return 0
+        return max(0, self.__yarn_package_count() - self.yarn_packages[component_name])
+
+    def report(self, component_name: str) -> None:
+        stats = self.stats(component_name)
+        if stats:
+            self.totals.update(stats)
+            logging.info(f"Gradle tasks of {component_name}: {self.__describe(stats)}")
+        npm_stats = self.npm_stats(component_name)
+        if npm_stats:
+            self.npm_totals.update(npm_stats)
+            logging.info(f"npm requests of {component_name}: {self.__describe_npm(npm_stats)}")
+        yarn_stats = self.yarn_stats(component_name)
+        if yarn_stats:
+            self.yarn_totals += yarn_stats
+            logging.info(f"Yarn packages added to the cache while building {component_name}: {yarn_stats}")
+
+    def summary(self) -> None:
+        if self.totals:
+            logging.info(f"Gradle tasks of all components: {self.__describe(self.totals)}")
+        if self.npm_totals:
+            logging.info(f"npm requests of all components: {self.__describe_npm(self.npm_totals)}")
+        if self.yarn_totals:
+            logging.info(f"Yarn packages added to the cache: {self.yarn_totals}")
+        for directory, size in self.sizes.items():
+            added = self.__size(directory) - size
+            if added > 0:
+                logging.info(f"Added {added / 1024 ** 2:.1f} MB to {directory}")
+
+    def close(self) -> None:
+        shutil.rmtree(self.stats_dir, ignore_errors=True)
+
+    def __enter__(self) -> 'BuildToolCaches':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, exc_traceback: Any) -> None:
+        self.close()
+
+    @classmethod
+    def __describe(cls, stats: Counter[str]) -> str:
+        cacheable = stats["from-cache"] + stats["executed"]
+        hits = f", {stats['from-cache'] / cacheable:.0%} from the build cache" if cacheable else ""
+        return ", ".join(f"{count} {outcome}" for outcome, count in sorted(stats.items())) + hits
+
+    @classmethod
+    def __describe_npm(cls, stats: Counter[str]) -> str:
+        # a revalidated entry was served from the cache after the registry confirmed it
+        hits = stats["cache hit"] + stats["cache revalidated"]
+        return ", ".join(f"{count} {outcome}" for outcome, count in sorted(stats.items())) + f", {hits / sum(stats.values()):.0%} from the cache"
+
+    def __yarn_package_count(self) -> int:
+        # Yarn 1 keeps each package in a directory of a versioned folder, e.g. v6/npm-lodash-4.17.21-<hash>-integrity
+        count = 0
+        for folder in os.scandir(self.yarn_cache):
+            if folder.is_dir() and re.fullmatch(r"v\d+", folder.name):
+                count += sum(1 for entry in os.scandir(folder.path) if entry.name.startswith("npm-"))
+        return count
+
+    @classmethod
+    def __size(cls, directory: str) -> int:
+        size = 0
+        for dir, _, files in os.walk(directory):
+            for file_name in files:
+                try:
+                    size += os.lstat(os.path.join(dir, file_name)).st_size
+                except OSError:
+                    continue
+        return size
+
+    def __write_gradle_settings(self) -> None:
+        init_dir = os.path.join(self.gradle_user_home, "init.d")
+        os.makedirs(init_dir, exist_ok=True)
+        with open(os.path.join(init_dir, "opensearch-build.gradle"), "w") as f:
+            f.write(self.INIT_SCRIPT)
+
+        # Keep the user's settings, e.g. proxies or JVM arguments, when the managed home is not the user's own
+        properties = []
+        user_properties = os.path.join(os.path.expanduser("~"), ".gradle", "gradle.properties")
+        if os.path.isfile(user_properties) and os.path.realpath(user_properties) != os.path.join(self.gradle_user_home, "gradle.properties"):
+            with open(user_properties, "r") as f:
+                properties = [line.rstrip("\n") for line in f if not line.startswith("org.gradle.caching=")]
+        with open(os.path.join(self.gradle_user_home, "gradle.properties"), "w") as f:
+            f.write("\n".join(properties + ["org.gradle.caching=true"]) + "\n")
@@ -0,0 +1,91 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, List, Tuple
+
+"""
+This class records a timeline of the build as spans, one per component and phase (checkout, build, export, checks),
+with nested spans for individual artifacts. Spans are written in the Chrome trace event format, which can be loaded
+in chrome://tracing or https://ui.perfetto.dev, and summarized in the log as the slowest components and phases.
+Spans of a build with several targets are tagged with the output directory of their target, and each target's trace
+only has its own spans.
+"""
+
+
+class BuildTracer:
+    PHASES = ["checkout", "build", "export", "checks"]
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.lock = threading.Lock()
+        self.events: List[Dict[str, Any]] = []
+        self.threads: Dict[int, int] = {}
+
+    @contextmanager
+    def span(self, name: str, category: str, component: str = None, target: str = None, **args: Any) -> Generator[Dict[str, Any], None, None]:
+        """
+        Record the time spent in a block as a span, yields the span's args which the block may add to.
+
+        :param target: Output directory of the target the span belongs to, see write.
+        """
+        if target:
+            args["target"] = target
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            end = time.perf_counter()
+            with self.lock:
+                tid = self.threads.setdefault(threading.get_ident(), len(self.threads) + 1)
+                self.events.append({
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": round((start - self.start) * 1000000),
+                    "dur": round((end - start) * 1000000),
+                    "pid": os.getpid(),
+                    "tid": tid,
+                    "args": {"component": component, **args} if component else args,
+                })
+
+    def write(self, path: str, target: str = None) -> None:
+        """
+        Write the spans, only those of a target and those that belong to no target when a target is given.
+        """
+        with self.lock:
+            events = sorted(
+                [event for event in self.events if target is None or event["args"].get("target", target) == target],
+                key=lambda event: event["ts"],
+            )
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        logging.info(f"Created build trace {path}")
+
+    def summary(self, top: int = 10) -> None:
+        components: Dict[str, float] = {}
+        phases: List[Tuple[float, str, str]] = []
+        with self.lock:
+            for event in self.events:
+                component = event["args"].get("component", None)
+                if event["cat"] in self.PHASES and component:
+                    seconds = event["dur"] / 1000000
+                    components[component] = components.get(component, 0) + seconds
+                    phases.append((seconds, component, event["cat"]))
+        if not components:
+            return
+        logging.info(f"Slowest components (top {top}):")
+        for component, seconds in sorted(components.items(), key=lambda item: -item[1])[:top]:
+            logging.info(f"  {seconds:10.1f}s  {component}")
+        logging.info(f"Slowest phases (top {top}):")
+        for seconds, component, phase in sorted(phases, reverse=True)[:top]:
+            logging.info(f"  {seconds:10.1f}s  {component} {phase}")
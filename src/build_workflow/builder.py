@@ -22,6 +22,12 @@ class Builder(ABC):
         self.component = component
         self.target = target
 
+    def retarget(self, target: BuildTarget) -> None:
+        """
+        Build the component for another target, the next checkout keeps what was checked out for the previous one.
+        """
+        self.target = target
+
     @abstractmethod
     def checkout(self, work_dir: str) -> None:
         pass
@@ -33,3 +39,9 @@ class Builder(ABC):
     @abstractmethod
     def export_artifacts(self, build_recorder: BuildRecorder) -> None:
         pass
+
+    def finish(self) -> None:
+        """
+        Called once the exported artifacts passed their checks.
+        """
+        pass
@@ -7,14 +7,16 @@
 
 import logging
 import os
-import urllib.request
-from typing import Any
+from typing import Any, List, Tuple
 
 import manifests.distribution
+from build_workflow.build_prefetch import BuildPrefetch
 from build_workflow.build_recorder import BuildRecorder
+from build_workflow.build_target import BuildTarget
 from build_workflow.builder import Builder
 from git.git_repository import GitRepository
 from manifests.build_manifest import BuildManifest
+from system.download_pool import DownloadPool
 
 
 class BuilderFromDist(Builder):
@@ -24,6 +26,10 @@ class BuilderFromDist(Builder):
             self.ref = manifest.ref
             self.sha = manifest.commit_id
 
+    def __init__(self, component: Any, target: BuildTarget, prefetch: BuildPrefetch = None) -> None:
+        super().__init__(component, target)
+        self.prefetch = prefetch
+
     def checkout(self, work_dir: str) -> None:
         self.__download_build_manifest()
 
@@ -40,19 +46,33 @@ class BuilderFromDist(Builder):
         logging.info(f"Downloading {component_manifest.name} {component_manifest.version} ({component_manifest.commit_id}) ...")
         logging.info(f"Distribution was built from {component_manifest.repository}#{component_manifest.ref}")
         build_recorder.record_component(self.component.name, BuilderFromDist.ManifestGitRepository(component_manifest))
+        download_pool = DownloadPool.default()
+        downloads: List[Tuple[str, str, str, Any]] = []
         for artifact_type in component_manifest.artifacts:
             artifact_path = os.path.join(self.output_path, artifact_type)
             logging.info(f"Downloading into {artifact_path} ...")
             if artifact_type not in ["maven"]:  # avoid re-publishing maven artifacts, see https://github.com/opensearch-project/opensearch-build/issues/1279
                 for artifact in component_manifest.artifacts[artifact_type]:
                     artifact_url = f"{self.distribution_url}/{artifact}"
+                    prefetched = self.prefetch.artifact(artifact_url) if self.prefetch else None
+                    if prefetched:
+                        downloads.append((artifact_type, artifact, prefetched, None))
+                        continue
                     artifact_dest = os.path.realpath(os.path.join(self.output_path, artifact))
                     os.makedirs(os.path.dirname(artifact_dest), exist_ok=True)
                     logging.info(f"Downloading {artifact_url} into {artifact_dest}")
-                    urllib.request.urlretrieve(artifact_url, artifact_dest)
-                    build_recorder.record_artifact(self.component.name, artifact_type, artifact, artifact_dest)
+                    downloads.append((artifact_type, artifact, artifact_dest, download_pool.submit(artifact_url, artifact_dest, verify=True)))
+        # Record artifacts in manifest order as their downloads complete
+        for artifact_type, artifact, artifact_dest, download in downloads:
+            if download:
+                download.result()
+            build_recorder.record_artifact(self.component.name, artifact_type, artifact, artifact_dest)
 
     def __download_build_manifest(self) -> None:
+        prefetched = self.prefetch.dist(self.component, self.target) if self.prefetch else None
+        if prefetched:
+            self.distribution_url, self.build_manifest = prefetched
+            return
         self.distribution_url = manifests.distribution.find_build_root(self.component.dist, self.target.platform, self.target.architecture, self.target_name)
         manifest_url = f"{self.distribution_url}/manifest.yml"
         logging.info(f"Downloading {manifest_url} ...")
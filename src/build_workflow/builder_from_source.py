@@ -5,9 +5,20 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import logging
 import os
+import re
+import shutil
+import subprocess
+from typing import Any, List, Tuple
 
+from build_workflow.build_artifact_finder import BuildArtifactFinder
+from build_workflow.build_cache import BuildCache
+from build_workflow.build_prefetch import BuildPrefetch
 from build_workflow.build_recorder import BuildRecorder
+from build_workflow.build_resources import BuildResources
+from build_workflow.build_target import BuildTarget
+from build_workflow.build_tool_caches import BuildToolCaches
 from build_workflow.builder import Builder
 from git.git_repository import GitRepository
 from paths.script_finder import ScriptFinder
@@ -15,20 +26,85 @@ from paths.script_finder import ScriptFinder
 """
 This class is responsible for executing the build for a component and passing the results to a build recorder.
 It will notify the build recorder of build information such as repository and git ref, and any artifacts generated by the build.
-Artifacts found in "<build root>/artifacts/<maven|plugins|libs|dist|core-plugins>" will be recognized and recorded.
+Artifacts found in "<build root>/artifacts/<maven|plugins|libs|dist|core-plugins>" will be recognized and recorded in bulk.
+When a build cache is given, a component that was already built from the same commit for the same target is restored
+from the cache instead of being checked out and built, and the artifacts of a build are stored in the cache by finish,
+once they passed their checks.
+With reuse_checkout, the checkout of a previous build in the same directory is updated in place, so that build tools can
+reuse their outputs and caches in it, e.g. Gradle's up-to-date checks.
+A builder that was retargeted builds the same checkout again for another target.
+With build_tool_caches, the build script runs with the Gradle, Yarn and npm caches shared by all components.
+With prefetch, the component is checked out from the mirror that its ref was prefetched into, see BuildPrefetch.
+With resources, the build script runs in the environment that lets BuildResources attribute its processes to it.
 """
 
 
 class BuilderFromSource(Builder):
+    class CachedGitRepository(GitRepository):
+        def __init__(self, url: str, ref: str, sha: str) -> None:
+            self.url = url
+            self.ref = ref
+            self.sha = sha
+
+    def __init__(
+        self,
+        component: Any,
+        target: BuildTarget,
+        build_cache: BuildCache = None,
+        reuse_checkout: bool = False,
+        clean_checkout: bool = False,
+        build_tool_caches: BuildToolCaches = None,
+        prefetch: BuildPrefetch = None,
+        resources: BuildResources = None,
+    ) -> None:
+        super().__init__(component, target)
+        self.build_cache = build_cache
+        self.build_tool_caches = build_tool_caches
+        self.resources = resources
+        self.prefetch = prefetch
+        self.cached: BuildCache.Entry = None
+        # Exported artifacts that are stored in the build cache once they passed their checks
+        self.artifacts: List[Tuple[str, str, str]] = []
+        self.reuse_checkout = reuse_checkout
+        self.clean_checkout = clean_checkout
+        self.git_repo: GitRepository = None
+
     def checkout(self, work_dir: str) -> None:
+        self.cached = None
+        self.artifacts = []
+        if self.build_cache:
+            commit_id = self.__resolve_commit_id()
+            if commit_id:
+                self.cached = self.build_cache.get(self.__cache_key(commit_id), self.component.name)
+            if self.cached:
+                logging.info(f"Restoring {self.component.name} at {commit_id} from build cache {self.cached.path}")
+                return
+
+        if self.git_repo:
+            # Checked out for another target, never export the artifacts built for it
+            shutil.rmtree(os.path.join(self.git_repo.working_directory, self.output_path), ignore_errors=True)
+            return
+
         self.git_repo = GitRepository(
             self.component.repository,
             self.component.ref,
             os.path.join(work_dir, self.component.name),
             self.component.working_directory,
+            mirror=self.prefetch.mirror if self.prefetch else None,
+            reuse=self.reuse_checkout,
+            clean=self.clean_checkout,
         )
+        if self.reuse_checkout:
+            # Never export the artifacts of a previous build
+            shutil.rmtree(os.path.join(self.git_repo.working_directory, self.output_path), ignore_errors=True)
 
     def build(self, build_recorder: BuildRecorder) -> None:
+        if self.cached:
+            build_recorder.record_component(
+                self.component.name,
+                BuilderFromSource.CachedGitRepository(self.component.repository, self.component.ref, self.cached.commit_id)
+            )
+            return
 
         # List of components whose build scripts support `-d` parameter
         # Bundled plugins do not need `-d` as they are java based zips
@@ -53,14 +129,45 @@ class BuilderFromSource(Builder):
             )
         )
 
-        self.git_repo.execute(build_command)
+        env = {**(self.build_tool_caches.env(self.component.name) if self.build_tool_caches else {}), **(self.resources.env if self.resources else {})}
+        if env:
+            self.git_repo.execute(build_command, env=env)
+        else:
+            self.git_repo.execute(build_command)
+        if self.build_tool_caches:
+            self.build_tool_caches.report(self.component.name)
         build_recorder.record_component(self.component.name, self.git_repo)
 
     def export_artifacts(self, build_recorder: BuildRecorder) -> None:
-        artifacts_path = os.path.join(self.git_repo.working_directory, self.output_path)
-        for artifact_type in ["maven", "dist", "plugins", "libs", "core-plugins"]:
-            for dir, _, files in os.walk(os.path.join(artifacts_path, artifact_type)):
-                for file_name in files:
-                    absolute_path = os.path.join(dir, file_name)
-                    relative_path = os.path.relpath(absolute_path, artifacts_path)
-                    build_recorder.record_artifact(self.component.name, artifact_type, relative_path, absolute_path)
+        if self.cached:
+            build_recorder.record_artifacts(
+                self.component.name,
+                [
+                    (artifact_type, artifact_path, self.cached.file(artifact_path))
+                    for artifact_type, artifact_paths in self.cached.artifacts.items()
+                    for artifact_path in artifact_paths
+                ]
+            )
+            self.cached.publish_to_maven_local()
+            return
+
+        self.artifacts = BuildArtifactFinder.find(os.path.join(self.git_repo.working_directory, self.output_path))
+        build_recorder.record_artifacts(self.component.name, self.artifacts)
+
+    def finish(self) -> None:
+        if self.build_cache and self.artifacts:
+            self.build_cache.put(self.__cache_key(self.git_repo.sha), self.component.name, self.git_repo, self.artifacts)
+
+    def __resolve_commit_id(self) -> str:
+        try:
+            commit_id = GitRepository.stable_ref(self.component.repository, self.component.ref)[0]
+        except subprocess.CalledProcessError as e:
+            logging.warning(f"Unable to resolve {self.component.repository}@{self.component.ref}, skipping build cache: {e}")
+            return None
+        # Refs that do not resolve to a full commit ID cannot be used as a cache key
+        return commit_id if re.match(r"^[0-9a-f]{40}$", commit_id) else None
+
+    def __cache_key(self, commit_id: str) -> str:
+        # Build scripts in the component's repository are covered by the commit ID
+        build_script = ScriptFinder.find_default_build_script(self.target.name, self.component.name)
+        return BuildCache.key(self.component.repository, commit_id, self.target, build_script)
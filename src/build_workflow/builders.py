@@ -7,7 +7,11 @@
 
 from abc import ABC
 
+from build_workflow.build_cache import BuildCache
+from build_workflow.build_prefetch import BuildPrefetch
+from build_workflow.build_resources import BuildResources
 from build_workflow.build_target import BuildTarget
+from build_workflow.build_tool_caches import BuildToolCaches
 from build_workflow.builder import Builder
 from build_workflow.builder_from_dist import BuilderFromDist
 from build_workflow.builder_from_source import BuilderFromSource
@@ -16,10 +20,20 @@ from manifests.input_manifest import InputComponent
 
 class Builders(ABC):
     @classmethod
-    def builder_from(self, component: InputComponent, target: BuildTarget) -> Builder:
+    def builder_from(
+        self,
+        component: InputComponent,
+        target: BuildTarget,
+        build_cache: BuildCache = None,
+        reuse_checkout: bool = False,
+        clean_checkout: bool = False,
+        build_tool_caches: BuildToolCaches = None,
+        prefetch: BuildPrefetch = None,
+        resources: BuildResources = None,
+    ) -> Builder:
         if hasattr(component, "dist"):
-            return BuilderFromDist(component, target)
+            return BuilderFromDist(component, target, prefetch)
         elif hasattr(component, "repository"):
-            return BuilderFromSource(component, target)
+            return BuilderFromSource(component, target, build_cache, reuse_checkout, clean_checkout, build_tool_caches, prefetch, resources)
         else:
             raise ValueError(f"Invalid component type: {type(component)}")
@@ -21,9 +21,10 @@ class CiCheckListSourceRef(CiCheckList):
     def checkout(self, work_dir: str) -> None:
 
         # If ref is commit id, checkout the repository instead, as ls-remote does not allow non-branch/non-tag to be checked
+        # Only the commit is needed, check out the files at the root of the repository only
         if self.component_ref_is_sha1:
             self.git_repo = GitRepository(
-                self.component.repository, self.component.ref, os.path.join(work_dir, self.component.name), self.component.working_directory
+                self.component.repository, self.component.ref, os.path.join(work_dir, self.component.name), self.component.working_directory, sparse_paths=[]
             )
 
         return super().checkout(work_dir)
@@ -33,7 +34,7 @@ class CiCheckListSourceRef(CiCheckList):
 
         if self.component_ref_is_sha1:
             logging.info(f"Detect {self.component.name} with ref {self.component.ref} in sha1 format, treat as commit.")
-            results = subprocess.check_output(f"git cat-file -t {self.component.ref}", shell=True, cwd=self.git_repo.working_directory).decode().strip().split("\t")
+            results = subprocess.check_output(f"git cat-file -t {self.component.ref}", shell=True, cwd=self.git_repo.dir).decode().strip().split("\t")
             check_failure = False if len(results) == 1 and results[0] == 'commit' else True
         else:
             logging.info(f"Treat {self.component.name} with ref {self.component.ref} as branch/tag since it is not sha1 commit")
@@ -0,0 +1,155 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Generator, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+
+class GitMirror:
+    """
+    This class maintains a local cache of bare repositories, one per URL, that is shared by all workflows on a host.
+    A checkout fetches into the mirror incrementally and borrows its objects through git alternates, so checking out
+    a commit that is already known to the mirror needs no network at all.
+    Each mirror is guarded by a file lock, and mirrors that have not been used for `max_age` days are pruned.
+    Enable it for all workflows by pointing the OPENSEARCH_BUILD_GIT_MIRROR environment variable at a directory.
+    A mirror resolves each ref once, later fetches of the same ref through the same GitMirror return the same commit.
+    A shallow mirror only fetches the commits that are checked out, e.g. for a mirror that lives as long as a build.
+    """
+
+    ENVIRONMENT_VARIABLE = "OPENSEARCH_BUILD_GIT_MIRROR"
+    DEFAULT_MAX_AGE = 30
+
+    def __init__(self, path: str, max_age: int = DEFAULT_MAX_AGE, shallow: bool = False) -> None:
+        self.path = os.path.realpath(path)
+        self.max_age = max_age
+        self.shallow = shallow
+        self.fetched: Dict[Tuple[str, str], str] = {}
+        self.fetched_lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls) -> 'GitMirror':
+        path = os.getenv(cls.ENVIRONMENT_VARIABLE)
+        return cls(path) if path else None
+
+    def repository_path(self, url: str) -> str:
+        return os.path.join(self.path, hashlib.sha1(url.encode()).hexdigest() + ".git")
+
+    def fetch(self, url: str, ref: str) -> str:
+        """
+        Make a ref available in the mirror of a repository.
+
+        :param url: Repository URL.
+        :param ref: A commit ID, branch or tag.
+        :return: The commit ID the ref resolved to.
+        """
+        path = self.repository_path(url)
+        with self.lock(url):
+            with self.fetched_lock:
+                sha = self.fetched.get((url, ref))
+            if sha:
+                return sha
+            if not os.path.isdir(path):
+                logging.info(f"Creating mirror of {url} in {path}")
+                os.makedirs(path)
+                self.__execute("git init --bare", path)
+                self.__execute(f"git remote add origin {url}", path)
+                self.prune()
+            if re.match(r"^[0-9a-f]{40}$", ref) and self.__has_commit(ref, path):
+                logging.info(f"Found {url}@{ref} in mirror {path}")
+                sha = ref
+            else:
+                self.__execute(f"git fetch{' --depth 1' if self.shallow else ''} origin {ref}", path)
+                sha = self.__output("git rev-parse FETCH_HEAD", path)
+                # Keep every fetched commit reachable so that it survives garbage collection
+                self.__execute(f"git update-ref refs/mirror/{sha} {sha}", path)
+            os.utime(path)
+            with self.fetched_lock:
+                self.fetched[(url, ref)] = sha
+        return sha
+
+    def borrow(self, url: str, directory: str) -> None:
+        """
+        Let the repository checked out in a directory use the objects of the mirror.
+        """
+        alternates = os.path.join(directory, ".git", "objects", "info", "alternates")
+        objects = os.path.join(self.repository_path(url), "objects")
+        os.makedirs(os.path.dirname(alternates), exist_ok=True)
+        existing: List[str] = []
+        if os.path.isfile(alternates):
+            with open(alternates, "r") as f:
+                existing = f.read().splitlines()
+        # A checkout that is updated in place borrows from the same mirror again
+        if objects not in existing:
+            with open(alternates, "a") as f:
+                f.write(objects + "\n")
+        shallow = os.path.join(self.repository_path(url), "shallow")
+        if os.path.isfile(shallow):
+            # Parents of shallow commits are missing from the mirror, and must not be looked for
+            shutil.copyfile(shallow, os.path.join(directory, ".git", "shallow"))
+
+    @contextmanager
+    def lock(self, url: str, blocking: bool = True) -> Generator[bool, None, None]:
+        os.makedirs(self.path, exist_ok=True)
+        with open(self.repository_path(url) + ".lock", "w") as f:
+            locked = True
+            if fcntl:
+                try:
+                    fcntl.flock(f, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    locked = False
+            try:
+                yield locked
+            finally:
+                if fcntl and locked:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def prune(self) -> List[str]:
+        """
+        Remove mirrors that have not been used for `max_age` days, skipping mirrors that are in use.
+
+        :return: Paths of the removed mirrors.
+        """
+        pruned: List[str] = []
+        cutoff = time.time() - self.max_age * 24 * 60 * 60
+        for item in os.scandir(self.path):
+            if not item.is_dir() or not item.name.endswith(".git") or item.stat().st_mtime >= cutoff:
+                continue
+            lock_path = item.path + ".lock"
+            with open(lock_path, "w") as f:
+                if fcntl:
+                    try:
+                        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except BlockingIOError:
+                        continue
+                logging.info(f"Pruning mirror {item.path}, unused for more than {self.max_age} days")
+                shutil.rmtree(item.path, ignore_errors=True)
+                pruned.append(item.path)
+        return pruned
+
+    def __has_commit(self, sha: str, path: str) -> bool:
+        return subprocess.call(f"git cat-file -e {sha}^{{commit}}", cwd=path, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) == 0
+
+    def __execute(self, command: str, cwd: str) -> None:
+        logging.info(f'Executing "{command}" in {cwd}')
+        subprocess.check_call(command, cwd=cwd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def __output(self, command: str, cwd: str) -> str:
+        logging.info(f'Executing "{command}" in {cwd}')
+        return subprocess.check_output(command, cwd=cwd, shell=True).decode().strip()
@@ -0,0 +1,84 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+import yaml
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+
+class GitRefCache:
+    """
+    This class remembers the commit IDs that refs of remote repositories resolved to, for `ttl` seconds.
+    It lets back-to-back invocations in one pipeline resolve each ref only once, see InputManifest.stable.
+    Entries are kept in a YAML file keyed on repository URL and ref, and may be used from several threads.
+    Saving merges the entries with those saved by other processes in the meantime, under a file lock.
+    """
+
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "opensearch-build", "refs.yml")
+
+    def __init__(self, ttl: int, path: str = DEFAULT_PATH) -> None:
+        self.ttl = ttl
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, dict]] = self.__load()
+
+    def get(self, url: str, ref: str) -> Optional[List[str]]:
+        with self.lock:
+            entry = self.entries.get(url, {}).get(ref, None)
+            if entry is None or entry["time"] < time.time() - self.ttl:
+                return None
+            return [entry["sha"], entry["name"]]
+
+    def put(self, url: str, ref: str, stable_ref: List[str]) -> None:
+        with self.lock:
+            self.entries.setdefault(url, {})[ref] = {"sha": stable_ref[0], "name": stable_ref[1], "time": time.time()}
+
+    def save(self) -> None:
+        with self.lock:
+            try:
+                os.makedirs(os.path.dirname(os.path.realpath(self.path)), exist_ok=True)
+                with open(f"{self.path}.lock", "w") as lock_file:
+                    if fcntl:
+                        fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    # Keep the newest entry of each ref, whichever process resolved it
+                    entries = self.__load()
+                    for url, refs in self.entries.items():
+                        for ref, entry in refs.items():
+                            saved = entries.setdefault(url, {}).get(ref)
+                            if saved is None or saved["time"] < entry["time"]:
+                                entries[url][ref] = entry
+                    cutoff = time.time() - self.ttl
+                    self.entries = {}
+                    for url, refs in entries.items():
+                        refs = {ref: entry for ref, entry in refs.items() if entry["time"] >= cutoff}
+                        if refs:
+                            self.entries[url] = refs
+                    tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                    with open(tmp_path, "w") as f:
+                        yaml.safe_dump(self.entries, f)
+                    os.replace(tmp_path, self.path)
+            except OSError as e:
+                logging.warning(f"Unable to save ref cache {self.path}: {e}")
+
+    def __load(self) -> Dict[str, Dict[str, dict]]:
+        if not os.path.isfile(self.path):
+            return {}
+        try:
+            with open(self.path, "r") as f:
+                return yaml.safe_load(f) or {}
+        except (OSError, yaml.YAMLError) as e:
+            logging.warning(f"Ignoring ref cache {self.path}: {e}")
+            return {}
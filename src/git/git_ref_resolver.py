@@ -0,0 +1,71 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import time
+from typing import Any, Dict, List, Tuple
+
+from git.git_ref_cache import GitRefCache
+from git.git_repository import GitRepository
+
+
+class GitRefResolver:
+    """
+    This class resolves the refs of many repositories to commit IDs on a pool of `workers` threads.
+    Refs of the same repository are resolved together with a single `git ls-remote`, and refs found in the optional
+    GitRefCache are not resolved again. Clients can obtain the time spent on each repository with "times".
+    """
+
+    def __init__(self, workers: int = 8, ref_cache: GitRefCache = None) -> None:
+        self.workers = workers
+        self.ref_cache = ref_cache
+        self.times: Dict[str, float] = {}
+
+    def resolve(self, refs: Dict[str, List[str]]) -> Dict[Tuple[str, str], List[str]]:
+        """
+        :param refs: Refs to resolve by repository URL.
+        :return: A [commit ID, ref name] pair by (repository URL, ref), see GitRepository.stable_ref.
+        """
+        results: Dict[Tuple[str, str], List[str]] = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self.__resolve, url, list(dict.fromkeys(url_refs))): url for url, url_refs in refs.items()}
+            for future, url in futures.items():
+                stable_refs, self.times[url] = future.result()
+                for ref, stable_ref in stable_refs.items():
+                    results[(url, ref)] = stable_ref
+        if self.ref_cache:
+            self.ref_cache.save()
+        return results
+
+    def stabilize(self, components: List[Any]) -> Dict[str, float]:
+        """
+        Resolve the refs of manifest components built from source, and stabilize each component with its commit ID.
+
+        :return: The time spent on the repository of each component, by component name.
+        """
+        refs: Dict[str, List[str]] = {}
+        for component in components:
+            refs.setdefault(component.repository, []).append(component.ref)
+        stable_refs = self.resolve(refs)
+        for component in components:
+            component.__stabilize__(stable_refs[(component.repository, component.ref)])
+        return {component.name: self.times[component.repository] for component in components}
+
+    def __resolve(self, url: str, refs: List[str]) -> Tuple[Dict[str, List[str]], float]:
+        start = time.time()
+        stable_refs: Dict[str, List[str]] = {}
+        for ref in refs:
+            cached = self.ref_cache.get(url, ref) if self.ref_cache else None
+            if cached:
+                stable_refs[ref] = cached
+        missing = [ref for ref in refs if ref not in stable_refs]
+        if missing:
+            for ref, stable_ref in GitRepository.stable_refs(url, missing).items():
+                stable_refs[ref] = stable_ref
+                if self.ref_cache:
+                    self.ref_cache.put(url, ref, stable_ref)
+        return stable_refs, time.time() - start
@@ -9,9 +9,10 @@ import logging
 import os
 import subprocess
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Dict, List
 
 from git.git_commit import GitCommit
+from git.git_mirror import GitMirror
 from system.temporary_directory import TemporaryDirectory
 
 
@@ -21,17 +22,44 @@ class GitRepository:
     This class checks out a Git repository at a particular ref into an empty named directory (or temporary a directory if no named directory is given).
     Temporary directories will be automatically deleted when the GitRepository object goes out of scope; named directories will be left alone.
     Clients can obtain the actual commit ID by querying the "sha" attribute, and the temp directory name with "dir".
+    When a GitMirror is given, or configured with OPENSEARCH_BUILD_GIT_MIRROR, objects are fetched into the mirror and shared with the checkout.
+    With reuse, an existing checkout in the named directory is updated in place with a fetch and a hard reset, keeping untracked files such as build outputs unless clean is set.
+    A named directory that is not a git checkout is never removed, it is only checked out into when it is empty.
+    With sparse_paths, only those directories and the files at the root of the repository are checked out (a cone mode sparse checkout), from a blob-less partial clone that
+    downloads the contents of files on demand; an empty list checks out the files at the root only. A mirror is never blob-less, it fetches the contents of all files.
+    Sparse checkouts are for repositories that are read, not built: a Gradle build in a subdirectory also needs directories at the root, e.g. gradle/wrapper or buildSrc.
     """
 
-    def __init__(self, url: str, ref: str, directory: str = None, working_subdirectory: str = None) -> None:
+    def __init__(
+        self,
+        url: str,
+        ref: str,
+        directory: str = None,
+        working_subdirectory: str = None,
+        mirror: GitMirror = None,
+        reuse: bool = False,
+        clean: bool = False,
+        sparse_paths: List[str] = None,
+    ) -> None:
         self.url = url
         self.ref = ref
+        self.sparse_paths = sparse_paths
+        self.mirror = mirror or GitMirror.from_environment()
         if directory is None:
             self.temp_dir = TemporaryDirectory()
             self.dir = os.path.realpath(self.temp_dir.name)
         else:
             self.temp_dir = None
             self.dir = directory
+            if reuse and os.path.isdir(os.path.join(self.dir, ".git")):
+                self.working_subdirectory = working_subdirectory
+                self.__update__(clean)
+                return
+            if reuse and os.path.isdir(self.dir) and not os.listdir(self.dir):
+                # Left over from a checkout that was interrupted before `git init`
+                os.rmdir(self.dir)
+            elif reuse and os.path.exists(self.dir):
+                raise FileExistsError(f"Unable to check out {self.url} into {self.dir}, it is not a git checkout and is not empty")
             os.makedirs(self.dir, exist_ok=False)
         self.working_subdirectory = working_subdirectory
         self.__checkout__()
@@ -46,11 +74,43 @@ class GitRepository:
     def __checkout__(self) -> None:
         self.execute_silent("git init", self.dir)
         self.execute_silent(f"git remote add origin {self.url}", self.dir)
-        self.execute_silent(f"git fetch --depth 1 origin {self.ref}", self.dir)
-        self.execute_silent("git checkout FETCH_HEAD", self.dir)
+        self.__sparse_checkout__()
+        if self.mirror:
+            sha = self.mirror.fetch(self.url, self.ref)
+            self.mirror.borrow(self.url, self.dir)
+            self.execute_silent(f"git checkout {sha}", self.dir)
+        else:
+            self.execute_silent(f"git fetch --depth 1{self.__filter__} origin {self.ref}", self.dir)
+            self.execute_silent("git checkout FETCH_HEAD", self.dir)
         self.sha = self.output("git rev-parse HEAD", self.dir)
         logging.info(f"Checked out {self.url}@{self.ref} into {self.dir} at {self.sha}")
 
+    def __update__(self, clean: bool = False) -> None:
+        self.execute_silent(f"git remote set-url origin {self.url}", self.dir)
+        self.__sparse_checkout__()
+        if self.mirror:
+            sha = self.mirror.fetch(self.url, self.ref)
+            self.mirror.borrow(self.url, self.dir)
+            self.execute_silent(f"git reset --hard {sha}", self.dir)
+        else:
+            self.execute_silent(f"git fetch --depth 1{self.__filter__} origin {self.ref}", self.dir)
+            self.execute_silent("git reset --hard FETCH_HEAD", self.dir)
+        if clean:
+            self.execute_silent("git clean -ffdx", self.dir)
+        self.sha = self.output("git rev-parse HEAD", self.dir)
+        logging.info(f"Updated {self.url}@{self.ref} in {self.dir} to {self.sha}")
+
+    def __sparse_checkout__(self) -> None:
+        if self.sparse_paths is not None and self.mirror:
+            logging.info(f"Fetching all files of {self.url} into the mirror, only the sparse checkout of {self.dir} is limited to some paths")
+        if self.sparse_paths is not None:
+            self.execute_silent(f"git sparse-checkout set --cone {' '.join(self.sparse_paths)}".strip(), self.dir)
+
+    @property
+    def __filter__(self) -> str:
+        # Files outside of a sparse checkout are never downloaded
+        return " --filter=blob:none" if self.sparse_paths is not None else ""
+
     @property
     def working_directory(self) -> str:
         if self.working_subdirectory:
@@ -63,6 +123,55 @@ class GitRepository:
         results = subprocess.check_output(f"git ls-remote {url} {ref}", shell=True).decode().strip().split("\t")
         return results if len(results) > 1 else [ref, ref]
 
+    @classmethod
+    def stable_refs(self, url: str, refs: List[str]) -> Dict[str, List[str]]:
+        """
+        Resolve several refs of a repository with a single `git ls-remote`.
+
+        :return: A [commit ID, ref name] pair for each ref, see stable_ref.
+        """
+        if len(refs) == 1:
+            return {refs[0]: self.stable_ref(url, refs[0])}
+        remote_refs = []
+        output = subprocess.check_output(f"git ls-remote {url} {' '.join(refs)}", shell=True).decode().strip()
+        for line in output.splitlines():
+            parts = line.split("\t")
+            if len(parts) > 1:
+                remote_refs.append(parts)
+        results = {}
+        for ref in refs:
+            # ls-remote matches patterns against the end of ref names, keep the first match like stable_ref does
+            matches = [remote_ref for remote_ref in remote_refs if remote_ref[1] == ref or remote_ref[1].endswith("/" + ref)]
+            results[ref] = matches[0] if matches else [ref, ref]
+        return results
+
+    @classmethod
+    def changed_paths(self, url: str, from_sha: str, to_sha: str) -> List[str]:
+        """
+        List the paths that differ between two commits, fetching only their trees.
+
+        :return: Changed paths, relative to the root of the repository.
+        """
+        with TemporaryDirectory() as work_dir:
+            for command in ["git init", f"git remote add origin {url}", f"git fetch --depth 1 --filter=blob:none origin {from_sha} {to_sha}"]:
+                subprocess.check_call(command, cwd=work_dir.name, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            output = subprocess.check_output(f"git diff --name-only --no-renames {from_sha} {to_sha}", cwd=work_dir.name, shell=True).decode()
+        return [path for path in output.splitlines() if path]
+
+    @classmethod
+    def existing_paths(self, url: str, sha: str, paths: List[str]) -> List[str]:
+        """
+        List which of the given files exist in a commit, fetching only its tree.
+
+        :return: Existing paths, relative to the root of the repository, in the order given.
+        """
+        with TemporaryDirectory() as work_dir:
+            for command in ["git init", f"git remote add origin {url}", f"git fetch --depth 1 --filter=blob:none origin {sha}"]:
+                subprocess.check_call(command, cwd=work_dir.name, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            output = subprocess.check_output(f"git ls-tree --name-only FETCH_HEAD -- {' '.join(paths)}", cwd=work_dir.name, shell=True).decode()
+        existing = output.splitlines()
+        return [path for path in paths if path in existing]
+
     def execute_silent(self, command: str, cwd: str = None) -> None:
         cwd = cwd or self.working_directory
         logging.info(f'Executing "{command}" in {cwd}')
@@ -79,10 +188,13 @@ class GitRepository:
         logging.info(f'Executing "{command}" in {cwd}')
         return subprocess.check_output(command, cwd=cwd, shell=True).decode().strip()
 
-    def execute(self, command: str, cwd: str = None) -> None:
+    def execute(self, command: str, cwd: str = None, env: Dict[str, str] = None) -> None:
         cwd = cwd or self.working_directory
         logging.info(f'Executing "{command}" in {cwd}')
-        subprocess.check_call(command, cwd=cwd, shell=True)
+        if env:
+            subprocess.check_call(command, cwd=cwd, shell=True, env={**os.environ, **env})
+        else:
+            subprocess.check_call(command, cwd=cwd, shell=True)
 
     def path(self, subdirname: str = None) -> Path:
         dirname = self.dir
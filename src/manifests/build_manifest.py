@@ -38,6 +38,9 @@ components:
       libs:
         - libs/relative/path/to/artifact
         - ...
+    incremental: optional, present when an incremental build reused the artifacts of a previous build
+      commit_id: The git commit ID the artifacts were built from
+      reason: Why the component was not rebuilt
   - ...
 """
 
@@ -79,6 +82,14 @@ class BuildManifest(ComponentManifest['BuildManifest', 'BuildComponents']):
                         },
                     },
                     "commit_id": {"required": True, "type": "string"},
+                    "incremental": {
+                        "type": "dict",
+                        "nullable": True,
+                        "schema": {
+                            "commit_id": {"required": True, "type": "string"},
+                            "reason": {"required": True, "type": "string"},
+                        },
+                    },
                     "name": {"required": True, "type": "string"},
                     "ref": {"required": True, "type": "string"},
                     "repository": {"required": True, "type": "string"},
@@ -138,6 +149,7 @@ class BuildComponent(Component):
         self.commit_id = data["commit_id"]
         self.artifacts = data.get("artifacts", {})
         self.version = data["version"]
+        self.incremental = data.get("incremental", None)
 
     def __to_dict__(self) -> dict:
         return {
@@ -147,6 +159,7 @@ class BuildComponent(Component):
             "commit_id": self.commit_id,
             "artifacts": self.artifacts,
             "version": self.version,
+            "incremental": self.incremental,
         }
 
 
@@ -6,10 +6,10 @@
 # compatible open source license.
 
 
-import logging
-import urllib.request
 from typing import List
 
+from system.download_pool import DownloadPool
+
 
 class DistributionNotFound(Exception):
     def __init__(self, urls: List[str]) -> None:
@@ -23,12 +23,9 @@ def find_build_root(base_url: str, platform: str, architecture: str, product_nam
         f"{base_url}/{platform}/{architecture}/builds"
     ]
 
-    for distribution_url in possible_urls:
-        manifest_url = f"{distribution_url}/manifest.yml"
-        try:
-            with urllib.request.urlopen(manifest_url):
-                # OK we could access the manifest, return the url
-                return distribution_url
-        except:
-            logging.info(f"No build manifest found at {manifest_url}")
-    raise DistributionNotFound(possible_urls)
+    manifest_urls = [f"{distribution_url}/manifest.yml" for distribution_url in possible_urls]
+    manifest_url = DownloadPool.default().find(manifest_urls)
+    if manifest_url is None:
+        raise DistributionNotFound(possible_urls)
+    # OK we could access the manifest, return the url
+    return possible_urls[manifest_urls.index(manifest_url)]
@@ -40,8 +40,10 @@ components:
 import copy
 import itertools
 import logging
-from typing import Callable, Iterator, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 
+from git.git_ref_cache import GitRefCache
+from git.git_ref_resolver import GitRefResolver
 from git.git_repository import GitRepository
 from manifests.component_manifest import Component, ComponentManifest, Components
 
@@ -109,6 +111,7 @@ class InputManifest_1_0(ComponentManifest['InputManifest_1_0', 'InputComponents_
         self.ci = self.Ci(data.get("ci", None))
 
         self.components = InputComponents_1_0(data.get("components", []))  # type: ignore[assignment]
+        self.stabilize_times: Dict[str, float] = {}
 
     def __to_dict__(self) -> dict:
         return {
@@ -118,9 +121,9 @@ class InputManifest_1_0(ComponentManifest['InputManifest_1_0', 'InputComponents_
             "components": self.components.__to_dict__(),
         }
 
-    def stable(self) -> 'InputManifest_1_0':
+    def stable(self, workers: int = 8, ref_cache: GitRefCache = None) -> 'InputManifest_1_0':
         manifest: 'InputManifest_1_0' = copy.deepcopy(self)
-        manifest.components.__stabilize__()
+        manifest.stabilize_times = manifest.components.__stabilize__(workers, ref_cache)
         return manifest
 
     class Ci:
@@ -172,9 +175,8 @@ class InputComponents_1_0(Components['InputComponent_1_0 ']):
     def __create__(self, data: dict) -> 'InputComponent_1_0':
         return InputComponent_1_0._from(data)  # type: ignore[no-any-return]
 
-    def __stabilize__(self) -> None:
-        for component in self.values():
-            component.__stabilize__()
+    def __stabilize__(self, workers: int = 8, ref_cache: GitRefCache = None) -> Dict[str, float]:
+        return GitRefResolver(workers, ref_cache).stabilize([component for component in self.values() if isinstance(component, InputComponentFromSource_1_0)])
 
     def select(self, focus: List[str] = [], platform: str = None) -> Iterator['InputComponent_1_0']:
         """
@@ -239,8 +241,8 @@ class InputComponentFromSource_1_0(InputComponent_1_0):
         self.ref = data["ref"]
         self.working_directory = data.get("working_directory", None)
 
-    def __stabilize__(self) -> None:
-        ref, name = GitRepository.stable_ref(self.repository, self.ref)
+    def __stabilize__(self, stable_ref: List[str] = None) -> None:
+        ref, name = stable_ref or GitRepository.stable_ref(self.repository, self.ref)
         logging.info(f"Updating ref for {self.repository} from {self.ref} to {ref} ({name})")
         self.ref = ref
 
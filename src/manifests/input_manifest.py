@@ -35,19 +35,32 @@ components:
       - windows
       - darwin
       - linux
+    depends_on: optional list of components this component depends on
+    incremental_ignore: optional list of path patterns whose changes do not require a rebuild, see BuildIncremental
+      - docs/*
+      - ...
   - ...
 """
+import collections
 import copy
+import heapq
 import itertools
 import logging
-from typing import Callable, Iterator, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional
 
+from git.git_ref_cache import GitRefCache
+from git.git_ref_resolver import GitRefResolver
 from git.git_repository import GitRepository
 from manifests.component_manifest import Component, ComponentManifest, Components
 from manifests.input.input_manifest_1_0 import InputManifest_1_0
 
 
 class InputManifest(ComponentManifest['InputManifest', 'InputComponents']):
+    class CycleError(Exception):
+        def __init__(self, components: List[str]) -> None:
+            self.components = components
+            super().__init__(f"Circular dependency between components: {', '.join(components)}.")
+
     VERSIONS = {
         "1.0": InputManifest_1_0,
         # "1.1": current
@@ -92,7 +105,8 @@ class InputManifest(ComponentManifest['InputManifest', 'InputComponents']):
                             "working_directory": {"type": "string"},
                             "checks": {"type": "list", "schema": {"anyof": [{"type": "string"}, {"type": "dict"}]}},
                             "platforms": {"type": "list", "schema": {"type": "string", "allowed": ["linux", "windows", "darwin"]}},
-                            "depends_on": {"type": "list", "schema": {"type": "string"}}
+                            "depends_on": {"type": "list", "schema": {"type": "string"}},
+                            "incremental_ignore": {"type": "list", "schema": {"type": "string"}},
                         },
                     },
                     {
@@ -116,6 +130,9 @@ class InputManifest(ComponentManifest['InputManifest', 'InputComponents']):
         self.ci = self.Ci(data.get("ci", None))
 
         self.components = InputComponents(data.get("components", []))  # type: ignore[assignment]
+        self.stabilize_times: Dict[str, float] = {}
+        self.__dependents: Optional[Dict[str, List[str]]] = None
+        self.__order: List[str] = []
 
     def __to_dict__(self) -> dict:
         return {
@@ -125,17 +142,92 @@ class InputManifest(ComponentManifest['InputManifest', 'InputComponents']):
             "components": self.components.__to_dict__(),
         }
 
-    def stable(self) -> 'InputManifest':
+    def stable(self, workers: int = 8, ref_cache: GitRefCache = None) -> 'InputManifest':
+        """
+        Resolve the refs of all components to commit IDs.
+
+        :param int workers: Number of repositories resolved concurrently.
+        :param GitRefCache ref_cache: Optional cache of recently resolved refs.
+        :return: A copy of the manifest, with the time it took to resolve each component in `stabilize_times`.
+        """
         manifest: 'InputManifest' = copy.deepcopy(self)
-        manifest.components.__stabilize__()
+        manifest.stabilize_times = manifest.components.__stabilize__(workers, ref_cache)
         return manifest
 
     def plugins_depend_on(self, plugin: str) -> List[str]:
-        plugins = []
-        for component in self.components.select():
-            if component.depends_on is not None and plugin in component.depends_on:
-                plugins.append(component.name)
-        return plugins
+        return list(self.dependents.get(plugin, []))
+
+    @property
+    def dependents(self) -> Dict[str, List[str]]:
+        """
+        Components that list each component in `depends_on`, in manifest order.
+        """
+        self.__index()
+        return self.__dependents  # type: ignore[return-value]
+
+    @property
+    def topological_order(self) -> List[str]:
+        """
+        Names of all components, each after the components it depends on, otherwise in manifest order.
+
+        :raises CycleError: Components depend on each other.
+        """
+        self.__index()
+        return self.__order
+
+    def dependents_closure(self, names: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Find the components that depend on some components, directly or indirectly.
+
+        :return: The given components and their dependents, each mapped to the dependency it was found through, or None for the given components.
+        """
+        included: Dict[str, Optional[str]] = dict.fromkeys(names)
+        queue = collections.deque(names)
+        while queue:
+            name = queue.popleft()
+            for dependent in self.dependents.get(name, []):
+                if dependent not in included:
+                    included[dependent] = name
+                    queue.append(dependent)
+        return included
+
+    def __index(self) -> None:
+        if self.__dependents is not None:
+            return
+        names = list(self.components.keys())
+        dependents: Dict[str, List[str]] = {name: [] for name in names}
+        remaining: Dict[str, int] = {}
+        for component in self.components.values():
+            # Dependencies on components that are not part of this manifest are assumed to be available already
+            dependencies = [name for name in dict.fromkeys(component.depends_on or []) if name in dependents and name != component.name]
+            remaining[component.name] = len(dependencies)
+            for dependency in dependencies:
+                dependents[dependency].append(component.name)
+
+        position = {name: index for index, name in enumerate(names)}
+        ready = [position[name] for name, count in remaining.items() if not count]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            name = names[heapq.heappop(ready)]
+            order.append(name)
+            for dependent in dependents[name]:
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    heapq.heappush(ready, position[dependent])
+
+        if len(order) < len(names):
+            # Leave out components that only depend on a cycle
+            cycle = {name for name, count in remaining.items() if count}
+            while True:
+                leaves = {name for name in cycle if not any(dependent in cycle for dependent in dependents[name])}
+                if not leaves:
+                    break
+                cycle -= leaves
+            raise InputManifest.CycleError(sorted(cycle))
+
+        self.__dependents = dependents
+        self.__order = order
 
     class Ci:
         def __init__(self, data: dict) -> None:
@@ -186,9 +278,8 @@ class InputComponents(Components['InputComponent']):
     def __create__(self, data: dict) -> 'InputComponent':
         return InputComponent._from(data)  # type: ignore[no-any-return]
 
-    def __stabilize__(self) -> None:
-        for component in self.values():
-            component.__stabilize__()
+    def __stabilize__(self, workers: int = 8, ref_cache: GitRefCache = None) -> Dict[str, float]:
+        return GitRefResolver(workers, ref_cache).stabilize([component for component in self.values() if isinstance(component, InputComponentFromSource)])
 
     def select(self, focus: List[str] = [], platform: str = None) -> Iterator['InputComponent']:
         """
@@ -253,9 +344,10 @@ class InputComponentFromSource(InputComponent):
         self.repository = data["repository"]
         self.ref = data["ref"]
         self.working_directory = data.get("working_directory", None)
+        self.incremental_ignore = data.get("incremental_ignore", None)
 
-    def __stabilize__(self) -> None:
-        ref, name = GitRepository.stable_ref(self.repository, self.ref)
+    def __stabilize__(self, stable_ref: List[str] = None) -> None:
+        ref, name = stable_ref or GitRepository.stable_ref(self.repository, self.ref)
         logging.info(f"Updating ref for {self.repository} from {self.ref} to {ref} ({name})")
         self.ref = ref
 
@@ -268,6 +360,7 @@ class InputComponentFromSource(InputComponent):
             "checks": list(map(lambda check: check.__to_dict__(), self.checks)),
             "platforms": self.platforms,
             "depends_on": self.depends_on,
+            "incremental_ignore": self.incremental_ignore,
         }
 
 
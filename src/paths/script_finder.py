@@ -6,7 +6,7 @@
 # compatible open source license.
 
 import os
-from typing import Callable, List
+from typing import Callable, List, Optional
 
 
 class ScriptFinder:
@@ -56,21 +56,33 @@ class ScriptFinder:
         return cls.__find_script(script_name, paths)
 
     @classmethod
-    def find_build_script(cls, project: str, component_name: str, git_dir: str) -> str:
-        paths = [
-            os.path.realpath(os.path.join(cls.component_scripts_path, component_name, "build.sh")),
-            os.path.realpath(os.path.join(git_dir, "build.sh")),
-            os.path.realpath(os.path.join(git_dir, "scripts", "build.sh")),
+    def __build_script_paths(cls, project: str, component_name: str, git_dir: Optional[str]) -> List[str]:
+        paths = [os.path.realpath(os.path.join(cls.component_scripts_path, component_name, "build.sh"))]
+        # Without git_dir, the scripts in the component's Git repository are left out
+        if git_dir is not None:
+            paths.append(os.path.realpath(os.path.join(git_dir, "build.sh")))
+            paths.append(os.path.realpath(os.path.join(git_dir, "scripts", "build.sh")))
+        paths.append(
             os.path.realpath(
                 os.path.join(
                     cls.default_scripts_path,
                     project.replace(" ", "-").lower(),
                     "build.sh",
                 )
-            ),
-        ]
+            )
+        )
+        return paths
 
-        return cls.__find_script("build.sh", paths)
+    @classmethod
+    def find_build_script(cls, project: str, component_name: str, git_dir: str) -> str:
+        return cls.__find_script("build.sh", cls.__build_script_paths(project, component_name, git_dir))
+
+    @classmethod
+    def find_default_build_script(cls, project: str, component_name: str) -> str:
+        """
+        Find the build script without looking into the component's Git repository.
+        """
+        return cls.__find_script("build.sh", cls.__build_script_paths(project, component_name, None))
 
     @classmethod
     def find_install_script(cls, component_name: str) -> str:
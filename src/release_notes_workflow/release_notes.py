@@ -55,11 +55,12 @@ class ReleaseNotes:
         with TemporaryDirectory(chdir=True) as work_dir:
             results.append(component.name)
             results.append(f"[{component.ref}]")
+            # The working directory of the component is not checked out, commits are logged from the root of the repository
             with GitRepository(
                     component.repository,
                     component.ref,
                     os.path.join(work_dir.name, component.name),
-                    component.working_directory,
+                    sparse_paths=["release-notes"],
             ) as repo:
                 logging.debug(f"Checked out {component.name} into {repo.dir}")
                 release_notes = ReleaseNotesComponents.from_component(component, build_version, repo.dir)
@@ -39,7 +39,16 @@ def main() -> int:
         BundleLocations.from_path(args.base_url, os.getcwd(), build.filename, build.distribution)
     )
 
-    with Bundles.create(build_manifest, artifacts_dir, bundle_recorder, args.keep) as bundle:
+    with Bundles.create(
+        build_manifest,
+        artifacts_dir,
+        bundle_recorder,
+        args.keep,
+        args.parallel,
+        args.fast_install,
+        args.compression_level,
+        args.compression_threads,
+    ) as bundle:
         bundle.install_min()
         bundle.install_components()
         logging.info(f"Installed plugins: {bundle.installed_plugins}")
@@ -6,33 +6,84 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import itertools
 import logging
 import os
 import sys
+import time
 import uuid
+from typing import List, Optional, Tuple
 
 from build_workflow.build_args import BuildArgs
+from build_workflow.build_artifact_validator import BuildArtifactValidator
+from build_workflow.build_cache import BuildCache
+from build_workflow.build_history import BuildHistory
 from build_workflow.build_incremental import BuildIncremental
+from build_workflow.build_journal import BuildJournal
+from build_workflow.build_merge import BuildMerge
+from build_workflow.build_plan import BuildPlan
+from build_workflow.build_prefetch import BuildPrefetch
 from build_workflow.build_recorder import BuildRecorder
+from build_workflow.build_resources import BuildResources
+from build_workflow.build_scheduler import BuildScheduler
+from build_workflow.build_shard import BuildShard
 from build_workflow.build_target import BuildTarget
+from build_workflow.build_tool_caches import BuildToolCaches
+from build_workflow.build_tracer import BuildTracer
 from build_workflow.builders import Builders
+from git.git_mirror import GitMirror
+from git.git_ref_cache import GitRefCache
 from manifests.build_manifest import BuildManifest
-from manifests.input_manifest import InputManifest
+from manifests.input_manifest import InputComponent, InputComponentFromSource, InputManifest
 from paths.build_output_dir import BuildOutputDir
 from system import console
+from system.download_pool import DownloadPool
+from system.file_placement import FilePlacement
+from system.os import current_architecture, current_platform
 from system.temporary_directory import TemporaryDirectory
 
 
+def target_dirs(args: BuildArgs, manifest: InputManifest) -> List[Tuple[str, str, str, Optional[str]]]:
+    """
+    :return: The distribution, platform and architecture of every target, and the directory its outputs are written in.
+    """
+    platforms = args.platforms or [manifest.build.platform or current_platform()]
+    architectures = args.architectures or [manifest.build.architecture or current_architecture()]
+    # Targets for more than one platform or architecture are written to {platform}/{architecture}/{distribution}/builds
+    return [
+        (distribution, platform, architecture, os.path.join(os.getcwd(), platform, architecture) if len(platforms) * len(architectures) > 1 else None)
+        for distribution, platform, architecture in itertools.product(args.distributions, platforms, architectures)
+    ]
+
+
+def merge(args: BuildArgs) -> int:
+    manifest = InputManifest.from_file(args.manifest)
+    for distribution, _, _, cwd in target_dirs(args, manifest):
+        shards_dir = BuildShard.shards_dir(manifest.build.filename, distribution, cwd)
+        output_dir = BuildOutputDir(manifest.build.filename, distribution, cwd).dir
+        logging.info(f"Merging the shards in {shards_dir} into {output_dir}")
+        BuildMerge(BuildMerge.find(shards_dir), output_dir, FilePlacement(args.artifact_placement)).write(list(manifest.components.keys()))
+    logging.info("Done.")
+    return 0
+
+
 def main() -> int:
     args = BuildArgs()
-    console.configure(level=args.logging_level)
+    # The plan is printed to stdout
+    console.configure(level=args.logging_level, stream=sys.stderr if args.plan else sys.stdout)
+    if args.merge:
+        return merge(args)
     manifest = InputManifest.from_file(args.manifest)
     build_manifest = None
     components = args.components
     failed_plugins = []
+    ref_cache = GitRefCache(args.ref_cache_ttl) if args.ref_cache_ttl > 0 else None
 
     if args.ref_manifest:
-        manifest = manifest.stable()
+        manifest = manifest.stable(ref_cache=ref_cache)
+        if manifest.stabilize_times:
+            slowest = max(manifest.stabilize_times, key=lambda name: manifest.stabilize_times[name])
+            logging.info(f"Resolved the refs of {len(manifest.stabilize_times)} components, the slowest was {slowest} in {manifest.stabilize_times[slowest]:.1f}s")
         if os.path.exists(args.ref_manifest):
             if manifest == InputManifest.from_path(args.ref_manifest):
                 logging.info(f"No changes since {args.ref_manifest}")
@@ -44,20 +95,50 @@ def main() -> int:
             manifest.to_file(args.ref_manifest)
         return 0
 
-    output_dir = BuildOutputDir(manifest.build.filename, args.distribution).dir
+    # (distribution, platform, architecture, output directory) of every target
+    outputs = []
+    for distribution, platform, architecture, cwd in target_dirs(args, manifest):
+        if args.shard:
+            output_dir = args.shard.output_dir(manifest.build.filename, distribution, cwd)
+        else:
+            output_dir = BuildOutputDir(manifest.build.filename, distribution, cwd, makedirs=not args.plan).dir
+        outputs.append((distribution, platform, architecture, output_dir))
+
+    targets = [
+        BuildTarget(
+            name=manifest.build.name,
+            version=manifest.build.version,
+            qualifier=manifest.build.qualifier,
+            patches=manifest.build.patches,
+            snapshot=args.snapshot if args.snapshot is not None else manifest.build.snapshot,
+            output_dir=output_dir,
+            distribution=distribution,
+            platform=platform,
+            architecture=architecture,
+        )
+        for distribution, platform, architecture, output_dir in outputs
+    ]
+    history = BuildHistory()
+    reasons = None
 
     if args.incremental:
-        buildIncremental = BuildIncremental(manifest, args.distribution)
+        buildIncremental = BuildIncremental(manifest, args.distribution, ref_cache, args.incremental_paths)
         list_of_updated_plugins = buildIncremental.commits_diff(manifest)
         components = buildIncremental.rebuild_plugins(list_of_updated_plugins, manifest)
+        if args.explain:
+            buildIncremental.explain(components)
+        reasons = buildIncremental.reasons
 
         build_manifest_path = os.path.join(args.distribution, "builds", manifest.build.filename, "manifest.yml")
         if not os.path.exists(build_manifest_path):
             logging.error(f"Previous build manifest missing at path: {build_manifest_path}")
-        build_manifest = BuildManifest.from_path(build_manifest_path)
+        build_manifest = buildIncremental.reuse(BuildManifest.from_path(build_manifest_path))
 
         if not components:
             logging.info("No commit difference found between any components. Skipping the build.")
+            if args.plan:
+                BuildPlan(manifest, targets, [], history, incremental=True).write()
+                return 0
             build_manifest.build.id = os.getenv("BUILD_NUMBER") or uuid.uuid4().hex
             build_manifest.to_file(build_manifest_path)
             logging.info(f"Updating the build ID in the build manifest to {build_manifest.build.id}.")
@@ -65,44 +146,137 @@ def main() -> int:
 
         logging.info(f"Plugins for incremental build: {components}")
 
-    with TemporaryDirectory(keep=args.keep, chdir=True) as work_dir:
-        logging.info(f"Building in {work_dir.name}")
+    target_platforms = list(dict.fromkeys(target.platform for target in targets))
+    selected = [
+        component
+        for component in manifest.components.select(focus=components, platform=target_platforms[0] if len(target_platforms) == 1 else None)
+        if any(component.__matches__(platform=platform) for platform in target_platforms)
+    ]
+    if args.shard:
+        selected = args.shard.select(manifest, selected)
+        logging.info(f"Building shard {args.shard.index} of {args.shard.count}: {', '.join(component.name for component in selected)}")
 
-        target = BuildTarget(
-            name=manifest.build.name,
-            version=manifest.build.version,
-            qualifier=manifest.build.qualifier,
-            patches=manifest.build.patches,
-            snapshot=args.snapshot if args.snapshot is not None else manifest.build.snapshot,
-            output_dir=output_dir,
-            distribution=args.distribution,
-            platform=args.platform or manifest.build.platform,
-            architecture=args.architecture or manifest.build.architecture,
-        )
+    if args.plan:
+        stable = manifest.stable(ref_cache=ref_cache)
+        commit_ids = {component.name: component.ref for component in stable.components.select() if isinstance(component, InputComponentFromSource)}
+        BuildPlan(manifest, targets, selected, history, commit_ids, reasons, args.incremental, stable.stabilize_times).write()
+        return 0
 
-        build_recorder = BuildRecorder(target, build_manifest) if args.incremental else BuildRecorder(target)
+    with TemporaryDirectory(keep=args.keep, chdir=True) as work_dir:
+        logging.info(f"Building in {work_dir.name}")
+        if args.workspace:
+            os.makedirs(args.workspace, exist_ok=True)
+            logging.info(f"Checking out components in workspace {args.workspace}")
 
-        logging.info(f"Building {manifest.build.name} ({target.architecture}) into {target.output_dir}")
+        file_placement = FilePlacement(args.artifact_placement)
+        tracer = BuildTracer()
+        build_cache = None
+        if args.build_cache:
+            # Shards other than the first restore the core components that the first shard builds
+            awaited = args.shard.awaited([component.name for component in selected]) if args.shard else []
+            build_cache = BuildCache(args.build_cache_dir, args.build_cache_max_size, awaited)
+        elif args.shard:
+            logging.info("Building the core components in every shard, use --build-cache with a shared --build-cache-dir to build them once")
+        resources = BuildResources(args.memory_budget) if args.resource_governor else None
+        build_tool_caches = BuildToolCaches(args.shared_caches_dir or os.path.join(work_dir.name, ".caches")) if args.shared_caches else None
+        artifact_validator = BuildArtifactValidator()
+        commit_ids = None
+        if args.resume:
+            # Components that finished building another commit than their ref now points to are rebuilt
+            stable = manifest.stable(ref_cache=ref_cache)
+            commit_ids = {component.name: component.ref for component in stable.components.select() if isinstance(component, InputComponentFromSource)}
+        journals = []
+        build_recorders = []
+        # Maven artifacts are the same for every target, and only recorded for the first target that builds a component
+        maven_targets = {component.name: next(index for index, target in enumerate(targets) if component.__matches__(platform=target.platform)) for component in selected}
+        for index, target in enumerate(targets):
+            logging.info(f"Building {manifest.build.name} ({target.architecture}) into {target.output_dir}")
+            journals.append(BuildJournal(target, args.resume, commit_ids))
+            skip_maven = [name for name, maven_target in maven_targets.items() if maven_target < index]
+            build_recorders.append(BuildRecorder(target, build_manifest, file_placement, artifact_validator, tracer, journals[-1], skip_maven))
 
-        for component in manifest.components.select(focus=components, platform=target.platform):
+        def build_component(component: InputComponent) -> None:
             logging.info(f"Building {component.name}")
 
-            builder = Builders.builder_from(component, target)
+            # Each component is checked out once and built for every target
+            builder = Builders.builder_from(component, targets[0], build_cache, bool(args.workspace), args.workspace_clean, build_tool_caches, prefetch, resources)
             try:
-                builder.checkout(work_dir.name)
-                builder.build(build_recorder)
-                builder.export_artifacts(build_recorder)
+                for target, journal, build_recorder in zip(targets, journals, build_recorders):
+                    if component.name in journal.finished or not component.__matches__(platform=target.platform):
+                        continue
+                    name = component.name if len(targets) == 1 else f"{component.name} ({target.distribution}, {target.platform}, {target.architecture})"
+                    start = time.monotonic()
+                    builder.retarget(target)
+                    with tracer.span(name, "checkout", component.name, target.output_dir):
+                        builder.checkout(args.workspace or work_dir.name)
+                    with tracer.span(name, "build", component.name, target.output_dir):
+                        if resources:
+                            with resources.reserve(component.name, os.path.join(args.workspace or work_dir.name, component.name)):
+                                builder.build(build_recorder)
+                        else:
+                            builder.build(build_recorder)
+                    with tracer.span(name, "export", component.name, target.output_dir):
+                        builder.export_artifacts(build_recorder)
+                    with tracer.span(name, "checks", component.name, target.output_dir):
+                        build_recorder.check_artifacts(component.name)
+                    build_recorder.finish_component(component.name)
+                    builder.finish()
+                    if not getattr(builder, "cached", None):
+                        # Restoring from the build cache says nothing about how long a build takes
+                        history.record(component.name, target, time.monotonic() - start)
                 logging.info(f"Successfully built {component.name}")
             except Exception as e:
                 logging.error(f"ERROR: {e}")
                 logging.error(f"Error building {component.name}, retry with: {args.component_command(component.name)}")
-                if args.continue_on_error and component.name not in ['OpenSearch', 'job-scheduler', 'common-utils', 'OpenSearch-Dashboards']:
-                    failed_plugins.append(component.name)
-                    continue
-                else:
-                    raise
+                raise
+
+        def can_continue(component_name: str) -> bool:
+            return args.continue_on_error and component_name not in ['OpenSearch', 'job-scheduler', 'common-utils', 'OpenSearch-Dashboards']
+
+        selected = [component for component in selected if not all(component.name in journal.finished for journal in journals)]
+        prefetch = None
+        if args.prefetch:
+            mirror = GitMirror.from_environment()
+            if not mirror and not args.workspace:
+                # Checkouts in a workspace outlive the build, and cannot borrow objects from a mirror in the work directory
+                mirror = GitMirror(os.path.join(work_dir.name, ".git-mirror"), shallow=True)
+            prefetch = BuildPrefetch(mirror, os.path.join(work_dir.name, ".prefetch"))
+        try:
+            if prefetch:
+                prefetch.start(selected, targets)
+            if args.parallel > 1:
+                failed_plugins = BuildScheduler(selected, args.parallel).run(build_component, can_continue)
+            else:
+                for component in selected:
+                    try:
+                        build_component(component)
+                    except Exception:
+                        if can_continue(component.name):
+                            failed_plugins.append(component.name)
+                            continue
+                        else:
+                            raise
+        finally:
+            if prefetch:
+                prefetch.close()
+            if build_tool_caches:
+                build_tool_caches.close()
 
-        build_recorder.write_manifest()
+        artifact_validator.close()
+        for journal, build_recorder in zip(journals, build_recorders):
+            build_recorder.write_manifest()
+            if not failed_plugins:
+                journal.complete()
+            journal.close()
+        tracer.summary()
+        if resources:
+            resources.close()
+        if build_tool_caches:
+            build_tool_caches.summary()
+        if build_cache:
+            build_cache.evict()
+        history.save()
+        DownloadPool.default().report()
     if len(failed_plugins) > 0:
         logging.error(f"Failed plugins are {failed_plugins}")
     logging.info("Done.")
@@ -7,11 +7,12 @@
 
 import logging
 import sys
+from typing import TextIO
 
 
-def configure(level: int) -> None:
+def configure(level: int, stream: TextIO = sys.stdout) -> None:
     logging.basicConfig(
-        stream=sys.stdout,
+        stream=stream,
         level=level,
         format="%(asctime)s %(levelname)-8s %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
@@ -0,0 +1,221 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+"""
+This class downloads files on a bounded pool of threads that share keep-alive HTTP connections.
+Interrupted downloads are kept in a `.part` file next to the destination, with the ETag (or Last-Modified date) and size
+of the remote file in a `.part.json` file. They are only resumed with a `Range` and an `If-Range` request when the
+server has a `.sha512` sidecar checksum file to verify the result against, and the remote file still has the same
+validator and size, otherwise they start over. Failed requests are retried with an exponential backoff, and files can
+be verified against their `.sha512` checksum when the server has one. The shared `DownloadPool.default()` pool reports
+the overall throughput with `report`.
+"""
+
+
+class DownloadPool:
+    class ChecksumError(Exception):
+        def __init__(self, url: str, expected: str, actual: str) -> None:
+            self.url = url
+            super().__init__(f"Checksum mismatch for {url}, expected sha512 {expected}, but was {actual}.")
+
+    __default: Optional['DownloadPool'] = None
+    __default_lock = threading.Lock()
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, workers: int = 8, retries: int = 3, backoff: float = 1.0, timeout: float = 60) -> None:
+        self.workers = workers
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+        self.lock = threading.Lock()
+        self.files = 0
+        self.bytes = 0
+        self.elapsed = 0.0
+
+    @classmethod
+    def default(cls) -> 'DownloadPool':
+        with cls.__default_lock:
+            if cls.__default is None:
+                cls.__default = DownloadPool()
+            return cls.__default
+
+    def exists(self, url: str) -> bool:
+        try:
+            with self.session.get(url, stream=True, timeout=self.timeout) as response:
+                return response.status_code == 200
+        except requests.RequestException as e:
+            logging.debug(f"Unable to reach {url}: {e}")
+            return False
+
+    def find(self, urls: List[str]) -> Optional[str]:
+        """
+        Probe URLs concurrently.
+
+        :return: The first URL, in the order given, that exists.
+        """
+        probes = [self.executor.submit(self.exists, url) for url in urls]
+        for url, probe in zip(urls, probes):
+            if probe.result():
+                return url
+            logging.info(f"No file found at {url}")
+        return None
+
+    def submit(self, url: str, dest: str, verify: bool = False) -> concurrent.futures.Future:
+        """
+        Download a file in the background.
+
+        :param verify: Verify the file against `{url}.sha512` when it exists.
+        :return: A future that completes with the number of bytes downloaded.
+        """
+        return self.executor.submit(self.download, url, dest, verify)
+
+    def download(self, url: str, dest: str, verify: bool = False) -> int:
+        start = time.time()
+        downloaded = 0
+        for attempt in range(self.retries + 1):
+            try:
+                # A partial file is only resumed when the result can be verified
+                part = f"{dest}.part"
+                resumable = os.path.isfile(part) and os.path.getsize(part) > 0
+                expected = self.__checksum(url) if verify or resumable else None
+                downloaded += self.__download(url, dest, resume=expected is not None)
+                if expected:
+                    self.__verify(url, dest, expected)
+                break
+            except (requests.RequestException, OSError, DownloadPool.ChecksumError) as e:
+                if isinstance(e, DownloadPool.ChecksumError):
+                    os.unlink(dest)
+                if attempt == self.retries or not self.__retryable(e):
+                    raise
+                delay = self.backoff * 2 ** attempt
+                logging.warning(f"Error downloading {url}, retrying in {delay}s: {e}")
+                time.sleep(delay)
+        with self.lock:
+            self.files += 1
+            self.bytes += downloaded
+            self.elapsed += time.time() - start
+        return downloaded
+
+    def report(self) -> None:
+        with self.lock:
+            if not self.files:
+                return
+            rate = self.bytes / self.elapsed if self.elapsed else 0
+            logging.info(
+                f"Downloaded {self.files} file(s), {self.bytes / 1024 ** 2:.1f} MB in {self.elapsed:.1f}s"
+                f" of download time ({rate / 1024 ** 2:.1f} MB/s per download)"
+            )
+
+    @classmethod
+    def __retryable(cls, e: Exception) -> bool:
+        if isinstance(e, requests.HTTPError) and e.response is not None:
+            return e.response.status_code >= 500 or e.response.status_code in [408, 429]
+        return True
+
+    def __download(self, url: str, dest: str, resume: bool = False) -> int:
+        part = f"{dest}.part"
+        state_path = f"{part}.json"
+        state = self.__state(state_path) if resume and os.path.isfile(part) else {}
+        offset = os.path.getsize(part) if state.get("validator") and state.get("size") else 0
+        headers = {"Range": f"bytes={offset}-", "If-Range": state["validator"]} if 0 < offset < state.get("size", 0) else {}
+        if not headers:
+            offset = 0
+        with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+            if response.status_code == 416:
+                # the partial file is not a prefix of the remote file, start over
+                self.__remove(part, state_path)
+                return self.__download(url, dest)
+            response.raise_for_status()
+            size = self.__size(response)
+            if response.status_code != 206:
+                offset = 0
+            elif size != state.get("size"):
+                # the remote file changed, but the server ignored If-Range
+                self.__remove(part, state_path)
+                return self.__download(url, dest)
+            else:
+                logging.info(f"Resuming {url} at {offset} bytes")
+            if not offset:
+                validator = response.headers.get("ETag")
+                if not validator or validator.startswith("W/"):
+                    validator = response.headers.get("Last-Modified")
+                with open(state_path, "w") as f:
+                    json.dump({"validator": validator, "size": size}, f)
+            downloaded = 0
+            with open(part, "ab" if offset else "wb") as f:
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                    f.write(chunk)
+                    downloaded += len(chunk)
+        os.replace(part, dest)
+        self.__remove(state_path)
+        return downloaded
+
+    @classmethod
+    def __state(cls, path: str) -> dict:
+        try:
+            with open(path, "r") as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def __size(cls, response: requests.Response) -> Optional[int]:
+        """
+        :return: The size of the remote file, from Content-Range or Content-Length.
+        """
+        content_range = response.headers.get("Content-Range", "")
+        total = content_range.rpartition("/")[2]
+        if response.status_code == 206:
+            return int(total) if total.isdigit() else None
+        length = response.headers.get("Content-Length", "")
+        return int(length) if length.isdigit() else None
+
+    @classmethod
+    def __remove(cls, *paths: str) -> None:
+        for path in paths:
+            if os.path.isfile(path):
+                os.unlink(path)
+
+    def __checksum(self, url: str) -> Optional[str]:
+        with self.session.get(f"{url}.sha512", timeout=self.timeout) as response:
+            if response.status_code in [403, 404]:
+                logging.debug(f"No checksum for {url}")
+                return None
+            response.raise_for_status()
+            fields = response.text.split()
+            if not fields:
+                logging.warning(f"Ignoring empty checksum {url}.sha512")
+                return None
+            return fields[0].lower()
+
+    def __verify(self, url: str, dest: str, expected: str) -> None:
+        sha = hashlib.sha512()
+        with open(dest, "rb") as f:
+            for chunk in iter(lambda: f.read(self.CHUNK_SIZE), b""):
+                sha.update(chunk)
+        if sha.hexdigest() != expected:
+            raise DownloadPool.ChecksumError(url, expected, sha.hexdigest())
+        logging.info(f"Verified {dest} against {url}.sha512")
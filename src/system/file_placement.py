@@ -0,0 +1,166 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import collections
+import hashlib
+import logging
+import os
+import shutil
+import threading
+from typing import Callable, Counter, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+"""
+This class places files into an output directory with the cheapest mechanism the filesystem supports.
+In `auto` mode it tries a reflink (FICLONE), `os.copy_file_range` and `os.sendfile` before falling back to a regular
+copy, and remembers the first mechanism that worked for each pair of source and destination devices. A hardlink is never
+tried in `auto` mode: sources such as workspace checkouts and build cache entries outlive the build, and a file that
+shares their inode would change when they are rewritten in place. Any other strategy, including `hardlink`, is tried
+first, with a regular copy as the fallback. Files that are already present with the same contents, at the destination or
+at another path placed earlier, are not copied again; contents are only hashed when their sizes match.
+"""
+
+
+class FilePlacement:
+    STRATEGIES = ["auto", "reflink", "hardlink", "copy_file_range", "sendfile", "copy"]
+    # Strategies that write the data again, and benefit from deduplication
+    COPIES = ["copy_file_range", "sendfile", "copy"]
+    FICLONE = 0x40049409
+
+    def __init__(self, strategy: str = "auto") -> None:
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Invalid file placement strategy: {strategy}, expected one of {', '.join(self.STRATEGIES)}.")
+        self.strategy = strategy
+        self.lock = threading.Lock()
+        self.devices: Dict[Tuple[int, int], str] = {}
+        # Paths placed so far by size, and the hashes of their contents once known
+        self.placed: Dict[int, List[str]] = {}
+        self.digests: Dict[str, str] = {}
+        self.stats: Counter[str] = collections.Counter()
+
+    def place(self, src: str, dest: str) -> str:
+        """
+        Place a file at dest, replacing any existing file.
+
+        :return: The mechanism that was used, or `dedupe` if the file was not copied.
+        """
+        devices = self.__devices(src, dest)
+        strategies = self.__strategies(devices)
+        size = self.__size(src) if strategies[0] in self.COPIES else None
+
+        with self.lock:
+            self.digests.pop(dest, None)
+        if size is not None and self.__dedupe(src, dest, size):
+            used = "dedupe"
+        else:
+            used = next(strategy for strategy in strategies if self.__place(src, dest, strategy))
+
+        with self.lock:
+            if devices and used not in ["dedupe", "copy"] and self.strategy == "auto":
+                self.devices.setdefault(devices, used)
+            if size is not None and dest not in self.placed.setdefault(size, []):
+                self.placed[size].append(dest)
+            self.stats[used] += 1
+        return used
+
+    def __dedupe(self, src: str, dest: str, size: int) -> bool:
+        candidates = [dest] if os.path.isfile(dest) and self.__size(dest) == size else []
+        with self.lock:
+            candidates += [path for path in self.placed.get(size, []) if path != dest]
+        if not candidates:
+            return False
+        digest = self.__digest(src)
+        for candidate in candidates:
+            if digest is None or self.__digest(candidate) != digest:
+                continue
+            if candidate == dest or self.__place(candidate, dest, "hardlink"):
+                with self.lock:
+                    self.digests[dest] = digest
+                return True
+        return False
+
+    def __strategies(self, devices: Optional[Tuple[int, int]]) -> List[str]:
+        if self.strategy != "auto":
+            return [self.strategy, "copy"] if self.strategy != "copy" else ["copy"]
+        strategies = ["reflink", "copy_file_range", "sendfile", "copy"]
+        with self.lock:
+            known = self.devices.get(devices) if devices else None
+        if known:
+            strategies = strategies[strategies.index(known):]
+        return strategies
+
+    def __place(self, src: str, dest: str, strategy: str) -> bool:
+        if os.path.lexists(dest):
+            # Never write through an existing file, it may be a hardlink to a file placed earlier
+            os.unlink(dest)
+        if strategy == "copy":
+            shutil.copyfile(src, dest)
+            return True
+        try:
+            if strategy == "hardlink":
+                os.link(src, dest)
+            elif strategy == "reflink" and fcntl:
+                with open(src, "rb") as fsrc, open(dest, "wb") as fdest:
+                    fcntl.ioctl(fdest.fileno(), self.FICLONE, fsrc.fileno())
+            elif strategy == "copy_file_range" and hasattr(os, "copy_file_range"):
+                self.__copy_range(src, dest, os.copy_file_range)  # type: ignore[attr-defined]
+            elif strategy == "sendfile" and hasattr(os, "sendfile"):
+                self.__copy_range(src, dest, lambda fsrc, fdest, count: os.sendfile(fdest, fsrc, None, count))
+            else:
+                return False
+            return True
+        except OSError as e:
+            logging.debug(f"Unable to place {src} at {dest} with {strategy}: {e}")
+            if os.path.lexists(dest):
+                os.unlink(dest)
+            return False
+
+    @classmethod
+    def __copy_range(cls, src: str, dest: str, copy: Callable[[int, int, int], int]) -> None:
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdest:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = copy(fsrc.fileno(), fdest.fileno(), min(remaining, 1024 ** 3))
+                if copied == 0:
+                    raise OSError(f"Unexpected end of {src}")
+                remaining -= copied
+
+    @classmethod
+    def __devices(cls, src: str, dest: str) -> Optional[Tuple[int, int]]:
+        try:
+            return (os.stat(src).st_dev, os.stat(os.path.dirname(dest) or ".").st_dev)
+        except OSError:
+            return None
+
+    def __digest(self, path: str) -> Optional[str]:
+        with self.lock:
+            digest = self.digests.get(path)
+        if digest:
+            return digest
+        try:
+            sha = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    sha.update(chunk)
+        except OSError:
+            return None
+        # Only placed files keep their contents for the rest of the build
+        with self.lock:
+            if any(path in paths for paths in self.placed.values()):
+                self.digests[path] = sha.hexdigest()
+        return sha.hexdigest()
+
+    @classmethod
+    def __size(cls, path: str) -> Optional[int]:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return None
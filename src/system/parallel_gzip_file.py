@@ -0,0 +1,75 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import collections
+import concurrent.futures
+import io
+import zlib
+from typing import Any, Deque
+
+"""
+This class writes a gzip file compressed on several threads, like pigz. What is written is split into blocks that are
+compressed into independent gzip members by a thread pool, zlib releasing the GIL while it compresses, and the members
+are written in order. A file with several members is a standard gzip file, that gzip, gunzip and tarfile read as one
+stream. Members have no file name and a zero modification time, so that the same data, compression level and block
+size always give the same file.
+"""
+
+
+class ParallelGzipFile(io.RawIOBase):
+    BLOCK_SIZE = 4 * 1024 * 1024
+
+    def __init__(self, path: str, compresslevel: int = 9, workers: int = 4, block_size: int = BLOCK_SIZE) -> None:
+        super().__init__()
+        self.path = path
+        self.compresslevel = compresslevel
+        self.workers = workers
+        self.block_size = block_size
+        self.buffer = bytearray()
+        self.members = 0
+        self.pending: Deque[concurrent.futures.Future] = collections.deque()
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gzip")
+        self.file = open(path, "wb")
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self.buffer += data
+        while len(self.buffer) >= self.block_size:
+            self.__submit(bytes(self.buffer[:self.block_size]))
+            del self.buffer[:self.block_size]
+        return len(data)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            # An empty file is a single empty member
+            if self.buffer or not self.members:
+                self.__submit(bytes(self.buffer))
+                self.buffer.clear()
+            while self.pending:
+                self.file.write(self.pending.popleft().result())
+        finally:
+            for future in self.pending:
+                future.cancel()
+            self.executor.shutdown(wait=True)
+            self.file.close()
+            super().close()
+
+    def __submit(self, block: bytes) -> None:
+        self.pending.append(self.executor.submit(self.__compress, block, self.compresslevel))
+        self.members += 1
+        # Bound the memory used by blocks waiting to be written
+        while len(self.pending) > 2 * self.workers:
+            self.file.write(self.pending.popleft().result())
+
+    @classmethod
+    def __compress(cls, block: bytes, compresslevel: int) -> bytes:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(block) + compressor.flush()
@@ -9,6 +9,8 @@
 
 import os
 import zipfile
+import zlib
+from typing import Optional, Tuple
 
 
 class ZipFile(zipfile.ZipFile):
@@ -23,3 +25,48 @@ class ZipFile(zipfile.ZipFile):
             os.chmod(targetpath, attr)
 
         return targetpath
+
+    @classmethod
+    def compress(cls, filename: str, arcname: str, compress_type: int, compresslevel: Optional[int] = None) -> Tuple[zipfile.ZipInfo, bytes]:
+        """
+        Read and compress a file like ZipFile.write does, outside of any ZipFile, so that files can be compressed on
+        several threads and then written in order with write_compressed. The whole file is held in memory, callers
+        write large files with ZipFile.write instead.
+
+        :param compress_type: ZIP_STORED or ZIP_DEFLATED.
+        """
+        zinfo = zipfile.ZipInfo.from_file(filename, arcname)
+        zinfo.compress_type = compress_type
+        with open(filename, "rb") as f:
+            data = f.read()
+        zinfo.file_size = len(data)
+        zinfo.CRC = zlib.crc32(data)
+        if compress_type == zipfile.ZIP_DEFLATED:
+            compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION if compresslevel is None else compresslevel, zlib.DEFLATED, -15)
+            data = compressor.compress(data) + compressor.flush()
+        zinfo.compress_size = len(data)
+        return zinfo, data
+
+    def write_compressed(self, zinfo: zipfile.ZipInfo, data: bytes) -> None:
+        """
+        Write a file returned by compress, with the same header and data as ZipFile.write.
+
+        This is the only use of the internals of zipfile.ZipFile, there is no public API to write data that is already
+        compressed. It follows ZipFile.write, and writes the same bytes as ZipFile.write with CPython 3.8 to 3.13.
+        """
+        with self._lock:  # type: ignore[attr-defined]
+            zinfo.flag_bits = 0x00
+            # Compressed size can be larger than uncompressed size
+            zip64 = zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+            if zip64 and not self._allowZip64:  # type: ignore[attr-defined]
+                raise zipfile.LargeZipFile("Filesize would require ZIP64 extensions")
+            if self._seekable:  # type: ignore[attr-defined]
+                self.fp.seek(self.start_dir)
+            zinfo.header_offset = self.fp.tell()
+            self._writecheck(zinfo)  # type: ignore[attr-defined]
+            self._didModify = True
+            self.fp.write(zinfo.FileHeader(zip64))
+            self.fp.write(data)
+            self.start_dir = self.fp.tell()
+            self.filelist.append(zinfo)
+            self.NameToInfo[zinfo.filename] = zinfo
@@ -51,6 +51,7 @@ class BwcTestSuite(abc.ABC):
             self.component.repository,
             self.component.commit_id,
             os.path.join(self.work_dir, self.component.name),
+            # Not a sparse checkout, Gradle builds in a subdirectory use gradle/wrapper, buildSrc or settings.gradle at the root
             test_config.working_directory
         )
 
@@ -53,6 +53,7 @@ class IntegTestSuiteOpenSearch(IntegTestSuite):
             self.component.repository,
             self.component.commit_id,
             os.path.join(self.work_dir, self.component.name),
+            # Not a sparse checkout, Gradle builds in a subdirectory use gradle/wrapper, buildSrc or settings.gradle at the root
             test_config.working_directory
         )
 
@@ -5,6 +5,7 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import json
 import os
 import tempfile
 import unittest
@@ -12,11 +13,13 @@ from typing import Any
 from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
+import yaml
 
 from build_workflow.build_incremental import BuildIncremental
 from manifests.build_manifest import BuildManifest
-from manifests.input_manifest import InputManifest
+from manifests.input_manifest import InputComponentFromSource, InputManifest
 from run_build import main
+from system.temporary_directory import TemporaryDirectory
 
 
 class TestRunBuild(unittest.TestCase):
@@ -24,6 +27,20 @@ class TestRunBuild(unittest.TestCase):
     def _capfd(self, capfd: Any) -> None:
         self.capfd = capfd
 
+    def setUp(self) -> None:
+        # Never fetch from the network in the background
+        patcher = patch("run_build.BuildPrefetch")
+        self.mock_prefetch = patcher.start()
+        self.addCleanup(patcher.stop)
+        # Never write build journals into the current directory
+        patcher = patch("run_build.BuildJournal")
+        self.mock_journal = patcher.start()
+        self.mock_journal.return_value.finished = {}
+        self.addCleanup(patcher.stop)
+        # Output directories are created in the current directory
+        self.tmp_dir = TemporaryDirectory(chdir=True)
+        self.addCleanup(self.tmp_dir.__exit__, None, None, None)
+
     @patch("argparse._sys.argv", ["run_build.py", "--help"])
     def test_usage(self) -> None:
         with self.assertRaises(SystemExit):
@@ -62,6 +79,7 @@ class TestRunBuild(unittest.TestCase):
         main()
         self.assertNotEqual(mock_builder.return_value.build.call_count, 0)
         self.assertEqual(mock_builder.return_value.build.call_count, mock_builder.return_value.export_artifacts.call_count)
+        self.assertEqual(mock_builder.return_value.build.call_count, mock_recorder.return_value.check_artifacts.call_count)
         mock_recorder.return_value.write_manifest.assert_called()
 
     @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "darwin"])
@@ -135,7 +153,7 @@ class TestRunBuild(unittest.TestCase):
     @patch("logging.info")
     def test_main_manifest_lock_without_changes(self, mock_logging: Mock, mock_to_file: Mock, mock_stable: Mock, *mocks: Any) -> None:
         main()
-        mock_stable.assert_called_with()
+        mock_stable.assert_called_with(ref_cache=None)
         mock_to_file.assert_not_called()
         mock_logging.assert_called_with(f"No changes since {self.OPENSEARCH_MANIFEST}.lock")
 
@@ -147,7 +165,7 @@ class TestRunBuild(unittest.TestCase):
     @patch("logging.info")
     def test_main_manifest_lock_with_changes(self, mock_logging: Mock, mock_to_file: Mock, mock_stable: Mock, *mocks: Any) -> None:
         main()
-        mock_stable.assert_called_with()
+        mock_stable.assert_called_with(ref_cache=None)
         mock_to_file.assert_called_with(self.OPENSEARCH_MANIFEST + ".lock")
         mock_logging.assert_called_with(f"Updating {self.OPENSEARCH_MANIFEST}.lock")
 
@@ -159,7 +177,7 @@ class TestRunBuild(unittest.TestCase):
     @patch("logging.info")
     def test_main_manifest_new_lock(self, mock_logging: Mock, mock_to_file: Mock, mock_stable: Mock, *mocks: Any) -> None:
         main()
-        mock_stable.assert_called_with()
+        mock_stable.assert_called_with(ref_cache=None)
         mock_to_file.assert_called_with(self.OPENSEARCH_MANIFEST + ".lock")
         mock_logging.assert_called_with(f"Creating {self.OPENSEARCH_MANIFEST}.lock")
 
@@ -171,7 +189,7 @@ class TestRunBuild(unittest.TestCase):
     @patch("logging.info")
     def test_main_manifest_new_lock_with_overrides(self, mock_logging: Mock, mock_to_file: Mock, mock_stable: Mock, *mocks: Any) -> None:
         main()
-        mock_stable.assert_called_with()
+        mock_stable.assert_called_with(ref_cache=None)
         mock_to_file.assert_called_with(self.OPENSEARCH_MANIFEST + ".lock")
         mock_logging.assert_called_with(f"Creating {self.OPENSEARCH_MANIFEST}.lock")
 
@@ -183,7 +201,7 @@ class TestRunBuild(unittest.TestCase):
     @patch("logging.info")
     def test_main_manifest_lock_without_changes_input_schema_1_1(self, mock_logging: Mock, mock_to_file: Mock, mock_stable: Mock, *mocks: Any) -> None:
         main()
-        mock_stable.assert_called_with()
+        mock_stable.assert_called_with(ref_cache=None)
         mock_to_file.assert_not_called()
         mock_logging.assert_called_with(f"No changes since {self.OPENSEARCH_MANIFEST_2_12}.lock")
 
@@ -229,6 +247,331 @@ class TestRunBuild(unittest.TestCase):
         main()
         mock_logging_error.assert_called_with("Failed plugins are ['sql', 'alerting']")
 
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--parallel", "4"])
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_parallel(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        main()
+        self.assertNotEqual(mock_builder.return_value.build.call_count, 0)
+        self.assertEqual(mock_builder.return_value.build.call_count, mock_builder.call_count)
+        self.assertEqual(mock_builder.return_value.export_artifacts.call_count, mock_builder.call_count)
+        self.assertEqual(mock_builder.call_args_list[0][0][0].name, "OpenSearch")
+        mock_recorder.return_value.write_manifest.assert_called()
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--parallel", "4", "--memory-budget", "16"])
+    @patch("run_build.BuildResources")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_parallel_resources(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, mock_resources: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        main()
+        mock_resources.assert_called_with(16 * 1024 ** 3)
+        self.assertEqual(mock_resources.return_value.reserve.call_count, mock_builder.return_value.build.call_count)
+        mock_resources.return_value.reserve.assert_any_call("OpenSearch", os.path.join(tempfile.gettempdir(), "OpenSearch"))
+        mock_resources.return_value.close.assert_called_once()
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--parallel", "4", "--no-resource-governor"])
+    @patch("run_build.BuildResources")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_parallel_no_resource_governor(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, mock_resources: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        main()
+        mock_resources.assert_not_called()
+        self.assertNotEqual(mock_builder.return_value.build.call_count, 0)
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--workspace", os.path.join(tempfile.gettempdir(), "workspace")])
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_workspace(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        main()
+        workspace = os.path.realpath(os.path.join(tempfile.gettempdir(), "workspace"))
+        self.assertTrue(os.path.isdir(workspace))
+        os.rmdir(workspace)
+        self.assertEqual(mock_builder.call_args[0][3:5], (True, False))
+        mock_builder.return_value.checkout.assert_called_with(workspace)
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--shared-caches"])
+    @patch("run_build.BuildToolCaches")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_shared_caches(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, mock_caches: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        main()
+        mock_caches.assert_called_with(os.path.join(tempfile.gettempdir(), ".caches"))
+        self.assertEqual(mock_builder.call_args[0][5], mock_caches.return_value)
+        mock_caches.return_value.summary.assert_called_once()
+
+    @patch("argparse._sys.argv", ["run_build.py", INPUT_MANIFEST_PATH, "-p", "linux", "--component", "geospatial", "--plan"])
+    @patch("run_build.BuildHistory")
+    @patch("run_build.Builders.builder_from")
+    @patch("run_build.TemporaryDirectory")
+    @patch("run_build.BuildOutputDir")
+    @patch("git.git_repository.GitRepository.existing_paths", return_value=[])
+    def test_main_plan(self, mock_existing_paths: Mock, mock_output_dir: Mock, mock_temp: Mock, mock_builder: Mock, mock_history: Mock) -> None:
+        mock_history.return_value.estimate.return_value = 60.0
+        mock_output_dir.return_value.dir = os.path.join("tar", "builds", "opensearch")
+        stable = InputManifest.from_path(self.INPUT_MANIFEST_PATH)
+        geospatial = stable.components["geospatial"]
+        assert isinstance(geospatial, InputComponentFromSource)
+        geospatial.ref = "0" * 40
+        with patch.object(InputManifest, "stable", return_value=stable) as mock_stable:
+            self.assertEqual(main(), 0)
+        mock_stable.assert_called_once()
+        mock_temp.assert_not_called()
+        mock_builder.assert_not_called()
+        mock_output_dir.assert_called_once_with("opensearch", "tar", None, makedirs=False)
+        mock_existing_paths.assert_called_once_with(geospatial.repository, "0" * 40, ["build.sh", "scripts/build.sh"])
+        out, _ = self.capfd.readouterr()
+        plan = json.loads(out)
+        self.assertEqual(plan["components"][0]["name"], "geospatial")
+        self.assertEqual(plan["components"][0]["commit_id"], "0" * 40)
+        self.assertEqual(plan["components"][0]["estimate"], 60.0)
+        self.assertEqual(plan["build"]["targets"][0]["platform"], "linux")
+
+    @patch("argparse._sys.argv", ["run_build.py", INPUT_MANIFEST_PATH, "--incremental", "-p", "linux", "--plan"])
+    @patch("run_build.BuildIncremental.commits_diff", return_value=[])
+    @patch("run_build.BuildIncremental.rebuild_plugins", return_value=[])
+    @patch("manifests.build_manifest.BuildManifest.from_path")
+    @patch("manifests.build_manifest.BuildManifest.to_file")
+    def test_main_plan_incremental_no_change(self, mock_to_file: Mock, mock_build_manifest: Mock, *mocks: Any) -> None:
+        mock_build_manifest.return_value = self.BUILD_MANIFEST
+        self.assertEqual(main(), 0)
+        mock_to_file.assert_not_called()
+        out, _ = self.capfd.readouterr()
+        plan = json.loads(out)
+        self.assertTrue(plan["build"]["incremental"])
+        self.assertEqual(plan["components"], [])
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--prefetch"])
+    @patch.dict(os.environ, {"OPENSEARCH_BUILD_GIT_MIRROR": ""})
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_prefetch(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        main()
+        mirror, download_dir = self.mock_prefetch.call_args[0]
+        self.assertEqual((mirror.path, mirror.shallow), (os.path.join(os.path.realpath(tempfile.gettempdir()), ".git-mirror"), True))
+        self.assertEqual(download_dir, os.path.join(tempfile.gettempdir(), ".prefetch"))
+        components, targets = self.mock_prefetch.return_value.start.call_args[0]
+        self.assertEqual([component.name for component in components], [call_args[0][0].name for call_args in mock_builder.call_args_list])
+        self.assertEqual(targets[0].platform, "linux")
+        self.assertTrue(all(call_args[0][6] == self.mock_prefetch.return_value for call_args in mock_builder.call_args_list))
+        self.mock_prefetch.return_value.close.assert_called_once()
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--prefetch", "--workspace", "workspace"])
+    @patch.dict(os.environ, {"OPENSEARCH_BUILD_GIT_MIRROR": ""})
+    @patch("os.makedirs")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_prefetch_workspace(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        main()
+        self.assertIsNone(self.mock_prefetch.call_args[0][0])
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux"])
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_no_prefetch(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        main()
+        self.mock_prefetch.assert_not_called()
+        self.assertTrue(all(call_args[0][6] is None for call_args in mock_builder.call_args_list))
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--prefetch"])
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_prefetch_error(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_builder.return_value.build.side_effect = Exception("Error building")
+        with self.assertRaises(Exception):
+            main()
+        # pending fetches are cancelled
+        self.mock_prefetch.return_value.close.assert_called_once()
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux"])
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_invalid_artifacts_not_finished(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_recorder.return_value.check_artifacts.side_effect = Exception("Artifact is invalid")
+        with self.assertRaises(Exception):
+            main()
+        mock_builder.return_value.export_artifacts.assert_called_once()
+        # invalid artifacts are never stored in the build cache
+        mock_builder.return_value.finish.assert_not_called()
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "-d", "tar", "rpm", "-a", "x64", "arm64"])
+    @patch("run_build.BuildJournal")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_multiple_targets(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, mock_journal: Mock) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_journal.return_value.finished = {}
+        main()
+        targets = [call_args[0][0] for call_args in mock_recorder.call_args_list]
+        self.assertEqual([(target.distribution, target.architecture) for target in targets], [("tar", "x64"), ("tar", "arm64"), ("rpm", "x64"), ("rpm", "arm64")])
+        self.assertEqual(targets[1].output_dir, os.path.join(os.getcwd(), "linux", "arm64", "tar", "builds", "opensearch"))
+        skip_maven = [call_args[0][6] for call_args in mock_recorder.call_args_list]
+        self.assertEqual(skip_maven[0], [])
+        built = [call_args[0][0].name for call_args in mock_builder.call_args_list]
+        self.assertEqual([sorted(names) for names in skip_maven[1:]], [sorted(built)] * 3)
+        # each component is checked out once and built for every target
+        components = len(mock_builder.call_args_list)
+        self.assertNotEqual(components, 0)
+        self.assertEqual(mock_builder.return_value.build.call_count, 4 * components)
+        self.assertEqual(mock_builder.return_value.retarget.call_args_list[:4], [call(target) for target in targets])
+        self.assertEqual(mock_recorder.return_value.write_manifest.call_count, 4)
+
+    @patch("run_build.BuildJournal")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_multiple_platforms_skip_maven(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, mock_journal: Mock) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_journal.return_value.finished = {}
+        with open(self.INPUT_MANIFEST_PATH) as f:
+            data = yaml.safe_load(f)
+        # security is not built for windows, its maven artifacts are recorded for linux
+        next(component for component in data["components"] if component["name"] == "security")["platforms"] = ["linux"]
+        with TemporaryDirectory() as tmp_dir:
+            manifest_path = os.path.join(tmp_dir.name, "opensearch-input-2.12.0.yml")
+            with open(manifest_path, "w") as f:
+                yaml.safe_dump(data, f)
+            with patch("argparse._sys.argv", ["run_build.py", manifest_path, "-p", "windows", "linux", "-d", "zip"]):
+                main()
+        targets = [call_args[0][0] for call_args in mock_recorder.call_args_list]
+        self.assertEqual([target.platform for target in targets], ["windows", "linux"])
+        skip_maven = [call_args[0][6] for call_args in mock_recorder.call_args_list]
+        self.assertEqual(skip_maven[0], [])
+        self.assertIn("OpenSearch", skip_maven[1])
+        self.assertNotIn("security", skip_maven[1])
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--resume"])
+    @patch("manifests.input.input_manifest_1_0.InputManifest_1_0.stable", return_value=InputManifest.from_path(OPENSEARCH_MANIFEST_2_12))
+    @patch("run_build.BuildJournal")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_resume(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, mock_journal: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_journal.return_value.finished = {"OpenSearch": {"name": "OpenSearch"}}
+        main()
+        self.assertEqual(mock_journal.call_args[0][1], True)
+        self.assertEqual(mock_journal.call_args[0][2]["OpenSearch"], "c85e75cb4db7946d7d4dfd0e7317c3f684e6345d")
+        built = [call_args[0][0].name for call_args in mock_builder.call_args_list]
+        self.assertNotEqual(len(built), 0)
+        self.assertNotIn("OpenSearch", built)
+        self.assertEqual(mock_recorder.return_value.finish_component.call_count, len(built))
+        mock_journal.return_value.complete.assert_called_once()
+
+    @patch("run_build.BuildJournal")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_shard(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, mock_journal: Mock) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_journal.return_value.finished = {}
+        built = []
+        for shard in ["1/2", "2/2"]:
+            mock_builder.reset_mock()
+            with patch("argparse._sys.argv", ["run_build.py", self.INPUT_MANIFEST_PATH, "-p", "linux", "--shard", shard]):
+                main()
+            output_dir = mock_recorder.call_args[0][0].output_dir
+            self.assertEqual(output_dir, os.path.join(os.getcwd(), "tar", "shards", "opensearch", shard.replace("/", "-of-")))
+            built.append([call_args[0][0].name for call_args in mock_builder.call_args_list])
+        self.assertEqual(built[0][0], "OpenSearch")
+        self.assertEqual(built[1][0], "OpenSearch")
+        self.assertEqual(set(built[0]) | set(built[1]), set(self.INPUT_MANIFEST.components.keys()))
+        self.assertLess(len(built[0]), len(self.INPUT_MANIFEST.components))
+
+    @patch("run_build.BuildCache")
+    @patch("run_build.BuildJournal")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_shard_build_cache(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, mock_journal: Mock, mock_cache: Mock) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_journal.return_value.finished = {}
+        for shard, awaited in [("1/2", []), ("2/2", ["OpenSearch"])]:
+            with patch("argparse._sys.argv", ["run_build.py", self.INPUT_MANIFEST_PATH, "-p", "linux", "--shard", shard, "--build-cache"]):
+                main()
+            # the first shard builds the core components, the other shards restore them from the build cache
+            self.assertEqual(mock_cache.call_args[0][2], awaited)
+
+    @patch("argparse._sys.argv", ["run_build.py", INPUT_MANIFEST_PATH, "--merge"])
+    @patch("run_build.BuildOutputDir")
+    @patch("run_build.BuildMerge")
+    def test_main_merge(self, mock_merge: Mock, mock_output_dir: Mock) -> None:
+        mock_output_dir.return_value.dir = "builds"
+        self.assertEqual(main(), 0)
+        mock_merge.find.assert_called_with(os.path.join(os.getcwd(), "tar", "shards", "opensearch"))
+        self.assertEqual(mock_merge.call_args[0][:2], (mock_merge.find.return_value, "builds"))
+        mock_merge.return_value.write.assert_called_with(list(self.INPUT_MANIFEST.components.keys()))
+
+    @patch("argparse._sys.argv", ["run_build.py", INPUT_MANIFEST_PATH, "--merge", "-p", "linux", "windows", "-a", "x64"])
+    @patch("run_build.BuildOutputDir")
+    @patch("run_build.BuildMerge")
+    def test_main_merge_multiple_platforms(self, mock_merge: Mock, mock_output_dir: Mock) -> None:
+        mock_output_dir.return_value.dir = "builds"
+        self.assertEqual(main(), 0)
+        self.assertEqual(
+            [call_args[0][0] for call_args in mock_merge.find.call_args_list],
+            [os.path.join(os.getcwd(), platform, "x64", "tar", "shards", "opensearch") for platform in ["linux", "windows"]],
+        )
+        self.assertEqual(
+            mock_output_dir.call_args_list,
+            [call("opensearch", "tar", os.path.join(os.getcwd(), platform, "x64")) for platform in ["linux", "windows"]],
+        )
+
+    @patch("argparse._sys.argv", ["run_build.py", INPUT_MANIFEST_PATH, "-p", "linux", "--continue-on-error", "--parallel", "2",
+                                  "--component", "job-scheduler", "geospatial", "security"])
+    @patch("run_build.Builders.builder_from")
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    @patch("run_build.logging.error")
+    def test_main_parallel_failure_skips_dependents(self, mock_logging_error: Mock, mock_temp: Mock, mock_recorder: Mock, mock_builder_from: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+
+        def builder_from(component: Any, target: Any, *args: Any) -> MagicMock:
+            builder = MagicMock()
+            if component.name == "security":
+                builder.build.side_effect = Exception("Error during build")
+            return builder
+
+        mock_builder_from.side_effect = builder_from
+        main()
+        self.assertEqual(sorted(call_args[0][0].name for call_args in mock_builder_from.call_args_list), ["geospatial", "job-scheduler", "security"])
+        mock_logging_error.assert_called_with("Failed plugins are ['security']")
+
+    @patch("argparse._sys.argv", ["run_build.py", INPUT_MANIFEST_PATH, "-p", "linux", "--parallel", "2", "--component", "job-scheduler", "geospatial"])
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    @patch("run_build.logging.error")
+    def test_main_parallel_failure(self, mock_logging_error: Mock, mock_temp: Mock, mock_recorder: Mock, mock_builder_from: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_builder_from.return_value.build.side_effect = Exception("Error during build")
+        with pytest.raises(Exception, match="Error during build"):
+            main()
+        # geospatial depends on job-scheduler and is never started
+        self.assertEqual(mock_builder_from.call_count, 1)
+        mock_logging_error.assert_called_with(f"Error building job-scheduler, retry with: run_build.py {self.INPUT_MANIFEST_PATH} --component job-scheduler")
+        mock_recorder.return_value.write_manifest.assert_not_called()
+
     @patch("argparse._sys.argv", ["run_build.py", NON_OPENSEARCH_MANIFEST, "-p", "linux"])
     @patch("run_build.Builders.builder_from", return_value=MagicMock())
     @patch("run_build.BuildRecorder", return_value=MagicMock())
@@ -245,6 +588,7 @@ class TestRunBuild(unittest.TestCase):
 
     @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "--incremental"])
     @patch("os.path.exists")
+    @patch("run_build.BuildOutputDir")
     @patch("run_build.Builders.builder_from", return_value=MagicMock())
     @patch("run_build.BuildRecorder", return_value=MagicMock())
     @patch("manifests.build_manifest.BuildManifest.from_path")
@@ -258,6 +602,22 @@ class TestRunBuild(unittest.TestCase):
         self.assertEqual(mock_build_incremental.call_count, 1)
         mock_build_incremental.return_value.commits_diff.assert_called()
         mock_build_incremental.return_value.rebuild_plugins.assert_called()
+        mock_build_incremental.return_value.explain.assert_not_called()
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "--incremental", "--explain"])
+    @patch("os.path.exists")
+    @patch("run_build.BuildOutputDir")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("manifests.build_manifest.BuildManifest.from_path")
+    @patch("run_build.TemporaryDirectory")
+    @patch("run_build.BuildIncremental")
+    def test_main_incremental_explain(self, mock_build_incremental: MagicMock, mock_temp: MagicMock,
+                                      mock_build_manifest: MagicMock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_build_manifest.return_value = self.BUILD_MANIFEST
+        main()
+        mock_build_incremental.return_value.explain.assert_called_once_with(mock_build_incremental.return_value.rebuild_plugins.return_value)
 
     @patch.dict(os.environ, {"BUILD_NUMBER": "1234"})
     @patch("argparse._sys.argv", ["run_build.py", INPUT_MANIFEST_PATH, "--incremental", "-p", "linux"])
@@ -295,6 +655,7 @@ class TestRunBuild(unittest.TestCase):
         except FileNotFoundError:
             pass
 
+    @patch("run_build.BuildJournal")
     @patch("argparse._sys.argv", ["run_build.py", INPUT_MANIFEST_PATH, "--incremental", "-p", "linux"])
     @patch("run_build.BuildIncremental.commits_diff", return_value=MagicMock())
     @patch("run_build.BuildIncremental.rebuild_plugins", return_value=MagicMock())
@@ -329,6 +690,7 @@ class TestRunBuild(unittest.TestCase):
         mock_recorder.assert_called_once()
         mock_recorder.return_value.write_manifest.assert_called()
 
+    @patch("run_build.BuildJournal")
     @patch("argparse._sys.argv", ["run_build.py", INPUT_MANIFEST_PATH, "--incremental", "-p", "linux", "--continue-on-error"])
     @patch("run_build.BuildIncremental.commits_diff", return_value=MagicMock())
     @patch("run_build.BuildIncremental.rebuild_plugins", return_value=MagicMock())
@@ -369,6 +731,7 @@ class TestRunBuild(unittest.TestCase):
         mock_recorder.assert_called_once()
         mock_recorder.return_value.write_manifest.assert_not_called()
 
+    @patch("run_build.BuildJournal")
     @patch("argparse._sys.argv", ["run_build.py", INPUT_MANIFEST_PATH, "--incremental", "-p", "linux", "--continue-on-error"])
     @patch("run_build.BuildIncremental.commits_diff", return_value=MagicMock())
     @patch("run_build.BuildIncremental.rebuild_plugins", return_value=MagicMock())
@@ -53,3 +53,44 @@ class TestAssembleArgs(unittest.TestCase):
     @patch("argparse._sys.argv", [ASSEMBLE_PY, OPENSEARCH_MANIFEST, "--base-url", "url"])
     def test_base_url(self) -> None:
         self.assertEqual(AssembleArgs().base_url, "url")
+
+    @patch("argparse._sys.argv", [ASSEMBLE_PY, OPENSEARCH_MANIFEST])
+    def test_parallel_default(self) -> None:
+        self.assertEqual(AssembleArgs().parallel, 1)
+
+    @patch("argparse._sys.argv", [ASSEMBLE_PY, OPENSEARCH_MANIFEST, "--parallel", "4"])
+    def test_parallel(self) -> None:
+        self.assertEqual(AssembleArgs().parallel, 4)
+
+    @patch("argparse._sys.argv", [ASSEMBLE_PY, OPENSEARCH_MANIFEST, "--parallel", "0"])
+    def test_parallel_invalid(self) -> None:
+        with self.assertRaises(SystemExit):
+            AssembleArgs()
+
+    @patch("argparse._sys.argv", [ASSEMBLE_PY, OPENSEARCH_MANIFEST])
+    def test_fast_install_default(self) -> None:
+        self.assertFalse(AssembleArgs().fast_install)
+
+    @patch("argparse._sys.argv", [ASSEMBLE_PY, OPENSEARCH_MANIFEST, "--fast-install"])
+    def test_fast_install(self) -> None:
+        self.assertTrue(AssembleArgs().fast_install)
+
+    @patch("argparse._sys.argv", [ASSEMBLE_PY, OPENSEARCH_MANIFEST])
+    def test_compression_default(self) -> None:
+        self.assertIsNone(AssembleArgs().compression_level)
+        self.assertEqual(AssembleArgs().compression_threads, 1)
+
+    @patch("argparse._sys.argv", [ASSEMBLE_PY, OPENSEARCH_MANIFEST, "--compression-level", "6", "--compression-threads", "8"])
+    def test_compression(self) -> None:
+        self.assertEqual(AssembleArgs().compression_level, 6)
+        self.assertEqual(AssembleArgs().compression_threads, 8)
+
+    @patch("argparse._sys.argv", [ASSEMBLE_PY, OPENSEARCH_MANIFEST, "--compression-level", "10"])
+    def test_compression_level_invalid(self) -> None:
+        with self.assertRaises(SystemExit):
+            AssembleArgs()
+
+    @patch("argparse._sys.argv", [ASSEMBLE_PY, OPENSEARCH_MANIFEST, "--compression-threads", "0"])
+    def test_compression_threads_invalid(self) -> None:
+        with self.assertRaises(SystemExit):
+            AssembleArgs()
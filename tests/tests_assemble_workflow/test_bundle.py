@@ -7,6 +7,7 @@
 
 import os
 import unittest
+from typing import List
 from unittest.mock import MagicMock, Mock, patch
 
 from assemble_workflow.bundle import Bundle
@@ -18,6 +19,9 @@ class TestBundle(unittest.TestCase):
         def install_plugin(self, plugin: BuildComponent) -> None:
             pass
 
+        def install_plugins(self, tmp_paths: List[str]) -> None:
+            pass
+
     @patch("assemble_workflow.dist.Dist.extract")
     def test_bundle(self, dist_extract: Mock) -> None:
         manifest_path = os.path.join(os.path.dirname(__file__), "data/opensearch-build-linux-1.1.0.yml")
@@ -49,6 +53,18 @@ class TestBundle(unittest.TestCase):
         self.assertTrue(bundle.min_dist.path.endswith("opensearch-min-1.3.0-windows-x64.zip"))
         dist_extract.assert_called_once()
 
+    def test_bundle_min_dist_not_copied(self) -> None:
+        manifest_path = os.path.join(os.path.dirname(__file__), "data/opensearch-build-linux-1.1.0.yml")
+        artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
+        bundle_recorder = MagicMock()
+        with patch("shutil.copyfile") as mock_copyfile:
+            bundle = self.DummyBundle(BuildManifest.from_path(manifest_path), artifacts_path, bundle_recorder)
+            mock_copyfile.assert_not_called()
+        self.assertEqual(bundle.min_dist.path, os.path.join(artifacts_path, "dist", "opensearch-min-1.1.0-linux-x64.tar.gz"))
+        self.assertTrue(os.path.isfile(os.path.join(bundle.min_dist.archive_path, "opensearch.txt")))
+        self.assertEqual(os.listdir(bundle.tmp_dir.name), ["opensearch-1.1.0"])
+        bundle_recorder.record_component.assert_called_once_with(bundle.components["OpenSearch"], "dist/opensearch-min-1.1.0-linux-x64.tar.gz")
+
     def test_bundle_does_not_exist_raises_error(self) -> None:
         manifest_path = os.path.join(os.path.dirname(__file__), "data/opensearch-build-linux-1.1.0.yml")
         with self.assertRaises(FileNotFoundError) as ctx:
@@ -8,9 +8,10 @@
 import os
 import unittest
 import zipfile
-from unittest.mock import MagicMock, Mock, call, patch
+from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 from assemble_workflow.bundle_opensearch import BundleOpenSearch
+from assemble_workflow.plugin_installer import PluginInstaller
 from manifests.build_manifest import BuildManifest
 from paths.script_finder import ScriptFinder
 from system.os import current_platform
@@ -218,6 +219,133 @@ class TestBundleOpenSearch(unittest.TestCase):
                 )
         self.assertEqual(path_isfile.call_count, 2)
 
+    @patch("subprocess.check_call")
+    @patch("os.path.isfile", return_value=True)
+    def test_bundle_install_components_parallel(self, path_isfile: Mock, mock_check_call: Mock) -> None:
+        manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-linux-1.1.0.yml")
+        artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
+        serial_recorder = MagicMock()
+        serial_bundle = BundleOpenSearch(BuildManifest.from_path(manifest_path), artifacts_path, serial_recorder)
+        bundle_recorder = MagicMock()
+        bundle = BundleOpenSearch(BuildManifest.from_path(manifest_path), artifacts_path, bundle_recorder, workers=4)
+
+        with patch("shutil.copyfile") as mock_copyfile:
+            serial_bundle.install_components()
+            mock_check_call.reset_mock()
+            bundle.install_components()
+            self.assertEqual(mock_copyfile.call_count, 24)
+
+        self.assertEqual(
+            [(args[0].name, args[1:]) for args, _ in bundle_recorder.record_component.call_args_list],
+            [(args[0].name, args[1:]) for args, _ in serial_recorder.record_component.call_args_list],
+        )
+        script = "opensearch-plugin.bat" if current_platform() == "windows" else "opensearch-plugin"
+        install_plugin_bin = os.path.join(bundle.min_dist.archive_path, "bin", script)
+
+        def plugins(*names: str) -> str:
+            return " ".join(f"file:{os.path.join(bundle.tmp_dir.name, f'opensearch-{name}-1.1.0.0.zip')}" for name in names)
+
+        self.assertEqual(
+            mock_check_call.call_args_list,
+            [
+                call(
+                    f"{install_plugin_bin} install --batch {plugins('job-scheduler', 'sql', 'alerting', 'notifications', 'security')}",
+                    cwd=bundle.min_dist.archive_path,
+                    shell=True,
+                ),
+                call(
+                    f"{install_plugin_bin} install --batch {plugins('performance-analyzer')}",
+                    cwd=bundle.min_dist.archive_path,
+                    shell=True,
+                ),
+                call(
+                    " ".join(
+                        [
+                            "bash",
+                            ScriptFinder.find_install_script("performance-analyzer"),
+                            "-v 1.1.0",
+                            "-p linux",
+                            "-a x64",
+                            "-f",
+                            artifacts_path,
+                            "-o",
+                            bundle.min_dist.archive_path,
+                        ]
+                    ),
+                    cwd=bundle.min_dist.archive_path,
+                    shell=True,
+                ),
+                call(
+                    f"{install_plugin_bin} install --batch "
+                    f"{plugins('index-management', 'knn', 'anomaly-detection', 'asynchronous-search', 'reports-scheduler', 'notebooks')}",
+                    cwd=bundle.min_dist.archive_path,
+                    shell=True,
+                ),
+            ],
+        )
+
+    @patch.object(PluginInstaller, "install", return_value="opensearch-job-scheduler")
+    @patch("subprocess.check_call")
+    def test_bundle_install_plugin_fast(self, mock_check_call: Mock, mock_install: Mock) -> None:
+        manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-linux-1.1.0.yml")
+        artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
+        bundle_recorder = MagicMock()
+        bundle = BundleOpenSearch(BuildManifest.from_path(manifest_path), artifacts_path, bundle_recorder, fast_install=True)
+
+        with patch("shutil.copyfile") as mock_copyfile:
+            bundle.install_plugin(bundle.components["job-scheduler"])
+            mock_copyfile.assert_not_called()
+
+        mock_install.assert_called_once_with(os.path.join(artifacts_path, "plugins", "opensearch-job-scheduler-1.1.0.0.zip"))
+        bundle_recorder.record_component.assert_called_with(bundle.components["job-scheduler"], "plugins/opensearch-job-scheduler-1.1.0.0.zip")
+        mock_check_call.assert_called_once()
+        self.assertTrue(mock_check_call.call_args[0][0].startswith("bash "))
+
+    @patch.object(PluginInstaller, "install", side_effect=PluginInstaller.UnsupportedPluginError("plugin.zip", "it has a plugin-security.policy"))
+    @patch("subprocess.check_call")
+    @patch("os.path.isfile", return_value=True)
+    def test_bundle_install_plugin_fast_unsupported(self, path_isfile: Mock, mock_check_call: Mock, mock_install: Mock) -> None:
+        manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-linux-1.1.0.yml")
+        artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
+        bundle_recorder = MagicMock()
+        bundle = BundleOpenSearch(BuildManifest.from_path(manifest_path), artifacts_path, bundle_recorder, fast_install=True)
+
+        with patch("shutil.copyfile") as mock_copyfile:
+            bundle.install_plugin(bundle.components["job-scheduler"])
+            self.assertEqual(mock_copyfile.call_count, 1)
+
+        mock_install.assert_called_once()
+        bundle_recorder.record_component.assert_called_with(bundle.components["job-scheduler"], "plugins/opensearch-job-scheduler-1.1.0.0.zip")
+        script = "opensearch-plugin.bat" if current_platform() == "windows" else "opensearch-plugin"
+        install_plugin_bin = os.path.join(bundle.min_dist.archive_path, "bin", script)
+        self.assertEqual(
+            mock_check_call.call_args_list[0],
+            call(
+                f'{install_plugin_bin} install --batch file:{os.path.join(bundle.tmp_dir.name, "opensearch-job-scheduler-1.1.0.0.zip")}',
+                cwd=bundle.min_dist.archive_path,
+                shell=True,
+            ),
+        )
+
+    @patch("subprocess.check_call")
+    def test_bundle_install_plugins_fast(self, mock_check_call: Mock) -> None:
+        manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-linux-1.1.0.yml")
+        artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
+        bundle = BundleOpenSearch(BuildManifest.from_path(manifest_path), artifacts_path, MagicMock(), fast_install=True)
+
+        def install(path: str) -> str:
+            if path == "b.zip":
+                raise PluginInstaller.UnsupportedPluginError(path, "it has a plugin-security.policy")
+            return path
+
+        with patch.object(PluginInstaller, "install", side_effect=install) as mock_install:
+            bundle.install_plugins(["a.zip", "b.zip", "c.zip", "d.zip"])
+            self.assertEqual(mock_install.call_args_list, [call("a.zip"), call("b.zip"), call("c.zip"), call("d.zip")])
+
+        script = "opensearch-plugin.bat" if current_platform() == "windows" else "opensearch-plugin"
+        install_plugin_bin = os.path.join(bundle.min_dist.archive_path, "bin", script)
+        mock_check_call.assert_called_once_with(f"{install_plugin_bin} install --batch file:b.zip", cwd=bundle.min_dist.archive_path, shell=True)
+
     def test_bundle_package_tar(self) -> None:
         manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-linux-1.1.0.yml")
         artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
@@ -232,8 +360,8 @@ class TestBundleOpenSearch(unittest.TestCase):
             mock_tarfile_open.return_value.__enter__.return_value.add = mock_tarfile_add
             with patch("shutil.copyfile") as mock_copyfile:
                 bundle.package(os.path.dirname(__file__))
-                mock_tarfile_open.assert_called_with("opensearch.tar", "w:gz")
-                mock_tarfile_add.assert_called_with(os.path.join(bundle.tmp_dir.name, "opensearch-1.1.0"), arcname="opensearch-1.1.0")
+                mock_tarfile_open.assert_called_with("opensearch.tar", "w:gz", compresslevel=9)
+                mock_tarfile_add.assert_called_with(os.path.join(bundle.tmp_dir.name, "opensearch-1.1.0"), arcname="opensearch-1.1.0", filter=ANY)
                 self.assertEqual(mock_copyfile.call_count, 1)
 
     def test_bundle_package_zip(self) -> None:
@@ -250,6 +378,10 @@ class TestBundleOpenSearch(unittest.TestCase):
             mock_zipfile_open.return_value.__enter__.return_value.write = mock_zipfile_write
             with patch("shutil.copyfile") as mock_copyfile:
                 bundle.package(os.path.dirname(__file__))
-                mock_zipfile_open.assert_called_with("opensearch.zip", "w", zipfile.ZIP_DEFLATED)
-                mock_zipfile_write.assert_called_with(os.path.join(bundle.tmp_dir.name, "opensearch-1.3.0", "opensearch.txt"), os.path.join("opensearch-1.3.0", "opensearch.txt"))
+                mock_zipfile_open.assert_called_with("opensearch.zip", "w", zipfile.ZIP_DEFLATED, compresslevel=None)
+                mock_zipfile_write.assert_called_with(
+                    os.path.join(bundle.tmp_dir.name, "opensearch-1.3.0", "opensearch.txt"),
+                    os.path.join("opensearch-1.3.0", "opensearch.txt"),
+                    zipfile.ZIP_DEFLATED,
+                )
                 self.assertEqual(mock_copyfile.call_count, 1)
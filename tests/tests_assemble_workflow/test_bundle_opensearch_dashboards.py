@@ -103,3 +103,22 @@ class TestBundleOpenSearchDashboards(unittest.TestCase):
                     ]
                 )
         self.assertEqual(path_isfile.call_count, 2)
+
+    @patch("subprocess.check_call")
+    def test_bundle_install_plugins(self, mock_check_call: Mock) -> None:
+        manifest_path = os.path.join(os.path.dirname(__file__), "data/opensearch-dashboards-build-1.1.0.yml")
+        artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
+        bundle = BundleOpenSearchDashboards(BuildManifest.from_path(manifest_path), artifacts_path, MagicMock())
+
+        mock_check_call.reset_mock()
+        bundle.install_plugins(["a.zip", "b.zip"])
+
+        script = "opensearch-dashboards-plugin.bat" if current_platform() == "windows" else "opensearch-dashboards-plugin"
+        install_plugin_bin = os.path.join(bundle.min_dist.archive_path, "bin", script)
+        self.assertEqual(
+            mock_check_call.call_args_list,
+            [
+                call(f"{install_plugin_bin} --allow-root install file:a.zip", cwd=bundle.min_dist.archive_path, shell=True),
+                call(f"{install_plugin_bin} --allow-root install file:b.zip", cwd=bundle.min_dist.archive_path, shell=True),
+            ],
+        )
@@ -35,6 +35,13 @@ class TestBundles(unittest.TestCase):
         bundle = Bundles.create(BuildManifest.from_path(manifest_path), artifacts_path, MagicMock(), True)
         self.assertTrue(bundle.tmp_dir.keep)
 
+    def test_bundle_workers(self) -> None:
+        manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-linux-1.1.0.yml")
+        artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
+        bundle = Bundles.create(BuildManifest.from_path(manifest_path), artifacts_path, MagicMock(), False, 4, True)
+        self.assertEqual(bundle.workers, 4)
+        self.assertTrue(bundle.fast_install)
+
     def test_bundle_opensearch_invalid(self) -> None:
         manifest = BuildManifest(
             {
@@ -5,12 +5,18 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import io
 import os
+import tarfile
 import unittest
+import zipfile
+from typing import Any, List, Optional, Tuple
 from unittest.mock import MagicMock, Mock, call, patch
 
-from assemble_workflow.dist import DistDeb, DistRpm, DistTar
+from assemble_workflow.dist import DistDeb, DistRpm, DistTar, DistZip
 from manifests.build_manifest import BuildManifest
+from system.temporary_directory import TemporaryDirectory
+from system.zip_file import ZipFile
 
 
 class TestDist(unittest.TestCase):
@@ -60,6 +66,157 @@ class TestDist(unittest.TestCase):
         distTar_build.assert_called_once()
         shutil_copyfile.assert_called_once()
 
+    def __build_tar(self, work_dir: str, name: str, compression_threads: int) -> tarfile.TarFile:
+        dist = DistTar("OpenSearch", self.distTar.path, "opensearch-1.3.0", self.manifest.build, 6, compression_threads)
+        dist.archive_path = self.artifacts_path + "opensearch-1.3.0"
+        dist.__build__(os.path.join(work_dir, name), work_dir)
+        return tarfile.open(os.path.join(work_dir, name), "r:gz")
+
+    def test_build_tar_compression_threads(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            with self.__build_tar(work_dir.name, "serial.tar.gz", 1) as serial, self.__build_tar(work_dir.name, "parallel.tar.gz", 4) as parallel:
+                self.assertEqual(
+                    [(member.name, member.mode, member.mtime, member.size) for member in parallel.getmembers()],
+                    [(member.name, member.mode, member.mtime, member.size) for member in serial.getmembers()],
+                )
+                self.assertIn("opensearch-1.3.0", parallel.getnames())
+
+    @patch.dict(os.environ, {"SOURCE_DATE_EPOCH": "315532800"})
+    def test_build_tar_source_date_epoch(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            with self.__build_tar(work_dir.name, "parallel.tar.gz", 2) as parallel:
+                self.assertEqual({member.mtime for member in parallel.getmembers()}, {315532800})
+
+    def __build_zip(self, work_dir: str, name: str, compression_level: int, compression_threads: int) -> zipfile.ZipFile:
+        archive_path = os.path.join(work_dir, "opensearch-1.3.0")
+        if not os.path.isdir(archive_path):
+            os.makedirs(os.path.join(archive_path, "bin"))
+            os.makedirs(os.path.join(archive_path, "lib"))
+            with open(os.path.join(archive_path, "bin", "opensearch"), "w") as f:
+                f.write("#!/bin/bash\n" * 100)
+            os.chmod(os.path.join(archive_path, "bin", "opensearch"), 0o755)
+            with open(os.path.join(archive_path, "lib", "opensearch-1.3.0.jar"), "w") as f:
+                f.write("jar" * 100)
+        dist = DistZip("OpenSearch", "opensearch-min-1.3.0-windows-x64.zip", "opensearch-1.3.0", self.manifest.build, compression_level, compression_threads)
+        dist.archive_path = archive_path
+        dist.__build__(os.path.join(work_dir, name), work_dir)
+        return zipfile.ZipFile(os.path.join(work_dir, name), "r")
+
+    def test_build_zip_stored(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            with self.__build_zip(work_dir.name, "serial.zip", None, 1) as zip:
+                jar_mode = os.stat(os.path.join(work_dir.name, "opensearch-1.3.0", "lib", "opensearch-1.3.0.jar")).st_mode
+                self.assertEqual(
+                    sorted((info.filename, info.compress_type, info.external_attr >> 16) for info in zip.infolist()),
+                    [
+                        (os.path.join("opensearch-1.3.0", "bin", "opensearch"), zipfile.ZIP_DEFLATED, 0o100755),
+                        (os.path.join("opensearch-1.3.0", "lib", "opensearch-1.3.0.jar"), zipfile.ZIP_STORED, jar_mode),
+                    ],
+                )
+
+    def test_build_zip_level_0(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            with self.__build_zip(work_dir.name, "stored.zip", 0, 1) as zip:
+                self.assertEqual({info.compress_type for info in zip.infolist()}, {zipfile.ZIP_STORED})
+
+    def test_build_zip_compression_threads(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            with self.__build_zip(work_dir.name, "serial.zip", None, 1) as serial, self.__build_zip(work_dir.name, "parallel.zip", None, 4) as parallel:
+                self.assertIsNone(parallel.testzip())
+                self.assertEqual(
+                    [(info.filename, info.compress_type, info.external_attr, info.date_time, info.CRC) for info in parallel.infolist()],
+                    [(info.filename, info.compress_type, info.external_attr, info.date_time, info.CRC) for info in serial.infolist()],
+                )
+            with open(os.path.join(work_dir.name, "serial.zip"), "rb") as serial_file, open(os.path.join(work_dir.name, "parallel.zip"), "rb") as parallel_file:
+                self.assertEqual(serial_file.read(), parallel_file.read())
+
+    def test_build_zip_large_files(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            with self.__build_zip(work_dir.name, "serial.zip", None, 1):
+                pass
+            # bin/opensearch is larger than 1000 bytes and compressed on the writing thread
+            with patch.object(DistZip, "MAX_THREADED_FILE_SIZE", 1000), patch.object(ZipFile, "compress", wraps=ZipFile.compress) as mock_compress:
+                with self.__build_zip(work_dir.name, "parallel.zip", None, 4):
+                    pass
+            self.assertEqual([call_args[0][1] for call_args in mock_compress.call_args_list], [os.path.join("opensearch-1.3.0", "lib", "opensearch-1.3.0.jar")])
+            with open(os.path.join(work_dir.name, "serial.zip"), "rb") as serial_file, open(os.path.join(work_dir.name, "parallel.zip"), "rb") as parallel_file:
+                self.assertEqual(serial_file.read(), parallel_file.read())
+
+    def __tree(self, path: str) -> List[Tuple[str, int, Optional[int], Any]]:
+        tree = []
+        for root, dirs, files in os.walk(path):
+            for name in dirs + files:
+                fn = os.path.join(root, name)
+                st = os.lstat(fn)
+                link = os.readlink(fn) if os.path.islink(fn) else None
+                contents = None
+                if link is None and os.path.isfile(fn):
+                    with open(fn, "rb") as f:
+                        contents = f.read()
+                tree.append((os.path.relpath(fn, path), st.st_mode, int(st.st_mtime) if link is None else None, link if link is not None else contents))
+        return sorted(tree, key=lambda entry: entry[0])
+
+    def __tar(self, work_dir: str) -> str:
+        source = os.path.join(work_dir, "source", "opensearch-1.3.0")
+        os.makedirs(os.path.join(source, "bin"))
+        os.makedirs(os.path.join(source, "lib", "empty"))
+        with open(os.path.join(source, "bin", "opensearch"), "w") as f:
+            f.write("#!/bin/bash\n")
+        os.chmod(os.path.join(source, "bin", "opensearch"), 0o750)
+        for i in range(10):
+            with open(os.path.join(source, "lib", f"lib-{i}.jar"), "wb") as f:
+                f.write(os.urandom(1024 * i))
+        os.symlink("lib-1.jar", os.path.join(source, "lib", "link.jar"))
+        os.link(os.path.join(source, "lib", "lib-2.jar"), os.path.join(source, "lib", "hardlink.jar"))
+        for root, dirs, files in os.walk(source):
+            for name in dirs + files:
+                os.utime(os.path.join(root, name), (1000000000, 1000000000), follow_symlinks=False)
+        os.utime(source, (1000000000, 1000000000))
+        path = os.path.join(work_dir, "opensearch-min-1.3.0-linux-x64.tar.gz")
+        with tarfile.open(path, "w:gz") as tar:
+            tar.add(source, arcname="opensearch-1.3.0")
+        return path
+
+    def test_extract_tar_compression_threads(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = self.__tar(work_dir.name)
+            DistTar("OpenSearch", path, "opensearch-1.3.0", self.manifest.build).extract(os.path.join(work_dir.name, "serial"))
+            # Files larger than 4 KB are extracted on the reading thread
+            with patch.object(DistTar, "MAX_THREADED_FILE_SIZE", 4096):
+                dist = DistTar("OpenSearch", path, "opensearch-1.3.0", self.manifest.build, None, 4)
+                self.assertEqual(dist.extract(os.path.join(work_dir.name, "parallel")), os.path.join(work_dir.name, "parallel", "opensearch-1.3.0"))
+            self.assertEqual(self.__tree(os.path.join(work_dir.name, "parallel")), self.__tree(os.path.join(work_dir.name, "serial")))
+            self.assertEqual(self.__tree(os.path.join(work_dir.name, "parallel")), self.__tree(os.path.join(work_dir.name, "source")))
+
+    def test_extract_tar_outside_dest(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "opensearch-min-1.3.0-linux-x64.tar.gz")
+            with tarfile.open(path, "w:gz") as tar:
+                info = tarfile.TarInfo("opensearch-1.3.0/../../outside.txt")
+                tar.addfile(info, io.BytesIO(b""))
+            dist = DistTar("OpenSearch", path, "opensearch-1.3.0", self.manifest.build, None, 2)
+            with self.assertRaises(tarfile.ExtractError):
+                dist.extract(os.path.join(work_dir.name, "dest", "opensearch"))
+            self.assertFalse(os.path.exists(os.path.join(work_dir.name, "dest", "outside.txt")))
+
+    def test_extract_tar_rename(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = self.__tar(work_dir.name)
+            dist = DistTar("OpenSearch", path, "opensearch-1.3.1", self.manifest.build, None, 2)
+            self.assertEqual(dist.extract(os.path.join(work_dir.name, "dest")), os.path.join(work_dir.name, "dest", "opensearch-1.3.1"))
+            self.assertEqual(os.listdir(os.path.join(work_dir.name, "dest")), ["opensearch-1.3.1"])
+
+    def test_extract_zip_compression_threads(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            with self.__build_zip(work_dir.name, "opensearch.zip", None, 1):
+                pass
+            for name, compression_threads in [("serial", 1), ("parallel", 4)]:
+                dist = DistZip("OpenSearch", os.path.join(work_dir.name, "opensearch.zip"), "opensearch-1.3.0", self.manifest.build, None, compression_threads)
+                dist.extract(os.path.join(work_dir.name, name))
+            tree = self.__tree(os.path.join(work_dir.name, "parallel"))
+            self.assertEqual([(name, mode, data) for name, mode, _, data in tree], [(name, mode, data) for name, mode, _, data in self.__tree(os.path.join(work_dir.name, "serial"))])
+            self.assertIn((os.path.join("opensearch-1.3.0", "bin", "opensearch"), 0o100755), [(name, mode) for name, mode, _, _ in tree])
+
     def test_find_min_archive_path(self) -> None:
         self.assertEqual(
             self.distTar.find_min_archive_path(self.artifacts_path),
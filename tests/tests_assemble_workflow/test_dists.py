@@ -41,3 +41,8 @@ class TestDists(unittest.TestCase):
         self.assertEqual(return_cls_deb.__class__.__name__, 'DistDeb')
         return_cls_rpm = self.dists.create_dist("OpenSearch", "artifacts/dist", "opensearch-1.3.0", self.manifest_rpm.build)
         self.assertEqual(return_cls_rpm.__class__.__name__, 'DistRpm')
+
+    def test_create_dist_compression(self) -> None:
+        dist = self.dists.create_dist("OpenSearch", "artifacts/dist", "opensearch-1.3.0", self.manifest_tar.build, 6, 4)
+        self.assertEqual(dist.compression_level, 6)
+        self.assertEqual(dist.compression_threads, 4)
@@ -0,0 +1,236 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import io
+import os
+import shutil
+import stat
+import subprocess
+import tempfile
+import unittest
+import zipfile
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+from assemble_workflow.plugin_installer import PluginInstaller
+
+
+@unittest.skipUnless(os.name == "posix", "permissions are only set on posix")
+class TestPluginInstaller(unittest.TestCase):
+    DESCRIPTOR = {
+        "description": "Test plugin.",
+        "version": "1.1.0.0",
+        "name": "test",
+        "opensearch.version": "1.1.0",
+        "java.version": "11",
+        "classname": "org.opensearch.test.TestPlugin",
+    }
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.home = os.path.join(self.tmp_dir.name, "opensearch-1.1.0")
+        for name in ["bin", "config", "lib", "modules", "plugins"]:
+            os.makedirs(os.path.join(self.home, name))
+        for name in ["opensearch-cli-1.1.0.jar", "opensearch-1.1.0.jar"]:
+            open(os.path.join(self.home, "lib", name), "w").close()
+        os.makedirs(os.path.join(self.home, "modules", "transport-netty4"))
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def __zip(self, entries: Dict[str, Optional[str]], descriptor: Dict[str, str] = DESCRIPTOR) -> str:
+        path = os.path.join(self.tmp_dir.name, "plugin.zip")
+        with zipfile.ZipFile(path, "w") as zip:
+            if descriptor is not None:
+                zip.writestr("plugin-descriptor.properties", "".join(f"{key}={value}\n" for key, value in descriptor.items()))
+            for name, data in entries.items():
+                info = zipfile.ZipInfo(name)
+                # Permissions in the zip are not kept by the CLI
+                info.external_attr = (0o40700 if data is None else 0o100600) << 16
+                zip.writestr(info, data or "")
+        return path
+
+    def __tree(self, *paths: str) -> List[Tuple[str, str, Optional[str]]]:
+        tree: List[Tuple[str, str, Optional[str]]] = []
+        for path in paths:
+            for root, dirs, files in os.walk(os.path.join(self.home, path)):
+                tree.append((os.path.relpath(root, self.home), oct(stat.S_IMODE(os.stat(root).st_mode)), None))
+                for name in files:
+                    with open(os.path.join(root, name)) as f:
+                        tree.append((os.path.relpath(os.path.join(root, name), self.home), oct(stat.S_IMODE(os.stat(os.path.join(root, name)).st_mode)), f.read()))
+        return sorted(tree)
+
+    def test_version(self) -> None:
+        self.assertEqual(PluginInstaller(self.home).version, "1.1.0")
+
+    def test_version_snapshot(self) -> None:
+        os.unlink(os.path.join(self.home, "lib", "opensearch-1.1.0.jar"))
+        open(os.path.join(self.home, "lib", "opensearch-2.0.0-alpha1-SNAPSHOT.jar"), "w").close()
+        self.assertEqual(PluginInstaller(self.home).version, "2.0.0")
+
+    def test_version_missing(self) -> None:
+        os.unlink(os.path.join(self.home, "lib", "opensearch-1.1.0.jar"))
+        self.assertIsNone(PluginInstaller(self.home).version)
+
+    def test_install(self) -> None:
+        path = self.__zip({
+            "test.jar": "jar",
+            "lib/": None,
+            "lib/dependency.jar": "dependency",
+            "tools/bin/tool": "tool",
+            "empty/": None,
+            "bin/": None,
+            "bin/test-cli": "cli",
+            "config/test.yml": "config",
+        })
+        self.assertEqual(PluginInstaller(self.home).install(path), "test")
+        # The layout and permissions of opensearch-plugin install --batch
+        self.assertEqual(
+            self.__tree("plugins", "bin/test"),
+            [
+                ("bin/test", "0o755", None),
+                ("bin/test/test-cli", "0o755", "cli"),
+                ("plugins", oct(stat.S_IMODE(os.stat(os.path.join(self.home, "plugins")).st_mode)), None),
+                ("plugins/test", "0o755", None),
+                ("plugins/test/lib", "0o755", None),
+                ("plugins/test/lib/dependency.jar", "0o644", "dependency"),
+                ("plugins/test/plugin-descriptor.properties", "0o644", "".join(f"{key}={value}\n" for key, value in self.DESCRIPTOR.items())),
+                ("plugins/test/test.jar", "0o644", "jar"),
+                ("plugins/test/tools", "0o755", None),
+                ("plugins/test/tools/bin", "0o755", None),
+                ("plugins/test/tools/bin/tool", "0o755", "tool"),
+            ],
+        )
+        self.assertEqual(self.__tree("config/test")[1:], [("config/test/test.yml", "0o660", "config")])
+
+    def test_install_config_exists(self) -> None:
+        os.makedirs(os.path.join(self.home, "config", "test"))
+        with open(os.path.join(self.home, "config", "test", "test.yml"), "w") as f:
+            f.write("existing")
+        PluginInstaller(self.home).install(self.__zip({"config/test.yml": "config", "config/other.yml": "other"}))
+        self.assertEqual(
+            [(path, data) for path, _, data in self.__tree("config/test")[1:]],
+            [("config/test/other.yml", "other"), ("config/test/test.yml", "existing")],
+        )
+
+    def test_install_custom_folder(self) -> None:
+        path = self.__zip({"bin/test-cli": "cli"}, {**self.DESCRIPTOR, "custom.foldername": "custom"})
+        self.assertEqual(PluginInstaller(self.home).install(path), "custom")
+        self.assertEqual(os.listdir(os.path.join(self.home, "plugins")), ["custom"])
+        self.assertTrue(os.path.isfile(os.path.join(self.home, "bin", "custom", "test-cli")))
+
+    def test_install_extended_plugin(self) -> None:
+        os.makedirs(os.path.join(self.home, "plugins", "opensearch-job-scheduler"))
+        PluginInstaller(self.home).install(self.__zip({}, {**self.DESCRIPTOR, "extended.plugins": "opensearch-job-scheduler"}))
+        self.assertEqual(sorted(os.listdir(os.path.join(self.home, "plugins"))), ["opensearch-job-scheduler", "test"])
+
+    def test_install_failure_cleans_up(self) -> None:
+        path = self.__zip({"bin/test-cli": "cli"})
+        with patch("shutil.copyfile", side_effect=OSError("copy failed")):
+            with self.assertRaises(OSError):
+                PluginInstaller(self.home).install(path)
+        self.assertEqual(os.listdir(os.path.join(self.home, "plugins")), [])
+        self.assertEqual(os.listdir(os.path.join(self.home, "bin")), [])
+
+    def __assert_unsupported(self, path: str, reason: str) -> None:
+        with self.assertRaises(PluginInstaller.UnsupportedPluginError) as ctx:
+            PluginInstaller(self.home).install(path)
+        self.assertEqual(str(ctx.exception), f"plugin.zip requires the plugin CLI, {reason}.")
+        self.assertEqual(os.listdir(os.path.join(self.home, "plugins")), [] if "exists" not in reason else ["test"])
+
+    def test_unsupported_policy(self) -> None:
+        self.__assert_unsupported(self.__zip({"plugin-security.policy": "grant {};"}), "it has a plugin-security.policy")
+
+    def test_unsupported_missing_descriptor(self) -> None:
+        self.__assert_unsupported(self.__zip({"test.jar": "jar"}, None), "plugin-descriptor.properties is missing")
+
+    def test_unsupported_missing_property(self) -> None:
+        descriptor = {key: value for key, value in self.DESCRIPTOR.items() if key != "classname"}
+        self.__assert_unsupported(self.__zip({}, descriptor), "classname is missing from plugin-descriptor.properties")
+
+    def test_unsupported_version(self) -> None:
+        self.__assert_unsupported(self.__zip({}, {**self.DESCRIPTOR, "opensearch.version": "1.2.0"}), "it was built for OpenSearch 1.2.0, not 1.1.0")
+
+    def test_unsupported_native_controller(self) -> None:
+        self.__assert_unsupported(self.__zip({}, {**self.DESCRIPTOR, "has.native.controller": "true"}), "it has a native controller")
+
+    def test_unsupported_module(self) -> None:
+        self.__assert_unsupported(self.__zip({}, {**self.DESCRIPTOR, "name": "transport-netty4"}), "transport-netty4 is a module")
+
+    def test_unsupported_installed(self) -> None:
+        os.makedirs(os.path.join(self.home, "plugins", "test"))
+        self.__assert_unsupported(self.__zip({}), f"{os.path.join(self.home, 'plugins', 'test')} exists")
+
+    def test_unsupported_extended_plugin(self) -> None:
+        self.__assert_unsupported(
+            self.__zip({}, {**self.DESCRIPTOR, "extended.plugins": "opensearch-job-scheduler"}),
+            "it extends opensearch-job-scheduler, which is not installed",
+        )
+
+    def test_unsupported_entries(self) -> None:
+        self.__assert_unsupported(self.__zip({"opensearch/test.jar": "jar"}), "of the entry opensearch/test.jar")
+        self.__assert_unsupported(self.__zip({"../test.jar": "jar"}), "of the entry ../test.jar")
+        self.__assert_unsupported(self.__zip({"bin/tools/tool": "tool"}), "bin must be a directory of files")
+        self.__assert_unsupported(self.__zip({"config": "config"}), "config must be a directory of files")
+
+
+@unittest.skipUnless(os.name == "posix", "permissions are only set on posix")
+@unittest.skipUnless(os.environ.get("OPENSEARCH_DISTRIBUTION"), "set OPENSEARCH_DISTRIBUTION to an extracted OpenSearch distribution to compare with the plugin CLI")
+class TestPluginInstallerParity(unittest.TestCase):
+    """
+    Install the same plugin into two copies of a distribution, with opensearch-plugin install --batch and with
+    PluginInstaller, and compare the results. The plugin CLI needs a JDK, bundled with the distribution or in JAVA_HOME.
+    """
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.distribution = os.environ["OPENSEARCH_DISTRIBUTION"]
+        self.version = PluginInstaller(self.distribution).version
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def __jar(self, name: str) -> bytes:
+        data = io.BytesIO()
+        with zipfile.ZipFile(data, "w") as jar:
+            jar.writestr("META-INF/MANIFEST.MF", f"Manifest-Version: 1.0\nImplementation-Title: {name}\n")
+        return data.getvalue()
+
+    def __zip(self) -> str:
+        path = os.path.join(self.tmp_dir.name, "parity.zip")
+        descriptor = {**TestPluginInstaller.DESCRIPTOR, "name": "parity", "version": f"{self.version}.0", "opensearch.version": self.version}
+        with zipfile.ZipFile(path, "w") as zip:
+            zip.writestr("plugin-descriptor.properties", "".join(f"{key}={value}\n" for key, value in descriptor.items()))
+            zip.writestr("parity.jar", self.__jar("parity"))
+            zip.writestr("lib/parity-dependency.jar", self.__jar("parity-dependency"))
+            zip.writestr("tools/bin/tool", "tool")
+            zip.writestr("bin/parity-cli", "cli")
+            zip.writestr("config/parity.yml", "config")
+        return path
+
+    def __home(self, name: str) -> str:
+        home = os.path.join(self.tmp_dir.name, name)
+        shutil.copytree(self.distribution, home, symlinks=True)
+        return home
+
+    def __tree(self, home: str, path: str) -> List[Tuple[str, str, Optional[bytes]]]:
+        tree: List[Tuple[str, str, Optional[bytes]]] = []
+        for root, dirs, files in os.walk(os.path.join(home, path)):
+            tree.append((os.path.relpath(root, home), oct(stat.S_IMODE(os.stat(root).st_mode)), None))
+            for name in files:
+                with open(os.path.join(root, name), "rb") as f:
+                    tree.append((os.path.relpath(os.path.join(root, name), home), oct(stat.S_IMODE(os.stat(os.path.join(root, name)).st_mode)), f.read()))
+        return sorted(tree)
+
+    def test_parity(self) -> None:
+        path = self.__zip()
+        cli_home = self.__home("cli")
+        subprocess.check_call([os.path.join(cli_home, "bin", "opensearch-plugin"), "install", "--batch", f"file:{path}"])
+        fast_home = self.__home("fast")
+        self.assertEqual(PluginInstaller(fast_home).install(path), "parity")
+        for name in ["plugins", "config", "bin"]:
+            self.assertEqual(self.__tree(fast_home, name), self.__tree(cli_home, name))
@@ -11,6 +11,7 @@ import unittest
 from unittest.mock import patch
 
 from build_workflow.build_args import BuildArgs
+from build_workflow.build_cache import BuildCache
 
 
 class TestBuildArgs(unittest.TestCase):
@@ -52,6 +53,166 @@ class TestBuildArgs(unittest.TestCase):
     def test_continue_on_error_true(self) -> None:
         self.assertTrue(BuildArgs().continue_on_error)
 
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_parallel_default(self) -> None:
+        self.assertEqual(BuildArgs().parallel, 1)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--parallel", "4"])
+    def test_parallel(self) -> None:
+        self.assertEqual(BuildArgs().parallel, 4)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--parallel", "0"])
+    def test_parallel_invalid(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_resource_governor_default(self) -> None:
+        args = BuildArgs()
+        self.assertFalse(args.resource_governor)
+        self.assertIsNone(args.memory_budget)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--parallel", "4", "--memory-budget", "1.5"])
+    def test_resource_governor_parallel(self) -> None:
+        args = BuildArgs()
+        self.assertTrue(args.resource_governor)
+        self.assertEqual(args.memory_budget, int(1.5 * 1024 ** 3))
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--parallel", "4", "--no-resource-governor"])
+    def test_no_resource_governor(self) -> None:
+        self.assertFalse(BuildArgs().resource_governor)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--memory-budget", "0"])
+    def test_memory_budget_invalid(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_build_cache_default(self) -> None:
+        args = BuildArgs()
+        self.assertFalse(args.build_cache)
+        self.assertEqual(args.build_cache_dir, BuildCache.DEFAULT_PATH)
+        self.assertEqual(args.build_cache_max_size, BuildCache.DEFAULT_MAX_SIZE)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--build-cache"])
+    def test_build_cache(self) -> None:
+        self.assertTrue(BuildArgs().build_cache)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--build-cache-dir", "cache", "--build-cache-max-size", "2"])
+    def test_build_cache_dir(self) -> None:
+        args = BuildArgs()
+        self.assertEqual(args.build_cache_dir, "cache")
+        self.assertEqual(args.build_cache_max_size, 2 * 1024 ** 3)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_ref_cache_ttl_default(self) -> None:
+        self.assertEqual(BuildArgs().ref_cache_ttl, 0)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--ref-cache-ttl", "600"])
+    def test_ref_cache_ttl(self) -> None:
+        self.assertEqual(BuildArgs().ref_cache_ttl, 600)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_artifact_placement_default(self) -> None:
+        self.assertEqual(BuildArgs().artifact_placement, "auto")
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--artifact-placement", "copy"])
+    def test_artifact_placement(self) -> None:
+        self.assertEqual(BuildArgs().artifact_placement, "copy")
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--incremental", "--incremental-paths"])
+    def test_incremental_paths(self) -> None:
+        args = BuildArgs()
+        self.assertTrue(args.incremental)
+        self.assertTrue(args.incremental_paths)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_workspace_default(self) -> None:
+        args = BuildArgs()
+        self.assertIsNone(args.workspace)
+        self.assertFalse(args.workspace_clean)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--workspace", "workspace", "--workspace-clean"])
+    def test_workspace(self) -> None:
+        args = BuildArgs()
+        self.assertEqual(args.workspace, os.path.realpath("workspace"))
+        self.assertTrue(args.workspace_clean)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--workspace-clean"])
+    def test_workspace_clean_without_workspace(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_shared_caches_default(self) -> None:
+        args = BuildArgs()
+        self.assertFalse(args.shared_caches)
+        self.assertIsNone(args.shared_caches_dir)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--shared-caches"])
+    def test_shared_caches(self) -> None:
+        args = BuildArgs()
+        self.assertTrue(args.shared_caches)
+        self.assertIsNone(args.shared_caches_dir)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--shared-caches-dir", "caches"])
+    def test_shared_caches_dir(self) -> None:
+        args = BuildArgs()
+        self.assertTrue(args.shared_caches)
+        self.assertEqual(args.shared_caches_dir, os.path.realpath("caches"))
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_resume_default(self) -> None:
+        self.assertFalse(BuildArgs().resume)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--resume"])
+    def test_resume(self) -> None:
+        self.assertTrue(BuildArgs().resume)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_shard_default(self) -> None:
+        self.assertIsNone(BuildArgs().shard)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--shard", "2/3"])
+    def test_shard(self) -> None:
+        shard = BuildArgs().shard
+        self.assertEqual((shard.index, shard.count), (2, 3))
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--shard", "4/3"])
+    def test_shard_invalid(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--shard", "1/2", "--incremental"])
+    def test_shard_incremental(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--merge", "-d", "zip"])
+    def test_merge(self) -> None:
+        args = BuildArgs()
+        self.assertTrue(args.merge)
+        self.assertEqual(args.distributions, ["zip"])
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--merge", "--shard", "1/2"])
+    def test_merge_shard(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--incremental", "--explain"])
+    def test_explain(self) -> None:
+        self.assertTrue(BuildArgs().explain)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--explain"])
+    def test_explain_without_incremental(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--incremental-paths"])
+    def test_incremental_paths_without_incremental(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
     @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
     def test_snapshot_default(self) -> None:
         self.assertFalse(BuildArgs().snapshot)
@@ -100,6 +261,37 @@ class TestBuildArgs(unittest.TestCase):
     def test_distribution_default(self) -> None:
         self.assertEqual(BuildArgs().distribution, "tar")
 
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--plan"])
+    def test_plan(self) -> None:
+        self.assertTrue(BuildArgs().plan)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--plan", "--lock"])
+    def test_plan_lock(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_prefetch_default(self) -> None:
+        self.assertFalse(BuildArgs().prefetch)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--prefetch"])
+    def test_prefetch(self) -> None:
+        self.assertTrue(BuildArgs().prefetch)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "-d", "tar", "rpm", "tar", "-p", "linux", "-a", "x64", "arm64"])
+    def test_multiple_targets(self) -> None:
+        args = BuildArgs()
+        self.assertEqual(args.distributions, ["tar", "rpm"])
+        self.assertEqual(args.distribution, "tar")
+        self.assertEqual(args.platforms, ["linux"])
+        self.assertEqual(args.architectures, ["x64", "arm64"])
+        self.assertEqual(args.architecture, "x64")
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "-d", "tar", "rpm", "--incremental"])
+    def test_multiple_targets_incremental(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
     @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--distribution", "rpm"])
     def test_distribution(self) -> None:
         self.assertEqual(BuildArgs().distribution, "rpm")
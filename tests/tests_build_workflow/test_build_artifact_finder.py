@@ -0,0 +1,65 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import unittest
+
+from build_workflow.build_artifact_finder import BuildArtifactFinder
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildArtifactFinder(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.builds = os.path.join(self.tmp_dir.name, "builds")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.__exit__(None, None, None)
+
+    def __write(self, path: str) -> str:
+        absolute_path = os.path.join(self.builds, path)
+        os.makedirs(os.path.dirname(absolute_path), exist_ok=True)
+        with open(absolute_path, "w") as f:
+            f.write(path)
+        return absolute_path
+
+    def test_find(self) -> None:
+        for path in ["libs/b.jar", "libs/a.jar", "maven/org/z/z.pom", "maven/org/a.jar", "maven/b/b.jar", "dist/opensearch.tar.gz", "unknown/file.txt"]:
+            self.__write(path)
+        self.assertEqual(
+            [(artifact_type, path) for artifact_type, path, _ in BuildArtifactFinder.find(self.builds)],
+            [
+                ("maven", os.path.join("maven", "b", "b.jar")),
+                ("maven", os.path.join("maven", "org", "a.jar")),
+                ("maven", os.path.join("maven", "org", "z", "z.pom")),
+                ("dist", os.path.join("dist", "opensearch.tar.gz")),
+                ("libs", os.path.join("libs", "a.jar")),
+                ("libs", os.path.join("libs", "b.jar")),
+            ]
+        )
+        self.assertTrue(all(file == os.path.join(self.builds, path) for _, path, file in BuildArtifactFinder.find(self.builds)))
+
+    def test_find_files_before_subdirectories(self) -> None:
+        self.__write("plugins/a/nested.zip")
+        self.__write("plugins/b.zip")
+        self.assertEqual(
+            [path for _, path, _ in BuildArtifactFinder.find(self.builds)],
+            [os.path.join("plugins", "b.zip"), os.path.join("plugins", "a", "nested.zip")]
+        )
+
+    def test_find_does_not_follow_directory_links(self) -> None:
+        self.__write("libs/a.jar")
+        other = os.path.dirname(self.__write(os.path.join("..", "other", "b.jar")))
+        os.symlink(other, os.path.join(self.builds, "libs", "other"))
+        os.symlink(os.path.join(other, "b.jar"), os.path.join(self.builds, "libs", "b.jar"))
+        self.assertEqual(
+            [path for _, path, _ in BuildArtifactFinder.find(self.builds)],
+            [os.path.join("libs", "a.jar"), os.path.join("libs", "b.jar")]
+        )
+
+    def test_find_missing(self) -> None:
+        self.assertEqual(BuildArtifactFinder.find(self.builds), [])
@@ -0,0 +1,88 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import unittest
+from zipfile import ZipFile
+
+from build_workflow.build_artifact_check import BuildArtifactCheck
+from build_workflow.build_artifact_validator import BuildArtifactValidator
+from build_workflow.build_target import BuildTarget
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildArtifactValidator(unittest.TestCase):
+    TARGET = BuildTarget(name="OpenSearch", version="2.12.0", snapshot=False)
+
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "artifact-checks.json")
+        self.plugin = self.__zip("job-scheduler-2.12.0.0.zip", "plugin-descriptor.properties", "version=2.12.0.0\nopensearch.version=2.12.0\n")
+        self.jar = self.__zip("job-scheduler-2.12.0.0.jar", "META-INF/MANIFEST.MF", "Implementation-Version: 2.12.0.0\n")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.__exit__(None, None, None)
+
+    def __zip(self, name: str, entry: str, data: str) -> str:
+        path = os.path.join(self.tmp_dir.name, name)
+        with ZipFile(path, "w") as zip:
+            zip.writestr(entry, data)
+        return path
+
+    def test_key(self) -> None:
+        key = BuildArtifactValidator.key(self.TARGET, "plugins", self.plugin)
+        self.assertEqual(key, BuildArtifactValidator.key(self.TARGET, "plugins", self.plugin))
+        self.assertNotEqual(key, BuildArtifactValidator.key(self.TARGET, "maven", self.plugin))
+        self.assertNotEqual(key, BuildArtifactValidator.key(BuildTarget(name="OpenSearch", version="2.13.0"), "plugins", self.plugin))
+        with open(self.plugin, "ab") as f:
+            f.write(b"changed")
+        self.assertNotEqual(key, BuildArtifactValidator.key(self.TARGET, "plugins", self.plugin))
+
+    def test_check_and_memoize(self) -> None:
+        with BuildArtifactValidator(2, self.path) as validator:
+            validator.submit(self.TARGET, "job-scheduler", "plugins", self.plugin)
+            validator.submit(self.TARGET, "job-scheduler", "maven", self.jar)
+            validator.wait(self.TARGET, "job-scheduler")
+            self.assertEqual(validator.counts, {"plugins": 1, "maven": 1})
+            self.assertEqual(validator.memoized, {"plugins": 0, "maven": 0})
+            self.assertEqual(sorted(validator.times.keys()), ["maven", "plugins"])
+
+        with BuildArtifactValidator(2, self.path) as validator:
+            validator.submit(self.TARGET, "job-scheduler", "plugins", self.plugin)
+            validator.submit(self.TARGET, "job-scheduler", "maven", self.jar)
+            validator.wait(self.TARGET, "job-scheduler")
+            self.assertEqual(validator.memoized, {"plugins": 1, "maven": 1})
+
+    def test_check_invalid(self) -> None:
+        invalid = self.__zip("invalid-2.12.0.0.zip", "plugin-descriptor.properties", "version=1.0.0.0\nopensearch.version=2.12.0\n")
+        with BuildArtifactValidator(2, self.path) as validator:
+            validator.submit(self.TARGET, "invalid", "plugins", invalid)
+            with self.assertRaises(BuildArtifactCheck.BuildArtifactInvalidError) as ctx:
+                validator.wait(self.TARGET, "invalid")
+            self.assertEqual(ctx.exception.path, invalid)
+            self.assertEqual(
+                str(ctx.exception),
+                "Artifact invalid-2.12.0.0.zip is invalid. Expected to have version=any of ['2.12.0.0'], but was '1.0.0.0'.",
+            )
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_wait_by_target(self) -> None:
+        other = BuildTarget(name="OpenSearch", version="2.12.0", snapshot=False, output_dir="other")
+        invalid = self.__zip("invalid-2.12.0.0.zip", "plugin-descriptor.properties", "version=1.0.0.0\nopensearch.version=2.12.0\n")
+        with BuildArtifactValidator(2, self.path) as validator:
+            validator.submit(self.TARGET, "job-scheduler", "plugins", self.plugin)
+            validator.submit(other, "job-scheduler", "plugins", invalid)
+            validator.wait(self.TARGET, "job-scheduler")
+            with self.assertRaises(BuildArtifactCheck.BuildArtifactInvalidError):
+                validator.wait(other, "job-scheduler")
+
+    def test_no_check_for_type(self) -> None:
+        with BuildArtifactValidator(2, self.path) as validator:
+            validator.submit(self.TARGET, "job-scheduler", "libs", self.jar)
+            self.assertIsNone(validator.executor)
+            validator.wait(self.TARGET, "job-scheduler")
+            self.assertEqual(validator.counts, {})
@@ -0,0 +1,145 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from build_workflow.build_cache import BuildCache
+from build_workflow.build_target import BuildTarget
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildCache(unittest.TestCase):
+    TARGET = BuildTarget(
+        name="OpenSearch",
+        version="2.12.0",
+        platform="linux",
+        architecture="x64",
+        distribution="tar",
+        snapshot=False,
+    )
+
+    GIT_REPO = MagicMock(
+        url="https://github.com/opensearch-project/job-scheduler.git",
+        ref="main",
+        sha="aaf09b0211df15dd74ff2756f2590c360b03486b",
+    )
+
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.cache = BuildCache(os.path.join(self.tmp_dir.name, "cache"))
+        self.artifacts_dir = os.path.join(self.tmp_dir.name, "builds")
+        os.makedirs(os.path.join(self.artifacts_dir, "plugins"))
+        os.makedirs(os.path.join(self.artifacts_dir, "maven", "org", "opensearch"))
+        self.plugin = os.path.join(self.artifacts_dir, "plugins", "job-scheduler-2.12.0.0.zip")
+        self.jar = os.path.join(self.artifacts_dir, "maven", "org", "opensearch", "job-scheduler-2.12.0.0.jar")
+        for path in [self.plugin, self.jar]:
+            with open(path, "w") as f:
+                f.write(os.path.basename(path))
+        self.build_script = os.path.join(self.tmp_dir.name, "build.sh")
+        with open(self.build_script, "w") as f:
+            f.write("echo build")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.__exit__(None, None, None)
+
+    def __key(self, commit_id: str = "aaf09b0211df15dd74ff2756f2590c360b03486b", target: BuildTarget = TARGET) -> str:
+        return BuildCache.key("https://github.com/opensearch-project/job-scheduler.git", commit_id, target, self.build_script)
+
+    def __put(self, key: str) -> None:
+        self.cache.put(key, "job-scheduler", self.GIT_REPO, [
+            ("maven", os.path.join("maven", "org", "opensearch", "job-scheduler-2.12.0.0.jar"), self.jar),
+            ("plugins", os.path.join("plugins", "job-scheduler-2.12.0.0.zip"), self.plugin),
+        ])
+
+    def test_key(self) -> None:
+        self.assertEqual(self.__key(), self.__key())
+        self.assertNotEqual(self.__key(), self.__key(commit_id="0000000000000000000000000000000000000000"))
+        self.assertNotEqual(self.__key(), self.__key(target=BuildTarget(name="OpenSearch", version="2.12.0", platform="linux", architecture="arm64")))
+
+    def test_key_patches(self) -> None:
+        target = BuildTarget(name="OpenSearch", version="2.12.0", platform="linux", architecture="x64", distribution="tar", snapshot=False, patches=["2.11.0"])
+        self.assertNotEqual(self.__key(), self.__key(target=target))
+
+    def test_key_build_script(self) -> None:
+        key = self.__key()
+        with open(self.build_script, "a") as f:
+            f.write(" --changed")
+        self.assertNotEqual(key, self.__key())
+
+    def test_get_miss(self) -> None:
+        self.assertIsNone(self.cache.get(self.__key()))
+
+    def test_get_awaited(self) -> None:
+        key = self.__key()
+        cache = BuildCache(self.cache.path, awaited=["job-scheduler"])
+        with patch("build_workflow.build_cache.time.sleep", side_effect=lambda _: self.__put(key)) as mock_sleep:
+            self.assertIsNone(cache.get(key))
+            self.assertEqual(cache.get(key, "common-utils"), None)
+            entry = cache.get(key, "job-scheduler")
+        mock_sleep.assert_called_once_with(BuildCache.WAIT_INTERVAL)
+        self.assertEqual(entry.component, "job-scheduler")
+
+    def test_get_awaited_timeout(self) -> None:
+        cache = BuildCache(self.cache.path, awaited=["job-scheduler"])
+        with patch("build_workflow.build_cache.time.monotonic", side_effect=[0, 0, BuildCache.WAIT_TIMEOUT]), patch("build_workflow.build_cache.time.sleep"):
+            self.assertIsNone(cache.get(self.__key(), "job-scheduler"))
+
+    def test_put_and_get(self) -> None:
+        key = self.__key()
+        self.__put(key)
+        entry = self.cache.get(key)
+        self.assertEqual(entry.component, "job-scheduler")
+        self.assertEqual(entry.commit_id, "aaf09b0211df15dd74ff2756f2590c360b03486b")
+        self.assertEqual(entry.artifacts, {
+            "maven": [os.path.join("maven", "org", "opensearch", "job-scheduler-2.12.0.0.jar")],
+            "plugins": [os.path.join("plugins", "job-scheduler-2.12.0.0.zip")],
+        })
+        with open(entry.file(os.path.join("plugins", "job-scheduler-2.12.0.0.zip"))) as f:
+            self.assertEqual(f.read(), "job-scheduler-2.12.0.0.zip")
+
+    def test_publish_to_maven_local(self) -> None:
+        key = self.__key()
+        self.__put(key)
+        maven_local = os.path.join(self.tmp_dir.name, "m2")
+        self.cache.get(key).publish_to_maven_local(maven_local)
+        self.assertTrue(os.path.isfile(os.path.join(maven_local, "org", "opensearch", "job-scheduler-2.12.0.0.jar")))
+        self.assertFalse(os.path.exists(os.path.join(maven_local, "plugins")))
+
+    def test_publish_to_maven_local_replaces_stale(self) -> None:
+        key = self.__key()
+        self.__put(key)
+        maven_local = os.path.join(self.tmp_dir.name, "m2")
+        jar = os.path.join(maven_local, "org", "opensearch", "job-scheduler-2.12.0.0.jar")
+        os.makedirs(os.path.dirname(jar))
+        with open(jar, "w") as f:
+            f.write("stale")
+        self.cache.get(key).publish_to_maven_local(maven_local)
+        with open(jar) as f:
+            self.assertEqual(f.read(), "job-scheduler-2.12.0.0.jar")
+
+    def test_put_does_not_evict(self) -> None:
+        self.cache.max_size = 0
+        key = self.__key()
+        self.__put(key)
+        self.assertIsNotNone(self.cache.get(key))
+
+    def test_evict_least_recently_used(self) -> None:
+        first = self.__key(commit_id="1" * 40)
+        second = self.__key(commit_id="2" * 40)
+        self.__put(first)
+        os.utime(os.path.join(self.cache.path, first, BuildCache.ENTRY_FILE), (0, 0))
+        self.__put(second)
+        os.utime(os.path.join(self.cache.path, second, BuildCache.ENTRY_FILE), (1, 1))
+        # using the first entry makes the second one the least recently used
+        self.assertIsNotNone(self.cache.get(first))
+        # room for a single entry
+        self.cache.max_size = os.path.getsize(os.path.join(self.cache.path, first, BuildCache.ENTRY_FILE)) + 2 * len("job-scheduler-2.12.0.0.zip")
+        self.cache.evict()
+        self.assertIsNotNone(self.cache.get(first))
+        self.assertIsNone(self.cache.get(second))
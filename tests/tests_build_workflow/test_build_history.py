@@ -0,0 +1,57 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import unittest
+
+from build_workflow.build_history import BuildHistory
+from build_workflow.build_target import BuildTarget
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildHistory(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "history", "build-history.json")
+        self.linux = BuildTarget(name="OpenSearch", version="2.12.0", platform="linux", architecture="x64", distribution="tar")
+        self.windows = BuildTarget(name="OpenSearch", version="2.12.0", platform="windows", architecture="x64", distribution="zip")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.__exit__(None, None, None)
+
+    def test_estimate(self) -> None:
+        history = BuildHistory(self.path)
+        self.assertIsNone(history.estimate("OpenSearch", self.linux))
+        for seconds in [100, 300, 110]:
+            history.record("OpenSearch", self.linux, seconds)
+        history.record("OpenSearch", self.windows, 500)
+        self.assertEqual(history.estimate("OpenSearch", self.linux), 110)
+        self.assertEqual(history.estimate("OpenSearch", self.windows), 500)
+        self.assertEqual(history.estimate("OpenSearch", BuildTarget(name="OpenSearch", version="2.12.0", platform="linux", architecture="arm64")), 205)
+        self.assertIsNone(history.estimate("sql", self.linux))
+
+    def test_record_keeps_latest_durations(self) -> None:
+        history = BuildHistory(self.path)
+        for seconds in range(BuildHistory.MAX_DURATIONS + 5):
+            history.record("sql", self.linux, seconds)
+        self.assertEqual(history.durations["sql"]["linux/x64/tar"], [float(seconds) for seconds in range(5, BuildHistory.MAX_DURATIONS + 5)])
+
+    def test_save(self) -> None:
+        history = BuildHistory(self.path)
+        history.save()
+        self.assertFalse(os.path.exists(self.path))
+        history.record("sql", self.linux, 42.04)
+        history.save()
+        self.assertEqual(BuildHistory(self.path).estimate("sql", self.linux), 42.0)
+
+    def test_invalid_file(self) -> None:
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as f:
+            f.write("{")
+        with self.assertLogs(level="WARNING"):
+            history = BuildHistory(self.path)
+        self.assertEqual(history.durations, {})
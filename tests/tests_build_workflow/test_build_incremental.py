@@ -6,9 +6,10 @@
 # compatible open source license.
 
 import os
+import subprocess
 import unittest
-from typing import List
-from unittest.mock import MagicMock, patch
+from typing import Any, List
+from unittest.mock import MagicMock, call, patch
 
 from build_workflow.build_incremental import BuildIncremental
 from manifests.build_manifest import BuildManifest
@@ -114,6 +115,106 @@ class TestBuildIncremental(unittest.TestCase):
         mock_build_manifest.assert_called_once()
         self.assertEqual(diff_list, ["OpenSearch"])
 
+    INPUT_MANIFEST_DATA = {'schema-version': '1.1',
+                           'build': {'name': 'OpenSearch', 'version': '2.12.0'},
+                           'components': [{'name': 'OpenSearch',
+                                           'repository': 'https://github.com/opensearch-project/OpenSearch.git',
+                                           'ref': '05c2befd7d01fab4aef4f0d3d6722d2da240b2c6'},
+                                          {'name': 'job-scheduler',
+                                           'repository': 'https://github.com/opensearch-project/job-scheduler.git',
+                                           'ref': '4e2a5e3e1f5d0d1b4e1a5dd2ea3d2d1a1b4f8e8c',
+                                           'incremental_ignore': ['docs/*']}]}
+    BUILD_MANIFEST_DATA = {'schema-version': '1.2',
+                           'build': {'name': 'OpenSearch', 'version': '2.12.0', 'platform': 'linux',
+                                     'architecture': 'x64', 'id': 'b2b848e29077488ca7e8c37501b36c87'},
+                           'components': [{'name': 'OpenSearch',
+                                           'repository': 'https://github.com/opensearch-project/OpenSearch.git',
+                                           'ref': '2.x', 'commit_id': '05c2befd7d01fab4aef4f0d3d6722d2da240b2c6',
+                                           'version': '2.12.0.0'},
+                                          {'name': 'job-scheduler',
+                                           'repository': 'https://github.com/opensearch-project/job-scheduler.git',
+                                           'ref': '2.x', 'commit_id': 'f4a8d4e0bd4ce1a3f3ae1f4bd9a4c0e6a0b2d1c3',
+                                           'artifacts': {'plugins': ['plugins/opensearch-job-scheduler-2.12.0.0.zip']},
+                                           'version': '2.12.0.0'}]}
+
+    @patch("os.path.exists", return_value=True)
+    @patch("manifests.build_manifest.BuildManifest.from_path")
+    @patch("manifests.input_manifest.InputManifest.stable")
+    @patch("git.git_repository.GitRepository.changed_paths", return_value=["README.md", ".github/workflows/ci.yml", "docs/index.rst"])
+    def test_commits_diff_ignored_paths(self, mock_changed_paths: MagicMock, stable_mock_input_manifest: MagicMock, mock_build_manifest: MagicMock, *mocks: Any) -> None:
+        stable_mock_input_manifest.return_value = InputManifest(self.INPUT_MANIFEST_DATA)
+        mock_build_manifest.return_value = BuildManifest(self.BUILD_MANIFEST_DATA)
+        build_incremental = BuildIncremental(self.INPUT_MANIFEST, "tar", paths=True)
+
+        diff_list = build_incremental.commits_diff(self.INPUT_MANIFEST)
+
+        self.assertEqual(diff_list, [])
+        mock_changed_paths.assert_called_once_with(
+            "https://github.com/opensearch-project/job-scheduler.git",
+            "f4a8d4e0bd4ce1a3f3ae1f4bd9a4c0e6a0b2d1c3",
+            "4e2a5e3e1f5d0d1b4e1a5dd2ea3d2d1a1b4f8e8c",
+        )
+        self.assertEqual(list(build_incremental.skipped.keys()), ["job-scheduler"])
+        self.assertEqual(
+            build_incremental.skipped["job-scheduler"]["reason"],
+            "only ignored paths changed since f4a8d4e0bd4ce1a3f3ae1f4bd9a4c0e6a0b2d1c3: README.md, .github/workflows/ci.yml, docs/index.rst"
+        )
+
+    @patch("os.path.exists", return_value=True)
+    @patch("manifests.build_manifest.BuildManifest.from_path")
+    @patch("manifests.input_manifest.InputManifest.stable")
+    @patch("git.git_repository.GitRepository.changed_paths", return_value=["README.md", "src/main/java/Main.java"])
+    def test_commits_diff_relevant_paths(self, mock_changed_paths: MagicMock, stable_mock_input_manifest: MagicMock, mock_build_manifest: MagicMock, *mocks: Any) -> None:
+        stable_mock_input_manifest.return_value = InputManifest(self.INPUT_MANIFEST_DATA)
+        mock_build_manifest.return_value = BuildManifest(self.BUILD_MANIFEST_DATA)
+        build_incremental = BuildIncremental(self.INPUT_MANIFEST, "tar", paths=True)
+
+        self.assertEqual(build_incremental.commits_diff(self.INPUT_MANIFEST), ["job-scheduler"])
+        self.assertEqual(build_incremental.skipped, {})
+
+    @patch("os.path.exists", return_value=True)
+    @patch("manifests.build_manifest.BuildManifest.from_path")
+    @patch("manifests.input_manifest.InputManifest.stable")
+    @patch("git.git_repository.GitRepository.changed_paths", side_effect=subprocess.CalledProcessError(128, "git fetch"))
+    def test_commits_diff_paths_unavailable(self, mock_changed_paths: MagicMock, stable_mock_input_manifest: MagicMock, mock_build_manifest: MagicMock, *mocks: Any) -> None:
+        stable_mock_input_manifest.return_value = InputManifest(self.INPUT_MANIFEST_DATA)
+        mock_build_manifest.return_value = BuildManifest(self.BUILD_MANIFEST_DATA)
+        build_incremental = BuildIncremental(self.INPUT_MANIFEST, "tar", paths=True)
+
+        self.assertEqual(build_incremental.commits_diff(self.INPUT_MANIFEST), ["job-scheduler"])
+
+    @patch("os.path.exists", return_value=True)
+    @patch("manifests.build_manifest.BuildManifest.from_path")
+    @patch("manifests.input_manifest.InputManifest.stable")
+    @patch("git.git_repository.GitRepository.changed_paths")
+    def test_commits_diff_without_paths(self, mock_changed_paths: MagicMock, stable_mock_input_manifest: MagicMock, mock_build_manifest: MagicMock, *mocks: Any) -> None:
+        stable_mock_input_manifest.return_value = InputManifest(self.INPUT_MANIFEST_DATA)
+        mock_build_manifest.return_value = BuildManifest(self.BUILD_MANIFEST_DATA)
+        build_incremental = BuildIncremental(self.INPUT_MANIFEST, "tar")
+
+        self.assertEqual(build_incremental.commits_diff(self.INPUT_MANIFEST), ["job-scheduler"])
+        mock_changed_paths.assert_not_called()
+
+    def test_reuse(self) -> None:
+        build_incremental = BuildIncremental(self.INPUT_MANIFEST, "tar", paths=True)
+        build_manifest = BuildManifest(self.BUILD_MANIFEST_DATA)
+        self.assertIs(build_incremental.reuse(build_manifest), build_manifest)
+
+        build_incremental.skipped["job-scheduler"] = {
+            "commit_id": "4e2a5e3e1f5d0d1b4e1a5dd2ea3d2d1a1b4f8e8c",
+            "built_commit_id": "f4a8d4e0bd4ce1a3f3ae1f4bd9a4c0e6a0b2d1c3",
+            "reason": "only ignored paths changed since f4a8d4e0bd4ce1a3f3ae1f4bd9a4c0e6a0b2d1c3: README.md",
+        }
+        reused = build_incremental.reuse(build_manifest)
+        component = reused.components["job-scheduler"]
+        self.assertEqual(component.commit_id, "4e2a5e3e1f5d0d1b4e1a5dd2ea3d2d1a1b4f8e8c")
+        self.assertEqual(component.artifacts, {'plugins': ['plugins/opensearch-job-scheduler-2.12.0.0.zip']})
+        self.assertEqual(component.incremental, {
+            "commit_id": "f4a8d4e0bd4ce1a3f3ae1f4bd9a4c0e6a0b2d1c3",
+            "reason": "only ignored paths changed since f4a8d4e0bd4ce1a3f3ae1f4bd9a4c0e6a0b2d1c3: README.md",
+        })
+        self.assertIsNone(reused.components["OpenSearch"].incremental)
+
     def test_rebuild_plugins_with_no_update(self) -> None:
         diff_list: List[str] = []
         rebuild_list = self.buildIncremental.rebuild_plugins(diff_list, self.INPUT_MANIFEST)
@@ -151,6 +252,43 @@ class TestBuildIncremental(unittest.TestCase):
         self.assertEqual(len(rebuild_list_geo), 1)
         self.assertTrue("geospatial" in rebuild_list_js)
 
+    def test_rebuild_plugins_in_dependency_order(self) -> None:
+        build_incremental = BuildIncremental(self.INPUT_MANIFEST, "tar")
+        diff_list = ["common-utils"]
+        rebuild_list = build_incremental.rebuild_plugins(diff_list, self.INPUT_MANIFEST)
+        self.assertEqual(diff_list, ["common-utils"])
+        self.assertEqual(len(rebuild_list), len(set(rebuild_list)))
+        order = self.INPUT_MANIFEST.topological_order
+        self.assertEqual(rebuild_list, sorted(rebuild_list, key=order.index))
+        self.assertEqual(rebuild_list[0], "common-utils")
+        self.assertEqual(build_incremental.reasons["ml-commons"], "depends on common-utils")
+        self.assertEqual(build_incremental.reasons["neural-search"], "depends on ml-commons")
+        self.assertNotIn("common-utils", build_incremental.reasons)
+
+    def test_rebuild_plugins_with_core_update_reasons(self) -> None:
+        build_incremental = BuildIncremental(self.INPUT_MANIFEST, "tar")
+        build_incremental.rebuild_plugins(["OpenSearch"], self.INPUT_MANIFEST)
+        self.assertEqual(build_incremental.reasons["sql"], "OpenSearch changed and every component depends on it")
+
+    @patch("os.path.exists", return_value=True)
+    @patch("manifests.build_manifest.BuildManifest.from_path")
+    @patch("manifests.input_manifest.InputManifest.stable")
+    @patch("logging.info")
+    def test_explain(self, mock_logging_info: MagicMock, stable_mock_input_manifest: MagicMock, mock_build_manifest: MagicMock, *mocks: Any) -> None:
+        input_manifest = InputManifest(self.INPUT_MANIFEST_DATA)
+        stable_mock_input_manifest.return_value = input_manifest
+        mock_build_manifest.return_value = BuildManifest(self.BUILD_MANIFEST_DATA)
+        build_incremental = BuildIncremental(input_manifest, "tar")
+
+        components = build_incremental.rebuild_plugins(build_incremental.commits_diff(input_manifest), input_manifest)
+        mock_logging_info.reset_mock()
+        build_incremental.explain(components)
+
+        mock_logging_info.assert_has_calls([
+            call("Rebuilding 1 component(s):"),
+            call("  job-scheduler: commit changed from f4a8d4e0bd4ce1a3f3ae1f4bd9a4c0e6a0b2d1c3 to 4e2a5e3e1f5d0d1b4e1a5dd2ea3d2d1a1b4f8e8c"),
+        ])
+
     def test_rebuild_plugins_with_dashboards(self) -> None:
         buildIncrementDashboards = BuildIncremental(self.INPUT_MANIFEST_DASHBOARDS, "tar")
         diff_list = ["observabilityDashboards"]
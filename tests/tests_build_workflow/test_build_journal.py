@@ -0,0 +1,126 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import os
+import unittest
+from typing import Any, Dict, List
+
+from build_workflow.build_journal import BuildJournal
+from build_workflow.build_target import BuildTarget
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildJournal(unittest.TestCase):
+    COMPONENT = {
+        "name": "common-utils",
+        "repository": "https://github.com/opensearch-project/common-utils.git",
+        "ref": "main",
+        "commit_id": "3913d7097934cbfe1fdcf919347f22a597d00b76",
+        "version": "2.12.0.0",
+    }
+
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.tmp_dir.__exit__(None, None, None)
+
+    def __target(self, version: str = "2.12.0") -> BuildTarget:
+        return BuildTarget(
+            build_id="1",
+            output_dir=self.tmp_dir.name,
+            name="OpenSearch",
+            version=version,
+            platform="linux",
+            architecture="x64",
+            distribution="tar",
+            snapshot=False,
+        )
+
+    def __record(self, journal: BuildJournal, name: str, finished: bool = True) -> None:
+        os.makedirs(os.path.join(self.tmp_dir.name, "maven"), exist_ok=True)
+        with open(os.path.join(self.tmp_dir.name, "maven", f"{name}.jar"), "w") as f:
+            f.write(name)
+        journal.record("component", **{**self.COMPONENT, "name": name})
+        journal.record("artifact", name=name, type="maven", path=f"maven/{name}.jar")
+        if finished:
+            journal.record("finished", name=name)
+
+    def __events(self) -> List[Dict[str, Any]]:
+        with open(os.path.join(self.tmp_dir.name, BuildJournal.FILENAME)) as f:
+            return [json.loads(line) for line in f]
+
+    def test_record(self) -> None:
+        with BuildJournal(self.__target()) as journal:
+            self.__record(journal, "common-utils")
+        self.assertEqual(self.__events(), [
+            {"event": "build", "name": "OpenSearch", "version": "2.12.0", "platform": "linux", "architecture": "x64", "distribution": "tar"},
+            {"event": "component", **self.COMPONENT},
+            {"event": "artifact", "name": "common-utils", "type": "maven", "path": "maven/common-utils.jar"},
+            {"event": "finished", "name": "common-utils"},
+        ])
+
+    def test_resume(self) -> None:
+        with BuildJournal(self.__target()) as journal:
+            self.__record(journal, "common-utils")
+            self.__record(journal, "job-scheduler", finished=False)
+        with open(os.path.join(self.tmp_dir.name, BuildJournal.FILENAME), "a") as f:
+            f.write('{"event": "artif')
+
+        with BuildJournal(self.__target(), resume=True) as journal:
+            self.assertEqual(journal.finished, {"common-utils": {**self.COMPONENT, "artifacts": {"maven": ["maven/common-utils.jar"]}}})
+        # finished components are kept for the next resume
+        with BuildJournal(self.__target(), resume=True) as journal:
+            self.assertEqual(list(journal.finished.keys()), ["common-utils"])
+
+    def test_resume_rebuilt_component(self) -> None:
+        with BuildJournal(self.__target()) as journal:
+            self.__record(journal, "common-utils")
+            self.__record(journal, "common-utils", finished=False)
+        with BuildJournal(self.__target(), resume=True) as journal:
+            self.assertEqual(journal.finished, {})
+
+    def test_resume_missing_artifact(self) -> None:
+        with BuildJournal(self.__target()) as journal:
+            self.__record(journal, "common-utils")
+            self.__record(journal, "job-scheduler")
+        os.unlink(os.path.join(self.tmp_dir.name, "maven", "job-scheduler.jar"))
+        with BuildJournal(self.__target(), resume=True) as journal:
+            self.assertEqual(list(journal.finished.keys()), ["common-utils"])
+
+    def test_resume_changed_ref(self) -> None:
+        with BuildJournal(self.__target()) as journal:
+            self.__record(journal, "common-utils")
+        with BuildJournal(self.__target(), resume=True, commit_ids={"common-utils": "3913d70"}) as journal:
+            self.assertEqual(list(journal.finished.keys()), ["common-utils"])
+        with BuildJournal(self.__target(), resume=True, commit_ids={"common-utils": "0" * 40}) as journal:
+            self.assertEqual(journal.finished, {})
+
+    def test_resume_different_build(self) -> None:
+        with BuildJournal(self.__target()) as journal:
+            self.__record(journal, "common-utils")
+        with BuildJournal(self.__target("2.13.0"), resume=True) as journal:
+            self.assertEqual(journal.finished, {})
+
+    def test_resume_completed_build(self) -> None:
+        with BuildJournal(self.__target()) as journal:
+            self.__record(journal, "common-utils")
+            journal.complete()
+        with BuildJournal(self.__target(), resume=True) as journal:
+            self.assertEqual(journal.finished, {})
+
+    def test_resume_without_journal(self) -> None:
+        with BuildJournal(self.__target(), resume=True) as journal:
+            self.assertEqual(journal.finished, {})
+
+    def test_no_resume(self) -> None:
+        with BuildJournal(self.__target()) as journal:
+            self.__record(journal, "common-utils")
+        with BuildJournal(self.__target()) as journal:
+            self.assertEqual(journal.finished, {})
+        self.assertEqual(len(self.__events()), 1)
@@ -0,0 +1,105 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import unittest
+from typing import Any, Dict, List
+
+from build_workflow.build_merge import BuildMerge
+from manifests.build_manifest import BuildManifest
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildMerge(unittest.TestCase):
+    BUILD = {"name": "OpenSearch", "version": "2.12.0", "platform": "linux", "architecture": "x64", "distribution": "tar"}
+
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.shards_dir = os.path.join(self.tmp_dir.name, "shards")
+        self.output_dir = os.path.join(self.tmp_dir.name, "builds", "opensearch")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.__exit__(None, None, None)
+
+    def __component(self, name: str, commit_id: str = "3913d7097934cbfe1fdcf919347f22a597d00b76", path: str = None) -> Dict[str, Any]:
+        return {
+            "name": name,
+            "repository": f"https://github.com/opensearch-project/{name}.git",
+            "ref": "main",
+            "commit_id": commit_id,
+            "artifacts": {"maven": [path or f"maven/{name}.jar"]},
+            "version": "2.12.0.0",
+        }
+
+    def __fragment(self, shard: str, components: List[Dict[str, Any]], build_id: str = "1", version: str = "2.12.0") -> str:
+        fragment = os.path.join(self.shards_dir, shard)
+        for component in components:
+            for path in component["artifacts"]["maven"]:
+                os.makedirs(os.path.dirname(os.path.join(fragment, path)), exist_ok=True)
+                with open(os.path.join(fragment, path), "w") as f:
+                    f.write(f"{component['name']} {component['commit_id']}")
+        os.makedirs(fragment, exist_ok=True)
+        BuildManifest({
+            "schema-version": "1.2",
+            "build": {**self.BUILD, "id": build_id, "version": version},
+            "components": components,
+        }).to_file(os.path.join(fragment, "manifest.yml"))
+        return fragment
+
+    def test_merge(self) -> None:
+        first = self.__fragment("1-of-2", [self.__component("OpenSearch"), self.__component("common-utils"), self.__component("alerting")])
+        second = self.__fragment("2-of-2", [self.__component("OpenSearch"), self.__component("common-utils"), self.__component("sql")], build_id="2")
+
+        manifest = BuildMerge(BuildMerge.find(self.shards_dir), self.output_dir).write(["OpenSearch", "common-utils", "sql", "alerting"])
+
+        self.assertEqual(BuildMerge.find(self.shards_dir), [first, second])
+        self.assertEqual(manifest.build.id, "1")
+        self.assertEqual(list(manifest.components.keys()), ["OpenSearch", "common-utils", "sql", "alerting"])
+        self.assertEqual(BuildManifest.from_path(os.path.join(self.output_dir, "manifest.yml")).to_dict(), manifest.to_dict())
+        for name in ["OpenSearch", "common-utils", "sql", "alerting"]:
+            self.assertTrue(os.path.isfile(os.path.join(self.output_dir, "maven", f"{name}.jar")))
+
+    def test_merge_conflicting_component(self) -> None:
+        self.__fragment("1-of-2", [self.__component("common-utils")])
+        self.__fragment("2-of-2", [self.__component("common-utils", commit_id="0000000000000000000000000000000000000000")])
+        with self.assertRaises(BuildMerge.ConflictError) as ctx:
+            BuildMerge(BuildMerge.find(self.shards_dir), self.output_dir).merge()
+        self.assertEqual(
+            str(ctx.exception),
+            f"Conflicting entries for common-utils in {os.path.join(self.shards_dir, '1-of-2')} and {os.path.join(self.shards_dir, '2-of-2')}."
+        )
+
+    def test_merge_conflicting_artifact(self) -> None:
+        self.__fragment("1-of-2", [self.__component("alerting", path="maven/shared.jar")])
+        self.__fragment("2-of-2", [self.__component("sql", path="maven/shared.jar")])
+        with self.assertRaisesRegex(BuildMerge.ConflictError, "^Conflicting entries for maven/shared.jar in "):
+            BuildMerge(BuildMerge.find(self.shards_dir), self.output_dir).merge()
+
+    def test_merge_different_builds(self) -> None:
+        self.__fragment("1-of-2", [self.__component("alerting")])
+        self.__fragment("2-of-2", [self.__component("sql")], version="2.13.0")
+        with self.assertRaisesRegex(BuildMerge.ConflictError, "^Conflicting entries for build in "):
+            BuildMerge(BuildMerge.find(self.shards_dir), self.output_dir).merge()
+
+    def test_find_missing_fragment(self) -> None:
+        self.__fragment("1-of-3", [self.__component("alerting")])
+        os.makedirs(os.path.join(self.shards_dir, "3-of-3"))
+        with self.assertRaises(BuildMerge.MissingFragmentsError) as ctx:
+            BuildMerge.find(self.shards_dir)
+        self.assertEqual(str(ctx.exception), f"Missing build manifest fragments in {self.shards_dir}: 2-of-3, 3-of-3.")
+
+    def test_find_different_shard_counts(self) -> None:
+        self.__fragment("1-of-1", [self.__component("alerting")])
+        self.__fragment("1-of-2", [self.__component("alerting")])
+        with self.assertRaises(ValueError) as ctx:
+            BuildMerge.find(self.shards_dir)
+        self.assertEqual(str(ctx.exception), f"Found the shards of more than one build in {self.shards_dir}, built with 1, 2 shards.")
+
+    def test_find_no_shards(self) -> None:
+        with self.assertRaises(BuildMerge.NoShardsError) as ctx:
+            BuildMerge.find(self.shards_dir)
+        self.assertEqual(str(ctx.exception), f"No shards found in {self.shards_dir}, build them with --shard first.")
@@ -0,0 +1,90 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import io
+import json
+import os
+import subprocess
+import unittest
+from typing import Optional
+from unittest.mock import MagicMock, patch
+
+from build_workflow.build_plan import BuildPlan
+from build_workflow.build_target import BuildTarget
+from manifests.input_manifest import InputManifest
+from paths.script_finder import ScriptFinder
+
+
+@patch("git.git_repository.GitRepository.existing_paths", return_value=[])
+class TestBuildPlan(unittest.TestCase):
+    MANIFEST = InputManifest.from_path(os.path.join(os.path.dirname(__file__), "data", "opensearch-input-2.12.0.yml"))
+    ESTIMATES = {"OpenSearch": 600.0, "common-utils": 60.0, "job-scheduler": 120.0, "geospatial": 300.0}
+
+    def setUp(self) -> None:
+        self.history = MagicMock()
+        self.history.estimate.side_effect = self.__estimate
+        self.target = BuildTarget(name="OpenSearch", version="2.12.0", platform="linux", architecture="x64", distribution="tar", output_dir="tar/builds/opensearch")
+
+    def __estimate(self, name: str, target: BuildTarget) -> Optional[float]:
+        return self.ESTIMATES.get(name)
+
+    def __components(self, *names: str) -> list:
+        return [component for component in self.MANIFEST.components.select(focus=list(names))]
+
+    def test_to_dict(self, mock_existing_paths: MagicMock) -> None:
+        components = self.__components("geospatial", "k-NN", "job-scheduler", "common-utils", "OpenSearch")
+        plan = BuildPlan(self.MANIFEST, [self.target], components, self.history, {"geospatial": "0" * 40}, resolve_times={"geospatial": 1.234}).to_dict()
+
+        self.assertEqual(plan["build"]["targets"], [{"distribution": "tar", "platform": "linux", "architecture": "x64", "output_dir": "tar/builds/opensearch"}])
+        self.assertFalse(plan["build"]["incremental"])
+        self.assertEqual([component["name"] for component in plan["components"]], ["OpenSearch", "common-utils", "job-scheduler", "k-NN", "geospatial"])
+        geospatial = next(component for component in plan["components"] if component["name"] == "geospatial")
+        self.assertEqual(geospatial["depends_on"], ["OpenSearch", "job-scheduler"])
+        self.assertEqual(geospatial["commit_id"], "0" * 40)
+        self.assertEqual(geospatial["resolve_time"], 1.23)
+        self.assertIsNone(plan["components"][0]["resolve_time"])
+        self.assertEqual(geospatial["ref"], "f48c9dabcd4d955e5d88b0670d519cd7d341581c")
+        self.assertEqual(geospatial["build_script"], ScriptFinder.find_default_build_script("OpenSearch", "geospatial"))
+        self.assertFalse(geospatial["build_script_in_repository"])
+        mock_existing_paths.assert_any_call(geospatial["repository"], "0" * 40, ["build.sh", "scripts/build.sh"])
+        mock_existing_paths.assert_any_call(plan["components"][1]["repository"], plan["components"][1]["ref"], ["build.sh", "scripts/build.sh"])
+        self.assertEqual(geospatial["estimate"], 300.0)
+        self.assertNotIn("reason", geospatial)
+        self.assertEqual(plan["estimate"], {"serial": 1080.0, "critical_path": 1020.0, "unknown": ["k-NN"]})
+
+    def test_reasons(self, mock_existing_paths: MagicMock) -> None:
+        plan = BuildPlan(self.MANIFEST, [self.target], self.__components("common-utils", "job-scheduler"), self.history, reasons={"job-scheduler": "changed"}, incremental=True).to_dict()
+        self.assertTrue(plan["build"]["incremental"])
+        self.assertEqual([component["reason"] for component in plan["components"]], ["selected", "changed"])
+
+    def test_estimate_all_targets(self, mock_existing_paths: MagicMock) -> None:
+        windows = BuildTarget(name="OpenSearch", version="2.12.0", platform="windows", architecture="x64", distribution="zip")
+        plan = BuildPlan(self.MANIFEST, [self.target, windows], self.__components("OpenSearch"), self.history).to_dict()
+        self.assertEqual(plan["components"][0]["estimate"], 1200.0)
+
+    def test_write(self, mock_existing_paths: MagicMock) -> None:
+        stream = io.StringIO()
+        BuildPlan(self.MANIFEST, [self.target], [], self.history).write(stream)
+        self.assertEqual(json.loads(stream.getvalue())["estimate"], {"serial": 0, "critical_path": 0, "unknown": []})
+
+    def test_build_script_in_repository(self, mock_existing_paths: MagicMock) -> None:
+        mock_existing_paths.side_effect = lambda url, sha, paths: paths[1:]
+        plan = BuildPlan(self.MANIFEST, [self.target], self.__components("job-scheduler"), self.history).to_dict()
+        self.assertEqual(plan["components"][0]["build_script"], "scripts/build.sh")
+        self.assertTrue(plan["components"][0]["build_script_in_repository"])
+
+    def test_build_script_component_scripts(self, mock_existing_paths: MagicMock) -> None:
+        plan = BuildPlan(self.MANIFEST, [self.target], self.__components("OpenSearch"), self.history).to_dict()
+        self.assertEqual(plan["components"][0]["build_script"], os.path.join(ScriptFinder.component_scripts_path, "OpenSearch", "build.sh"))
+        self.assertFalse(plan["components"][0]["build_script_in_repository"])
+        mock_existing_paths.assert_not_called()
+
+    def test_build_script_unavailable(self, mock_existing_paths: MagicMock) -> None:
+        mock_existing_paths.side_effect = subprocess.CalledProcessError(128, "git fetch")
+        plan = BuildPlan(self.MANIFEST, [self.target], self.__components("job-scheduler"), self.history).to_dict()
+        self.assertIsNone(plan["components"][0]["build_script"])
+        self.assertIsNone(plan["components"][0]["build_script_in_repository"])
@@ -0,0 +1,111 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import os
+import subprocess
+import time
+import unittest
+from unittest.mock import MagicMock, Mock, call, patch
+
+from build_workflow.build_prefetch import BuildPrefetch
+from build_workflow.build_target import BuildTarget
+from manifests.build_manifest import BuildManifest
+from manifests.input_manifest import InputComponentFromDist, InputComponentFromSource
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildPrefetch(unittest.TestCase):
+    BUILD_MANIFEST = BuildManifest.from_path(os.path.join(os.path.dirname(__file__), "data", "opensearch-build-windows-1.1.0.yml"))
+
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.mirror = MagicMock()
+        self.download_pool = MagicMock()
+        self.download_pool.submit.side_effect = self.__submit
+        self.prefetch = BuildPrefetch(self.mirror, self.tmp_dir.name, self.download_pool)
+        self.target = BuildTarget(name="OpenSearch", version="1.1.0", platform="windows", architecture="x64")
+
+    def tearDown(self) -> None:
+        self.prefetch.close()
+        self.tmp_dir.__exit__(None, None, None)
+
+    def __submit(self, url: str, dest: str, verify: bool = False) -> concurrent.futures.Future:
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        if "security" in url:
+            future.set_exception(OSError("unreachable"))
+        else:
+            future.set_result(0)
+        return future
+
+    def test_start_fetches_refs(self) -> None:
+        components = [
+            InputComponentFromSource({"name": "OpenSearch", "repository": "https://github.com/opensearch-project/OpenSearch.git", "ref": "main"}),
+            InputComponentFromSource({"name": "common-utils", "repository": "https://github.com/opensearch-project/common-utils.git", "ref": "main"}),
+            InputComponentFromSource({"name": "other", "repository": "https://github.com/opensearch-project/OpenSearch.git", "ref": "main"}),
+        ]
+        self.prefetch.start(components, [self.target])
+        concurrent.futures.wait(self.prefetch.refs.values())
+        self.assertEqual(
+            sorted(self.mirror.fetch.call_args_list),
+            [
+                call("https://github.com/opensearch-project/OpenSearch.git", "main"),
+                call("https://github.com/opensearch-project/common-utils.git", "main"),
+            ]
+        )
+
+    def test_start_without_mirror(self) -> None:
+        prefetch = BuildPrefetch(None, self.tmp_dir.name, self.download_pool)
+        prefetch.start([InputComponentFromSource({"name": "OpenSearch", "repository": "url", "ref": "main"})], [self.target])
+        prefetch.close()
+        self.assertEqual(prefetch.refs, {})
+
+    def test_close_cancels_pending_fetches(self) -> None:
+        self.mirror.fetch.side_effect = lambda url, ref: time.sleep(0.5)
+        prefetch = BuildPrefetch(self.mirror, self.tmp_dir.name, self.download_pool, workers=1)
+        prefetch.start([InputComponentFromSource({"name": name, "repository": name, "ref": "main"}) for name in ["a", "b", "c"]], [self.target])
+        prefetch.close()
+        self.assertTrue(all(future.done() for future in prefetch.refs.values()))
+        self.mirror.fetch.assert_called_once_with("a", "main")
+
+    def test_fetch_ref_error(self) -> None:
+        self.mirror.fetch.side_effect = subprocess.CalledProcessError(128, "git fetch")
+        with self.assertLogs(level="WARNING") as logs:
+            self.prefetch.start([InputComponentFromSource({"name": "OpenSearch", "repository": "url", "ref": "main"})], [self.target])
+            concurrent.futures.wait(self.prefetch.refs.values())
+        self.assertIn("Unable to prefetch url@main", logs.output[0])
+
+    @patch("build_workflow.build_prefetch.BuildManifest.from_url", return_value=BUILD_MANIFEST)
+    @patch("manifests.distribution.find_build_root", return_value="dist_url")
+    def test_dist(self, mock_find_build_root: Mock, mock_from_url: Mock) -> None:
+        components = [InputComponentFromDist({"name": name, "dist": "url"}) for name in ["notifications", "security", "common-utils"]]
+        self.prefetch.start(components, [self.target])
+
+        self.assertEqual(self.prefetch.dist(components[0], self.target), ("dist_url", self.BUILD_MANIFEST))
+        mock_find_build_root.assert_called_with("url", "windows", "x64", "opensearch")
+        mock_from_url.assert_called_with("dist_url/manifest.yml")
+        self.prefetch.dist(components[1], self.target)
+        self.prefetch.dist(components[2], self.target)
+
+        dest = self.prefetch.artifact("dist_url/plugins/opensearch-notifications-1.1.0.0.zip")
+        self.assertEqual(os.path.dirname(os.path.dirname(dest)), self.tmp_dir.name)
+        self.assertEqual(os.path.basename(dest), "opensearch-notifications-1.1.0.0.zip")
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(self.prefetch.artifact("dist_url/plugins/opensearch-security-1.1.0.0.zip"))
+        self.assertIsNone(self.prefetch.artifact("dist_url/plugins/unknown.zip"))
+        # maven artifacts are never downloaded
+        self.assertEqual(self.download_pool.submit.call_count, 2)
+
+    @patch("manifests.distribution.find_build_root", side_effect=ValueError("No build root"))
+    def test_dist_error(self, mock_find_build_root: Mock) -> None:
+        component = InputComponentFromDist({"name": "notifications", "dist": "url"})
+        self.prefetch.start([component], [self.target])
+        with self.assertLogs(level="WARNING"):
+            self.assertIsNone(self.prefetch.dist(component, self.target))
+
+    def test_dist_not_prefetched(self) -> None:
+        self.assertIsNone(self.prefetch.dist(InputComponentFromDist({"name": "notifications", "dist": "url"}), self.target))
@@ -7,10 +7,11 @@
 
 import os
 import unittest
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 import yaml
 
+from build_workflow.build_artifact_check import BuildArtifactCheck
 from build_workflow.build_recorder import BuildRecorder
 from build_workflow.build_target import BuildTarget
 from build_workflow.opensearch.build_artifact_check_maven import BuildArtifactOpenSearchCheckMaven
@@ -157,6 +158,118 @@ class TestBuildRecorder(unittest.TestCase):
         mock_copyfile.assert_called()
         mock_makedirs.assert_called()
 
+    @patch("os.makedirs")
+    def test_record_artifact_file_placement(self, mock_makedirs: Mock) -> None:
+        file_placement = MagicMock()
+        recorder = BuildRecorder(BuildTarget(build_id="1", output_dir="output_dir", name="OpenSearch", version="1.3.0"), file_placement=file_placement)
+        recorder.record_component("common-utils", MagicMock())
+        recorder.record_artifact("common-utils", "libs", "file1.jar", __file__)
+        file_placement.place.assert_called_with(__file__, os.path.join("output_dir", "file1.jar"))
+        self.assertEqual(recorder.tracer.events[0]["name"], "file1.jar")
+        self.assertEqual(recorder.tracer.events[0]["cat"], "copy")
+        self.assertEqual(recorder.tracer.events[0]["args"]["component"], "common-utils")
+
+    @patch("build_workflow.build_recorder.BuildArtifactChecks.check")
+    @patch("os.makedirs")
+    def test_record_artifact_skip_maven(self, mock_makedirs: Mock, mock_check: Mock) -> None:
+        file_placement = MagicMock()
+        target = BuildTarget(build_id="1", output_dir="output_dir", name="OpenSearch", version="1.3.0")
+        recorder = BuildRecorder(target, file_placement=file_placement, skip_maven=["common-utils"])
+        recorder.record_component("common-utils", MagicMock(url="url", ref="main", sha="sha"))
+        recorder.record_component("job-scheduler", MagicMock(url="url", ref="main", sha="sha"))
+        recorder.record_artifact("common-utils", "maven", "maven/file1.jar", __file__)
+        recorder.record_artifacts("common-utils", [("maven", "maven/file2.jar", __file__), ("libs", "file1.jar", __file__)])
+        recorder.record_artifact("job-scheduler", "maven", "maven/file3.jar", __file__)
+        self.assertEqual(
+            file_placement.place.call_args_list,
+            [call(__file__, os.path.join("output_dir", "file1.jar")), call(__file__, os.path.join("output_dir", "maven/file3.jar"))],
+        )
+        self.assertEqual(recorder.get_manifest().components["common-utils"].artifacts, {"libs": ["file1.jar"]})
+        self.assertEqual(recorder.get_manifest().components["job-scheduler"].artifacts, {"maven": ["maven/file3.jar"]})
+
+    def test_record_artifacts(self) -> None:
+        with TemporaryDirectory() as tmp_dir:
+            target = BuildTarget(build_id="1", output_dir=os.path.join(tmp_dir.name, "builds"), name="OpenSearch", version="1.3.0")
+            artifact_validator = MagicMock()
+            journal = MagicMock(finished={})
+            recorder = BuildRecorder(target, artifact_validator=artifact_validator, journal=journal)
+            recorder.record_component("common-utils", MagicMock(url="url", ref="main", sha="sha"))
+            artifacts = [("maven", os.path.join("maven", "org", f"file{index}.jar"), __file__) for index in range(20)]
+            artifacts.append(("libs", "file.jar", __file__))
+            recorder.record_artifacts("common-utils", artifacts)
+            for _, path, _ in artifacts:
+                self.assertTrue(os.path.isfile(os.path.join(tmp_dir.name, "builds", path)))
+            self.assertEqual(
+                artifact_validator.submit.call_args_list,
+                [call(target, "common-utils", artifact_type, os.path.join(tmp_dir.name, "builds", path)) for artifact_type, path, _ in artifacts]
+            )
+            # Artifacts are recorded once their checks passed
+            self.assertEqual(recorder.get_manifest().components["common-utils"].artifacts, {})
+            recorder.check_artifacts("common-utils")
+            artifact_validator.wait.assert_called_once_with(target, "common-utils")
+            self.assertEqual(
+                recorder.get_manifest().components["common-utils"].artifacts,
+                {"maven": [path for artifact_type, path, _ in artifacts if artifact_type == "maven"], "libs": ["file.jar"]}
+            )
+            self.assertEqual(journal.record.call_args_list[-1], call("artifact", name="common-utils", type="libs", path="file.jar"))
+
+    @patch("build_workflow.build_recorder.BuildArtifactChecks.check")
+    def test_record_artifacts_invalid(self, mock_check: Mock) -> None:
+        mock_check.side_effect = [None, BuildArtifactCheck.BuildArtifactInvalidError("file1.jar", "invalid")]
+        with TemporaryDirectory() as tmp_dir:
+            recorder = BuildRecorder(BuildTarget(build_id="1", output_dir=tmp_dir.name, name="OpenSearch", version="1.3.0"))
+            recorder.record_component("common-utils", MagicMock(url="url", ref="main", sha="sha"))
+            with self.assertRaises(BuildArtifactCheck.BuildArtifactInvalidError):
+                recorder.record_artifacts("common-utils", [("libs", "file0.jar", __file__), ("libs", "file1.jar", __file__)])
+            self.assertEqual(recorder.get_manifest().components["common-utils"].artifacts, {})
+
+    @patch("os.makedirs")
+    @patch("build_workflow.build_recorder.BuildArtifactChecks.check")
+    def test_record_artifact_validator(self, mock_check: Mock, mock_makedirs: Mock) -> None:
+        artifact_validator = MagicMock()
+        target = BuildTarget(build_id="1", output_dir="output_dir", name="OpenSearch", version="1.3.0")
+        recorder = BuildRecorder(target, file_placement=MagicMock(), artifact_validator=artifact_validator)
+        recorder.record_component("common-utils", MagicMock(url="url", ref="main", sha="sha"))
+        recorder.record_artifact("common-utils", "maven", "file1.jar", __file__)
+        mock_check.assert_not_called()
+        artifact_validator.submit.assert_called_with(target, "common-utils", "maven", os.path.join("output_dir", "file1.jar"))
+        recorder.check_artifacts("common-utils")
+        artifact_validator.wait.assert_called_with(target, "common-utils")
+        self.assertEqual(recorder.get_manifest().components["common-utils"].artifacts, {"maven": ["file1.jar"]})
+
+    def test_check_artifacts_invalid(self) -> None:
+        with TemporaryDirectory() as tmp_dir:
+            artifact_validator = MagicMock()
+            artifact_validator.wait.side_effect = BuildArtifactCheck.BuildArtifactInvalidError("file1.jar", "invalid")
+            journal = MagicMock(finished={})
+            recorder = BuildRecorder(BuildTarget(build_id="1", output_dir=tmp_dir.name, name="OpenSearch", version="1.3.0"), artifact_validator=artifact_validator, journal=journal)
+            recorder.record_component("common-utils", MagicMock(url="url", ref="main", sha="sha"))
+            recorder.record_artifact("common-utils", "libs", "file1.jar", __file__)
+            self.assertTrue(os.path.isfile(os.path.join(tmp_dir.name, "file1.jar")))
+            with self.assertRaises(BuildArtifactCheck.BuildArtifactInvalidError):
+                recorder.check_artifacts("common-utils")
+            self.assertFalse(os.path.exists(os.path.join(tmp_dir.name, "file1.jar")))
+            self.assertEqual(recorder.get_manifest().components["common-utils"].artifacts, {})
+            self.assertNotIn("artifact", [record.args[0] for record in journal.record.call_args_list])
+
+    @patch("os.makedirs")
+    def test_record_journal(self, mock_makedirs: Mock) -> None:
+        journal = MagicMock(finished={"job-scheduler": {"name": "job-scheduler", "repository": "url", "ref": "main", "commit_id": "sha", "version": "1.3.0.0"}})
+        recorder = BuildRecorder(
+            BuildTarget(build_id="1", output_dir="output_dir", name="OpenSearch", version="1.3.0"),
+            file_placement=MagicMock(),
+            journal=journal,
+        )
+        recorder.record_component("common-utils", MagicMock(url="url", ref="main", sha="sha"))
+        recorder.record_artifact("common-utils", "libs", "file1.jar", __file__)
+        recorder.finish_component("common-utils")
+        journal.record.assert_has_calls([
+            call("component", name="common-utils", repository="url", ref="main", commit_id="sha", version="1.3.0.0-SNAPSHOT"),
+            call("artifact", name="common-utils", type="libs", path="file1.jar"),
+            call("finished", name="common-utils"),
+        ])
+        self.assertEqual(list(recorder.get_manifest().components.keys()), ["job-scheduler", "common-utils"])
+
     def test_get_manifest(self) -> None:
         manifest = self.__mock(snapshot=False).get_manifest()
         self.assertIs(type(manifest), BuildManifest)
@@ -200,6 +313,7 @@ class TestBuildRecorder(unittest.TestCase):
             mock.write_manifest()
             manifest_path = os.path.join(dest_dir.name, "manifest.yml")
             self.assertTrue(os.path.isfile(manifest_path))
+            self.assertTrue(os.path.isfile(os.path.join(dest_dir.name, "trace.json")))
             data = mock.get_manifest().to_dict()
             with open(manifest_path) as f:
                 self.assertEqual(yaml.safe_load(f), data)
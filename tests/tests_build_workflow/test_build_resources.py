@@ -0,0 +1,160 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import os
+import subprocess
+import threading
+import time
+import unittest
+from typing import List
+from unittest.mock import MagicMock, patch
+
+from build_workflow.build_resources import BuildResources
+from system.temporary_directory import TemporaryDirectory
+
+GB = 1024 ** 3
+
+
+class TestBuildResources(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "resource-hints.json")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.__exit__(None, None, None)
+
+    def __hints(self, hints: dict) -> None:
+        with open(self.path, "w") as f:
+            json.dump(hints, f)
+
+    def test_hint(self) -> None:
+        self.__hints({"sql": {"rss": 3 * GB, "cores": 2.5}, "k-NN": {"rss": 16 * GB, "cores": 16}})
+        with BuildResources(8 * GB, 8, self.path) as resources:
+            self.assertEqual(resources.hint("sql"), {"rss": 3 * GB, "cores": 2.5})
+            self.assertEqual(resources.hint("alerting"), BuildResources.DEFAULT_HINT)
+            # larger than the budget
+            self.assertEqual(resources.hint("k-NN"), {"rss": 8 * GB, "cores": 8})
+
+    def test_invalid_hints(self) -> None:
+        with open(self.path, "w") as f:
+            f.write("{")
+        with BuildResources(8 * GB, 8, self.path) as resources:
+            self.assertEqual(resources.hints, {})
+
+    def test_reserve_waits_for_budget(self) -> None:
+        events: List[str] = []
+        started = threading.Event()
+        release = threading.Event()
+
+        with BuildResources(3 * GB, 8, self.path) as resources:
+            def first() -> None:
+                with resources.reserve("sql", self.tmp_dir.name):
+                    events.append("sql started")
+                    started.set()
+                    release.wait(5)
+                    events.append("sql finished")
+
+            def second() -> None:
+                started.wait(5)
+                with resources.reserve("alerting", self.tmp_dir.name):
+                    events.append("alerting started")
+
+            threads = [threading.Thread(target=first), threading.Thread(target=second)]
+            for thread in threads:
+                thread.start()
+            started.wait(5)
+            time.sleep(0.1)
+            self.assertEqual(resources.free["rss"], 1 * GB)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        self.assertEqual(events, ["sql started", "sql finished", "alerting started"])
+        self.assertEqual(resources.free, {"rss": 3 * GB, "cores": 8})
+
+    def test_reserve_concurrently(self) -> None:
+        with BuildResources(8 * GB, 8, self.path) as resources:
+            with resources.reserve("sql", self.tmp_dir.name):
+                with resources.reserve("alerting", self.tmp_dir.name):
+                    self.assertEqual(sorted(resources.running.keys()), ["alerting", "sql"])
+                    self.assertEqual(resources.free, {"rss": 4 * GB, "cores": 6})
+
+    def test_reserve_larger_than_budget(self) -> None:
+        self.__hints({"k-NN": {"rss": 16 * GB, "cores": 1}})
+        with BuildResources(8 * GB, 8, self.path) as resources:
+            with resources.reserve("k-NN", self.tmp_dir.name):
+                self.assertEqual(resources.free["rss"], 0)
+
+    def test_learn(self) -> None:
+        process = subprocess.Popen("sleep 5", cwd=self.tmp_dir.name, shell=True)
+        try:
+            with BuildResources(8 * GB, 8, self.path, interval=0.05) as resources:
+                with resources.reserve("sql", self.tmp_dir.name) as reservation:
+                    for _ in range(100):
+                        if reservation.rss:
+                            break
+                        time.sleep(0.05)
+        finally:
+            process.kill()
+            process.wait()
+        self.assertGreater(reservation.rss, 0)
+        with open(self.path) as f:
+            hints = json.load(f)
+        self.assertEqual(list(hints.keys()), ["sql"])
+        self.assertEqual(hints["sql"]["rss"], reservation.rss)
+
+    def test_learn_shrinks_slowly(self) -> None:
+        self.__hints({"sql": {"rss": 4 * GB, "cores": 1}})
+        process = MagicMock(pid=1)
+        process.memory_info.return_value.rss = 2 * GB
+        process.cpu_times.return_value = MagicMock(user=0, system=0, children_user=0, children_system=0)
+        with patch.object(BuildResources, "_BuildResources__processes", return_value=[process]):
+            with BuildResources(8 * GB, 8, self.path) as resources:
+                with resources.reserve("sql", self.tmp_dir.name):
+                    pass
+        self.assertEqual(resources.hints["sql"]["rss"], 3 * GB)
+
+    def test_cpu_time_of_exited_processes(self) -> None:
+        process = MagicMock(pid=1)
+        process.memory_info.return_value.rss = GB
+        process.cpu_times.return_value = MagicMock(user=1, system=1, children_user=3, children_system=1)
+        with patch.object(BuildResources, "_BuildResources__processes", side_effect=[[process], []]):
+            with BuildResources(8 * GB, 8, self.path, interval=60) as resources:
+                with resources.reserve("sql", self.tmp_dir.name) as reservation:
+                    resources._BuildResources__sample(reservation)  # type: ignore[attr-defined]
+        # the processes exited before the last sample
+        self.assertEqual(reservation.cpu_time, 6)
+
+    @patch.dict("os.environ", {"GRADLE_OPTS": "-Xmx1g"})
+    def test_env(self) -> None:
+        with BuildResources(8 * GB, 8, self.path) as resources:
+            self.assertEqual(resources.env, {"GRADLE_OPTS": "-Xmx1g -Dorg.gradle.daemon=false"})
+
+    @patch("logging.warning")
+    def test_runaway(self, mock_warning: MagicMock) -> None:
+        self.__hints({"sql": {"rss": 1 * GB, "cores": 1}})
+        process = MagicMock(pid=1)
+        process.memory_info.return_value.rss = 3 * GB
+        process.cpu_times.return_value = MagicMock(user=1, system=1, children_user=0, children_system=0)
+        with patch.object(BuildResources, "_BuildResources__processes", return_value=[process]):
+            with BuildResources(8 * GB, 8, self.path) as resources:
+                with resources.reserve("sql", self.tmp_dir.name):
+                    pass
+        mock_warning.assert_called_once_with("sql uses 3.0 GB of memory, more than 2 times the 1.0 GB it used before")
+
+    def test_processes(self) -> None:
+        other = os.path.join(self.tmp_dir.name, "sql-other")
+        os.makedirs(os.path.join(self.tmp_dir.name, "sql"))
+        os.makedirs(other)
+        process = subprocess.Popen("sleep 5", cwd=other, shell=True)
+        try:
+            self.assertEqual(BuildResources._BuildResources__processes(os.path.join(self.tmp_dir.name, "sql")), [])  # type: ignore[attr-defined]
+            self.assertIn(process.pid, [child.pid for child in BuildResources._BuildResources__processes(other)])  # type: ignore[attr-defined]
+        finally:
+            process.kill()
+            process.wait()
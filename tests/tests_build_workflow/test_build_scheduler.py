@@ -0,0 +1,98 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import threading
+import unittest
+from typing import Any, Dict, List
+
+from build_workflow.build_scheduler import BuildScheduler
+from manifests.input_manifest import InputComponent, InputComponentFromSource
+
+
+def component(name: str, depends_on: List[str] = None) -> InputComponent:
+    data: Dict[str, Any] = {"name": name, "repository": f"https://github.com/opensearch-project/{name}.git", "ref": "main"}
+    if depends_on:
+        data["depends_on"] = depends_on
+    return InputComponentFromSource(data)
+
+
+class TestBuildScheduler(unittest.TestCase):
+    COMPONENTS = [
+        component("OpenSearch"),
+        component("common-utils"),
+        component("job-scheduler"),
+        component("alerting", ["common-utils"]),
+        component("anomaly-detection", ["common-utils", "job-scheduler"]),
+        component("security"),
+    ]
+
+    def test_dependencies(self) -> None:
+        scheduler = BuildScheduler(self.COMPONENTS, 2)
+        self.assertEqual(scheduler.dependencies["OpenSearch"], set())
+        self.assertEqual(scheduler.dependencies["common-utils"], {"OpenSearch"})
+        self.assertEqual(scheduler.dependencies["anomaly-detection"], {"OpenSearch", "common-utils", "job-scheduler"})
+
+    def test_dependencies_outside_selection(self) -> None:
+        scheduler = BuildScheduler([component("alerting", ["common-utils"])], 2)
+        self.assertEqual(scheduler.dependencies["alerting"], set())
+
+    def test_cycle(self) -> None:
+        with self.assertRaises(BuildScheduler.CycleError) as ctx:
+            BuildScheduler([component("a", ["b"]), component("b", ["a"]), component("c")], 2)
+        self.assertEqual(str(ctx.exception), "Circular dependency between components: a, b.")
+
+    def test_run_in_dependency_order(self) -> None:
+        built: List[str] = []
+        lock = threading.Lock()
+
+        def build(component: InputComponent) -> None:
+            with lock:
+                built.append(component.name)
+
+        failed = BuildScheduler(self.COMPONENTS, 4).run(build, lambda name: True)
+
+        self.assertEqual(failed, [])
+        self.assertEqual(sorted(built), sorted(c.name for c in self.COMPONENTS))
+        self.assertEqual(built[0], "OpenSearch")
+        self.assertLess(built.index("common-utils"), built.index("alerting"))
+        self.assertLess(built.index("job-scheduler"), built.index("anomaly-detection"))
+
+    def test_run_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=10)
+
+        def build(component: InputComponent) -> None:
+            if component.name in ["common-utils", "job-scheduler"]:
+                # both are only unblocked by OpenSearch and must be running at the same time
+                barrier.wait()
+
+        failed = BuildScheduler(self.COMPONENTS, 4).run(build, lambda name: True)
+        self.assertEqual(failed, [])
+
+    def test_run_failure_skips_dependents(self) -> None:
+        built: List[str] = []
+
+        def build(component: InputComponent) -> None:
+            if component.name == "job-scheduler":
+                raise Exception("Error building job-scheduler")
+            built.append(component.name)
+
+        failed = BuildScheduler(self.COMPONENTS, 2).run(build, lambda name: True)
+
+        self.assertEqual(failed, ["job-scheduler", "anomaly-detection"])
+        self.assertEqual(sorted(built), ["OpenSearch", "alerting", "common-utils", "security"])
+
+    def test_run_failure_cannot_continue(self) -> None:
+        built: List[str] = []
+
+        def build(component: InputComponent) -> None:
+            if component.name == "OpenSearch":
+                raise Exception("Error building OpenSearch")
+            built.append(component.name)
+
+        with self.assertRaisesRegex(Exception, "Error building OpenSearch"):
+            BuildScheduler(self.COMPONENTS, 2).run(build, lambda name: name != "OpenSearch")
+        self.assertEqual(built, [])
@@ -0,0 +1,63 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import unittest
+
+from build_workflow.build_shard import BuildShard
+from manifests.input_manifest import InputManifest
+
+
+class TestBuildShard(unittest.TestCase):
+    INPUT_MANIFEST = InputManifest.from_path(os.path.join(os.path.dirname(__file__), "data", "opensearch-input-2.12.0.yml"))
+    NAMES = list(INPUT_MANIFEST.components.keys())
+
+    def test_parse(self) -> None:
+        shard = BuildShard.parse("2/4")
+        self.assertEqual((shard.index, shard.count), (2, 4))
+        self.assertEqual(str(shard), "2-of-4")
+
+    def test_parse_invalid(self) -> None:
+        for value in ["2", "a/4", "0/4", "5/4", "1/0"]:
+            with self.assertRaises(ValueError):
+                BuildShard.parse(value)
+
+    def test_output_dir(self) -> None:
+        self.assertEqual(BuildShard(1, 2).output_dir("opensearch", "tar", "/cwd"), os.path.join("/cwd", "tar", "shards", "opensearch", "1-of-2"))
+        self.assertEqual(BuildShard.shards_dir("opensearch", "tar", "/cwd"), os.path.join("/cwd", "tar", "shards", "opensearch"))
+
+    def test_partition(self) -> None:
+        shards = BuildShard(1, 4).partition(self.INPUT_MANIFEST, self.NAMES)
+        self.assertEqual(len(shards), 4)
+        self.assertEqual(set().union(*shards), set(self.NAMES))
+        for shard in shards:
+            self.assertEqual(shard[0], "OpenSearch")
+            self.assertEqual(shard, [name for name in self.NAMES if name in shard])
+            # each shard builds the components it depends on
+            for name in shard:
+                for dependency in self.INPUT_MANIFEST.components[name].depends_on or []:
+                    self.assertIn(dependency, shard)
+        self.assertLessEqual(max(map(len, shards)) - min(map(len, shards)), 2)
+
+    def test_partition_deterministic(self) -> None:
+        shards = BuildShard(1, 3).partition(self.INPUT_MANIFEST, self.NAMES)
+        self.assertEqual(BuildShard(3, 3).partition(self.INPUT_MANIFEST, self.NAMES), shards)
+
+    def test_partition_more_shards_than_components(self) -> None:
+        shards = BuildShard(1, 3).partition(self.INPUT_MANIFEST, ["OpenSearch", "common-utils"])
+        self.assertEqual(shards, [["OpenSearch", "common-utils"], ["OpenSearch"], ["OpenSearch"]])
+
+    def test_select(self) -> None:
+        components = list(self.INPUT_MANIFEST.components.select(focus=["common-utils", "job-scheduler", "alerting", "sql"]))
+        first = [component.name for component in BuildShard(1, 2).select(self.INPUT_MANIFEST, components)]
+        second = [component.name for component in BuildShard(2, 2).select(self.INPUT_MANIFEST, components)]
+        self.assertEqual(first, ["common-utils", "alerting"])
+        self.assertEqual(second, ["job-scheduler", "sql"])
+
+    def test_awaited(self) -> None:
+        self.assertEqual(BuildShard(1, 2).awaited(self.NAMES), [])
+        self.assertEqual(BuildShard(2, 2).awaited(self.NAMES), ["OpenSearch"])
@@ -0,0 +1,117 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from build_workflow.build_tool_caches import BuildToolCaches
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildToolCaches(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.home = os.path.join(self.tmp_dir.name, "home")
+        os.makedirs(os.path.join(self.home, ".gradle"))
+        with patch("os.path.expanduser", return_value=self.home):
+            self.caches = BuildToolCaches(os.path.join(self.tmp_dir.name, "caches"))
+        self.path = os.path.realpath(os.path.join(self.tmp_dir.name, "caches"))
+
+    def tearDown(self) -> None:
+        self.caches.close()
+        self.tmp_dir.__exit__(None, None, None)
+
+    def __record(self, component_name: str, outcomes: str) -> None:
+        with open(self.caches.env(component_name)["OPENSEARCH_BUILD_GRADLE_STATS"], "w") as f:
+            f.write(outcomes)
+
+    def test_env(self) -> None:
+        env = self.caches.env("sql")
+        self.assertEqual(env["GRADLE_USER_HOME"], os.path.join(self.path, "gradle"))
+        self.assertEqual(env["OPENSEARCH_BUILD_GRADLE_CACHE"], os.path.join(self.path, "gradle-build-cache"))
+        self.assertEqual(env["OPENSEARCH_BUILD_GRADLE_STATS"], os.path.join(self.caches.stats_dir, "sql.txt"))
+        self.assertEqual(env["YARN_CACHE_FOLDER"], os.path.join(self.path, "yarn"))
+        self.assertEqual(env["npm_config_cache"], os.path.join(self.path, "npm"))
+        self.assertEqual(env["npm_config_logs_dir"], os.path.join(self.caches.stats_dir, "sql-npm-logs"))
+        for name in ["gradle", "gradle-build-cache", "yarn", "npm"]:
+            self.assertTrue(os.path.isdir(os.path.join(self.path, name)))
+
+    def test_gradle_settings(self) -> None:
+        with open(os.path.join(self.path, "gradle", "init.d", "opensearch-build.gradle")) as f:
+            self.assertIn("OPENSEARCH_BUILD_GRADLE_CACHE", f.read())
+        with open(os.path.join(self.path, "gradle", "gradle.properties")) as f:
+            self.assertEqual(f.read(), "org.gradle.caching=true\n")
+
+    def test_gradle_settings_keep_user_properties(self) -> None:
+        with open(os.path.join(self.home, ".gradle", "gradle.properties"), "w") as f:
+            f.write("systemProp.https.proxyHost=proxy\norg.gradle.caching=false\n")
+        with patch("os.path.expanduser", return_value=self.home):
+            BuildToolCaches(self.path)
+        with open(os.path.join(self.path, "gradle", "gradle.properties")) as f:
+            self.assertEqual(f.read(), "systemProp.https.proxyHost=proxy\norg.gradle.caching=true\n")
+
+    @patch("logging.info")
+    def test_report(self, mock_logging: MagicMock) -> None:
+        self.__record("sql", "from-cache\nfrom-cache\nfrom-cache\nexecuted\nup-to-date\n")
+        self.__record("alerting", "executed\n")
+        self.caches.report("sql")
+        self.caches.report("alerting")
+        self.caches.report("k-NN")
+        self.assertEqual(self.caches.stats("sql"), {"from-cache": 3, "executed": 1, "up-to-date": 1})
+        self.caches.summary()
+        self.assertEqual(mock_logging.call_args_list, [
+            call("Gradle tasks of sql: 1 executed, 3 from-cache, 1 up-to-date, 75% from the build cache"),
+            call("Gradle tasks of alerting: 1 executed, 0% from the build cache"),
+            call("Gradle tasks of all components: 2 executed, 3 from-cache, 1 up-to-date, 60% from the build cache"),
+        ])
+
+    @patch("logging.info")
+    def test_report_npm(self, mock_logging: MagicMock) -> None:
+        logs = self.caches.env("dashboards-reporting")["npm_config_logs_dir"]
+        os.makedirs(logs)
+        with open(os.path.join(logs, "2024-01-01T00_00_00_000Z-debug-0.log"), "w") as f:
+            f.write(
+                "10 http fetch GET 200 https://registry.npmjs.org/lodash 5ms (cache hit)\n"
+                "11 http fetch GET 200 https://registry.npmjs.org/react 120ms (cache miss)\n"
+                "12 http fetch GET 200 https://registry.npmjs.org/moment 60ms (cache revalidated)\n"
+                "13 silly audit (cache hit)\n"
+            )
+        self.caches.report("dashboards-reporting")
+        self.caches.summary()
+        self.assertEqual(mock_logging.call_args_list, [
+            call("npm requests of dashboards-reporting: 1 cache hit, 1 cache miss, 1 cache revalidated, 67% from the cache"),
+            call("npm requests of all components: 1 cache hit, 1 cache miss, 1 cache revalidated, 67% from the cache"),
+        ])
+
+    @patch("logging.info")
+    def test_report_yarn(self, mock_logging: MagicMock) -> None:
+        os.makedirs(os.path.join(self.path, "yarn", "v6", "npm-lodash-4.17.21-abc-integrity"))
+        self.caches.env("dashboards-reporting")
+        for package in ["npm-react-18.2.0-def-integrity", "npm-moment-2.29.4-ghi-integrity", ".tmp"]:
+            os.makedirs(os.path.join(self.path, "yarn", "v6", package))
+        self.caches.report("dashboards-reporting")
+        self.assertEqual(self.caches.yarn_stats("dashboards-reporting"), 2)
+        mock_logging.assert_called_with("Yarn packages added to the cache while building dashboards-reporting: 2")
+
+    def test_close(self) -> None:
+        self.__record("sql", "executed\n")
+        with self.caches:
+            pass
+        self.assertFalse(os.path.exists(self.caches.stats_dir))
+
+    def test_env_resets_stats(self) -> None:
+        self.__record("sql", "executed\n")
+        self.caches.env("sql")
+        self.assertEqual(self.caches.stats("sql"), {})
+
+    @patch("logging.info")
+    def test_summary_cache_growth(self, mock_logging: MagicMock) -> None:
+        with open(os.path.join(self.path, "yarn", "package.tgz"), "wb") as f:
+            f.write(b"0" * 1024 * 1024)
+        self.caches.summary()
+        mock_logging.assert_called_with(f"Added 1.0 MB to {os.path.join(self.path, 'yarn')}")
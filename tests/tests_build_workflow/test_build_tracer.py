@@ -0,0 +1,102 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import os
+import threading
+import unittest
+from unittest.mock import Mock, call, patch
+
+from build_workflow.build_tracer import BuildTracer
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildTracer(unittest.TestCase):
+    def test_span(self) -> None:
+        tracer = BuildTracer()
+        with tracer.span("job-scheduler", "export", "job-scheduler"):
+            with tracer.span("plugins/job-scheduler.zip", "copy", "job-scheduler", type="plugins") as args:
+                args["method"] = "hardlink"
+        copy, export = tracer.events
+        self.assertEqual(export["name"], "job-scheduler")
+        self.assertEqual(export["cat"], "export")
+        self.assertEqual(export["ph"], "X")
+        self.assertEqual(export["args"], {"component": "job-scheduler"})
+        self.assertEqual(copy["args"], {"component": "job-scheduler", "type": "plugins", "method": "hardlink"})
+        # the copy is nested in the export
+        self.assertEqual(copy["tid"], export["tid"])
+        self.assertGreaterEqual(copy["ts"], export["ts"])
+        self.assertLessEqual(copy["ts"] + copy["dur"], export["ts"] + export["dur"])
+
+    def test_span_on_error(self) -> None:
+        tracer = BuildTracer()
+        with self.assertRaises(ValueError):
+            with tracer.span("job-scheduler", "build", "job-scheduler"):
+                raise ValueError()
+        self.assertEqual(len(tracer.events), 1)
+
+    def test_span_threads(self) -> None:
+        tracer = BuildTracer()
+
+        def build() -> None:
+            with tracer.span("a", "build", "a"):
+                pass
+
+        with tracer.span("b", "build", "b"):
+            thread = threading.Thread(target=build)
+            thread.start()
+            thread.join()
+        self.assertEqual(sorted(event["tid"] for event in tracer.events), [1, 2])
+
+    def test_write(self) -> None:
+        tracer = BuildTracer()
+        with tracer.span("job-scheduler", "checkout", "job-scheduler"):
+            pass
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "trace.json")
+            tracer.write(path)
+            with open(path) as f:
+                data = json.load(f)
+        self.assertEqual(data["displayTimeUnit"], "ms")
+        self.assertEqual([event["name"] for event in data["traceEvents"]], ["job-scheduler"])
+
+    def test_write_target(self) -> None:
+        tracer = BuildTracer()
+        for target in ["tar", "zip"]:
+            with tracer.span(f"job-scheduler ({target})", "build", "job-scheduler", target):
+                pass
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "trace.json")
+            tracer.write(path, "zip")
+            with open(path) as f:
+                data = json.load(f)
+        self.assertEqual([event["name"] for event in data["traceEvents"]], ["job-scheduler (zip)"])
+        self.assertEqual(data["traceEvents"][0]["args"], {"component": "job-scheduler", "target": "zip"})
+
+    @patch("logging.info")
+    def test_summary(self, mock_logging: Mock) -> None:
+        tracer = BuildTracer()
+        tracer.events = [
+            {"name": "a", "cat": "checkout", "dur": 1000000, "args": {"component": "a"}},
+            {"name": "a", "cat": "build", "dur": 3000000, "args": {"component": "a"}},
+            {"name": "b", "cat": "build", "dur": 5000000, "args": {"component": "b"}},
+            {"name": "b.zip", "cat": "copy", "dur": 9000000, "args": {"component": "b"}},
+        ]
+        tracer.summary(top=2)
+        mock_logging.assert_has_calls([
+            call("Slowest components (top 2):"),
+            call("         5.0s  b"),
+            call("         4.0s  a"),
+            call("Slowest phases (top 2):"),
+            call("         5.0s  b build"),
+            call("         3.0s  a build"),
+        ])
+
+    @patch("logging.info")
+    def test_summary_empty(self, mock_logging: Mock) -> None:
+        BuildTracer().summary()
+        mock_logging.assert_not_called()
@@ -45,9 +45,9 @@ class TestBuilderFromDist(unittest.TestCase):
         self.__mock_builder("common-utils").build(build_recorder)
 
     @patch("os.makedirs")
-    @patch("urllib.request.urlretrieve")
+    @patch("system.download_pool.DownloadPool.submit")
     @patch("build_workflow.builder_from_dist.BuilderFromDist.ManifestGitRepository")
-    def test_export_artifacts(self, mock_manifest_git_repository: Mock, mock_urllib: Mock, mock_makedirs: Mock) -> None:
+    def test_export_artifacts(self, mock_manifest_git_repository: Mock, mock_submit: Mock, mock_makedirs: Mock) -> None:
         build_recorder = MagicMock()
         manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-windows-1.1.0.yml")
         mock_builder = self.__mock_builder("notifications")
@@ -60,16 +60,24 @@ class TestBuilderFromDist(unittest.TestCase):
             os.path.realpath(os.path.join("builds", "plugins")),
             exist_ok=True
         )
-        mock_urllib.assert_has_calls([
+        mock_submit.assert_has_calls([
             call(
                 'dist_url/plugins/opensearch-notifications-1.1.0.0.zip',
-                os.path.realpath(os.path.join("builds", "plugins", "opensearch-notifications-1.1.0.0.zip")))
+                os.path.realpath(os.path.join("builds", "plugins", "opensearch-notifications-1.1.0.0.zip")),
+                verify=True)
         ])
+        mock_submit.return_value.result.assert_called()
+        build_recorder.record_artifact.assert_called_with(
+            "notifications",
+            "plugins",
+            "plugins/opensearch-notifications-1.1.0.0.zip",
+            os.path.realpath(os.path.join("builds", "plugins", "opensearch-notifications-1.1.0.0.zip")),
+        )
 
     @patch("os.makedirs")
-    @patch("urllib.request.urlretrieve")
+    @patch("system.download_pool.DownloadPool.submit")
     @patch("build_workflow.builder_from_dist.BuilderFromDist.ManifestGitRepository")
-    def test_export_artifacts_skips_maven_artifacts(self, mock_manifest_git_repository: Mock, mock_urllib: Mock, mock_makedirs: Mock) -> None:
+    def test_export_artifacts_skips_maven_artifacts(self, mock_manifest_git_repository: Mock, mock_submit: Mock, mock_makedirs: Mock) -> None:
         build_recorder = MagicMock()
         manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-windows-1.1.0.yml")
         mock_builder = self.__mock_builder("common-utils")
@@ -77,4 +85,30 @@ class TestBuilderFromDist(unittest.TestCase):
         mock_builder.export_artifacts(build_recorder)
         build_recorder.record_component.assert_called_with("common-utils", mock_manifest_git_repository.return_value)
         mock_makedirs.assert_called_with("builds", exist_ok=True)
-        mock_urllib.assert_not_called()
+        mock_submit.assert_not_called()
+
+    @patch("system.download_pool.DownloadPool.submit")
+    @patch("build_workflow.builder_from_dist.BuildManifest")
+    @patch("build_workflow.builder_from_dist.BuilderFromDist.ManifestGitRepository")
+    def test_prefetched(self, mock_manifest_git_repository: Mock, mock_manifest: Mock, mock_submit: Mock) -> None:
+        build_recorder = MagicMock()
+        prefetch = MagicMock()
+        prefetch.dist.return_value = ("dist_url", BuildManifest.from_path(os.path.join(os.path.dirname(__file__), "data", "opensearch-build-windows-1.1.0.yml")))
+        prefetch.artifact.return_value = os.path.join("prefetch", "opensearch-notifications-1.1.0.0.zip")
+        builder = BuilderFromDist(InputComponentFromDist({"name": "notifications", "dist": "url"}), self.__mock_builder("notifications").target, prefetch)
+        builder.checkout("dir")
+        builder.export_artifacts(build_recorder)
+        mock_manifest.from_url.assert_not_called()
+        prefetch.artifact.assert_called_once_with("dist_url/plugins/opensearch-notifications-1.1.0.0.zip")
+        mock_submit.assert_not_called()
+        build_recorder.record_artifact.assert_called_once_with(
+            "notifications", "plugins", "plugins/opensearch-notifications-1.1.0.0.zip", os.path.join("prefetch", "opensearch-notifications-1.1.0.0.zip"))
+
+    @patch("manifests.distribution.find_build_root", return_value="dist_url")
+    @patch("build_workflow.builder_from_dist.BuildManifest")
+    def test_not_prefetched(self, mock_manifest: Mock, find_build_root: Mock) -> None:
+        prefetch = MagicMock()
+        prefetch.dist.return_value = None
+        builder = BuilderFromDist(InputComponentFromDist({"name": "notifications", "dist": "url"}), self.__mock_builder("notifications").target, prefetch)
+        builder.checkout("dir")
+        mock_manifest.from_url.assert_called_once_with("dist_url/manifest.yml")
@@ -7,13 +7,13 @@
 
 import os
 import unittest
-from typing import Any, List
-from unittest.mock import MagicMock, Mock, call, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from build_workflow.build_target import BuildTarget
 from build_workflow.builder_from_source import BuilderFromSource
 from manifests.input_manifest import InputComponentFromSource
 from paths.script_finder import ScriptFinder
+from system.temporary_directory import TemporaryDirectory
 
 
 class TestBuilderFromSource(unittest.TestCase):
@@ -68,6 +68,42 @@ class TestBuilderFromSource(unittest.TestCase):
     def test_builder(self) -> None:
         self.assertEqual(self.builder.component.name, "sample_component")
 
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_checkout(self, mock_git_repo: Mock) -> None:
+        self.builder.checkout("dir")
+        mock_git_repo.assert_called_with("url", "ref", os.path.join("dir", "sample_component"), None, mirror=None, reuse=False, clean=False)
+
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_checkout_reuse(self, mock_git_repo: Mock) -> None:
+        with TemporaryDirectory() as work_dir:
+            stale = os.path.join(work_dir.name, "builds", "maven", "stale.jar")
+            os.makedirs(os.path.dirname(stale))
+            open(stale, "w").close()
+            mock_git_repo.return_value = MagicMock(working_directory=work_dir.name)
+            builder = BuilderFromSource(self.builder.component, self.builder.target, reuse_checkout=True, clean_checkout=True)
+            builder.checkout("workspace")
+            mock_git_repo.assert_called_with("url", "ref", os.path.join("workspace", "sample_component"), None, mirror=None, reuse=True, clean=True)
+            self.assertFalse(os.path.exists(os.path.join(work_dir.name, "builds")))
+
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_checkout_prefetched(self, mock_git_repo: Mock) -> None:
+        prefetch = MagicMock()
+        builder = BuilderFromSource(self.builder.component, self.builder.target, prefetch=prefetch)
+        builder.checkout("dir")
+        self.assertEqual(mock_git_repo.call_args[1]["mirror"], prefetch.mirror)
+
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_checkout_retarget(self, mock_git_repo: Mock) -> None:
+        with TemporaryDirectory() as work_dir:
+            mock_git_repo.return_value = MagicMock(working_directory=work_dir.name)
+            self.builder.checkout("dir")
+            os.makedirs(os.path.join(work_dir.name, "builds", "maven"))
+            self.builder.retarget(self.builder_distribution_support.target)
+            self.builder.checkout("dir")
+            mock_git_repo.assert_called_once()
+            self.assertEqual(self.builder.target.distribution, "rpm")
+            self.assertFalse(os.path.exists(os.path.join(work_dir.name, "builds")))
+
     @patch("build_workflow.builder_from_source.GitRepository")
     def test_build(self, mock_git_repo: Mock) -> None:
         mock_git_repo.return_value = MagicMock(working_directory="dir")
@@ -89,6 +125,29 @@ class TestBuilderFromSource(unittest.TestCase):
         )
         build_recorder.record_component.assert_called_with("sample_component", mock_git_repo.return_value)
 
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_build_with_build_tool_caches(self, mock_git_repo: Mock) -> None:
+        mock_git_repo.return_value = MagicMock(working_directory="dir")
+        build_tool_caches = MagicMock()
+        build_tool_caches.env.return_value = {"GRADLE_USER_HOME": "gradle"}
+        builder = BuilderFromSource(self.builder.component, self.builder.target, build_tool_caches=build_tool_caches)
+        builder.checkout("dir")
+        builder.build(MagicMock())
+        build_tool_caches.env.assert_called_with("sample_component")
+        self.assertEqual(mock_git_repo.return_value.execute.call_args[1], {"env": {"GRADLE_USER_HOME": "gradle"}})
+        build_tool_caches.report.assert_called_with("sample_component")
+
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_build_with_resources(self, mock_git_repo: Mock) -> None:
+        mock_git_repo.return_value = MagicMock(working_directory="dir")
+        build_tool_caches = MagicMock()
+        build_tool_caches.env.return_value = {"GRADLE_USER_HOME": "gradle"}
+        resources = MagicMock(env={"GRADLE_OPTS": "-Dorg.gradle.daemon=false"})
+        builder = BuilderFromSource(self.builder.component, self.builder.target, build_tool_caches=build_tool_caches, resources=resources)
+        builder.checkout("dir")
+        builder.build(MagicMock())
+        self.assertEqual(mock_git_repo.return_value.execute.call_args[1], {"env": {"GRADLE_USER_HOME": "gradle", "GRADLE_OPTS": "-Dorg.gradle.daemon=false"}})
+
     @patch("build_workflow.builder_from_source.GitRepository")
     def test_build_distribution(self, mock_git_repo: Mock) -> None:
         mock_git_repo.return_value = MagicMock(working_directory="dir")
@@ -202,42 +261,91 @@ class TestBuilderFromSource(unittest.TestCase):
         )
         build_recorder.record_component.assert_called_with("not_found_component", mock_git_repo.return_value)
 
-    def mock_os_walk(self, artifact_path: str) -> List[Any]:
-        if artifact_path.endswith(os.path.join("dir", "builds", "core-plugins")):
-            return [["core-plugins", [], ["plugin1.zip"]]]
-        if artifact_path.endswith(os.path.join("dir", "builds", "maven")):
-            return [("maven", [], ["artifact1.jar"])]
-        else:
-            return []
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_export_artifacts(self, mock_git_repo: Mock) -> None:
+        build_recorder = MagicMock()
+        with TemporaryDirectory() as work_dir:
+            for path in ["maven/org/artifact1.jar", "maven/artifact1.pom", "core-plugins/plugin1.zip", "other/file.txt"]:
+                os.makedirs(os.path.dirname(os.path.join(work_dir.name, "builds", path)), exist_ok=True)
+                with open(os.path.join(work_dir.name, "builds", path), "w") as f:
+                    f.write(path)
+            mock_git_repo.return_value = MagicMock(working_directory=work_dir.name)
+            self.builder.checkout("dir")
+            self.builder.export_artifacts(build_recorder)
+            build_recorder.record_artifact.assert_not_called()
+            build_recorder.record_artifacts.assert_called_once_with(
+                "sample_component",
+                [
+                    ("maven", os.path.join("maven", "artifact1.pom"), os.path.join(work_dir.name, "builds", "maven", "artifact1.pom")),
+                    ("maven", os.path.join("maven", "org", "artifact1.jar"), os.path.join(work_dir.name, "builds", "maven", "org", "artifact1.jar")),
+                    ("core-plugins", os.path.join("core-plugins", "plugin1.zip"), os.path.join(work_dir.name, "builds", "core-plugins", "plugin1.zip")),
+                ]
+            )
+
+
+class TestBuilderFromSourceWithBuildCache(unittest.TestCase):
+    COMMIT_ID = "aaf09b0211df15dd74ff2756f2590c360b03486b"
+
+    def setUp(self) -> None:
+        self.build_cache = MagicMock()
+        self.builder = BuilderFromSource(
+            InputComponentFromSource({"name": "job-scheduler", "repository": "url", "ref": "main"}),
+            BuildTarget(
+                name="OpenSearch",
+                version="2.12.0",
+                platform="linux",
+                architecture="x64",
+                snapshot=False,
+            ),
+            self.build_cache,
+        )
+
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_restore_from_cache(self, mock_git_repo: Mock) -> None:
+        mock_git_repo.stable_ref.return_value = [self.COMMIT_ID, "refs/heads/main"]
+        entry = MagicMock(commit_id=self.COMMIT_ID, artifacts={"plugins": [os.path.join("plugins", "job-scheduler.zip")]})
+        entry.file.side_effect = lambda path: os.path.join("cache", path)
+        self.build_cache.get.return_value = entry
+        build_recorder = MagicMock()
+
+        self.builder.checkout("dir")
+        self.builder.build(build_recorder)
+        self.builder.export_artifacts(build_recorder)
 
-    @patch("os.walk")
+        mock_git_repo.assert_not_called()
+        git_repo = build_recorder.record_component.call_args[0][1]
+        self.assertEqual((git_repo.url, git_repo.ref, git_repo.sha), ("url", "main", self.COMMIT_ID))
+        build_recorder.record_artifacts.assert_called_once_with(
+            "job-scheduler", [("plugins", os.path.join("plugins", "job-scheduler.zip"), os.path.join("cache", "plugins", "job-scheduler.zip"))])
+        entry.publish_to_maven_local.assert_called_once()
+        self.builder.finish()
+        self.build_cache.put.assert_not_called()
+
+    @patch("build_workflow.builder_from_source.BuildArtifactFinder.find")
     @patch("build_workflow.builder_from_source.GitRepository")
-    def test_export_artifacts(self, mock_git_repo: Mock, mock_walk: Mock) -> None:
+    def test_store_in_cache(self, mock_git_repo: Mock, mock_find: Mock) -> None:
+        artifacts = [("plugins", os.path.join("plugins", "job-scheduler.zip"), os.path.join("dir", "builds", "plugins", "job-scheduler.zip"))]
+        mock_find.return_value = artifacts
+        mock_git_repo.stable_ref.return_value = [self.COMMIT_ID, "refs/heads/main"]
+        mock_git_repo.return_value = MagicMock(working_directory="dir", sha=self.COMMIT_ID)
+        self.build_cache.get.return_value = None
         build_recorder = MagicMock()
-        mock_git_repo.return_value = MagicMock(working_directory="dir")
-        mock_walk.side_effect = self.mock_os_walk
+
         self.builder.checkout("dir")
+        self.builder.build(build_recorder)
         self.builder.export_artifacts(build_recorder)
-        self.assertEqual(build_recorder.record_artifact.call_count, 2)
-        build_recorder.record_artifact.assert_has_calls(
-            [
-                call(
-                    "sample_component",
-                    "maven",
-                    os.path.relpath(
-                        os.path.join("maven", "artifact1.jar"),
-                        os.path.join("dir", "artifacts"),
-                    ),
-                    os.path.join("maven", "artifact1.jar"),
-                ),
-                call(
-                    "sample_component",
-                    "core-plugins",
-                    os.path.relpath(
-                        os.path.join("core-plugins", "plugin1.zip"),
-                        os.path.join("dir", "artifacts"),
-                    ),
-                    os.path.join("core-plugins", "plugin1.zip"),
-                ),
-            ]
-        )
+
+        mock_git_repo.return_value.execute.assert_called()
+        mock_find.assert_called_once_with(os.path.join("dir", "builds"))
+        build_recorder.record_artifacts.assert_called_once_with("job-scheduler", artifacts)
+        # Artifacts are stored once they passed their checks
+        self.build_cache.put.assert_not_called()
+        self.builder.finish()
+        self.build_cache.put.assert_called_once_with(self.build_cache.get.call_args[0][0], "job-scheduler", mock_git_repo.return_value, artifacts)
+
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_unresolved_ref_skips_cache(self, mock_git_repo: Mock) -> None:
+        mock_git_repo.stable_ref.return_value = ["main", "main"]
+        self.builder.checkout("dir")
+        self.build_cache.get.assert_not_called()
+        mock_git_repo.assert_called_once()
@@ -5,6 +5,7 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import os
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -34,7 +35,7 @@ class TestCiCheckListsSourceRef(unittest.TestCase):
         component = InputComponentFromSource({"name": "common-utils", "repository": "url", "ref": "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"})
         list = CiCheckListSourceRef(component, MagicMock())
         list.checkout("path")
-        mock_git_repo.assert_called()
+        mock_git_repo.assert_called_with("url", "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa", os.path.join("path", "common-utils"), None, sparse_paths=[])
 
     @patch("ci_workflow.ci_check_list_source_ref.GitRepository")
     @patch("subprocess.check_output", return_value="fatal".encode())
@@ -45,7 +46,7 @@ class TestCiCheckListsSourceRef(unittest.TestCase):
             list.checkout("path")
             list.check()
         self.assertEqual("Missing url@aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa.", str(ctx.exception))
-        mock_check_output.assert_called_with("git cat-file -t aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa", shell=True, cwd=mock_git_repo().working_directory)
+        mock_check_output.assert_called_with("git cat-file -t aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa", shell=True, cwd=mock_git_repo().dir)
 
     @patch("ci_workflow.ci_check_list_source_ref.GitRepository")
     @patch("subprocess.check_output", return_value="commit".encode())
@@ -54,4 +55,4 @@ class TestCiCheckListsSourceRef(unittest.TestCase):
         list = CiCheckListSourceRef(component, MagicMock())
         list.checkout("path")
         list.check()
-        mock_check_output.assert_called_with("git cat-file -t aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa", shell=True, cwd=mock_git_repo().working_directory)
+        mock_check_output.assert_called_with("git cat-file -t aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa", shell=True, cwd=mock_git_repo().dir)
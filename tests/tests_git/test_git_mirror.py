@@ -0,0 +1,100 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import subprocess
+import unittest
+from unittest.mock import patch
+
+from git.git_mirror import GitMirror
+from git.git_repository import GitRepository
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestGitMirror(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.origin = os.path.join(self.tmp_dir.name, "origin")
+        os.makedirs(self.origin)
+        self.__git("init")
+        self.__git("-c user.name=test -c user.email=test@example.com commit --allow-empty -m first")
+        self.sha = self.__git("rev-parse HEAD")
+        self.branch = self.__git("rev-parse --abbrev-ref HEAD")
+        self.mirror = GitMirror(os.path.join(self.tmp_dir.name, "mirror"))
+
+    def tearDown(self) -> None:
+        self.tmp_dir.__exit__(None, None, None)
+
+    def __git(self, args: str) -> str:
+        return subprocess.check_output(f"git {args}", cwd=self.origin, shell=True).decode().strip()
+
+    def test_from_environment(self) -> None:
+        with patch.dict(os.environ, {GitMirror.ENVIRONMENT_VARIABLE: self.tmp_dir.name}):
+            self.assertEqual(GitMirror.from_environment().path, os.path.realpath(self.tmp_dir.name))
+        with patch.dict(os.environ, {GitMirror.ENVIRONMENT_VARIABLE: ""}):
+            self.assertIsNone(GitMirror.from_environment())
+
+    def test_fetch_branch(self) -> None:
+        self.assertEqual(self.mirror.fetch(self.origin, self.branch), self.sha)
+        self.assertTrue(os.path.isdir(os.path.join(self.mirror.repository_path(self.origin), "objects")))
+
+    @patch("subprocess.check_call", wraps=subprocess.check_call)
+    def test_fetch_known_commit_is_offline(self, mock_check_call: unittest.mock.Mock) -> None:
+        self.mirror.fetch(self.origin, self.branch)
+        mock_check_call.reset_mock()
+        self.assertEqual(self.mirror.fetch(self.origin, self.sha), self.sha)
+        mock_check_call.assert_not_called()
+
+    def test_fetch_resolves_ref_once(self) -> None:
+        self.assertEqual(self.mirror.fetch(self.origin, self.branch), self.sha)
+        self.__git("-c user.name=test -c user.email=test@example.com commit --allow-empty -m second")
+        self.assertEqual(self.mirror.fetch(self.origin, self.branch), self.sha)
+        self.assertEqual(GitMirror(self.mirror.path).fetch(self.origin, self.branch), self.__git("rev-parse HEAD"))
+
+    def test_shallow_checkout(self) -> None:
+        self.__git("-c user.name=test -c user.email=test@example.com commit --allow-empty -m second")
+        sha = self.__git("rev-parse HEAD")
+        url = f"file://{self.origin}"
+        mirror = GitMirror(os.path.join(self.tmp_dir.name, "shallow-mirror"), shallow=True)
+        with GitRepository(url, self.branch, mirror=mirror) as repo:
+            self.assertEqual(repo.sha, sha)
+            self.assertEqual(repo.output("git rev-list --count HEAD"), "1")
+            self.assertTrue(os.path.isfile(os.path.join(repo.dir, ".git", "shallow")))
+
+    def test_checkout_borrows_objects(self) -> None:
+        with GitRepository(self.origin, self.branch, mirror=self.mirror) as repo:
+            self.assertEqual(repo.sha, self.sha)
+            with open(os.path.join(repo.dir, ".git", "objects", "info", "alternates")) as f:
+                self.assertEqual(f.read().strip(), os.path.join(self.mirror.repository_path(self.origin), "objects"))
+
+    def test_borrow_again(self) -> None:
+        with GitRepository(self.origin, self.branch, mirror=self.mirror) as repo:
+            self.mirror.borrow(self.origin, repo.dir)
+            with open(os.path.join(repo.dir, ".git", "objects", "info", "alternates")) as f:
+                self.assertEqual(f.read().splitlines(), [os.path.join(self.mirror.repository_path(self.origin), "objects")])
+
+    def test_lock_non_blocking(self) -> None:
+        with self.mirror.lock(self.origin) as locked:
+            self.assertTrue(locked)
+            with self.mirror.lock(self.origin, blocking=False) as locked_again:
+                self.assertFalse(locked_again)
+
+    def test_prune(self) -> None:
+        self.mirror.fetch(self.origin, self.branch)
+        path = self.mirror.repository_path(self.origin)
+        self.assertEqual(self.mirror.prune(), [])
+        os.utime(path, (0, 0))
+        self.assertEqual(self.mirror.prune(), [path])
+        self.assertFalse(os.path.exists(path))
+
+    def test_prune_skips_locked(self) -> None:
+        self.mirror.fetch(self.origin, self.branch)
+        path = self.mirror.repository_path(self.origin)
+        os.utime(path, (0, 0))
+        with self.mirror.lock(self.origin):
+            self.assertEqual(self.mirror.prune(), [])
+        self.assertTrue(os.path.isdir(path))
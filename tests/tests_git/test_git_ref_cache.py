@@ -0,0 +1,61 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+from git.git_ref_cache import GitRefCache
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestGitRefCache(unittest.TestCase):
+    URL = "https://github.com/opensearch-project/OpenSearch.git"
+
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "cache", "refs.yml")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.__exit__(None, None, None)
+
+    def test_get_miss(self) -> None:
+        self.assertIsNone(GitRefCache(60, self.path).get(self.URL, "main"))
+
+    def test_put_save_and_get(self) -> None:
+        cache = GitRefCache(60, self.path)
+        cache.put(self.URL, "main", ["sha", "refs/heads/main"])
+        self.assertEqual(cache.get(self.URL, "main"), ["sha", "refs/heads/main"])
+        cache.save()
+        self.assertEqual(GitRefCache(60, self.path).get(self.URL, "main"), ["sha", "refs/heads/main"])
+
+    def test_save_merges_concurrent_entries(self) -> None:
+        first = GitRefCache(60, self.path)
+        second = GitRefCache(60, self.path)
+        first.put(self.URL, "main", ["sha", "refs/heads/main"])
+        second.put(self.URL, "1.x", ["sha1x", "refs/heads/1.x"])
+        first.save()
+        second.save()
+        cache = GitRefCache(60, self.path)
+        self.assertEqual(cache.get(self.URL, "main"), ["sha", "refs/heads/main"])
+        self.assertEqual(cache.get(self.URL, "1.x"), ["sha1x", "refs/heads/1.x"])
+
+    @patch("time.time")
+    def test_expired(self, mock_time: Mock) -> None:
+        mock_time.return_value = 1000
+        cache = GitRefCache(60, self.path)
+        cache.put(self.URL, "main", ["sha", "refs/heads/main"])
+        mock_time.return_value = 1061
+        self.assertIsNone(cache.get(self.URL, "main"))
+        cache.save()
+        self.assertEqual(GitRefCache(60, self.path).entries, {})
+
+    def test_invalid_file(self) -> None:
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as f:
+            f.write("{")
+        self.assertEqual(GitRefCache(60, self.path).entries, {})
@@ -0,0 +1,47 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import unittest
+from typing import Dict, List
+from unittest.mock import MagicMock, Mock, patch
+
+from git.git_ref_resolver import GitRefResolver
+
+
+def stable_refs(url: str, refs: List[str]) -> Dict[str, List[str]]:
+    return {ref: [f"{url}@{ref}", f"refs/heads/{ref}"] for ref in refs}
+
+
+class TestGitRefResolver(unittest.TestCase):
+    @patch("git.git_repository.GitRepository.stable_refs", side_effect=stable_refs)
+    def test_resolve(self, mock_stable_refs: Mock) -> None:
+        resolver = GitRefResolver(2)
+        results = resolver.resolve({"a": ["main", "1.x", "main"], "b": ["main"]})
+        self.assertEqual(mock_stable_refs.call_count, 2)
+        mock_stable_refs.assert_any_call("a", ["main", "1.x"])
+        mock_stable_refs.assert_any_call("b", ["main"])
+        self.assertEqual(results, {
+            ("a", "main"): ["a@main", "refs/heads/main"],
+            ("a", "1.x"): ["a@1.x", "refs/heads/1.x"],
+            ("b", "main"): ["b@main", "refs/heads/main"],
+        })
+        self.assertEqual(sorted(resolver.times.keys()), ["a", "b"])
+
+    @patch("git.git_repository.GitRepository.stable_refs", side_effect=stable_refs)
+    def test_resolve_with_cache(self, mock_stable_refs: Mock) -> None:
+        ref_cache = MagicMock()
+        ref_cache.get.side_effect = lambda url, ref: ["cached", "refs/heads/main"] if ref == "main" else None
+        results = GitRefResolver(2, ref_cache).resolve({"a": ["main", "1.x"]})
+        mock_stable_refs.assert_called_once_with("a", ["1.x"])
+        ref_cache.put.assert_called_once_with("a", "1.x", ["a@1.x", "refs/heads/1.x"])
+        ref_cache.save.assert_called_once_with()
+        self.assertEqual(results[("a", "main")], ["cached", "refs/heads/main"])
+
+    @patch("git.git_repository.GitRepository.stable_refs", side_effect=Exception("ls-remote failed"))
+    def test_resolve_error(self, *mocks: Mock) -> None:
+        with self.assertRaisesRegex(Exception, "ls-remote failed"):
+            GitRefResolver(2).resolve({"a": ["main"]})
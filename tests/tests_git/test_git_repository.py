@@ -9,7 +9,7 @@ import os
 import subprocess
 import unittest
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from git.git_repository import GitRepository
 from system.temporary_directory import TemporaryDirectory
@@ -36,6 +36,11 @@ class TestGitRepository(unittest.TestCase):
         self.repo.execute("echo $PWD > created.txt")
         self.assertTrue(os.path.isfile(os.path.join(self.repo.dir, "created.txt")))
 
+    def test_execute_with_env(self) -> None:
+        self.repo.execute("echo $GRADLE_USER_HOME:$HOME > created.txt", env={"GRADLE_USER_HOME": "gradle"})
+        with open(os.path.join(self.repo.dir, "created.txt")) as f:
+            self.assertEqual(f.read().strip(), f"gradle:{os.environ['HOME']}")
+
     @patch('subprocess.check_call', return_value=0)
     def test_execute_in_subdir(self, mock_check_call: Mock) -> None:
         subdir = os.path.join(self.repo.dir, "ISSUE_TEMPLATE")
@@ -112,6 +117,25 @@ class TestGitRepositoryWithWorkingDir(unittest.TestCase):
         self.assertFalse(os.path.exists(repo.dir))
 
 
+class TestGitRepositoryWithMirror(unittest.TestCase):
+    @patch('subprocess.check_call', return_value=0)
+    @patch('subprocess.check_output', return_value='8ac515431bf24caf92fea9d9b0af3b8f10b88453'.encode())
+    def test_checkout_from_mirror(self, mock_output: Mock, mock_call: Mock) -> None:
+        mirror = MagicMock()
+        mirror.fetch.return_value = "8ac515431bf24caf92fea9d9b0af3b8f10b88453"
+        with GitRepository(
+            url="https://github.com/opensearch-project/.github",
+            ref="main",
+            mirror=mirror,
+        ) as repo:
+            mirror.fetch.assert_called_with("https://github.com/opensearch-project/.github", "main")
+            mirror.borrow.assert_called_with("https://github.com/opensearch-project/.github", repo.dir)
+            commands = [call.args[0] for call in mock_call.call_args_list]
+            self.assertIn("git checkout 8ac515431bf24caf92fea9d9b0af3b8f10b88453", commands)
+            self.assertNotIn("git fetch --depth 1 origin main", commands)
+            self.assertEqual(repo.sha, "8ac515431bf24caf92fea9d9b0af3b8f10b88453")
+
+
 class TestGitRepositoryClassMethods(unittest.TestCase):
     @patch("subprocess.check_output", return_value="sha\tHEAD".encode())
     def test_stable_ref(self, mock_output: Mock) -> None:
@@ -124,3 +148,148 @@ class TestGitRepositoryClassMethods(unittest.TestCase):
         ref, name = GitRepository.stable_ref("https://github.com/opensearch-project/OpenSearch", "sha")
         self.assertEqual(ref, "sha")
         self.assertEqual(name, "sha")
+
+    @patch("subprocess.check_output", return_value="sha1\trefs/heads/main\nsha2\trefs/tags/2.12.0\n".encode())
+    def test_stable_refs(self, mock_output: Mock) -> None:
+        refs = GitRepository.stable_refs("https://github.com/opensearch-project/OpenSearch", ["main", "2.12.0", "abcd"])
+        mock_output.assert_called_once_with("git ls-remote https://github.com/opensearch-project/OpenSearch main 2.12.0 abcd", shell=True)
+        self.assertEqual(refs, {
+            "main": ["sha1", "refs/heads/main"],
+            "2.12.0": ["sha2", "refs/tags/2.12.0"],
+            "abcd": ["abcd", "abcd"],
+        })
+
+    @patch("subprocess.check_output", return_value="sha\tHEAD".encode())
+    def test_stable_refs_single(self, mock_output: Mock) -> None:
+        refs = GitRepository.stable_refs("https://github.com/opensearch-project/OpenSearch", ["main"])
+        mock_output.assert_called_once_with("git ls-remote https://github.com/opensearch-project/OpenSearch main", shell=True)
+        self.assertEqual(refs, {"main": ["sha", "HEAD"]})
+
+    def test_changed_paths(self) -> None:
+        with TemporaryDirectory() as tmp_dir:
+            def git(args: str) -> str:
+                return subprocess.check_output(f"git -c user.name=test -c user.email=test@example.com {args}", cwd=tmp_dir.name, shell=True).decode().strip()
+
+            git("init")
+            os.makedirs(os.path.join(tmp_dir.name, "src"))
+            for path in ["README.md", os.path.join("src", "Main.java")]:
+                with open(os.path.join(tmp_dir.name, path), "w") as f:
+                    f.write("first")
+            git("add -A")
+            git("commit -m first")
+            first = git("rev-parse HEAD")
+            with open(os.path.join(tmp_dir.name, "README.md"), "w") as f:
+                f.write("second")
+            git("commit -am second")
+            second = git("rev-parse HEAD")
+
+            self.assertEqual(GitRepository.changed_paths(f"file://{tmp_dir.name}", first, second), ["README.md"])
+            self.assertEqual(GitRepository.changed_paths(f"file://{tmp_dir.name}", second, second), [])
+
+    def test_existing_paths(self) -> None:
+        with TemporaryDirectory() as tmp_dir:
+            def git(args: str) -> str:
+                return subprocess.check_output(f"git -c user.name=test -c user.email=test@example.com {args}", cwd=tmp_dir.name, shell=True).decode().strip()
+
+            git("init")
+            os.makedirs(os.path.join(tmp_dir.name, "plugin", "scripts"))
+            for path in ["build.sh", os.path.join("plugin", "scripts", "build.sh")]:
+                with open(os.path.join(tmp_dir.name, path), "w") as f:
+                    f.write("#!/bin/bash")
+            git("add -A")
+            git("commit -m first")
+            sha = git("rev-parse HEAD")
+
+            url = f"file://{tmp_dir.name}"
+            self.assertEqual(GitRepository.existing_paths(url, sha, ["plugin/build.sh", "plugin/scripts/build.sh"]), ["plugin/scripts/build.sh"])
+            self.assertEqual(GitRepository.existing_paths(url, sha, ["build.sh", "scripts/build.sh"]), ["build.sh"])
+
+
+class TestGitRepositoryReuse(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.origin = os.path.join(self.tmp_dir.name, "origin")
+        self.checkout = os.path.join(self.tmp_dir.name, "checkout")
+        os.makedirs(self.origin)
+        self.__git("init")
+        self.first = self.__commit("first")
+        self.second = self.__commit("second")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.__exit__(None, None, None)
+
+    def __git(self, args: str) -> str:
+        return subprocess.check_output(f"git -c user.name=test -c user.email=test@example.com {args}", cwd=self.origin, shell=True).decode().strip()
+
+    def __commit(self, content: str) -> str:
+        with open(os.path.join(self.origin, "file.txt"), "w") as f:
+            f.write(content)
+        self.__git("add file.txt")
+        self.__git(f"commit -m {content}")
+        return self.__git("rev-parse HEAD")
+
+    def test_reuse_updates_in_place(self) -> None:
+        repo = GitRepository(self.origin, self.first, self.checkout, reuse=True)
+        self.assertEqual(repo.sha, self.first)
+        os.makedirs(os.path.join(self.checkout, "build"))
+        with open(os.path.join(self.checkout, "file.txt"), "w") as f:
+            f.write("changed")
+
+        repo = GitRepository(self.origin, self.second, self.checkout, reuse=True)
+        self.assertEqual(repo.sha, self.second)
+        with open(os.path.join(self.checkout, "file.txt")) as f:
+            self.assertEqual(f.read(), "second")
+        self.assertTrue(os.path.isdir(os.path.join(self.checkout, "build")))
+
+    def test_reuse_clean(self) -> None:
+        GitRepository(self.origin, self.first, self.checkout, reuse=True)
+        os.makedirs(os.path.join(self.checkout, "build"))
+        GitRepository(self.origin, self.second, self.checkout, reuse=True, clean=True)
+        self.assertFalse(os.path.exists(os.path.join(self.checkout, "build")))
+
+    def test_reuse_empty_directory(self) -> None:
+        os.makedirs(self.checkout)
+        repo = GitRepository(self.origin, self.first, self.checkout, reuse=True)
+        self.assertEqual(repo.sha, self.first)
+
+    def test_reuse_keeps_other_directory(self) -> None:
+        os.makedirs(self.checkout)
+        open(os.path.join(self.checkout, "file"), "w").close()
+        with self.assertRaises(FileExistsError):
+            GitRepository(self.origin, self.first, self.checkout, reuse=True)
+        self.assertEqual(os.listdir(self.checkout), ["file"])
+
+    def test_sparse_checkout(self) -> None:
+        os.makedirs(os.path.join(self.origin, "release-notes"))
+        os.makedirs(os.path.join(self.origin, "src"))
+        for path in [os.path.join("release-notes", "notes.md"), os.path.join("src", "Main.java")]:
+            with open(os.path.join(self.origin, path), "w") as f:
+                f.write(path)
+        self.__git("add -A")
+        self.__git("commit -m third")
+        self.__git("config uploadpack.allowFilter true")
+        self.__git("config uploadpack.allowAnySHA1InWant true")
+        sha = self.__git("rev-parse HEAD")
+
+        repo = GitRepository(f"file://{self.origin}", sha, self.checkout, sparse_paths=["release-notes"])
+        self.assertEqual(repo.sha, sha)
+        self.assertTrue(os.path.isfile(os.path.join(self.checkout, "file.txt")))
+        self.assertTrue(os.path.isfile(os.path.join(self.checkout, "release-notes", "notes.md")))
+        self.assertFalse(os.path.exists(os.path.join(self.checkout, "src")))
+        self.assertEqual(repo.output("git config remote.origin.partialclonefilter", self.checkout), "blob:none")
+
+    def test_sparse_checkout_root_only(self) -> None:
+        os.makedirs(os.path.join(self.origin, "src"))
+        with open(os.path.join(self.origin, "src", "Main.java"), "w") as f:
+            f.write("class Main {}")
+        self.__git("add -A")
+        self.__git("commit -m third")
+        sha = self.__git("rev-parse HEAD")
+
+        GitRepository(self.origin, sha, self.checkout, sparse_paths=[])
+        self.assertEqual(sorted(os.listdir(self.checkout)), [".git", "file.txt"])
+
+    def test_existing_directory_without_reuse(self) -> None:
+        os.makedirs(self.checkout)
+        with self.assertRaises(FileExistsError):
+            GitRepository(self.origin, self.first, self.checkout)
@@ -0,0 +1,28 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import unittest
+from unittest.mock import Mock, patch
+
+from manifests.distribution import DistributionNotFound, find_build_root
+
+
+class TestDistribution(unittest.TestCase):
+    @patch("system.download_pool.DownloadPool.find", return_value="url/linux/x64/builds/opensearch/manifest.yml")
+    def test_find_build_root(self, mock_find: Mock) -> None:
+        self.assertEqual(find_build_root("url", "linux", "x64", "opensearch"), "url/linux/x64/builds/opensearch")
+        mock_find.assert_called_with(["url/linux/x64/builds/opensearch/manifest.yml", "url/linux/x64/builds/manifest.yml"])
+
+    @patch("system.download_pool.DownloadPool.find", return_value="url/linux/x64/builds/manifest.yml")
+    def test_find_build_root_legacy(self, mock_find: Mock) -> None:
+        self.assertEqual(find_build_root("url", "linux", "x64", "opensearch"), "url/linux/x64/builds")
+
+    @patch("system.download_pool.DownloadPool.find", return_value=None)
+    def test_find_build_root_not_found(self, mock_find: Mock) -> None:
+        with self.assertRaises(DistributionNotFound) as ctx:
+            find_build_root("url", "linux", "x64", "opensearch")
+        self.assertEqual(ctx.exception.urls, ["url/linux/x64/builds/opensearch", "url/linux/x64/builds"])
@@ -166,6 +166,38 @@ class TestInputManifest(unittest.TestCase):
         self.assertTrue("ml-commons" in plugins_depend_on_cu)
         self.assertTrue("notifications-core" in plugins_depend_on_cu)
 
+    def test_topological_order(self) -> None:
+        manifest = InputManifest({
+            "schema-version": "1.1",
+            "build": {"name": "OpenSearch", "version": "2.12.0"},
+            "components": [
+                {"name": "OpenSearch", "repository": "url", "ref": "main"},
+                {"name": "sql", "repository": "url", "ref": "main", "depends_on": ["job-scheduler", "common-utils"]},
+                {"name": "job-scheduler", "repository": "url", "ref": "main", "depends_on": ["common-utils", "missing"]},
+                {"name": "common-utils", "repository": "url", "ref": "main"},
+            ],
+        })
+        self.assertEqual(manifest.topological_order, ["OpenSearch", "common-utils", "job-scheduler", "sql"])
+        self.assertEqual(manifest.dependents, {"OpenSearch": [], "sql": [], "job-scheduler": ["sql"], "common-utils": ["sql", "job-scheduler"]})
+        self.assertEqual(manifest.dependents_closure(["common-utils"]), {"common-utils": None, "sql": "common-utils", "job-scheduler": "common-utils"})
+        self.assertEqual(manifest.dependents_closure(["job-scheduler"]), {"job-scheduler": None, "sql": "job-scheduler"})
+
+    def test_topological_order_cycle(self) -> None:
+        manifest = InputManifest({
+            "schema-version": "1.1",
+            "build": {"name": "OpenSearch", "version": "2.12.0"},
+            "components": [
+                {"name": "OpenSearch", "repository": "url", "ref": "main"},
+                {"name": "a", "repository": "url", "ref": "main", "depends_on": ["b"]},
+                {"name": "b", "repository": "url", "ref": "main", "depends_on": ["a"]},
+                {"name": "c", "repository": "url", "ref": "main", "depends_on": ["a"]},
+            ],
+        })
+        with self.assertRaises(InputManifest.CycleError) as ctx:
+            manifest.topological_order
+        self.assertEqual(ctx.exception.components, ["a", "b"])
+        self.assertEqual(str(ctx.exception), "Circular dependency between components: a, b.")
+
     def test_to_dict(self) -> None:
         path = os.path.join(self.manifests_path, "templates", "opensearch", "1.x", "os-template-1.1.0.yml")
         manifest = InputManifest.from_path(path)
@@ -231,6 +263,23 @@ class TestInputManifest(unittest.TestCase):
         opensearch: InputComponentFromSource = manifest.components["OpenSearch"]  # type: ignore[assignment]
         self.assertEqual(opensearch.ref, "abcd")
 
+    @patch("git.git_repository.GitRepository.stable_refs")
+    def test_stable_shared_repository(self, mock_stable_refs: Mock) -> None:
+        mock_stable_refs.return_value = {"main": ["sha1", "refs/heads/main"], "1.x": ["sha2", "refs/heads/1.x"]}
+        manifest = InputManifest({
+            "schema-version": "1.1",
+            "build": {"name": "OpenSearch", "version": "1.1.0"},
+            "components": [
+                {"name": "a", "repository": "https://github.com/opensearch-project/plugins.git", "ref": "main", "working_directory": "a"},
+                {"name": "b", "repository": "https://github.com/opensearch-project/plugins.git", "ref": "1.x", "working_directory": "b"},
+                {"name": "c", "repository": "https://github.com/opensearch-project/plugins.git", "ref": "main", "working_directory": "c"},
+                {"name": "d", "dist": "https://ci.opensearch.org/ci/dbc/distribution-build-opensearch/1.1.0/d"},
+            ],
+        }).stable()
+        mock_stable_refs.assert_called_once_with("https://github.com/opensearch-project/plugins.git", ["main", "1.x"])
+        self.assertEqual([manifest.components[name].ref for name in ["a", "b", "c"]], ["sha1", "sha2", "sha1"])  # type: ignore[attr-defined]
+        self.assertEqual(sorted(manifest.stabilize_times.keys()), ["a", "b", "c"])
+
     def test_eq(self) -> None:
         path = os.path.join(self.manifests_path, "templates", "opensearch", "1.x", "os-template-1.0.0.yml")
         manifest1 = InputManifest.from_path(path)
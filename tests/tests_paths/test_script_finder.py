@@ -73,6 +73,22 @@ class TestScriptFinder(unittest.TestCase):
         ):
             ScriptFinder.find_build_script("OpenSearch", "anything", self.component_without_scripts)
 
+    # find_default_build_script
+
+    def test_find_default_build_script(self) -> None:
+        self.assertEqual(
+            os.path.join(ScriptFinder.default_scripts_path, "opensearch", "build.sh"),
+            ScriptFinder.find_default_build_script("OpenSearch", "invalid"),
+            msg="A component without an override resolves to a default.",
+        )
+
+    def test_find_default_build_script_component_override(self) -> None:
+        self.assertEqual(
+            os.path.join(ScriptFinder.component_scripts_path, "OpenSearch", "build.sh"),
+            ScriptFinder.find_default_build_script("OpenSearch", "OpenSearch"),
+            msg="A component resolves to a component override.",
+        )
+
     # find_integ_test_script
 
     def test_find_integ_test_script_default(self) -> None:
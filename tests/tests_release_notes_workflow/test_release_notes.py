@@ -6,12 +6,14 @@
 # compatible open source license.
 
 import os
+import subprocess
 import unittest
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from manifests.input_manifest import InputComponentFromSource, InputManifest
 from release_notes_workflow.release_notes import ReleaseNotes
+from system.temporary_directory import TemporaryDirectory
 
 
 class TestReleaseNotes(unittest.TestCase):
@@ -33,6 +35,29 @@ class TestReleaseNotes(unittest.TestCase):
     def test_check(self, *mocks: Any) -> None:
         self.assertEqual(self.release_notes.check(self.component, self.build_version), ['OpenSearch-test', '[ref]', None, None, False, None])
 
+    @patch("subprocess.check_output", return_value=''.encode())
+    @patch("subprocess.check_call")
+    def test_check_sparse_checkout(self, mock_check_call: MagicMock, *mocks: Any) -> None:
+        self.release_notes.check(self.component, self.build_version)
+        commands = [call_args[0][0] for call_args in mock_check_call.call_args_list]
+        self.assertIn("git sparse-checkout set --cone release-notes", commands)
+        self.assertIn("git fetch --depth 1 --filter=blob:none origin ref", commands)
+
+    def test_check_working_directory(self) -> None:
+        with TemporaryDirectory() as tmp_dir:
+            def git(args: str) -> str:
+                return subprocess.check_output(f"git -c user.name=test -c user.email=test@example.com {args}", cwd=tmp_dir.name, shell=True).decode().strip()
+
+            git("init")
+            os.makedirs(os.path.join(tmp_dir.name, "notifications"))
+            with open(os.path.join(tmp_dir.name, "notifications", "build.gradle"), "w") as f:
+                f.write("")
+            git("add -A")
+            git("commit -m first")
+            sha = git("rev-parse --short HEAD")
+            component = InputComponentFromSource({"name": "notifications", "repository": f"file://{tmp_dir.name}", "ref": "HEAD", "working_directory": "notifications"})
+            self.assertEqual(self.release_notes.check(component, self.build_version)[:3], ["notifications", "[HEAD]", sha])
+
     @patch("subprocess.check_output", return_value=''.encode())
     @patch("subprocess.check_call")
     def test_check_with_manifest(self, *mocks: Any) -> None:
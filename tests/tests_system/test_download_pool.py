@@ -0,0 +1,192 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import json
+import os
+import unittest
+from typing import Any, Dict, List
+from unittest.mock import MagicMock, Mock, patch
+
+import requests
+
+from system.download_pool import DownloadPool
+from system.temporary_directory import TemporaryDirectory
+
+
+def response(status_code: int, content: bytes = b"", headers: Dict[str, str] = {}) -> MagicMock:
+    mock = MagicMock(status_code=status_code, text=content.decode(), headers=headers)
+    mock.__enter__.return_value = mock
+    mock.iter_content.return_value = [content] if content else []
+    if status_code >= 400:
+        mock.raise_for_status.side_effect = requests.HTTPError(response=mock)
+    return mock
+
+
+class TestDownloadPool(unittest.TestCase):
+    URL = "https://ci.opensearch.org/ci/dbc/distribution-build-opensearch/2.12.0/plugins/job-scheduler-2.12.0.0.zip"
+
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.dest = os.path.join(self.tmp_dir.name, "job-scheduler-2.12.0.0.zip")
+        self.pool = DownloadPool(workers=2, retries=2, backoff=0)
+        self.requests: List[Dict[str, Any]] = []
+        self.responses: Dict[str, List[MagicMock]] = {}
+
+        def get(url: str, headers: Dict[str, str] = {}, **kwargs: Any) -> MagicMock:
+            self.requests.append({"url": url, "headers": headers})
+            return self.responses[url].pop(0)
+
+        self.session = MagicMock()
+        self.session.get.side_effect = get
+        self.pool.session = self.session
+
+    def tearDown(self) -> None:
+        self.tmp_dir.__exit__(None, None, None)
+
+    def __read(self) -> bytes:
+        with open(self.dest, "rb") as f:
+            return f.read()
+
+    def test_download(self) -> None:
+        self.responses[self.URL] = [response(200, b"zip")]
+        self.assertEqual(self.pool.submit(self.URL, self.dest).result(), 3)
+        self.assertEqual(self.__read(), b"zip")
+        self.assertFalse(os.path.exists(f"{self.dest}.part"))
+        self.assertEqual((self.pool.files, self.pool.bytes), (1, 3))
+
+    def __part(self, data: bytes, validator: str = '"etag"', size: int = 3) -> None:
+        with open(f"{self.dest}.part", "wb") as f:
+            f.write(data)
+        with open(f"{self.dest}.part.json", "w") as f:
+            json.dump({"validator": validator, "size": size}, f)
+
+    def __checksum(self, data: bytes = b"zip") -> MagicMock:
+        return response(200, hashlib.sha512(data).hexdigest().encode())
+
+    def test_resume(self) -> None:
+        self.__part(b"zi")
+        self.responses[f"{self.URL}.sha512"] = [self.__checksum()]
+        self.responses[self.URL] = [response(206, b"p", {"Content-Range": "bytes 2-2/3"})]
+        self.pool.download(self.URL, self.dest)
+        self.assertEqual(self.requests[1]["headers"], {"Range": "bytes=2-", "If-Range": '"etag"'})
+        self.assertEqual(self.__read(), b"zip")
+        self.assertFalse(os.path.exists(f"{self.dest}.part.json"))
+
+    def test_resume_without_checksum(self) -> None:
+        self.__part(b"za")
+        self.responses[f"{self.URL}.sha512"] = [response(404)]
+        self.responses[self.URL] = [response(200, b"zip")]
+        self.pool.download(self.URL, self.dest)
+        self.assertEqual(self.requests[1]["headers"], {})
+        self.assertEqual(self.__read(), b"zip")
+
+    def test_resume_without_state(self) -> None:
+        with open(f"{self.dest}.part", "wb") as f:
+            f.write(b"za")
+        self.responses[f"{self.URL}.sha512"] = [self.__checksum()]
+        self.responses[self.URL] = [response(200, b"zip")]
+        self.pool.download(self.URL, self.dest)
+        self.assertEqual(self.requests[1]["headers"], {})
+        self.assertEqual(self.__read(), b"zip")
+
+    def test_resume_changed(self) -> None:
+        # the server ignores If-Range, and the size of the remote file changed
+        self.__part(b"zi")
+        self.responses[f"{self.URL}.sha512"] = [self.__checksum(b"zipzip")]
+        self.responses[self.URL] = [response(206, b"pzip", {"Content-Range": "bytes 2-5/6"}), response(200, b"zipzip")]
+        self.pool.download(self.URL, self.dest)
+        self.assertEqual(self.requests[2]["headers"], {})
+        self.assertEqual(self.__read(), b"zipzip")
+
+    def test_resume_not_supported(self) -> None:
+        self.__part(b"zi")
+        self.responses[f"{self.URL}.sha512"] = [self.__checksum()]
+        self.responses[self.URL] = [response(200, b"zip")]
+        self.pool.download(self.URL, self.dest)
+        self.assertEqual(self.__read(), b"zip")
+
+    def test_resume_not_satisfiable(self) -> None:
+        self.__part(b"zip", size=6)
+        self.responses[f"{self.URL}.sha512"] = [self.__checksum()]
+        self.responses[self.URL] = [response(416), response(200, b"zip")]
+        self.pool.download(self.URL, self.dest)
+        self.assertEqual(self.requests[2]["headers"], {})
+        self.assertEqual(self.__read(), b"zip")
+
+    @patch("time.sleep")
+    def test_retry(self, mock_sleep: Mock) -> None:
+        failure = response(200)
+        failure.iter_content.side_effect = requests.ConnectionError("reset")
+        self.responses[self.URL] = [response(503), failure, response(200, b"zip")]
+        self.pool.download(self.URL, self.dest)
+        self.assertEqual(self.__read(), b"zip")
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch("time.sleep")
+    def test_retry_exhausted(self, mock_sleep: Mock) -> None:
+        self.responses[self.URL] = [response(503), response(503), response(503)]
+        with self.assertRaises(requests.HTTPError):
+            self.pool.download(self.URL, self.dest)
+        self.assertEqual(len(self.requests), 3)
+
+    @patch("time.sleep")
+    def test_no_retry_not_found(self, mock_sleep: Mock) -> None:
+        self.responses[self.URL] = [response(404)]
+        with self.assertRaises(requests.HTTPError):
+            self.pool.download(self.URL, self.dest)
+        mock_sleep.assert_not_called()
+
+    def test_verify(self) -> None:
+        self.responses[self.URL] = [response(200, b"zip")]
+        self.responses[f"{self.URL}.sha512"] = [response(200, f"{hashlib.sha512(b'zip').hexdigest()}  job-scheduler-2.12.0.0.zip\n".encode())]
+        self.pool.download(self.URL, self.dest, verify=True)
+        self.assertEqual(self.__read(), b"zip")
+
+    def test_verify_no_checksum(self) -> None:
+        self.responses[self.URL] = [response(200, b"zip")]
+        self.responses[f"{self.URL}.sha512"] = [response(404)]
+        self.pool.download(self.URL, self.dest, verify=True)
+        self.assertEqual(self.__read(), b"zip")
+
+    def test_verify_empty_checksum(self) -> None:
+        self.responses[self.URL] = [response(200, b"zip")]
+        self.responses[f"{self.URL}.sha512"] = [response(200, b" \n")]
+        self.pool.download(self.URL, self.dest, verify=True)
+        self.assertEqual(self.__read(), b"zip")
+
+    @patch("time.sleep")
+    def test_verify_mismatch(self, mock_sleep: Mock) -> None:
+        self.responses[self.URL] = [response(200, b"zap"), response(200, b"zap"), response(200, b"zap")]
+        self.responses[f"{self.URL}.sha512"] = [response(200, hashlib.sha512(b"zip").hexdigest().encode())] * 3
+        with self.assertRaises(DownloadPool.ChecksumError) as ctx:
+            self.pool.download(self.URL, self.dest, verify=True)
+        self.assertTrue(str(ctx.exception).startswith(f"Checksum mismatch for {self.URL}, expected sha512 "))
+        self.assertFalse(os.path.exists(self.dest))
+
+    def test_find(self) -> None:
+        self.responses["a"] = [response(404)]
+        self.responses["b"] = [response(200)]
+        self.responses["c"] = [response(200)]
+        self.assertEqual(self.pool.find(["a", "b", "c"]), "b")
+
+    def test_find_none(self) -> None:
+        self.responses["a"] = [response(404)]
+        self.session.get.side_effect = requests.ConnectionError("unreachable")
+        self.assertIsNone(self.pool.find(["a"]))
+
+    @patch("logging.info")
+    def test_report(self, mock_logging: Mock) -> None:
+        self.pool.report()
+        mock_logging.assert_not_called()
+        self.responses[self.URL] = [response(200, b"zip")]
+        self.pool.download(self.URL, self.dest)
+        self.pool.report()
+        self.assertTrue(mock_logging.call_args[0][0].startswith("Downloaded 1 file(s), 0.0 MB in "))
+
+    def test_default(self) -> None:
+        self.assertIs(DownloadPool.default(), DownloadPool.default())
@@ -0,0 +1,108 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+from system.file_placement import FilePlacement
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestFilePlacement(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = TemporaryDirectory()
+        self.src = os.path.join(self.tmp_dir.name, "src.jar")
+        with open(self.src, "w") as f:
+            f.write("jar")
+        self.output_dir = os.path.join(self.tmp_dir.name, "output")
+        os.makedirs(self.output_dir)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.__exit__(None, None, None)
+
+    def __dest(self, name: str = "dest.jar") -> str:
+        return os.path.join(self.output_dir, name)
+
+    def __read(self, path: str) -> str:
+        with open(path) as f:
+            return f.read()
+
+    def test_invalid_strategy(self) -> None:
+        with self.assertRaisesRegex(ValueError, "Invalid file placement strategy: invalid, expected one of auto, "):
+            FilePlacement("invalid")
+
+    def test_strategies(self) -> None:
+        for strategy in ["hardlink", "copy_file_range", "sendfile", "copy"]:
+            with self.subTest(strategy=strategy):
+                dest = self.__dest(f"{strategy}.jar")
+                self.assertEqual(FilePlacement(strategy).place(self.src, dest), strategy)
+                self.assertEqual(self.__read(dest), "jar")
+
+    def test_hardlink(self) -> None:
+        FilePlacement("hardlink").place(self.src, self.__dest())
+        self.assertTrue(os.path.samefile(self.src, self.__dest()))
+
+    @patch("os.link", side_effect=OSError(18, "Invalid cross-device link"))
+    def test_fallback_to_copy(self, *mocks: Mock) -> None:
+        self.assertEqual(FilePlacement("hardlink").place(self.src, self.__dest()), "copy")
+        self.assertEqual(self.__read(self.__dest()), "jar")
+        self.assertFalse(os.path.samefile(self.src, self.__dest()))
+
+    @patch("os.link", side_effect=OSError(18, "Invalid cross-device link"))
+    def test_auto_remembers_strategy(self, mock_link: Mock) -> None:
+        placement = FilePlacement()
+        used = placement.place(self.src, self.__dest("first.jar"))
+        self.assertIn(used, ["reflink", "copy_file_range", "sendfile"])
+        self.assertEqual(list(placement.devices.values()), [used])
+        link_calls = mock_link.call_count
+        self.assertEqual(placement.place(self.src, self.__dest("second.jar")), used)
+        self.assertEqual(mock_link.call_count, link_calls)
+
+    @patch("os.link")
+    def test_auto_never_hardlinks(self, mock_link: Mock) -> None:
+        placement = FilePlacement()
+        self.assertNotEqual(placement.place(self.src, self.__dest()), "hardlink")
+        mock_link.assert_not_called()
+        self.assertFalse(os.path.samefile(self.src, self.__dest()))
+
+    def test_replaces_without_writing_through(self) -> None:
+        dest = self.__dest()
+        FilePlacement("hardlink").place(self.src, dest)
+        other = os.path.join(self.tmp_dir.name, "other.jar")
+        with open(other, "w") as f:
+            f.write("other")
+        FilePlacement("copy").place(other, dest)
+        self.assertEqual(self.__read(dest), "other")
+        self.assertEqual(self.__read(self.src), "jar")
+
+    @patch("shutil.copyfile")
+    def test_dedupe_identical_destination(self, mock_copyfile: Mock) -> None:
+        dest = self.__dest()
+        with open(dest, "w") as f:
+            f.write("jar")
+        placement = FilePlacement("copy")
+        self.assertEqual(placement.place(self.src, dest), "dedupe")
+        mock_copyfile.assert_not_called()
+        self.assertEqual(placement.stats["dedupe"], 1)
+
+    def test_dedupe_compares_sizes_first(self) -> None:
+        other = os.path.join(self.tmp_dir.name, "other.jar")
+        with open(other, "w") as f:
+            f.write("longer jar")
+        placement = FilePlacement("copy")
+        placement.place(self.src, self.__dest("first.jar"))
+        with patch("hashlib.sha256") as mock_sha256:
+            self.assertEqual(placement.place(other, self.__dest("second.jar")), "copy")
+            mock_sha256.assert_not_called()
+
+    def test_dedupe_identical_files(self) -> None:
+        placement = FilePlacement("copy")
+        self.assertEqual(placement.place(self.src, self.__dest("first.jar")), "copy")
+        self.assertEqual(placement.place(self.src, self.__dest("second.jar")), "dedupe")
+        self.assertTrue(os.path.samefile(self.__dest("first.jar"), self.__dest("second.jar")))
+        self.assertEqual(dict(placement.stats), {"copy": 1, "dedupe": 1})
@@ -0,0 +1,68 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import gzip
+import io
+import os
+import tarfile
+import unittest
+
+from system.parallel_gzip_file import ParallelGzipFile
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestParallelGzipFile(unittest.TestCase):
+    DATA = b"".join(f"line {i}\n".encode() for i in range(100000))
+
+    def __write(self, path: str, data: bytes, **kwargs: int) -> bytes:
+        with ParallelGzipFile(path, **kwargs) as gz:
+            # Writes do not line up with blocks
+            for offset in range(0, len(data), 10000):
+                gz.write(data[offset:offset + 10000])
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_write(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "data.gz")
+            compressed = self.__write(path, self.DATA, workers=3, block_size=64 * 1024)
+            self.assertEqual(gzip.decompress(compressed), self.DATA)
+            # One member per block, each starting with the gzip magic number
+            self.assertEqual(compressed.count(b"\x1f\x8b\x08"), len(self.DATA) // (64 * 1024) + 1)
+            with gzip.open(path, "rb") as f:
+                self.assertEqual(f.read(), self.DATA)
+
+    def test_write_reproducible(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            first = self.__write(os.path.join(work_dir.name, "first.gz"), self.DATA, workers=2, block_size=64 * 1024)
+            second = self.__write(os.path.join(work_dir.name, "second.gz"), self.DATA, workers=4, block_size=64 * 1024)
+            self.assertEqual(first, second)
+
+    def test_write_compresslevel(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            stored = self.__write(os.path.join(work_dir.name, "stored.gz"), self.DATA, compresslevel=0)
+            compressed = self.__write(os.path.join(work_dir.name, "compressed.gz"), self.DATA, compresslevel=9)
+            self.assertGreater(len(stored), len(self.DATA))
+            self.assertLess(len(compressed), len(self.DATA))
+            self.assertEqual(gzip.decompress(stored), gzip.decompress(compressed))
+
+    def test_write_empty(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "empty.gz")
+            self.assertEqual(gzip.decompress(self.__write(path, b"")), b"")
+
+    def test_tarfile(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            with open(os.path.join(work_dir.name, "data.txt"), "wb") as f:
+                f.write(self.DATA)
+            path = os.path.join(work_dir.name, "data.tar.gz")
+            with io.BufferedWriter(ParallelGzipFile(path, block_size=64 * 1024)) as gz:
+                with tarfile.open(fileobj=gz, mode="w|") as tar:
+                    tar.add(os.path.join(work_dir.name, "data.txt"), arcname="data.txt")
+            with tarfile.open(path, "r:gz") as tar:
+                self.assertEqual(tar.getnames(), ["data.txt"])
+                self.assertEqual(tar.extractfile("data.txt").read(), self.DATA)
@@ -33,3 +33,35 @@ class TestZipFile(unittest.TestCase):
 
             regular_file = os.path.join(tmp.name, "regular.py")
             self.assertTrue(os.path.exists(regular_file))
+
+    def test_write_compressed(self) -> None:
+        with TemporaryDirectory() as tmp:
+            files = [
+                (os.path.join(self.data_path, "executable.sh"), "executable.sh", zipfile.ZIP_DEFLATED),
+                (__file__, "regular.py", zipfile.ZIP_DEFLATED),
+                (__file__, "stored.jar", zipfile.ZIP_STORED),
+            ]
+            with ZipFile(os.path.join(tmp.name, "written.zip"), "w", zipfile.ZIP_DEFLATED) as zip:
+                for filename, arcname, compress_type in files:
+                    zip.write(filename, arcname, compress_type)
+            with ZipFile(os.path.join(tmp.name, "compressed.zip"), "w", zipfile.ZIP_DEFLATED) as zip:
+                for filename, arcname, compress_type in files:
+                    zip.write_compressed(*ZipFile.compress(filename, arcname, compress_type))
+
+            # The same bytes as ZipFile.write
+            with open(os.path.join(tmp.name, "written.zip"), "rb") as written, open(os.path.join(tmp.name, "compressed.zip"), "rb") as compressed:
+                self.assertEqual(written.read(), compressed.read())
+
+            with ZipFile(os.path.join(tmp.name, "compressed.zip"), "r") as zip:
+                self.assertIsNone(zip.testzip())
+                self.assertEqual([info.compress_type for info in zip.infolist()], [compress_type for _, _, compress_type in files])
+                zip.extractall(tmp.name)
+            self.assertTrue(os.access(os.path.join(tmp.name, "executable.sh"), os.X_OK))
+            with open(os.path.join(tmp.name, "stored.jar"), "rb") as stored, open(__file__, "rb") as f:
+                self.assertEqual(stored.read(), f.read())
+
+    def test_compress_level(self) -> None:
+        _, data = ZipFile.compress(__file__, "regular.py", zipfile.ZIP_DEFLATED)
+        _, fast_data = ZipFile.compress(__file__, "regular.py", zipfile.ZIP_DEFLATED, 1)
+        self.assertLess(len(data), os.path.getsize(__file__))
+        self.assertGreaterEqual(len(fast_data), len(data))
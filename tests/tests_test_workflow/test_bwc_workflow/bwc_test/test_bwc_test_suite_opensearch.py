@@ -139,6 +139,13 @@ class TestBwcSuiteOpenSearch(unittest.TestCase):
             self.bundle_manifest
         )
 
+        mock_git.assert_called_once_with(
+            component.repository,
+            component.commit_id,
+            os.path.join(self.work_dir, "dashboards-reports"),
+            "reports-scheduler"
+        )
+
         # call the test target
         status = suite.execute_bwctest_sh("with-security")
 